@@ -14,10 +14,14 @@ destek seviyelerini ve toplam alıcı iştahını tespit eder.
 ================================================================================
 """
 
-import pandas as pd
 import os
+import sys
 from datetime import datetime
 
+from borsa_analiz import analizler, profil
+from borsa_analiz.konsol import konsol_gunlugu
+from borsa_analiz.siralama import sirali
+
 # --- AYARLAR ---
 DOSYA_KONUMU = r"C:\Kullanıcılar\SeninKlasörün"  # CSV dosyalarının okunacağı konum
 CIKTI_KONUMU = r"C:\Kullanıcılar\RaporKlasörün"  # CSV raporlarının kaydedileceği konum
@@ -26,50 +30,8 @@ KADEME_DERINLIGI = 14  # Kaç kademe taranacak?
 def destek_analizi(ana_dizin, derinlik_siniri):
     print(f"[{ana_dizin}] klasöründeki veriler {derinlik_siniri} kademe derinliğinde taranıyor...")
     
-    yol_derinlik = os.path.join(ana_dizin, 'DERINLIK_ALIS-1.csv')
-    
     try:
-        df = pd.read_csv(yol_derinlik)
-        
-        sonuclar = []
-
-        for index, row in df.iterrows():
-            sembol = row['SEMBOL']
-            
-            en_yuksek_lot = 0
-            en_guclu_fiyat = 0
-            toplam_destek = 0
-            
-            # 1'den başlayıp belirlenen sınıra kadar (1..14)
-            for i in range(1, derinlik_siniri + 1): 
-                try:
-                    # Sütun isimleri: "1 ALIS ADET", "1 ALIS"
-                    adet_col = f"{i} ALIS ADET"
-                    fiyat_col = f"{i} ALIS"
-                    
-                    if adet_col in df.columns and fiyat_col in df.columns:
-                        adet = row[adet_col]
-                        fiyat = row[fiyat_col]
-                        
-                        if pd.notna(adet) and pd.notna(fiyat):
-                            toplam_destek += adet
-                            
-                            # En yüklü kademeyi bul
-                            if adet > en_yuksek_lot:
-                                en_yuksek_lot = adet
-                                en_guclu_fiyat = fiyat
-                except:
-                    continue 
-            
-            sonuclar.append({
-                'SEMBOL': sembol,
-                'MAJOR_DESTEK_FIYATI': en_guclu_fiyat,
-                'DESTEK_LOT_MIKTARI': int(en_yuksek_lot),
-                'TOPLAM_ALIS_DESTEGI': int(toplam_destek)
-            })
-            
-        return pd.DataFrame(sonuclar)
-
+        return analizler.destek_analizi(ana_dizin, derinlik_siniri)
     except FileNotFoundError:
         print("HATA: Dosya bulunamadı.")
         return None
@@ -78,40 +40,52 @@ def destek_analizi(ana_dizin, derinlik_siniri):
         return None
 
 # --- ANALİZİ BAŞLAT ---
-df_destek = destek_analizi(DOSYA_KONUMU, KADEME_DERINLIGI)
+def calistir(ana_dizin=DOSYA_KONUMU, cikti_konumu=CIKTI_KONUMU):
+    """Analizi çalıştırır, raporları kaydeder ve sonuç tablosunu döndürür."""
+    df_destek = destek_analizi(ana_dizin, KADEME_DERINLIGI)
+    profil.gecis('suzme')
 
-if df_destek is not None:
-    # Çıktı klasörünü kontrol et ve yoksa oluştur
-    if not os.path.exists(CIKTI_KONUMU):
-        os.makedirs(CIKTI_KONUMU)
-        print(f"✓ Çıktı klasörü oluşturuldu: {CIKTI_KONUMU}")
+    if df_destek is not None:
+        # Çıktı klasörünü kontrol et ve yoksa oluştur
+        if not os.path.exists(cikti_konumu):
+            os.makedirs(cikti_konumu)
+            print(f"✓ Çıktı klasörü oluşturuldu: {cikti_konumu}")
     
-    # Zaman damgası
-    zaman_damgasi = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Zaman damgası
+        zaman_damgasi = datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    # Filtreleme: En Güçlü Alış Desteği Olanlar (Güvenli Limanlar)
-    en_saglam = df_destek.sort_values(by='TOPLAM_ALIS_DESTEGI', ascending=False).head(10)
+        # Filtreleme: En Güçlü Alış Desteği Olanlar (Güvenli Limanlar)
+        tum_sirali = sirali(df_destek, 'TOPLAM_ALIS_DESTEGI')
+        en_saglam = tum_sirali.head(10)
     
-    print(f"\n{'='*65}")
-    print(f" {KADEME_DERINLIGI} KADEMEDE EN GÜÇLÜ ALICI DESTEĞİ OLAN HİSSELER")
-    print(f"{'='*65}")
-    print(en_saglam.to_string(index=False))
+        print(f"\n{'='*65}")
+        print(f" {KADEME_DERINLIGI} KADEMEDE EN GÜÇLÜ ALICI DESTEĞİ OLAN HİSSELER")
+        print(f"{'='*65}")
+        print(en_saglam.to_string(index=False))
     
-    # CSV olarak kaydet
-    # 1. Tüm Destek Analizi
-    tum_dosya = os.path.join(CIKTI_KONUMU, f'DESTEK_DUVARI_TUM_{zaman_damgasi}.csv')
-    df_destek.sort_values(by='TOPLAM_ALIS_DESTEGI', ascending=False).to_csv(tum_dosya, index=False, encoding='utf-8-sig')
-    print(f"\n✓ Tüm destek analizi: {tum_dosya}")
+        # CSV olarak kaydet
+        # 1. Tüm Destek Analizi
+        tum_dosya = os.path.join(cikti_konumu, f'DESTEK_DUVARI_TUM_{zaman_damgasi}.csv')
+        profil.rapor_yaz(tum_sirali, tum_dosya)
+        print(f"\n✓ Tüm destek analizi: {tum_dosya}")
     
-    # 2. En Güçlü 10
-    en_saglam_dosya = os.path.join(CIKTI_KONUMU, f'DESTEK_DUVARI_EN_GUCLU_{zaman_damgasi}.csv')
-    en_saglam.to_csv(en_saglam_dosya, index=False, encoding='utf-8-sig')
-    print(f"✓ En güçlü 10 destek: {en_saglam_dosya}")
+        # 2. En Güçlü 10
+        en_saglam_dosya = os.path.join(cikti_konumu, f'DESTEK_DUVARI_EN_GUCLU_{zaman_damgasi}.csv')
+        profil.rapor_yaz(en_saglam, en_saglam_dosya)
+        print(f"✓ En güçlü 10 destek: {en_saglam_dosya}")
     
-    # Yorumlama
-    print("\n[STRATEJİ]: 'MAJOR_DESTEK_FIYATI', olası düşüşlerde 'Tepki Alımı' gelmesi muhtemel yerdir.")
-    print("Alım emri girmek için bu seviyeler veya bir kademe üstü tercih edilebilir.")
+        # Yorumlama
+        print("\n[STRATEJİ]: 'MAJOR_DESTEK_FIYATI', olası düşüşlerde 'Tepki Alımı' gelmesi muhtemel yerdir.")
+        print("Alım emri girmek için bu seviyeler veya bir kademe üstü tercih edilebilir.")
     
-    print("\n" + "="*65)
-    print(" ANALİZ TAMAMLANDI - RAPORLAR CSV OLARAK KAYDEDİLDİ")
-    print("="*65)
\ No newline at end of file
+        print("\n" + "="*65)
+        print(" ANALİZ TAMAMLANDI - RAPORLAR CSV OLARAK KAYDEDİLDİ")
+        print("="*65)
+    
+    return df_destek
+
+
+if __name__ == '__main__':
+    # Komut satırından: python "<script>" [VERI_KLASORU] [CIKTI_KLASORU]
+    konsol_gunlugu()
+    calistir(*sys.argv[1:3])
\ No newline at end of file
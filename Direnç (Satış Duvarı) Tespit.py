@@ -10,10 +10,14 @@ Bu script, satış tarafındaki derinliği analiz eder.
 ================================================================================
 """
 
-import pandas as pd
 import os
+import sys
 from datetime import datetime
 
+from borsa_analiz import analizler, profil
+from borsa_analiz.konsol import konsol_gunlugu
+from borsa_analiz.siralama import sirali
+
 # --- AYARLAR ---
 DOSYA_KONUMU = r"C:\Kullanıcılar\SeninKlasörün"  # CSV dosyalarının okunacağı konum
 CIKTI_KONUMU = r"C:\Kullanıcılar\RaporKlasörün"  # CSV raporlarının kaydedileceği konum
@@ -24,51 +28,8 @@ KADEME_DERINLIGI = 14
 def direnc_analizi(ana_dizin, derinlik_siniri):
     print(f"[{ana_dizin}] klasöründeki veriler {derinlik_siniri} kademe derinliğinde taranıyor...")
     
-    yol_derinlik = os.path.join(ana_dizin, 'DERINLIK_SATIS-1.csv')
-    
     try:
-        df = pd.read_csv(yol_derinlik)
-        
-        sonuclar = []
-
-        for index, row in df.iterrows():
-            sembol = row['SEMBOL']
-            
-            en_yuksek_lot = 0
-            en_guclu_fiyat = 0
-            toplam_baski = 0
-            
-            # 1'den başlayıp belirlenen sınıra kadar döngü kuruyoruz (1..15 -> 14 dahil)
-            for i in range(1, derinlik_siniri + 1): 
-                try:
-                    # Sütun isimlerini dinamik oluşturuyoruz: "14 SATIS ADET" gibi
-                    adet_col = f"{i} SATIS ADET"
-                    fiyat_col = f"{i} SATIS"
-                    
-                    # Eğer dosya içinde bu sütun varsa işle (Yoksa hata vermez, atlar)
-                    if adet_col in df.columns and fiyat_col in df.columns:
-                        adet = row[adet_col]
-                        fiyat = row[fiyat_col]
-                        
-                        if pd.notna(adet) and pd.notna(fiyat):
-                            toplam_baski += adet
-                            
-                            # En güçlü direnç kademesini güncelle
-                            if adet > en_yuksek_lot:
-                                en_yuksek_lot = adet
-                                en_guclu_fiyat = fiyat
-                except:
-                    continue 
-            
-            sonuclar.append({
-                'SEMBOL': sembol,
-                'MAJOR_DIRENC_FIYATI': en_guclu_fiyat,
-                'DIRENC_LOT_MIKTARI': int(en_yuksek_lot),
-                'TOPLAM_SATIS_BASKISI': int(toplam_baski)
-            })
-            
-        return pd.DataFrame(sonuclar)
-
+        return analizler.direnc_analizi(ana_dizin, derinlik_siniri)
     except FileNotFoundError:
         print("HATA: Dosya bulunamadı.")
         return None
@@ -77,35 +38,47 @@ def direnc_analizi(ana_dizin, derinlik_siniri):
         return None
 
 # --- ANALİZİ BAŞLAT ---
-df_direnc = direnc_analizi(DOSYA_KONUMU, KADEME_DERINLIGI)
+def calistir(ana_dizin=DOSYA_KONUMU, cikti_konumu=CIKTI_KONUMU):
+    """Analizi çalıştırır, raporları kaydeder ve sonuç tablosunu döndürür."""
+    df_direnc = direnc_analizi(ana_dizin, KADEME_DERINLIGI)
+    profil.gecis('suzme')
 
-if df_direnc is not None:
-    # Çıktı klasörünü kontrol et ve yoksa oluştur
-    if not os.path.exists(CIKTI_KONUMU):
-        os.makedirs(CIKTI_KONUMU)
-        print(f"✓ Çıktı klasörü oluşturuldu: {CIKTI_KONUMU}")
+    if df_direnc is not None:
+        # Çıktı klasörünü kontrol et ve yoksa oluştur
+        if not os.path.exists(cikti_konumu):
+            os.makedirs(cikti_konumu)
+            print(f"✓ Çıktı klasörü oluşturuldu: {cikti_konumu}")
     
-    # Zaman damgası
-    zaman_damgasi = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Zaman damgası
+        zaman_damgasi = datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    en_baskili = df_direnc.sort_values(by='TOPLAM_SATIS_BASKISI', ascending=False).head(10)
+        tum_sirali = sirali(df_direnc, 'TOPLAM_SATIS_BASKISI')
+        en_baskili = tum_sirali.head(10)
     
-    print(f"\n{'='*65}")
-    print(f" {KADEME_DERINLIGI} KADEMEDE EN YOĞUN SATIŞ BASKISI OLAN HİSSELER")
-    print(f"{'='*65}")
-    print(en_baskili.to_string(index=False))
+        print(f"\n{'='*65}")
+        print(f" {KADEME_DERINLIGI} KADEMEDE EN YOĞUN SATIŞ BASKISI OLAN HİSSELER")
+        print(f"{'='*65}")
+        print(en_baskili.to_string(index=False))
     
-    # CSV olarak kaydet
-    # 1. Tüm Direnç Analizi
-    tum_dosya = os.path.join(CIKTI_KONUMU, f'DIRENC_DUVARI_TUM_{zaman_damgasi}.csv')
-    df_direnc.sort_values(by='TOPLAM_SATIS_BASKISI', ascending=False).to_csv(tum_dosya, index=False, encoding='utf-8-sig')
-    print(f"\n✓ Tüm direnç analizi: {tum_dosya}")
+        # CSV olarak kaydet
+        # 1. Tüm Direnç Analizi
+        tum_dosya = os.path.join(cikti_konumu, f'DIRENC_DUVARI_TUM_{zaman_damgasi}.csv')
+        profil.rapor_yaz(tum_sirali, tum_dosya)
+        print(f"\n✓ Tüm direnç analizi: {tum_dosya}")
     
-    # 2. En Baskılı 10
-    en_baskili_dosya = os.path.join(CIKTI_KONUMU, f'DIRENC_DUVARI_EN_BASKILI_{zaman_damgasi}.csv')
-    en_baskili.to_csv(en_baskili_dosya, index=False, encoding='utf-8-sig')
-    print(f"✓ En baskılı 10 direnç: {en_baskili_dosya}")
+        # 2. En Baskılı 10
+        en_baskili_dosya = os.path.join(cikti_konumu, f'DIRENC_DUVARI_EN_BASKILI_{zaman_damgasi}.csv')
+        profil.rapor_yaz(en_baskili, en_baskili_dosya)
+        print(f"✓ En baskılı 10 direnç: {en_baskili_dosya}")
     
-    print("\n" + "="*65)
-    print(" ANALİZ TAMAMLANDI - RAPORLAR CSV OLARAK KAYDEDİLDİ")
-    print("="*65)
\ No newline at end of file
+        print("\n" + "="*65)
+        print(" ANALİZ TAMAMLANDI - RAPORLAR CSV OLARAK KAYDEDİLDİ")
+        print("="*65)
+    
+    return df_direnc
+
+
+if __name__ == '__main__':
+    # Komut satırından: python "<script>" [VERI_KLASORU] [CIKTI_KLASORU]
+    konsol_gunlugu()
+    calistir(*sys.argv[1:3])
\ No newline at end of file
@@ -24,10 +24,13 @@ GİRDİ DOSYALARI (CSV):
 ================================================================================
 """
 
-import pandas as pd
 import os
+import sys
 from datetime import datetime
 
+from borsa_analiz import analizler, profil
+from borsa_analiz.konsol import konsol_gunlugu
+
 # --- KULLANICI AYARLARI ---
 DOSYA_KONUMU = r"C:\Kullanıcılar\SeninKlasörün"  # CSV dosyalarının okunacağı konum
 CIKTI_KONUMU = r"C:\Kullanıcılar\RaporKlasörün"  # CSV raporlarının kaydedileceği konum
@@ -35,30 +38,8 @@ CIKTI_KONUMU = r"C:\Kullanıcılar\RaporKlasörün"  # CSV raporlarının kayded
 def kademe_denge_analizi(ana_dizin):
     print(f"[{ana_dizin}] klasöründeki veriler taranıyor...")
     
-    # Dosya yollarını işletim sistemine uygun şekilde oluştur
-    yol_kademe = os.path.join(ana_dizin, 'KADEME_ANALIZI.csv')
-    yol_bekleyen = os.path.join(ana_dizin, 'BEKLEYEN_EMIRLER.csv')
-    
     try:
-        # 1. Dosyaları Oku
-        df_kademe = pd.read_csv(yol_kademe)
-        df_bekleyen = pd.read_csv(yol_bekleyen)
-        
-        # 2. Sütunları Seç ve Standartlaştır
-        # FARK: Aktif Alıcıların Satıcılara üstünlüğü
-        df_active = df_kademe[['SEMBOL', 'FARK']].rename(columns={'FARK': 'AKTIF_DENGE'})
-        
-        # NET.EMIR.FARKI: Tahtadaki pasif alıcıların satıcılara üstünlüğü
-        df_passive = df_bekleyen[['SEMBOL', 'NET.EMIR.FARKI']].rename(columns={'NET.EMIR.FARKI': 'PASIF_DENGE'})
-        
-        # 3. İki tabloyu SEMBOL üzerinden birleştir
-        df_merged = pd.merge(df_active, df_passive, on='SEMBOL', how='inner')
-        
-        # 4. Genel Denge Puanını Hesapla
-        df_merged['GENEL_DENGE'] = df_merged['AKTIF_DENGE'] + df_merged['PASIF_DENGE']
-        
-        return df_merged
-
+        return analizler.kademe_denge_analizi(ana_dizin)
     except FileNotFoundError:
         print("\n!!! HATA: Belirtilen klasörde dosyalar bulunamadı.")
         print("Lütfen 'DOSYA_KONUMU' satırındaki yolu ve dosya isimlerini kontrol et.")
@@ -69,57 +50,68 @@ def kademe_denge_analizi(ana_dizin):
 
 # --- ANA PROGRAM ---
 
-analiz_sonucu = kademe_denge_analizi(DOSYA_KONUMU)
+def calistir(ana_dizin=DOSYA_KONUMU, cikti_konumu=CIKTI_KONUMU):
+    """Analizi çalıştırır, raporları kaydeder ve sonuç tablosunu döndürür."""
+    analiz_sonucu = kademe_denge_analizi(ana_dizin)
+    profil.gecis('suzme')
 
-if analiz_sonucu is not None:
-    # Çıktı klasörünü kontrol et ve yoksa oluştur
-    if not os.path.exists(CIKTI_KONUMU):
-        os.makedirs(CIKTI_KONUMU)
-        print(f"✓ Çıktı klasörü oluşturuldu: {CIKTI_KONUMU}")
+    if analiz_sonucu is not None:
+        # Çıktı klasörünü kontrol et ve yoksa oluştur
+        if not os.path.exists(cikti_konumu):
+            os.makedirs(cikti_konumu)
+            print(f"✓ Çıktı klasörü oluşturuldu: {cikti_konumu}")
     
-    # Zaman damgası
-    zaman_damgasi = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Zaman damgası
+        zaman_damgasi = datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    # SENARYO 1: BOĞA PİYASASI ADAYLARI (Güçlü Alış İsteği)
-    # Hem anlık alıyorlar, hem de alta alış yazıp destekliyorlar.
-    guclu_alicili = analiz_sonucu[
-        (analiz_sonucu['AKTIF_DENGE'] > 0) & 
-        (analiz_sonucu['PASIF_DENGE'] > 0)
-    ].sort_values(by='GENEL_DENGE', ascending=False)
+        # SENARYO 1: BOĞA PİYASASI ADAYLARI (Güçlü Alış İsteği)
+        # Hem anlık alıyorlar, hem de alta alış yazıp destekliyorlar.
+        guclu_alicili = analiz_sonucu[
+            (analiz_sonucu['AKTIF_DENGE'] > 0) & 
+            (analiz_sonucu['PASIF_DENGE'] > 0)
+        ].sort_values(by='GENEL_DENGE', ascending=False)
     
-    # SENARYO 2: AYI PİYASASI ADAYLARI (Güçlü Satış Baskısı)
-    # Hem anlık satıyorlar, hem de üste satış yazıp baskılıyorlar.
-    guclu_saticili = analiz_sonucu[
-        (analiz_sonucu['AKTIF_DENGE'] < 0) & 
-        (analiz_sonucu['PASIF_DENGE'] < 0)
-    ].sort_values(by='GENEL_DENGE', ascending=True)
+        # SENARYO 2: AYI PİYASASI ADAYLARI (Güçlü Satış Baskısı)
+        # Hem anlık satıyorlar, hem de üste satış yazıp baskılıyorlar.
+        guclu_saticili = analiz_sonucu[
+            (analiz_sonucu['AKTIF_DENGE'] < 0) & 
+            (analiz_sonucu['PASIF_DENGE'] < 0)
+        ].sort_values(by='GENEL_DENGE', ascending=True)
 
-    print("\n" + "="*50)
-    print(" GÜÇLÜ ALICILI HİSSELER (TOP 10) - YÜKSELİŞ ADAYI")
-    print("="*50)
-    print(guclu_alicili[['SEMBOL', 'AKTIF_DENGE', 'PASIF_DENGE', 'GENEL_DENGE']].head(10).to_string(index=False))
+        print("\n" + "="*50)
+        print(" GÜÇLÜ ALICILI HİSSELER (TOP 10) - YÜKSELİŞ ADAYI")
+        print("="*50)
+        print(guclu_alicili[['SEMBOL', 'AKTIF_DENGE', 'PASIF_DENGE', 'GENEL_DENGE']].head(10).to_string(index=False))
     
-    print("\n" + "="*50)
-    print(" GÜÇLÜ SATICILI HİSSELER (TOP 10) - DÜŞÜŞ ADAYI")
-    print("="*50)
-    print(guclu_saticili[['SEMBOL', 'AKTIF_DENGE', 'PASIF_DENGE', 'GENEL_DENGE']].head(10).to_string(index=False))
+        print("\n" + "="*50)
+        print(" GÜÇLÜ SATICILI HİSSELER (TOP 10) - DÜŞÜŞ ADAYI")
+        print("="*50)
+        print(guclu_saticili[['SEMBOL', 'AKTIF_DENGE', 'PASIF_DENGE', 'GENEL_DENGE']].head(10).to_string(index=False))
     
-    # CSV olarak kaydet
-    # 1. Tüm Analiz
-    tum_dosya = os.path.join(CIKTI_KONUMU, f'KADEME_DENGE_TUM_{zaman_damgasi}.csv')
-    analiz_sonucu.sort_values(by='GENEL_DENGE', ascending=False).to_csv(tum_dosya, index=False, encoding='utf-8-sig')
-    print(f"\n✓ Tüm denge analizi: {tum_dosya}")
+        # CSV olarak kaydet
+        # 1. Tüm Analiz
+        tum_dosya = os.path.join(cikti_konumu, f'KADEME_DENGE_TUM_{zaman_damgasi}.csv')
+        profil.rapor_yaz(analiz_sonucu.sort_values(by='GENEL_DENGE', ascending=False), tum_dosya)
+        print(f"\n✓ Tüm denge analizi: {tum_dosya}")
     
-    # 2. Güçlü Alıcılı
-    alicili_dosya = os.path.join(CIKTI_KONUMU, f'KADEME_DENGE_ALICILI_{zaman_damgasi}.csv')
-    guclu_alicili.to_csv(alicili_dosya, index=False, encoding='utf-8-sig')
-    print(f"✓ Güçlü alıcılı hisseler: {alicili_dosya}")
+        # 2. Güçlü Alıcılı
+        alicili_dosya = os.path.join(cikti_konumu, f'KADEME_DENGE_ALICILI_{zaman_damgasi}.csv')
+        profil.rapor_yaz(guclu_alicili, alicili_dosya)
+        print(f"✓ Güçlü alıcılı hisseler: {alicili_dosya}")
     
-    # 3. Güçlü Satıcılı
-    saticili_dosya = os.path.join(CIKTI_KONUMU, f'KADEME_DENGE_SATICILI_{zaman_damgasi}.csv')
-    guclu_saticili.to_csv(saticili_dosya, index=False, encoding='utf-8-sig')
-    print(f"✓ Güçlü satıcılı hisseler: {saticili_dosya}")
+        # 3. Güçlü Satıcılı
+        saticili_dosya = os.path.join(cikti_konumu, f'KADEME_DENGE_SATICILI_{zaman_damgasi}.csv')
+        profil.rapor_yaz(guclu_saticili, saticili_dosya)
+        print(f"✓ Güçlü satıcılı hisseler: {saticili_dosya}")
     
-    print("\n" + "="*50)
-    print(" ANALİZ TAMAMLANDI - RAPORLAR CSV OLARAK KAYDEDİLDİ")
-    print("="*50)
\ No newline at end of file
+        print("\n" + "="*50)
+        print(" ANALİZ TAMAMLANDI - RAPORLAR CSV OLARAK KAYDEDİLDİ")
+        print("="*50)
+    
+    return analiz_sonucu
+
+
+if __name__ == '__main__':
+    # Komut satırından: python "<script>" [VERI_KLASORU] [CIKTI_KLASORU]
+    konsol_gunlugu()
+    calistir(*sys.argv[1:3])
\ No newline at end of file
@@ -14,10 +14,14 @@ PARAMETRE:
 ================================================================================
 """
 
-import pandas as pd
 import os
+import sys
 from datetime import datetime
 
+from borsa_analiz import analizler, profil
+from borsa_analiz.konsol import konsol_gunlugu
+from borsa_analiz.siralama import sirali
+
 # --- AYARLAR ---
 DOSYA_KONUMU = r"C:\Kullanıcılar\SeninKlasörün"  # CSV dosyalarının okunacağı konum
 CIKTI_KONUMU = r"C:\Kullanıcılar\RaporKlasörün"  # CSV raporlarının kaydedileceği konum
@@ -27,147 +31,72 @@ DUVAR_CARPANI = 4.0  # Ortalamanın 4 katı büyüklükteyse "Duvar" de.
 def likidite_duvari_analizi(ana_dizin, derinlik_siniri, carpan):
     print(f"[{ana_dizin}] klasöründe {carpan}x büyüklüğündeki duvarlar taranıyor...")
     
-    yol_alis = os.path.join(ana_dizin, 'DERINLIK_ALIS-1.csv')
-    yol_satis = os.path.join(ana_dizin, 'DERINLIK_SATIS-1.csv')
-    yol_fiyat = os.path.join(ana_dizin, 'ACILISLAR-1.csv')
-    
     try:
-        df_alis = pd.read_csv(yol_alis)
-        df_satis = pd.read_csv(yol_satis)
-        
-        # Fiyat bilgisini de alalım (Duvarın fiyata uzaklığını ölçmek için)
-        if os.path.exists(yol_fiyat):
-            df_fiyat = pd.read_csv(yol_fiyat)[['SEMBOL', 'KAPANIS']]
-        else:
-            df_fiyat = pd.DataFrame(columns=['SEMBOL', 'KAPANIS'])
-            
-        # Birleştir
-        df = pd.merge(df_alis, df_satis, on='SEMBOL', how='inner', suffixes=('_ALIS', '_SATIS'))
-        df = pd.merge(df, df_fiyat, on='SEMBOL', how='left')
-        
-        sonuclar = []
-
-        for index, row in df.iterrows():
-            sembol = row['SEMBOL']
-            kapanis = row['KAPANIS']
-            
-            # --- ALIŞ TARAFI (DESTEK DUVARI) ---
-            alis_lotlari = []
-            alis_fiyatlari = []
-            for i in range(1, derinlik_siniri + 1):
-                col_adet = f"{i} ALIS ADET"
-                col_fiyat = f"{i} ALIS"
-                if col_adet in row and pd.notna(row[col_adet]):
-                    alis_lotlari.append(row[col_adet])
-                    alis_fiyatlari.append(row[col_fiyat])
-            
-            # Analiz
-            if len(alis_lotlari) > 0:
-                ort_alis = sum(alis_lotlari) / len(alis_lotlari)
-                max_alis = max(alis_lotlari)
-                max_index = alis_lotlari.index(max_alis)
-                duvar_fiyati_alis = alis_fiyatlari[max_index]
-                
-                # Duvar mı? (Max Lot > Ortalama * Çarpan)
-                if max_alis > (ort_alis * carpan):
-                    duvar_gucu = max_alis / ort_alis
-                    uzaklik = (kapanis - duvar_fiyati_alis) / kapanis * 100 if kapanis else 0
-                    
-                    sonuclar.append({
-                        'SEMBOL': sembol,
-                        'YON': 'ALIS (DESTEK)',
-                        'DUVAR_FIYATI': duvar_fiyati_alis,
-                        'DUVAR_LOTU': int(max_alis),
-                        'DUVAR_GUCU_KAT': round(duvar_gucu, 1),
-                        'FIYATA_UZAKLIK_%': round(uzaklik, 2),
-                        'KAPANIS': kapanis
-                    })
-
-            # --- SATIŞ TARAFI (DİRENÇ DUVARI) ---
-            satis_lotlari = []
-            satis_fiyatlari = []
-            for i in range(1, derinlik_siniri + 1):
-                col_adet = f"{i} SATIS ADET"
-                col_fiyat = f"{i} SATIS"
-                if col_adet in row and pd.notna(row[col_adet]):
-                    satis_lotlari.append(row[col_adet])
-                    satis_fiyatlari.append(row[col_fiyat])
-            
-            # Analiz
-            if len(satis_lotlari) > 0:
-                ort_satis = sum(satis_lotlari) / len(satis_lotlari)
-                max_satis = max(satis_lotlari)
-                max_index = satis_lotlari.index(max_satis)
-                duvar_fiyati_satis = satis_fiyatlari[max_index]
-                
-                # Duvar mı?
-                if max_satis > (ort_satis * carpan):
-                    duvar_gucu = max_satis / ort_satis
-                    uzaklik = (duvar_fiyati_satis - kapanis) / kapanis * 100 if kapanis else 0
-                    
-                    sonuclar.append({
-                        'SEMBOL': sembol,
-                        'YON': 'SATIS (DIRENC)',
-                        'DUVAR_FIYATI': duvar_fiyati_satis,
-                        'DUVAR_LOTU': int(max_satis),
-                        'DUVAR_GUCU_KAT': round(duvar_gucu, 1),
-                        'FIYATA_UZAKLIK_%': round(uzaklik, 2),
-                        'KAPANIS': kapanis
-                    })
-                    
-        return pd.DataFrame(sonuclar)
-
+        return analizler.likidite_duvari_analizi(ana_dizin, derinlik_siniri, carpan)
     except Exception as e:
         print(f"HATA: {e}")
         return None
 
 # --- ANALİZİ BAŞLAT ---
-df_duvar = likidite_duvari_analizi(DOSYA_KONUMU, KADEME_DERINLIGI, DUVAR_CARPANI)
+def calistir(ana_dizin=DOSYA_KONUMU, cikti_konumu=CIKTI_KONUMU):
+    """Analizi çalıştırır, raporları kaydeder ve sonuç tablosunu döndürür."""
+    df_duvar = likidite_duvari_analizi(ana_dizin, KADEME_DERINLIGI, DUVAR_CARPANI)
+    profil.gecis('suzme')
 
-if df_duvar is not None:
-    # Çıktı klasörünü kontrol et ve yoksa oluştur
-    if not os.path.exists(CIKTI_KONUMU):
-        os.makedirs(CIKTI_KONUMU)
-        print(f"✓ Çıktı klasörü oluşturuldu: {CIKTI_KONUMU}")
+    if df_duvar is not None:
+        # Çıktı klasörünü kontrol et ve yoksa oluştur
+        if not os.path.exists(cikti_konumu):
+            os.makedirs(cikti_konumu)
+            print(f"✓ Çıktı klasörü oluşturuldu: {cikti_konumu}")
     
-    # Zaman damgası
-    zaman_damgasi = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Zaman damgası
+        zaman_damgasi = datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    # 1. EN BÜYÜK DESTEK DUVARLARI (Alış Yönü)
-    buy_walls = df_duvar[df_duvar['YON'] == 'ALIS (DESTEK)'].sort_values(by='DUVAR_GUCU_KAT', ascending=False).head(10)
+        # 1. EN BÜYÜK DESTEK DUVARLARI (Alış Yönü)
+        alis_sirali = sirali(df_duvar[df_duvar['YON'] == 'ALIS (DESTEK)'], 'DUVAR_GUCU_KAT')
+        buy_walls = alis_sirali.head(10)
     
-    print("\n" + "="*85)
-    print(f" TESPİT EDİLEN EN GÜÇLÜ ALIŞ DUVARLARI (ORTALAMANIN EN AZ {DUVAR_CARPANI} KATI)")
-    print("="*85)
-    print(buy_walls[['SEMBOL', 'DUVAR_FIYATI', 'DUVAR_LOTU', 'DUVAR_GUCU_KAT', 'FIYATA_UZAKLIK_%']].to_string(index=False))
+        print("\n" + "="*85)
+        print(f" TESPİT EDİLEN EN GÜÇLÜ ALIŞ DUVARLARI (ORTALAMANIN EN AZ {DUVAR_CARPANI} KATI)")
+        print("="*85)
+        print(buy_walls[['SEMBOL', 'DUVAR_FIYATI', 'DUVAR_LOTU', 'DUVAR_GUCU_KAT', 'FIYATA_UZAKLIK_%']].to_string(index=False))
     
-    # 2. EN BÜYÜK DİRENÇ DUVARLARI (Satış Yönü)
-    sell_walls = df_duvar[df_duvar['YON'] == 'SATIS (DIRENC)'].sort_values(by='DUVAR_GUCU_KAT', ascending=False).head(10)
+        # 2. EN BÜYÜK DİRENÇ DUVARLARI (Satış Yönü)
+        satis_sirali = sirali(df_duvar[df_duvar['YON'] == 'SATIS (DIRENC)'], 'DUVAR_GUCU_KAT')
+        sell_walls = satis_sirali.head(10)
     
-    print("\n" + "="*85)
-    print(f" TESPİT EDİLEN EN GÜÇLÜ SATIŞ DUVARLARI (ORTALAMANIN EN AZ {DUVAR_CARPANI} KATI)")
-    print("="*85)
-    print(sell_walls[['SEMBOL', 'DUVAR_FIYATI', 'DUVAR_LOTU', 'DUVAR_GUCU_KAT', 'FIYATA_UZAKLIK_%']].to_string(index=False))
+        print("\n" + "="*85)
+        print(f" TESPİT EDİLEN EN GÜÇLÜ SATIŞ DUVARLARI (ORTALAMANIN EN AZ {DUVAR_CARPANI} KATI)")
+        print("="*85)
+        print(sell_walls[['SEMBOL', 'DUVAR_FIYATI', 'DUVAR_LOTU', 'DUVAR_GUCU_KAT', 'FIYATA_UZAKLIK_%']].to_string(index=False))
 
-    # CSV olarak kaydet
-    # 1. Tüm Duvarlar
-    tum_dosya = os.path.join(CIKTI_KONUMU, f'LIKIDITE_DUVARI_TUM_{zaman_damgasi}.csv')
-    df_duvar.to_csv(tum_dosya, index=False, encoding='utf-8-sig')
-    print(f"\n✓ Tüm likidite duvarları: {tum_dosya}")
+        # CSV olarak kaydet
+        # 1. Tüm Duvarlar
+        tum_dosya = os.path.join(cikti_konumu, f'LIKIDITE_DUVARI_TUM_{zaman_damgasi}.csv')
+        profil.rapor_yaz(df_duvar, tum_dosya)
+        print(f"\n✓ Tüm likidite duvarları: {tum_dosya}")
     
-    # 2. Alış Duvarları
-    alis_dosya = os.path.join(CIKTI_KONUMU, f'LIKIDITE_DUVARI_ALIS_{zaman_damgasi}.csv')
-    df_duvar[df_duvar['YON'] == 'ALIS (DESTEK)'].sort_values(by='DUVAR_GUCU_KAT', ascending=False).to_csv(alis_dosya, index=False, encoding='utf-8-sig')
-    print(f"✓ Alış duvarları: {alis_dosya}")
+        # 2. Alış Duvarları
+        alis_dosya = os.path.join(cikti_konumu, f'LIKIDITE_DUVARI_ALIS_{zaman_damgasi}.csv')
+        profil.rapor_yaz(alis_sirali, alis_dosya)
+        print(f"✓ Alış duvarları: {alis_dosya}")
     
-    # 3. Satış Duvarları
-    satis_dosya = os.path.join(CIKTI_KONUMU, f'LIKIDITE_DUVARI_SATIS_{zaman_damgasi}.csv')
-    df_duvar[df_duvar['YON'] == 'SATIS (DIRENC)'].sort_values(by='DUVAR_GUCU_KAT', ascending=False).to_csv(satis_dosya, index=False, encoding='utf-8-sig')
-    print(f"✓ Satış duvarları: {satis_dosya}")
+        # 3. Satış Duvarları
+        satis_dosya = os.path.join(cikti_konumu, f'LIKIDITE_DUVARI_SATIS_{zaman_damgasi}.csv')
+        profil.rapor_yaz(satis_sirali, satis_dosya)
+        print(f"✓ Satış duvarları: {satis_dosya}")
 
-    print("\n[STRATEJİ]: 'DUVAR_GUCU_KAT' ne kadar yüksekse (örn: 10x), o seviye o kadar zor kırılır.")
-    print("Alış Duvarının hemen 1 kademe üzerine 'ALIM', Satış Duvarının 1 kademe altına 'SATIM/STOP' yazılır.")
+        print("\n[STRATEJİ]: 'DUVAR_GUCU_KAT' ne kadar yüksekse (örn: 10x), o seviye o kadar zor kırılır.")
+        print("Alış Duvarının hemen 1 kademe üzerine 'ALIM', Satış Duvarının 1 kademe altına 'SATIM/STOP' yazılır.")
+    
+        print("\n" + "="*85)
+        print(" ANALİZ TAMAMLANDI - RAPORLAR CSV OLARAK KAYDEDİLDİ")
+        print("="*85)
     
-    print("\n" + "="*85)
-    print(" ANALİZ TAMAMLANDI - RAPORLAR CSV OLARAK KAYDEDİLDİ")
-    print("="*85)
\ No newline at end of file
+    return df_duvar
+
+
+if __name__ == '__main__':
+    # Komut satırından: python "<script>" [VERI_KLASORU] [CIKTI_KLASORU]
+    konsol_gunlugu()
+    calistir(*sys.argv[1:3])
\ No newline at end of file
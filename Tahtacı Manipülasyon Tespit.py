@@ -15,10 +15,13 @@ SINYALLER:
 ================================================================================
 """
 
-import pandas as pd
 import os
+import sys
 from datetime import datetime
 
+from borsa_analiz import analizler, profil
+from borsa_analiz.konsol import konsol_gunlugu
+
 # --- AYARLAR ---
 DOSYA_KONUMU = r"C:\Kullanıcılar\SeninKlasörün"  # CSV dosyalarının okunacağı konum
 CIKTI_KONUMU = r"C:\Kullanıcılar\RaporKlasörün"  # CSV raporlarının kaydedileceği konum
@@ -26,72 +29,8 @@ CIKTI_KONUMU = r"C:\Kullanıcılar\RaporKlasörün"  # CSV raporlarının kayded
 def manipulasyon_analizi(ana_dizin):
     print(f"[{ana_dizin}] üzerinde manipülasyon taraması yapılıyor...")
     
-    yol_fiyat = os.path.join(ana_dizin, 'ACILISLAR-1.csv')
-    yol_kademe = os.path.join(ana_dizin, 'KADEME_ANALIZI.csv')
-    yol_bekleyen = os.path.join(ana_dizin, 'BEKLEYEN_EMIRLER.csv')
-    
     try:
-        # Dosyaları Oku
-        df_fiyat = pd.read_csv(yol_fiyat)
-        df_kademe = pd.read_csv(yol_kademe)
-        df_bekleyen = pd.read_csv(yol_bekleyen)
-        
-        # --- 1. HACİM VE FİYAT VERİLERİ ---
-        # Rölatif Hacim (Son 5 gün ortalamasına göre bugünkü durum)
-        hacim_cols = [f'HACIM-{i}' for i in range(1, 6)]
-        if all(c in df_fiyat.columns for c in hacim_cols):
-            df_fiyat['ORT_HACIM_5G'] = df_fiyat[hacim_cols].mean(axis=1)
-            df_fiyat['ROLATIF_HACIM'] = df_fiyat['HACIM'] / df_fiyat['ORT_HACIM_5G']
-        else:
-             df_fiyat['ROLATIF_HACIM'] = 1.0 
-             
-        df_fiyat['DEGISIM_YUZDE'] = ((df_fiyat['KAPANIS'] - df_fiyat['KAPANIS-1']) / df_fiyat['KAPANIS-1']) * 100
-        
-        # --- 2. AKTİF VE PASİF VERİLERİ ---
-        # Aktif Net: Anlık gerçekleşen işlemlerde kim baskın?
-        df_kademe = df_kademe[['SEMBOL', 'FARK']].rename(columns={'FARK': 'AKTIF_NET_LOT'})
-        
-        # Pasif Net: Bekleyen emirlerde kim baskın?
-        df_bekleyen = df_bekleyen[['SEMBOL', 'NET.EMIR.FARKI']].rename(columns={'NET.EMIR.FARKI': 'PASIF_NET_LOT'})
-        
-        # Birleştirme
-        df_m = pd.merge(df_fiyat, df_kademe, on='SEMBOL', how='inner')
-        df_m = pd.merge(df_m, df_bekleyen, on='SEMBOL', how='inner')
-        
-        # --- 3. MANİPÜLASYON SENARYOLARI ---
-        
-        # SENARYO A: "WASH TRADING" (Hacim Var, İcraat Yok)
-        # Hacim çok yüksek (>2 kat), ama fiyat değişimi çok küçük (<%0.5).
-        # Amaç: Hissede hareket varmış gibi gösterip ky çekmek.
-        df_m['SINYAL_WASH'] = (df_m['ROLATIF_HACIM'] > 2.0) & (df_m['DEGISIM_YUZDE'].abs() < 0.5)
-        
-        # SENARYO B: "SAHTE DESTEK / MAL ÇAKMA" (Boğa Tuzağı)
-        # Görüntü: Altta çok alıcı bekliyor (Pasif > 0), güvenli liman gibi.
-        # Gerçek: Aktif olarak satış yeniyor (Aktif < 0).
-        # Anlamı: Tahtacı alta kendi alışlarını yazıp "Düşmez bu" diyor, ama yukarıdan malı veriyor.
-        df_m['SINYAL_SAHTE_DESTEK'] = (df_m['PASIF_NET_LOT'] > 0) & (df_m['AKTIF_NET_LOT'] < 0) & (df_m['DEGISIM_YUZDE'] > -2.0)
-        
-        # SENARYO C: "BASKILAMA / MAL TOPLAMA" (Ayı Tuzağı)
-        # Görüntü: Üstte çok satıcı var (Pasif < 0), gitmez bu hisse gibi.
-        # Gerçek: Aktif olarak alım yapılıyor (Aktif > 0).
-        # Anlamı: Tahtacı üste duvar örüp fiyatı tutuyor, alttan dökülenleri topluyor.
-        df_m['SINYAL_BASKILAMA'] = (df_m['PASIF_NET_LOT'] < 0) & (df_m['AKTIF_NET_LOT'] > 0)
-        
-        # Filtreleme
-        supheli_hisseler = df_m[df_m['SINYAL_WASH'] | df_m['SINYAL_SAHTE_DESTEK'] | df_m['SINYAL_BASKILAMA']].copy()
-        
-        # Etiketleme Fonksiyonu
-        def etiketle(row):
-            tespitler = []
-            if row['SINYAL_WASH']: tespitler.append("HACIM VAR YON YOK (Fake Hacim)")
-            if row['SINYAL_SAHTE_DESTEK']: tespitler.append("SAHTE DESTEK (Mal Cakma)")
-            if row['SINYAL_BASKILAMA']: tespitler.append("BASKILAMA (Mal Toplama)")
-            return " + ".join(tespitler)
-            
-        supheli_hisseler['MANIPULASYON_TURU'] = supheli_hisseler.apply(etiketle, axis=1)
-        
-        return supheli_hisseler[['SEMBOL', 'KAPANIS', 'DEGISIM_YUZDE', 'ROLATIF_HACIM', 'AKTIF_NET_LOT', 'PASIF_NET_LOT', 'MANIPULASYON_TURU']]
-
+        return analizler.manipulasyon_analizi(ana_dizin)
     except FileNotFoundError:
         print("HATA: Dosya bulunamadı.")
         return None
@@ -100,51 +39,62 @@ def manipulasyon_analizi(ana_dizin):
         return None
 
 # --- ANALİZİ BAŞLAT ---
-df_sonuc = manipulasyon_analizi(DOSYA_KONUMU)
+def calistir(ana_dizin=DOSYA_KONUMU, cikti_konumu=CIKTI_KONUMU):
+    """Analizi çalıştırır, raporları kaydeder ve sonuç tablosunu döndürür."""
+    df_sonuc = manipulasyon_analizi(ana_dizin)
+    profil.gecis('suzme')
 
-if df_sonuc is not None:
-    # Çıktı klasörünü kontrol et ve yoksa oluştur
-    if not os.path.exists(CIKTI_KONUMU):
-        os.makedirs(CIKTI_KONUMU)
-        print(f"✓ Çıktı klasörü oluşturuldu: {CIKTI_KONUMU}")
+    if df_sonuc is not None:
+        # Çıktı klasörünü kontrol et ve yoksa oluştur
+        if not os.path.exists(cikti_konumu):
+            os.makedirs(cikti_konumu)
+            print(f"✓ Çıktı klasörü oluşturuldu: {cikti_konumu}")
     
-    # Zaman damgası
-    zaman_damgasi = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Zaman damgası
+        zaman_damgasi = datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    # 1. BASKILANANLAR (TOPLANANLAR) - Yükseliş Adayı
-    toplananlar = df_sonuc[df_sonuc['MANIPULASYON_TURU'].str.contains("BASKILAMA")].sort_values(by='AKTIF_NET_LOT', ascending=False)
+        # 1. BASKILANANLAR (TOPLANANLAR) - Yükseliş Adayı
+        toplananlar = df_sonuc[df_sonuc['MANIPULASYON_TURU'].str.contains("BASKILAMA")].sort_values(by='AKTIF_NET_LOT', ascending=False)
     
-    print("\n" + "="*85)
-    print(" GİZLİCE TOPLANAN HİSSELER (BASKILAMA VAR - POZİTİF SİNYAL)")
-    print("="*85)
-    print(toplananlar.head(10).to_string(index=False))
+        print("\n" + "="*85)
+        print(" GİZLİCE TOPLANAN HİSSELER (BASKILAMA VAR - POZİTİF SİNYAL)")
+        print("="*85)
+        print(toplananlar.head(10).to_string(index=False))
     
-    # 2. SAHTE DESTEKLİLER (MAL ÇAKILANLAR) - Düşüş Adayı
-    cakilanlar = df_sonuc[df_sonuc['MANIPULASYON_TURU'].str.contains("SAHTE DESTEK")].sort_values(by='AKTIF_NET_LOT', ascending=True) # En çok satılan en üstte
+        # 2. SAHTE DESTEKLİLER (MAL ÇAKILANLAR) - Düşüş Adayı
+        cakilanlar = df_sonuc[df_sonuc['MANIPULASYON_TURU'].str.contains("SAHTE DESTEK")].sort_values(by='AKTIF_NET_LOT', ascending=True) # En çok satılan en üstte
     
-    print("\n" + "="*85)
-    print(" DİKKAT! TUZAK OLABİLİR (SAHTE DESTEK - NEGATİF SİNYAL)")
-    print("="*85)
-    print(cakilanlar.head(10).to_string(index=False))
+        print("\n" + "="*85)
+        print(" DİKKAT! TUZAK OLABİLİR (SAHTE DESTEK - NEGATİF SİNYAL)")
+        print("="*85)
+        print(cakilanlar.head(10).to_string(index=False))
 
-    # CSV olarak kaydet
-    # 1. Tüm Şüpheli Hisseler
-    tum_dosya = os.path.join(CIKTI_KONUMU, f'MANIPULASYON_TUM_{zaman_damgasi}.csv')
-    df_sonuc.to_csv(tum_dosya, index=False, encoding='utf-8-sig')
-    print(f"\n✓ Tüm manipülasyon tespitleri: {tum_dosya}")
+        # CSV olarak kaydet
+        # 1. Tüm Şüpheli Hisseler
+        tum_dosya = os.path.join(cikti_konumu, f'MANIPULASYON_TUM_{zaman_damgasi}.csv')
+        profil.rapor_yaz(df_sonuc, tum_dosya)
+        print(f"\n✓ Tüm manipülasyon tespitleri: {tum_dosya}")
     
-    # 2. Baskılananlar (Toplananlar)
-    toplanan_dosya = os.path.join(CIKTI_KONUMU, f'MANIPULASYON_BASKILAMA_{zaman_damgasi}.csv')
-    toplananlar.to_csv(toplanan_dosya, index=False, encoding='utf-8-sig')
-    print(f"✓ Baskılama tespitleri: {toplanan_dosya}")
+        # 2. Baskılananlar (Toplananlar)
+        toplanan_dosya = os.path.join(cikti_konumu, f'MANIPULASYON_BASKILAMA_{zaman_damgasi}.csv')
+        profil.rapor_yaz(toplananlar, toplanan_dosya)
+        print(f"✓ Baskılama tespitleri: {toplanan_dosya}")
     
-    # 3. Sahte Destekler
-    sahte_dosya = os.path.join(CIKTI_KONUMU, f'MANIPULASYON_SAHTE_DESTEK_{zaman_damgasi}.csv')
-    cakilanlar.to_csv(sahte_dosya, index=False, encoding='utf-8-sig')
-    print(f"✓ Sahte destek tespitleri: {sahte_dosya}")
+        # 3. Sahte Destekler
+        sahte_dosya = os.path.join(cikti_konumu, f'MANIPULASYON_SAHTE_DESTEK_{zaman_damgasi}.csv')
+        profil.rapor_yaz(cakilanlar, sahte_dosya)
+        print(f"✓ Sahte destek tespitleri: {sahte_dosya}")
 
-    print("\n[İPUCU]: 'BASKILAMA' tespit edilen hisselerde, yukarıdaki 'Satış Duvarı' kaldırıldığı an sert yükseliş başlayabilir.")
+        print("\n[İPUCU]: 'BASKILAMA' tespit edilen hisselerde, yukarıdaki 'Satış Duvarı' kaldırıldığı an sert yükseliş başlayabilir.")
     
-    print("\n" + "="*85)
-    print(" ANALİZ TAMAMLANDI - RAPORLAR CSV OLARAK KAYDEDİLDİ")
-    print("="*85)
\ No newline at end of file
+        print("\n" + "="*85)
+        print(" ANALİZ TAMAMLANDI - RAPORLAR CSV OLARAK KAYDEDİLDİ")
+        print("="*85)
+    
+    return df_sonuc
+
+
+if __name__ == '__main__':
+    # Komut satırından: python "<script>" [VERI_KLASORU] [CIKTI_KLASORU]
+    konsol_gunlugu()
+    calistir(*sys.argv[1:3])
\ No newline at end of file
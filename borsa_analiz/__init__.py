@@ -0,0 +1,41 @@
+"""
+================================================================================
+PAKET ADI   : borsa_analiz
+YAZAR       : Borsa (AI Assistant)
+
+AÇIKLAMA:
+Analiz scriptlerinin ortak kullandığı yardımcı katman. Analizlerin
+kendileri yan etkisiz fonksiyonlar olarak borsa_analiz.analizler
+paketindedir.
+================================================================================
+"""
+
+import importlib
+
+from .veri_paketi import DOSYALAR, VeriPaketi, veri_paketi_al
+from .derinlik_motoru import DerinlikMatrisi, derinlik_matrisi
+from .skor_motoru import skorla
+from .onbellek import Onbellek
+from .semboller import SembolSozlugu
+from .ozellikler import ozellik_al
+from .konsol import konsol_gunlugu
+from .siralama import ilk_n, sirali
+
+# Komut satırı da olan modüller (python -m borsa_analiz.gecmis ...) ilk
+# erişimde yüklenir; paketle birlikte yüklenirlerse -m ikinci bir kopyasını
+# çalıştırır (GecmisHatasi gibi sınıflar iki kez tanımlanır).
+_TEMBEL = {
+    'Defterler': 'emir_defteri',
+    'EmirDefteri': 'emir_defteri',
+    'AlimServisi': 'akis',
+    'GecmisDeposu': 'gecmis',
+}
+
+
+def __getattr__(ad):
+    if ad in _TEMBEL:
+        return getattr(importlib.import_module(f'.{_TEMBEL[ad]}', __name__), ad)
+    raise AttributeError(f"module {__name__!r} has no attribute {ad!r}")
+
+
+__all__ = ['DOSYALAR', 'VeriPaketi', 'veri_paketi_al', 'DerinlikMatrisi', 'derinlik_matrisi', 'skorla', 'Onbellek', 'SembolSozlugu', 'ozellik_al', 'konsol_gunlugu', 'ilk_n', 'sirali', 'Defterler', 'EmirDefteri', 'AlimServisi', 'GecmisDeposu']
@@ -0,0 +1,7 @@
+"""python -m borsa_analiz: toplu çalıştırıcının komut satırı (bkz. calistirici.py)."""
+
+import sys
+
+from .calistirici import ana
+
+sys.exit(ana())
\ No newline at end of file
@@ -0,0 +1,592 @@
+"""
+================================================================================
+MODÜL ADI   : Akış Alımı (asyncio ile Eşzamanlı Besleme Okuma)
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Analizlerin tek girdi yolu açılışta yapılan engelleyici pd.read_csv
+idi. AlimServisi derinlik güncellemelerini (bkz. emir_defteri.py),
+işlem akışını (KADEME_ANALIZI) ve bekleyen emirleri (BEKLEYEN_EMIRLER)
+yerel kaynaklardan aynı anda okur:
+- dosya_kaynagi: kayıtlı dosya (tekrar oynatma, istenirse 'hiz' satır/sn)
+  veya takip=True ile sonuna yazıldıkça okunan dosya (tail -f),
+- soket_kaynagi: UNIX soket yolu veya (host, port).
+
+Her akışın her abonesi (tüketicisi) kendi sınırlı kuyruğuna sahiptir:
+- BEKLE: sıralı (FIFO) kuyruk. Dolunca o akışın okuyucusu bekler (geri
+  basınç); güncelleme kaybolmaz. Artımlı akışlar (derinlik) için.
+- SON: sembol başına son satırı tutan kuyruk. Aynı sembolün yeni satırı
+  kuyruktaki eskisinin yerine geçer (birleştirme); okuyucu sadece
+  kuyruktaki farklı sembol sayısı kapasiteye ulaşırsa bekler. Tam satır
+  gönderen akışlar (kademe, bekleyen) için.
+Yavaş bir tüketici (ör. skorlama) SON politikasıyla abone olursa kendi
+kuyruğunda birleştirme yapar; derinlik akışının kuyruğunu ve okuyucusunu
+bekletmez. Ağır (pandas) tüketiciler is_parcacigi=True ile thread'de
+çalıştırılır, olay döngüsü okumaya devam eder.
+
+METRİKLER:
+AlimServisi.metrikler() akış / abone başına okunan, işlenen, kuyrukta
+bekleyen, birleşen satır sayılarını, okuyucunun geri basınçla beklediği
+süreyi ve gecikmeyi (satırın okunmasından işlenmesinin bitmesine kadar
+geçen süre: son / ortalama / en büyük) tablo olarak verir.
+
+KULLANIM:
+    python -m borsa_analiz.akis --derinlik KAYIT.csv --kademe kademe.csv \\
+        --bekleyen unix:/tmp/bekleyen.sock --snapshot VERI_KLASORU --takip
+================================================================================
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import threading
+import time
+from collections import namedtuple
+from itertools import islice
+
+import pandas as pd
+
+from . import analizler
+from .emir_defteri import Defterler, satir_coz
+from .konsol import konsol_gunlugu
+from .siralama import ilk_n
+from .veri_paketi import VeriPaketi
+
+gunluk = logging.getLogger('borsa_analiz.akis')  # -m ile __main__ olarak da çalışır
+
+BEKLE, SON = 'bekle', 'son'
+
+KUYRUK_KAPASITESI = 10000
+TOPLU = 512             # Tüketicinin bir çağrıda aldığı en fazla satır
+DEVIR = 256             # Okuyucu bu kadar satırda bir olay döngüsüne sıra verir
+
+TabloSatiri = namedtuple('TabloSatiri', ['dosya', 'sembol', 'degerler'])
+
+KADEME_SUTUNLARI = ['SEMBOL', 'TOPLAM', 'AORT', 'ALIS', 'SATIS', 'FARK']
+BEKLEYEN_SUTUNLARI = ['SEMBOL', 'NET.EMIR.FARKI']
+
+METRIK_SUTUNLARI = ['AKIS', 'ABONE', 'POLITIKA', 'OKUNAN', 'HATALI_SATIR', 'ISLENEN', 'KUYRUKTA',
+                    'BIRLESEN', 'URETICI_BEKLEME_SN', 'SON_GECIKME_MS', 'ORT_GECIKME_MS',
+                    'MAKS_GECIKME_MS', 'ISLEME_SN', 'HATA']
+
+
+class AkisHatasi(Exception):
+    pass
+
+
+# --- SATIR ÇÖZÜCÜLER ---
+def tablo_cozucu(dosya_adi, sutunlar):
+    """Tam satır akışı ('SEMBOL,...' CSV satırı) için çözücü; başlık ve boş satırlar None."""
+    def coz(satir):
+        satir = satir.strip()
+        if not satir or satir.startswith('#'):
+            return None
+        parcalar = [p.strip() for p in satir.split(',')]
+        if parcalar[0] == 'SEMBOL':
+            return None
+        if len(parcalar) != len(sutunlar):
+            raise AkisHatasi(f"{dosya_adi}: {len(sutunlar)} alan bekleniyordu: {satir!r}")
+        return TabloSatiri(dosya_adi, parcalar[0], tuple(parcalar[1:]))
+    return coz
+
+
+# Akış türü -> (satır çözücü, artımlı mı?)
+# Artımlı akışın satırları birleştirilemez (SON politikası kullanılamaz).
+AKIS_TURLERI = {
+    'derinlik': (satir_coz, True),
+    'kademe': (tablo_cozucu('KADEME_ANALIZI.csv', KADEME_SUTUNLARI), False),
+    'bekleyen': (tablo_cozucu('BEKLEYEN_EMIRLER.csv', BEKLEYEN_SUTUNLARI), False),
+}
+
+
+# --- KAYNAKLAR ---
+async def dosya_kaynagi(yol, takip=False, hiz=None, aralik=0.2):
+    """Dosyayı satır satır okur.
+
+    takip=True: dosya sonuna gelince 'aralik' saniye bekleyip yeni yazılan
+    satırları okumaya devam eder; yarım yazılmış son satır tamamlanınca verilir.
+    hiz: kayıt tekrar oynatılırken saniyedeki satır sayısı (None: beklemeden).
+    """
+    baslangic = time.monotonic()
+    sayi = 0
+    yarim = ''
+    with open(yol, encoding='utf-8') as f:
+        while True:
+            satir = f.readline()
+            if not satir or not satir.endswith('\n'):
+                if not takip:
+                    if yarim + satir:
+                        yield yarim + satir
+                    return
+                yarim += satir
+                await asyncio.sleep(aralik)
+                continue
+            yield yarim + satir
+            yarim = ''
+            sayi += 1
+            if hiz:
+                gecikme = sayi / hiz - (time.monotonic() - baslangic)
+                if gecikme > 0:
+                    await asyncio.sleep(gecikme)
+
+
+async def soket_kaynagi(adres):
+    """Yerel sokete bağlanıp gelen satırları okur (adres: UNIX yolu veya (host, port))."""
+    if isinstance(adres, str):
+        okuyucu, yazici = await asyncio.open_unix_connection(adres)
+    else:
+        okuyucu, yazici = await asyncio.open_connection(*adres)
+    try:
+        async for satir in okuyucu:
+            yield satir.decode('utf-8')
+    finally:
+        yazici.close()
+
+
+def kaynak_ac(tanim, takip=False, hiz=None):
+    """'unix:YOL', 'tcp:HOST:PORT' veya dosya yolu tanımından kaynak üretir."""
+    if tanim.startswith('unix:'):
+        return soket_kaynagi(tanim[len('unix:'):])
+    if tanim.startswith('tcp:'):
+        host, _, port = tanim[len('tcp:'):].rpartition(':')
+        return soket_kaynagi((host or 'localhost', int(port)))
+    return dosya_kaynagi(tanim, takip=takip, hiz=hiz)
+
+
+# --- KUYRUKLAR ---
+_KAPAT = object()
+
+
+class SiraliKuyruk:
+    """Sınırlı FIFO kuyruk; dolduğunda koy() yer açılana kadar bekler."""
+
+    politika = BEKLE
+
+    def __init__(self, kapasite=KUYRUK_KAPASITESI):
+        self._kuyruk = asyncio.Queue(kapasite)
+        self._kapandi = False
+        self._isaretli = False      # Kapanış işareti kuyrukta mı?
+        self.birlesen = 0
+        self.bekleme_sn = 0.0       # Okuyucunun kuyruk dolu diye beklediği toplam süre
+
+    def __len__(self):
+        return self._kuyruk.qsize() - self._isaretli
+
+    async def koy(self, zaman, kayit):
+        if self._kuyruk.full():
+            baslangic = time.monotonic()
+            await self._kuyruk.put((zaman, kayit))
+            self.bekleme_sn += time.monotonic() - baslangic
+        else:
+            self._kuyruk.put_nowait((zaman, kayit))
+
+    async def al(self, en_fazla):
+        """En az bir, en fazla 'en_fazla' (zaman, kayıt); kuyruk kapandıysa ve boşsa []."""
+        if self._kapandi and self._kuyruk.empty():
+            return []
+        oge = await self._kuyruk.get()
+        ogeler = []
+        while oge is not _KAPAT:
+            ogeler.append(oge)
+            if len(ogeler) >= en_fazla or self._kuyruk.empty():
+                return ogeler
+            oge = self._kuyruk.get_nowait()
+        self._isaretli = False
+        return ogeler
+
+    def kapat(self):
+        # Bekleyen al()'ı uyandırmak için işaret; kuyruk doluysa gerek yok
+        self._kapandi = True
+        if not self._kuyruk.full():
+            self._kuyruk.put_nowait(_KAPAT)
+            self._isaretli = True
+
+
+class SonDegerKuyrugu:
+    """Sembol başına son kaydı tutan sınırlı kuyruk.
+
+    Kuyruktaki bir sembol için gelen yeni kayıt eskisinin yerine geçer ve
+    sırasını / ilk geliş zamanını korur; gecikme, sembolün işlenmemiş en
+    eski verisinden ölçülür.
+    """
+
+    politika = SON
+
+    def __init__(self, kapasite=KUYRUK_KAPASITESI):
+        self.kapasite = kapasite
+        self._ogeler = {}           # Sembol -> (zaman, kayıt), geliş sırasıyla
+        self._veri_var = asyncio.Event()
+        self._yer_var = asyncio.Event()
+        self._kapandi = False
+        self.birlesen = 0
+        self.bekleme_sn = 0.0
+
+    def __len__(self):
+        return len(self._ogeler)
+
+    async def koy(self, zaman, kayit):
+        eski = self._ogeler.get(kayit.sembol)
+        if eski is not None:
+            self._ogeler[kayit.sembol] = (eski[0], kayit)
+            self.birlesen += 1
+            return
+        if len(self._ogeler) >= self.kapasite:
+            baslangic = time.monotonic()
+            while len(self._ogeler) >= self.kapasite:
+                self._yer_var.clear()
+                await self._yer_var.wait()
+            self.bekleme_sn += time.monotonic() - baslangic
+        self._ogeler[kayit.sembol] = (zaman, kayit)
+        self._veri_var.set()
+
+    async def al(self, en_fazla):
+        while not self._ogeler:
+            if self._kapandi:
+                return []
+            self._veri_var.clear()
+            await self._veri_var.wait()
+        ogeler = [self._ogeler.pop(sembol) for sembol in list(islice(self._ogeler, en_fazla))]
+        self._yer_var.set()
+        return ogeler
+
+    def kapat(self):
+        self._kapandi = True
+        self._veri_var.set()
+
+
+KUYRUKLAR = {BEKLE: SiraliKuyruk, SON: SonDegerKuyrugu}
+
+
+# --- AKIŞ VE ABONE ---
+class Akis:
+    def __init__(self, ad, kaynak, tur=None):
+        tur = tur or ad
+        if tur not in AKIS_TURLERI:
+            raise AkisHatasi(f"Bilinmeyen akış türü: {tur} (geçerli: {', '.join(AKIS_TURLERI)})")
+        self.ad = ad
+        self.tur = tur
+        self.kaynak = kaynak
+        self.cozucu, self.artimli = AKIS_TURLERI[tur]
+        self.aboneler = []
+        self.okunan = 0
+        self.hatali = 0
+        self.hata = None
+        self.bitti = False
+
+    def __repr__(self):
+        return f"Akis({self.ad!r}, tur={self.tur!r}, okunan={self.okunan})"
+
+    async def oku(self):
+        """Kaynağı sonuna kadar okuyup her satırı bütün abonelerin kuyruğuna koyar."""
+        try:
+            async for satir in self.kaynak:
+                try:
+                    kayit = self.cozucu(satir)
+                except Exception as e:
+                    self.hatali += 1
+                    gunluk.warning(f"{self.ad}: {e}")
+                    continue
+                if kayit is None:
+                    continue
+                zaman = time.monotonic()
+                self.okunan += 1
+                for abone in self.aboneler:
+                    await abone.kuyruk.koy(zaman, kayit)
+                if self.okunan % DEVIR == 0:
+                    await asyncio.sleep(0)
+        except Exception as e:
+            # Bir kaynağın kopması diğer akışları durdurmaz
+            self.hata = e
+            gunluk.error(f"{self.ad}: kaynak okunamadı ({e})")
+        finally:
+            self.bitti = True
+            for abone in self.aboneler:
+                abone.kuyruk.kapat()
+
+
+class Abone:
+    def __init__(self, akis, ad, isleyici, kuyruk, toplu=TOPLU, is_parcacigi=False):
+        self.akis = akis
+        self.ad = ad
+        self.isleyici = isleyici    # isleyici(kayitlar): bir grup kaydı işler
+        self.kuyruk = kuyruk
+        self.toplu = toplu
+        self.is_parcacigi = is_parcacigi
+        self.islenen = 0
+        self.hata = 0
+        self.isleme_sn = 0.0
+        self.son_gecikme = 0.0
+        self.maks_gecikme = 0.0
+        self._toplam_gecikme = 0.0
+
+    def __repr__(self):
+        return f"Abone({self.akis.ad}/{self.ad}, {self.kuyruk.politika}, islenen={self.islenen})"
+
+    async def tuket(self):
+        """Kuyruk kapanıp boşalana kadar kayıtları gruplar halinde işler."""
+        while True:
+            ogeler = await self.kuyruk.al(self.toplu)
+            if not ogeler:
+                return
+            kayitlar = [kayit for _, kayit in ogeler]
+            baslangic = time.monotonic()
+            try:
+                if self.is_parcacigi:
+                    await asyncio.to_thread(self.isleyici, kayitlar)
+                else:
+                    self.isleyici(kayitlar)
+            except Exception as e:
+                self.hata += 1
+                gunluk.error(f"{self.akis.ad}/{self.ad}: {e}")
+            bitis = time.monotonic()
+            self.isleme_sn += bitis - baslangic
+            self.islenen += len(ogeler)
+            for zaman, _ in ogeler:
+                self._toplam_gecikme += bitis - zaman
+            self.son_gecikme = bitis - ogeler[-1][0]
+            self.maks_gecikme = max(self.maks_gecikme, bitis - ogeler[0][0])
+
+    def metrik(self):
+        ms = 1000.0
+        return [self.akis.ad, self.ad, self.kuyruk.politika, self.akis.okunan, self.akis.hatali,
+                self.islenen, len(self.kuyruk), self.kuyruk.birlesen, round(self.kuyruk.bekleme_sn, 3),
+                round(self.son_gecikme * ms, 2),
+                round(self._toplam_gecikme / self.islenen * ms, 2) if self.islenen else 0.0,
+                round(self.maks_gecikme * ms, 2), round(self.isleme_sn, 3), self.hata]
+
+
+# --- SERVİS ---
+class AlimServisi:
+    def __init__(self):
+        self.akislar = {}
+        self._gorevler = []
+
+    def __repr__(self):
+        return f"AlimServisi(akislar={list(self.akislar)})"
+
+    def akis_ekle(self, ad, kaynak, tur=None):
+        """Akış ekler. kaynak: satır veren async iterable (bkz. kaynak_ac); tur varsayılan olarak ad."""
+        if ad in self.akislar:
+            raise AkisHatasi(f"Akış zaten tanımlı: {ad}")
+        self.akislar[ad] = Akis(ad, kaynak, tur)
+        return self.akislar[ad]
+
+    def abone_ol(self, akis, ad, isleyici, politika=BEKLE, kapasite=KUYRUK_KAPASITESI,
+                 toplu=TOPLU, is_parcacigi=False):
+        """Akışa isleyici(kayitlar) çağıran bir tüketici bağlar.
+
+        Artımlı akışlar (derinlik) sadece BEKLE politikasıyla dinlenebilir;
+        satır kaybı defteri bozar.
+        """
+        akis = self.akislar[akis]
+        if politika not in KUYRUKLAR:
+            raise AkisHatasi(f"Geçersiz politika: {politika}")
+        if politika == SON and akis.artimli:
+            raise AkisHatasi(f"{akis.ad} artımlı bir akış; satırları birleştirilemez ({SON}).")
+        abone = Abone(akis, ad, isleyici, KUYRUKLAR[politika](kapasite), toplu, is_parcacigi)
+        akis.aboneler.append(abone)
+        return abone
+
+    def aboneler(self):
+        return [abone for akis in self.akislar.values() for abone in akis.aboneler]
+
+    async def calistir(self, sure=None):
+        """Akışları okuyup tüketicileri çalıştırır.
+
+        Bütün kaynaklar bitip kuyruklar boşalınca (veya 'sure' saniye
+        dolunca / durdur() çağrılınca) döner.
+        """
+        self._gorevler = ([asyncio.create_task(akis.oku()) for akis in self.akislar.values()]
+                          + [asyncio.create_task(abone.tuket()) for abone in self.aboneler()])
+        try:
+            await asyncio.wait_for(asyncio.gather(*self._gorevler), sure)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            pass
+        finally:
+            for gorev in self._gorevler:
+                gorev.cancel()
+            await asyncio.gather(*self._gorevler, return_exceptions=True)
+        return self.metrikler()
+
+    def durdur(self):
+        for gorev in self._gorevler:
+            gorev.cancel()
+
+    def metrikler(self):
+        return pd.DataFrame([abone.metrik() for abone in self.aboneler()], columns=METRIK_SUTUNLARI)
+
+
+# --- HAZIR TÜKETİCİLER ---
+class SonDurum:
+    """Tam satır akışlarının sembol başına son satırı (dosya -> sembol -> değerler).
+
+    Birden fazla abone (kademe, bekleyen) aynı nesneyi paylaşabilir.
+    Akış sadece değişen sembolleri gönderir; tohumla() ile snapshot
+    tabloları başlangıç durumu yapılmazsa tablolar akışta görünen
+    sembollerden ibaret kalır.
+    """
+
+    SUTUNLAR = {'KADEME_ANALIZI.csv': KADEME_SUTUNLARI, 'BEKLEYEN_EMIRLER.csv': BEKLEYEN_SUTUNLARI}
+
+    def __init__(self):
+        self.satirlar = {}
+        self._kilit = threading.Lock()
+
+    def __call__(self, kayitlar):
+        with self._kilit:
+            for kayit in kayitlar:
+                self.satirlar.setdefault(kayit.dosya, {})[kayit.sembol] = kayit.degerler
+
+    def tohumla(self, paket):
+        """Paketteki snapshot tablolarını (KADEME_ANALIZI, BEKLEYEN_EMIRLER) başlangıç durumu yapar.
+
+        Akıştan daha önce gelmiş satırların üzerine yazılmaz. Pakette
+        okunmamış akış sütunları boş (NaN) kalır.
+        """
+        for dosya_adi, sutunlar in self.SUTUNLAR.items():
+            if not paket.var_mi(dosya_adi):
+                continue
+            df = paket.oku(dosya_adi)
+            degerler = df.reindex(columns=sutunlar[1:]).itertuples(index=False, name=None)
+            with self._kilit:
+                satirlar = self.satirlar.setdefault(dosya_adi, {})
+                for sembol, satir in zip(df['SEMBOL'].astype(str), degerler):
+                    satirlar.setdefault(sembol, satir)
+        return self
+
+    def tablo(self, dosya_adi):
+        """Dosyanın güncel hali; sayısal sütunlar read_csv'deki gibi çıkarılır."""
+        with self._kilit:
+            satirlar = dict(self.satirlar.get(dosya_adi, {}))
+        sutunlar = self.SUTUNLAR[dosya_adi]
+        df = pd.DataFrame(list(satirlar.values()), columns=sutunlar[1:])
+        for sutun in sutunlar[1:]:
+            df[sutun] = pd.to_numeric(df[sutun], errors='coerce')
+        df.insert(0, 'SEMBOL', list(satirlar))
+        return df
+
+    def pakete_koy(self, paket):
+        for dosya_adi in list(self.satirlar):
+            paket.tablo_koy(dosya_adi, self.tablo(dosya_adi))
+        return paket
+
+
+class AnalizTuketicisi:
+    """Tam satır akışlarını SonDurum'da toplayıp bir analizi güncel tablolarla yeniden çalıştırır.
+
+    Durum paketin snapshot tablolarıyla tohumlanır; akıştaki satırlar
+    bunların üzerine yazılır. Akıştan gelmeyen dosyalar (fiyatlar vb.)
+    paketin klasöründen okunur.
+    Ağır olduğu için SON politikası ve is_parcacigi=True ile bağlanmalıdır.
+    """
+
+    def __init__(self, paket, ad, durum=None):
+        if ad not in analizler.ANALIZ_FONKSIYONLARI:
+            raise AkisHatasi(f"Bilinmeyen analiz: {ad}")
+        self.paket = paket
+        self.ad = ad
+        self.durum = (durum or SonDurum()).tohumla(paket)
+        self.sonuc = None
+        self.tur = 0
+        self._kilit = threading.Lock()
+
+    def __call__(self, kayitlar):
+        with self._kilit:
+            self.durum(kayitlar)
+            self.durum.pakete_koy(self.paket)
+            self.sonuc = analizler.ANALIZ_FONKSIYONLARI[self.ad](self.paket)
+            self.tur += 1
+
+
+def defter_isleyici(defterler):
+    """Derinlik akışını emir defterlerine uygulayan işleyici."""
+    return defterler.hepsini_uygula
+
+
+# --- KOMUT SATIRI ---
+async def _calistir(servis, sure, rapor):
+    async def raporla():
+        while True:
+            await asyncio.sleep(rapor)
+            for satir in servis.metrikler().itertuples(index=False):
+                gunluk.info(f"{satir.AKIS}/{satir.ABONE}: {satir.ISLENEN}/{satir.OKUNAN} işlendi, "
+                            f"kuyrukta {satir.KUYRUKTA}, gecikme {satir.SON_GECIKME_MS} ms")
+
+    gorev = asyncio.create_task(raporla()) if rapor else None
+    try:
+        return await servis.calistir(sure)
+    finally:
+        if gorev is not None:
+            gorev.cancel()
+
+
+def ana(argumanlar=None):
+    ayristirici = argparse.ArgumentParser(
+        prog='python -m borsa_analiz.akis',
+        description="Derinlik, kademe ve bekleyen emir akışlarını eşzamanlı okur.")
+    kaynak_yardimi = "Dosya yolu, unix:YOL veya tcp:HOST:PORT"
+    ayristirici.add_argument('--derinlik', metavar='KAYNAK', help=f"Kademe güncellemeleri. {kaynak_yardimi}")
+    ayristirici.add_argument('--kademe', metavar='KAYNAK', help=f"KADEME_ANALIZI satırları. {kaynak_yardimi}")
+    ayristirici.add_argument('--bekleyen', metavar='KAYNAK', help=f"BEKLEYEN_EMIRLER satırları. {kaynak_yardimi}")
+    ayristirici.add_argument('--snapshot', metavar='KLASOR',
+                             help="Başlangıç defterleri ve analizin akışta olmayan dosyaları")
+    ayristirici.add_argument('--analiz', default='kademe_denge_analizi', metavar='AD',
+                             choices=list(analizler.ANALIZ_FONKSIYONLARI),
+                             help="Kademe / bekleyen akışıyla güncellenecek analiz (--snapshot gerekir)")
+    ayristirici.add_argument('--takip', action='store_true', help="Dosyaları sonuna yazıldıkça okumaya devam et")
+    ayristirici.add_argument('--hiz', type=float, help="Kayıtları saniyede bu kadar satırla oynat")
+    ayristirici.add_argument('--kapasite', type=int, default=KUYRUK_KAPASITESI, help="Kuyruk kapasitesi")
+    ayristirici.add_argument('--sure', type=float, help="Bu kadar saniye sonra dur")
+    ayristirici.add_argument('--rapor', type=float, default=5.0, help="Metrik raporu aralığı (saniye, 0: kapalı)")
+    ayristirici.add_argument('--ilk', type=int, default=15, help="Gösterilecek satır sayısı")
+    secenekler = ayristirici.parse_args(argumanlar)
+
+    tanimlar = {ad: getattr(secenekler, ad) for ad in AKIS_TURLERI if getattr(secenekler, ad)}
+    if not tanimlar:
+        ayristirici.error("En az bir akış (--derinlik, --kademe, --bekleyen) verilmeli.")
+
+    konsol_gunlugu()
+    # Analiz her güncellemede tekrar çalışır; eksik sembol bilgileri konsolu doldurmasın
+    logging.getLogger('borsa_analiz.analizler').setLevel(logging.WARNING)
+    servis = AlimServisi()
+    for ad, tanim in tanimlar.items():
+        servis.akis_ekle(ad, kaynak_ac(tanim, secenekler.takip, secenekler.hiz))
+
+    defterler = None
+    if 'derinlik' in tanimlar:
+        defterler = Defterler.tablodan(secenekler.snapshot) if secenekler.snapshot else Defterler()
+        servis.abone_ol('derinlik', 'defter', defter_isleyici(defterler), kapasite=secenekler.kapasite)
+
+    durum = SonDurum()
+    tablo_akislari = [ad for ad in tanimlar if not AKIS_TURLERI[ad][1]]
+    tuketici = None
+    if secenekler.snapshot and tablo_akislari:
+        tuketici = AnalizTuketicisi(VeriPaketi(secenekler.snapshot), secenekler.analiz, durum)
+    for ad in tablo_akislari:
+        if tuketici is not None:
+            servis.abone_ol(ad, secenekler.analiz, tuketici, politika=SON,
+                            kapasite=secenekler.kapasite, is_parcacigi=True)
+        else:
+            servis.abone_ol(ad, 'son_durum', durum, politika=SON, kapasite=secenekler.kapasite)
+
+    try:
+        metrikler = asyncio.run(_calistir(servis, secenekler.sure, secenekler.rapor))
+    except KeyboardInterrupt:
+        print("\nAkış alımı durduruldu.")
+        metrikler = servis.metrikler()
+
+    print(metrikler.to_string(index=False))
+    if defterler is not None:
+        print(f"\n{len(defterler)} sembol defteri güncel.")
+        df = defterler.ozet_tablosu(sadece_degisenler=True)
+        print(ilk_n(df, 'DERINLIK_ORANI', secenekler.ilk).to_string(index=False))
+    if tuketici is not None and tuketici.sonuc is not None:
+        print(f"\n{secenekler.analiz} ({tuketici.tur} kez güncellendi):")
+        print(tuketici.sonuc.head(secenekler.ilk).to_string(index=False))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(ana())
\ No newline at end of file
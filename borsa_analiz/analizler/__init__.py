@@ -0,0 +1,53 @@
+"""
+================================================================================
+PAKET ADI   : borsa_analiz.analizler
+YAZAR       : Borsa (AI Assistant)
+
+AÇIKLAMA:
+15 analizin saf fonksiyon halleri. Her fonksiyon bir veri klasörü yolu
+veya hazır bir VeriPaketi alır, sonuç tablosunu (pd.DataFrame) döndürür:
+- Ekrana yazmaz, dosya kaydetmez; raporlama scriptlerin işidir.
+- Analiz yapılamıyorsa hata yükseltir (eksik dosya: FileNotFoundError,
+  eksik sütun: AnalizHatasi); None döndürmez.
+- Düşen semboller ve benzeri notlar 'logging' ile bildirilir
+  (bkz. konsol.konsol_gunlugu).
+İçe aktarmanın yan etkisi yoktur: dosya okunmaz, ekrana bir şey yazılmaz.
+
+KULLANIM:
+    from borsa_analiz import VeriPaketi
+    from borsa_analiz.analizler import wapd_analizi
+    df = wapd_analizi(VeriPaketi(klasor))
+================================================================================
+"""
+
+
+class AnalizHatasi(Exception):
+    """Girdi dosyası var ama analiz için gereken sütunlar eksik."""
+
+
+from .acilis_istahi import acilis_istahi_analizi  # noqa: E402
+from .buyuk_tarama import buyuk_tarama_robotu  # noqa: E402
+from .destek import destek_analizi  # noqa: E402
+from .direnc import direnc_analizi  # noqa: E402
+from .guclu_talep import guclu_talep_analizi  # noqa: E402
+from .kademe_denge import kademe_denge_analizi  # noqa: E402
+from .kritik_destek import kritik_destek_analizi  # noqa: E402
+from .kritik_direnc import kritik_direnc_analizi  # noqa: E402
+from .kurumsal_maliyet import kurumsal_maliyet_analizi  # noqa: E402
+from .likidite_duvari import likidite_duvari_analizi  # noqa: E402
+from .otomatik_derinlik import otomatik_derinlik_analizi  # noqa: E402
+from .spread import spread_analizi  # noqa: E402
+from .sikisma import sikisma_analizi  # noqa: E402
+from .manipulasyon import manipulasyon_analizi  # noqa: E402
+from .wapd import wapd_analizi  # noqa: E402
+
+# Analiz adı (sema.ANALIZ_SUTUNLARI anahtarı) -> fonksiyon
+ANALIZ_FONKSIYONLARI = {f.__name__: f for f in (
+    acilis_istahi_analizi, buyuk_tarama_robotu, destek_analizi, direnc_analizi,
+    guclu_talep_analizi, kademe_denge_analizi, kritik_destek_analizi,
+    kritik_direnc_analizi, kurumsal_maliyet_analizi, likidite_duvari_analizi,
+    otomatik_derinlik_analizi, spread_analizi, sikisma_analizi,
+    manipulasyon_analizi, wapd_analizi,
+)}
+
+__all__ = ['AnalizHatasi', 'ANALIZ_FONKSIYONLARI'] + list(ANALIZ_FONKSIYONLARI)
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""
+================================================================================
+MODÜL ADI   : Açılış İştahı ve Gap Analizi
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Gap (açılış - önceki kapanış) ve açılıştan bu yana performans (%).
+İştah Puanı bu ikisinin toplamıdır.
+Script: 'Açılış İştahı ve Gap Analizi.py'
+================================================================================
+"""
+
+from .. import veri_paketi_al
+from ..semboller import sembol_metne
+from ..sonuc_onbellegi import onbellekli
+
+
+@onbellekli
+def acilis_istahi_analizi(veri):
+    """Hisse başına GAP_YUZDE, ACILIS_PERFORMANSI_YUZDE ve ISTAH_PUANI sütunlarını ekler.
+
+    veri: klasör yolu veya VeriPaketi. ACILISLAR-1.csv yoksa FileNotFoundError.
+    """
+    paket = veri_paketi_al(veri, 'acilis_istahi_analizi')
+    
+    if paket.var_mi('ACILISLAR-1.csv'):
+        df = paket.oku('ACILISLAR-1.csv')
+    else:
+        raise FileNotFoundError(f"{paket.yol('ACILISLAR-1.csv')} dosyası bulunamadı!")
+    
+    # HESAPLAMALAR
+    # 1. GAP (Boşluk): Açılış - Önceki Kapanış
+    if 'KAPANIS-1' in df.columns:
+        df['GAP_YUZDE'] = ((df['ACILIS'] - df['KAPANIS-1']) / df['KAPANIS-1']) * 100
+    else:
+        df['GAP_YUZDE'] = 0
+        
+    # 2. PERFORMANS: Şu Anki Fiyat - Açılış Fiyatı
+    df['ACILIS_PERFORMANSI_YUZDE'] = ((df['KAPANIS'] - df['ACILIS']) / df['ACILIS']) * 100
+    
+    # 3. İŞTAH SKORU
+    df['ISTAH_PUANI'] = df['GAP_YUZDE'] + df['ACILIS_PERFORMANSI_YUZDE']
+    
+    return sembol_metne(df)
\ No newline at end of file
@@ -0,0 +1,76 @@
+"""
+================================================================================
+MODÜL ADI   : Büyük Tarama ve Skorlama
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Maliyet, kademe, fiyat, bekleyen emir ve derinlik dosyalarını sembol
+kimlikleriyle birleştirip skor_motoru ile 0-100 arası puanlar.
+Script: 'BÜYÜK TARAMA VE SKORLAMA.py'
+================================================================================
+"""
+
+import logging
+
+from .. import veri_paketi_al
+from ..ozellikler import ozellik_al
+from ..skor_motoru import skorla
+from ..sonuc_onbellegi import onbellekli
+
+gunluk = logging.getLogger(__name__)
+
+
+@onbellekli
+def buyuk_tarama_robotu(veri):
+    """Fiyat, pivot, derinlik ve kademe verisini birleştirip skorlanmış tabloyu döndürür.
+
+    Sıralama ve ilk 20 seçimi çağırana bırakılır (bkz. skor_motoru.skorla).
+    """
+    # Veri Paketi (Her dosya ilk kullanımda bir kez okunur)
+    paket = veri_paketi_al(veri, 'buyuk_tarama_robotu')
+    
+    # --- VERİLERİ OKU ---
+    # 1. Maliyet Verisi (Balina)
+    df_maliyet = paket.oku('MALIYET_ALICI-1.csv')[['SEMBOL', 'ENIYI ALICI.1', 'NET ADET', 'MALIYET']]
+    df_maliyet.rename(columns={'ENIYI ALICI.1': 'BALINA_ADI', 'NET ADET': 'BALINA_LOT', 'MALIYET': 'BALINA_MALIYET'}, inplace=True)
+    
+    # 2. Kademe Verisi (Trend)
+    df_kademe = paket.oku('KADEME_ANALIZI.csv')[['SEMBOL', 'TOPLAM', 'AORT', 'ALIS', 'SATIS']]
+    df_kademe.rename(columns={'TOPLAM': 'TOPLAM_ISLEM_LOT', 'ALIS': 'AKTIF_ALIS', 'SATIS': 'AKTIF_SATIS'}, inplace=True)
+    
+    # 3. Fiyat Verisi (Kapanış & Pivot)
+    df_fiyat = paket.oku('ACILISLAR-1.csv')[['SEMBOL', 'KAPANIS', 'YUKSEK', 'DUSUK']]
+    # Pivot Hesabı: (Yüksek + Düşük + Kapanış) / 3
+    df_fiyat['PIVOT'] = ozellik_al(paket, 'PIVOT')
+    
+    # 4. Bekleyen Emir (Teorik Niyet Simülasyonu)
+    df_bekleyen = paket.oku('BEKLEYEN_EMIRLER.csv')[['SEMBOL', 'NET.EMIR.FARKI']]
+    
+    # 5. Derinlik Verisi (Destek)
+    # Derinlik dosyalarını oku ve toplam lotları hesapla (Satır bazlı)
+    df_d_alis = paket.oku('DERINLIK_ALIS-1.csv')
+    df_d_satis = paket.oku('DERINLIK_SATIS-1.csv')
+    
+    # Alış toplamı (bütün ADET sütunları, bkz. ozellikler.py)
+    df_d_alis['TOPLAM_DERINLIK_ALIS'] = ozellik_al(paket, 'TOPLAM_DERINLIK_ALIS')
+    
+    # Satış toplamı
+    df_d_satis['TOPLAM_DERINLIK_SATIS'] = ozellik_al(paket, 'TOPLAM_DERINLIK_SATIS')
+    
+    # --- BİRLEŞTİRME (SEMBOL KİMLİKLERİYLE) ---
+    # Metin 'SEMBOL' üzerinden merge yerine paketin ortak sözlüğündeki kimliklerle dizi indeksleme
+    sozluk = paket.sembol_sozlugu()
+    df = sozluk.birlestir(df_maliyet, df_kademe, 'inner', 'KADEME_ANALIZI.csv')
+    df = sozluk.birlestir(df, df_fiyat, 'inner', 'ACILISLAR-1.csv')
+    df = sozluk.birlestir(df, df_bekleyen, 'left')
+    df = sozluk.birlestir(df, df_d_alis[['SEMBOL', 'TOPLAM_DERINLIK_ALIS']], 'left')
+    df = sozluk.birlestir(df, df_d_satis[['SEMBOL', 'TOPLAM_DERINLIK_SATIS']], 'left')
+    
+    # Taramaya alınamayan (Kademe / Fiyat verisi olmayan) hisseler
+    for satir in sozluk.dusen_raporu():
+        gunluk.info(satir)
+    
+    # --- PUANLAMA MOTORU ---
+    # Kurallar satır satır değil, sütun maskeleri olarak tek seferde hesaplanır (bkz. skor_motoru)
+    return skorla(df)
\ No newline at end of file
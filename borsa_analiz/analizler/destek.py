@@ -0,0 +1,42 @@
+"""
+================================================================================
+MODÜL ADI   : Destek (Alış Duvarı) Tespiti
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+İlk N alış kademesindeki en yüklü kademe (Major Destek) ve fiyatı
+dolu kademelerin toplam lotu (Duvarın Kalınlığı).
+Script: 'Destek (Alış Duvarı) Tespit.py'
+================================================================================
+"""
+
+import pandas as pd
+
+from .. import veri_paketi_al
+from ..derinlik_motoru import derinlik_matrisi
+from ..sonuc_onbellegi import onbellekli
+
+KADEME_DERINLIGI = 14
+
+
+@onbellekli
+def destek_analizi(veri, derinlik_siniri=KADEME_DERINLIGI):
+    """Her hisse için en güçlü alış kademesi (fiyat, lot) ve toplam destek lotu."""
+    paket = veri_paketi_al(veri, 'destek_analizi')
+    
+    # Derinlik matrisi: her hisse bir satır, her kademe bir sütun (1..derinlik_siniri)
+    alis = derinlik_matrisi(paket, 'ALIS', derinlik_siniri)
+    
+    # Sadece fiyatı ve lotu dolu kademeler sayılır
+    toplam_destek = alis.toplam_lot(fiyat_gerekli=True)
+    
+    # En yüklü kademeyi bul
+    en_guclu_fiyat, en_yuksek_lot = alis.duvar(fiyat_gerekli=True)
+    
+    return pd.DataFrame({
+        'SEMBOL': alis.semboller,
+        'MAJOR_DESTEK_FIYATI': en_guclu_fiyat,
+        'DESTEK_LOT_MIKTARI': en_yuksek_lot.astype('int64'),
+        'TOPLAM_ALIS_DESTEGI': toplam_destek.astype('int64')
+    })
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""
+================================================================================
+MODÜL ADI   : Direnç (Satış Duvarı) Tespiti
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+İlk N satış kademesindeki en yüklü kademe (Major Direnç) ve fiyatı
+dolu kademelerin toplam lotu (Satış Baskısı).
+Script: 'Direnç (Satış Duvarı) Tespit.py'
+================================================================================
+"""
+
+import pandas as pd
+
+from .. import veri_paketi_al
+from ..derinlik_motoru import derinlik_matrisi
+from ..sonuc_onbellegi import onbellekli
+
+KADEME_DERINLIGI = 14
+
+
+@onbellekli
+def direnc_analizi(veri, derinlik_siniri=KADEME_DERINLIGI):
+    """Her hisse için en güçlü satış kademesi (fiyat, lot) ve toplam direnç lotu."""
+    paket = veri_paketi_al(veri, 'direnc_analizi')
+    
+    # Derinlik matrisi: her hisse bir satır, her kademe bir sütun (1..derinlik_siniri)
+    satis = derinlik_matrisi(paket, 'SATIS', derinlik_siniri)
+    
+    # Sadece fiyatı ve lotu dolu kademeler sayılır
+    toplam_baski = satis.toplam_lot(fiyat_gerekli=True)
+    
+    # En güçlü direnç kademesini bul
+    en_guclu_fiyat, en_yuksek_lot = satis.duvar(fiyat_gerekli=True)
+    
+    return pd.DataFrame({
+        'SEMBOL': satis.semboller,
+        'MAJOR_DIRENC_FIYATI': en_guclu_fiyat,
+        'DIRENC_LOT_MIKTARI': en_yuksek_lot.astype('int64'),
+        'TOPLAM_SATIS_BASKISI': toplam_baski.astype('int64')
+    })
\ No newline at end of file
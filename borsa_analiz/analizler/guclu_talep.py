@@ -0,0 +1,65 @@
+"""
+================================================================================
+MODÜL ADI   : Güçlü Talep & Hacim Patlaması
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Rölatif hacim, günlük fiyat değişimi ve aktif net para girişini
+(KADEME_ANALIZI 'FARK') tek tabloda toplar.
+Script: 'Güçlü Talep & Hacim Patlaması Tarayıcısı.py'
+================================================================================
+"""
+
+import logging
+
+from .. import veri_paketi_al
+from ..ozellikler import ozellik_al
+from ..semboller import sembol_metne
+from ..sonuc_onbellegi import onbellekli
+from . import AnalizHatasi
+
+gunluk = logging.getLogger(__name__)
+
+
+@onbellekli
+def guclu_talep_analizi(veri):
+    """Rölatif hacim, fiyat değişimi ve net para girişini hisse başına birleştirir.
+
+    HACIM-1..5 sütunları yoksa AnalizHatasi yükseltir.
+    """
+    paket = veri_paketi_al(veri, 'guclu_talep_analizi')
+    
+    # 1. Dosyaları Oku
+    df_fiyat = paket.oku('ACILISLAR-1.csv')
+    df_kademe = paket.oku('KADEME_ANALIZI.csv')
+    
+    # 2. Hacim Ortalamasını Hesapla (Son 5 Gün)
+    # Sütunlar: HACIM-1, HACIM-2 ... HACIM-5 (ortak özellikler pakette bir kez hesaplanır)
+    ort_hacim = ozellik_al(paket, 'ORT_HACIM_5G')
+    
+    # Eğer bu sütunlar varsa ortalama al
+    if ort_hacim is not None:
+        df_fiyat['ORT_HACIM_5G'] = ort_hacim
+        
+        # Rölatif Hacim (Bugün / Ortalama)
+        # 1.0 = Ortalama kadar, 2.0 = Ortalamanın 2 katı
+        df_fiyat['ROLATIF_HACIM'] = ozellik_al(paket, 'ROLATIF_HACIM')
+        
+        # Fiyat Değişimi (%)
+        # ((Kapanış - Önceki Kapanış) / Önceki Kapanış) * 100
+        df_fiyat['DEGISIM_YUZDE'] = ozellik_al(paket, 'DEGISIM_YUZDE')
+    else:
+        raise AnalizHatasi("Hacim geçmiş verileri (HACIM-1, HACIM-2 vb.) bulunamadı.")
+
+    # 3. Kademeleri Hazırla
+    # Sadece SEMBOL ve FARK (Net Para Girişi) lazım
+    df_kademe_kisa = df_kademe[['SEMBOL', 'FARK']].rename(columns={'FARK': 'NET_PARA_GIRIS_LOT'})
+    
+    # 4. Verileri Birleştir (SEMBOL kimlikleriyle)
+    sozluk = paket.sembol_sozlugu()
+    df_merged = sozluk.birlestir(df_fiyat, df_kademe_kisa, 'inner', 'KADEME_ANALIZI.csv')
+    for satir in sozluk.dusen_raporu():
+        gunluk.info(satir)
+    
+    return sembol_metne(df_merged)
\ No newline at end of file
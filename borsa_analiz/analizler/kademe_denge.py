@@ -0,0 +1,49 @@
+"""
+================================================================================
+MODÜL ADI   : Kademeler Arası Denge
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Aktif denge (KADEME_ANALIZI 'FARK') ile pasif denge (BEKLEYEN_EMIRLER
+'NET.EMIR.FARKI') ve ikisinin toplamı GENEL_DENGE.
+Script: 'Kademeler Arası Denge Analiz.py'
+================================================================================
+"""
+
+import logging
+
+from .. import veri_paketi_al
+from ..semboller import sembol_metne
+from ..sonuc_onbellegi import onbellekli
+
+gunluk = logging.getLogger(__name__)
+
+
+@onbellekli
+def kademe_denge_analizi(veri):
+    """Aktif alış/satış lotlarını (KADEME_ANALIZI) fiyat tablosuyla birleştirir."""
+    # Veri paketini hazırla (Dosya yolları paket içinde oluşturulur)
+    paket = veri_paketi_al(veri, 'kademe_denge_analizi')
+    
+    # 1. Dosyaları Oku
+    df_kademe = paket.oku('KADEME_ANALIZI.csv')
+    df_bekleyen = paket.oku('BEKLEYEN_EMIRLER.csv')
+    
+    # 2. Sütunları Seç ve Standartlaştır
+    # FARK: Aktif Alıcıların Satıcılara üstünlüğü
+    df_active = df_kademe[['SEMBOL', 'FARK']].rename(columns={'FARK': 'AKTIF_DENGE'})
+    
+    # NET.EMIR.FARKI: Tahtadaki pasif alıcıların satıcılara üstünlüğü
+    df_passive = df_bekleyen[['SEMBOL', 'NET.EMIR.FARKI']].rename(columns={'NET.EMIR.FARKI': 'PASIF_DENGE'})
+    
+    # 3. İki tabloyu SEMBOL kimlikleri üzerinden birleştir
+    sozluk = paket.sembol_sozlugu()
+    df_merged = sozluk.birlestir(df_active, df_passive, 'inner', 'BEKLEYEN_EMIRLER.csv')
+    for satir in sozluk.dusen_raporu():
+        gunluk.info(satir)
+    
+    # 4. Genel Denge Puanını Hesapla
+    df_merged['GENEL_DENGE'] = df_merged['AKTIF_DENGE'] + df_merged['PASIF_DENGE']
+    
+    return sembol_metne(df_merged)
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""
+================================================================================
+MODÜL ADI   : Kritik Destek Tespiti
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Tahtadaki en büyük alış duvarını son 5 günün dibiyle karşılaştırır;
+ikisi %1'den yakınsa seviye 'kritik' sayılır.
+Script: 'Kritik Destek Tespit.py'
+================================================================================
+"""
+
+import numpy as np
+import pandas as pd
+
+from .. import veri_paketi_al
+from ..derinlik_motoru import derinlik_matrisi
+from ..ozellikler import ozellik_al
+from ..sonuc_onbellegi import onbellekli
+
+KADEME_DERINLIGI = 14
+
+
+@onbellekli
+def kritik_destek_analizi(veri, derinlik_siniri=KADEME_DERINLIGI):
+    """En büyük alış duvarını 5 günlük dip ile karşılaştırır.
+
+    İkisi arasında %1'den az fark varsa CAKISMA_DURUMU 'VAR' olur; 5 günlük
+    dip sütunları yoksa boş tablo döner.
+    """
+    paket = veri_paketi_al(veri, 'kritik_destek_analizi')
+    
+    # Fiyat geçmişi SEMBOL indeksli tablo olarak bir kez hazırlanır (hisse başına tarama yok)
+    df_fiyat = paket.sembol_indeksli('ACILISLAR-1.csv')
+    
+    # --- 1. DERİNLİK ANALİZİ (TAHTADAKİ ALICI DUVARI) ---
+    # En yüklü alış kademesi tüm hisseler için tek seferde bulunur
+    alis = derinlik_matrisi(paket, 'ALIS', derinlik_siniri)
+    duvar_fiyati, en_yuksek_lot = alis.duvar()
+    
+    # --- 2. TEKNİK ANALİZ (GEÇMİŞ DİP) ---
+    # Derinlikteki her hissenin fiyat satırı (ACILISLAR'da olmayanlar analiz dışı)
+    fiyat_data = df_fiyat.reindex(alis.semboller)
+    fiyat_var = df_fiyat.index.get_indexer(alis.semboller) >= 0
+    
+    # Son 5 günün en düşüğünü bul: DUSUK, DUSUK-1 ... DUSUK-4 (sütunlar yoksa None)
+    dip_5g = ozellik_al(paket, 'DIP_5G')
+    dip_var = dip_5g is not None
+    
+    gecmis_dip = dip_5g.reindex(alis.semboller).to_numpy(dtype='float64') if dip_var else np.full(len(alis), np.nan)
+    guncel_fiyat = fiyat_data['KAPANIS'].to_numpy(dtype='float64')
+    
+    # --- 3. ÇAKIŞMA KONTROLÜ ---
+    # Alış Duvarı ile Geçmiş Dip birbirine yakın mı?
+    with np.errstate(invalid='ignore', divide='ignore'):
+        fark_yuzde = np.abs(duvar_fiyati - gecmis_dip) / gecmis_dip * 100
+        
+        # Destek şu anki fiyattan ne kadar aşağıda?
+        destege_uzaklik = (guncel_fiyat - duvar_fiyati) / guncel_fiyat * 100
+    
+    # Sadece fiyatı bulunan, geçmiş dip sütunları olan ve tahtada alış duvarı olan hisseler
+    secili = fiyat_var & dip_var & (duvar_fiyati > 0)
+    
+    return pd.DataFrame({
+        'SEMBOL': alis.semboller[secili],
+        'GUNCEL_FIYAT': guncel_fiyat[secili],
+        'TEKNIK_DIP_5G': gecmis_dip[secili],
+        'TAHTA_ALIS_DUVARI': duvar_fiyati[secili],
+        'DUVARDAKI_LOT': en_yuksek_lot[secili].astype('int64'),
+        'CAKISMA_DURUMU': np.where(fark_yuzde[secili] < 1.0, 'VAR', 'YOK'), # %1'den az fark varsa
+        'DESTEGE_UZAKLIK_YUZDE': destege_uzaklik[secili]
+    })
\ No newline at end of file
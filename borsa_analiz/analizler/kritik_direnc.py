@@ -0,0 +1,65 @@
+"""
+================================================================================
+MODÜL ADI   : Kritik Direnç Tespiti
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Tahtadaki en büyük satış duvarını son 5 günün zirvesiyle karşılaştırır;
+ikisi %1'den yakınsa seviye 'kritik' sayılır.
+Script: 'Kritik Direnç Tespit.py'
+================================================================================
+"""
+
+import numpy as np
+import pandas as pd
+
+from .. import veri_paketi_al
+from ..derinlik_motoru import derinlik_matrisi
+from ..ozellikler import ozellik_al
+from ..sonuc_onbellegi import onbellekli
+
+KADEME_DERINLIGI = 14
+
+
+@onbellekli
+def kritik_direnc_analizi(veri, derinlik_siniri=KADEME_DERINLIGI):
+    """En büyük satış duvarını 5 günlük zirve ile karşılaştırır (zirve sütunları yoksa NaN)."""
+    paket = veri_paketi_al(veri, 'kritik_direnc_analizi')
+    
+    # Fiyat geçmişi SEMBOL indeksli tablo olarak bir kez hazırlanır (hisse başına tarama yok)
+    df_fiyat = paket.sembol_indeksli('ACILISLAR-1.csv')
+    
+    # --- 1. DERİNLİK ANALİZİ (TAHTADAKİ DUVAR) ---
+    # En yüklü satış kademesi tüm hisseler için tek seferde bulunur
+    satis = derinlik_matrisi(paket, 'SATIS', derinlik_siniri)
+    duvar_fiyati, en_yuksek_lot = satis.duvar()
+    
+    # --- 2. TEKNİK ANALİZ (GEÇMİŞ ZİRVE) ---
+    # ACILISLAR tablosundan hisseleri tek seferde çek (bulunmayanlar analiz dışı)
+    fiyat_data = df_fiyat.reindex(satis.semboller)
+    fiyat_var = df_fiyat.index.get_indexer(satis.semboller) >= 0
+    
+    # Son 5 günün en yükseğini bul: YUKSEK, YUKSEK-1 ... YUKSEK-4 (sütunlar yoksa None)
+    zirve_5g = ozellik_al(paket, 'ZIRVE_5G')
+    
+    gecmis_zirve = zirve_5g.reindex(satis.semboller).to_numpy(dtype='float64') if zirve_5g is not None else np.full(len(satis), np.nan)
+    guncel_fiyat = fiyat_data['KAPANIS'].to_numpy(dtype='float64')
+    
+    # --- 3. ÇAKIŞMA KONTROLÜ ---
+    # Derinlik Duvarı ile Geçmiş Zirve birbirine yakın mı?
+    with np.errstate(invalid='ignore', divide='ignore'):
+        fark_yuzde = np.abs(duvar_fiyati - gecmis_zirve) / gecmis_zirve * 100
+        
+        # Direnç şu anki fiyattan ne kadar uzak?
+        dirence_uzaklik = (duvar_fiyati - guncel_fiyat) / guncel_fiyat * 100
+    
+    return pd.DataFrame({
+        'SEMBOL': satis.semboller[fiyat_var],
+        'GUNCEL_FIYAT': guncel_fiyat[fiyat_var],
+        'TEKNIK_ZIRVE_5G': gecmis_zirve[fiyat_var],
+        'TAHTA_SATIS_DUVARI': duvar_fiyati[fiyat_var],
+        'DUVARDAKI_LOT': en_yuksek_lot[fiyat_var].astype('int64'),
+        'CAKISMA_DURUMU': np.where(fark_yuzde[fiyat_var] < 1.0, 'VAR', 'YOK'), # %1'den az fark varsa çakışma var
+        'DIRENCE_UZAKLIK_YUZDE': dirence_uzaklik[fiyat_var]
+    })
\ No newline at end of file
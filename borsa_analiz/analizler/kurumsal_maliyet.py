@@ -0,0 +1,86 @@
+"""
+================================================================================
+MODÜL ADI   : Kurumsal Maliyet ve Dağılım
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+1. alıcının kimliği ve maliyeti, ilk 4 alıcının ağırlıklı ortalama
+maliyeti ve kapanışın 1. alıcı maliyetine uzaklığı (%).
+Script: 'Kurumsal Maliyet ve Dağılım Analizi.py'
+================================================================================
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+from .. import veri_paketi_al
+from ..semboller import sembol_metne
+from ..sonuc_onbellegi import onbellekli
+
+
+# Adında bu ifadelerden biri geçen alıcı kurumsal sayılır
+KURUMSAL_LISTESI = [
+    'BANK OF AMERICA', 'CITIBANK', 'DEUTSCHE', 'HSBC', 'YAPI KREDI', 'IS YATIRIM', 'TEB'
+]
+
+
+@onbellekli
+def kurumsal_maliyet_analizi(veri, kurumsal_listesi=KURUMSAL_LISTESI):
+    """En iyi alıcının ve ilk 4 alıcının maliyetini güncel fiyatla karşılaştırır.
+
+    kurumsal_listesi: adında bu ifadelerden biri geçen alıcı kurumsal sayılır.
+    Fiyat dosyasında olmayan hisseler sonuca alınmaz.
+    """
+    paket = veri_paketi_al(veri, 'kurumsal_maliyet_analizi')
+    
+    # 1. Dosyaları Oku (Fiyat dosyası SEMBOL indeksli tablo olarak bir kez hazırlanır)
+    df_takas = paket.oku('MALIYET_ALICI-1.csv')
+    df_fiyat = paket.sembol_indeksli('ACILISLAR-1.csv')
+    
+    # --- 1. ALICI VERİLERİ ---
+    alici_1_adi = df_takas['ENIYI ALICI.1'].astype(object).map(lambda ad: str(ad).strip())
+    alici_1_maliyet = df_takas['MALIYET']
+    
+    # --- İLK 4 ALICI TOPLAMI (KONSANTRASYON) ---
+    # Sütun isimleri: NET ADET, NET ADET.1, NET ADET.2, NET ADET.3 (olmayan sütun 0 sayılır)
+    toplam_net_alim = df_takas['NET ADET'] + df_takas.get('NET ADET.1', 0) + df_takas.get('NET ADET.2', 0) + df_takas.get('NET ADET.3', 0)
+    
+    # Ağırlıklı Ortalama Maliyet (İlk 4 Kurum)
+    # (Maliyet * Lot) toplamı / Toplam Lot
+    toplam_para = (df_takas['NET ADET'] * df_takas['MALIYET']) + \
+                  (df_takas.get('NET ADET.1', 0) * df_takas.get('MALIYET.1', 0)) + \
+                  (df_takas.get('NET ADET.2', 0) * df_takas.get('MALIYET.2', 0)) + \
+                  (df_takas.get('NET ADET.3', 0) * df_takas.get('MALIYET.3', 0))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ort_maliyet_ilk4 = np.where(toplam_net_alim != 0, toplam_para / toplam_net_alim, 0)
+
+    # --- GÜNCEL FİYATI BUL ---
+    # Tek bir indeksli eşleştirme (Fiyat dosyasında olmayan hisseler analiz dışı)
+    fiyat_var = df_fiyat.index.get_indexer(df_takas['SEMBOL']) >= 0
+    kapanis = df_fiyat['KAPANIS'].reindex(df_takas['SEMBOL']).to_numpy()
+    
+    # Fiyat / Maliyet Farkı (%)
+    # Eğer %2 ise, kurumun maliyetinin sadece %2 üzerindeyiz (Ucuz).
+    with np.errstate(invalid='ignore', divide='ignore'):
+        fark_yuzde = np.where(alici_1_maliyet > 0, ((kapanis - alici_1_maliyet) / alici_1_maliyet) * 100, 0)
+    
+    # Kurumsal mı?
+    kurum_deseni = '|'.join(re.escape(k) for k in kurumsal_listesi)
+    is_institutional = alici_1_adi.str.upper().str.contains(kurum_deseni, regex=True)
+    
+    df_sonuc = pd.DataFrame({
+        'SEMBOL': df_takas['SEMBOL'],
+        'EN_IYI_ALICI': alici_1_adi,
+        'ALICI_KURUMSAL_MI': is_institutional,
+        'ALICI_1_MALIYET': alici_1_maliyet,
+        'ILK4_ORT_MALIYET': ort_maliyet_ilk4,
+        'GUNCEL_FIYAT': kapanis,
+        'MALIYET_FARK_YUZDE': fark_yuzde,
+        'TOPLANAN_LOT': toplam_net_alim
+    })[fiyat_var]
+    df_sonuc['TOPLANAN_LOT'] = df_sonuc['TOPLANAN_LOT'].astype('int64')
+    
+    return sembol_metne(df_sonuc.reset_index(drop=True))
\ No newline at end of file
@@ -0,0 +1,74 @@
+"""
+================================================================================
+MODÜL ADI   : Likidite Duvarı
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Dolu kademelerin ortalama lotunun 'carpan' katını aşan en büyük kademe
+(duvar), alış ve satış tarafı için ayrı satırlar.
+Script: 'Likidite Duvarı Analizi.py'
+================================================================================
+"""
+
+import numpy as np
+import pandas as pd
+
+from .. import veri_paketi_al
+from ..derinlik_motoru import derinlik_matrisi, ortak_semboller
+from ..yardimci import yuvarla
+from ..sonuc_onbellegi import onbellekli
+
+KADEME_DERINLIGI = 14
+DUVAR_CARPANI = 4.0
+
+
+@onbellekli
+def likidite_duvari_analizi(veri, derinlik_siniri=KADEME_DERINLIGI, carpan=DUVAR_CARPANI):
+    """Kademe ortalamasının 'carpan' katından büyük alış/satış kademelerini listeler.
+
+    Her duvar bir satırdır (YON: ALIS / SATIS); duvar yoksa boş tablo döner.
+    """
+    paket = veri_paketi_al(veri, 'likidite_duvari_analizi')
+    
+    # Fiyat bilgisini de alalım (Duvarın fiyata uzaklığını ölçmek için)
+    if paket.var_mi('ACILISLAR-1.csv'):
+        df_fiyat = paket.oku('ACILISLAR-1.csv')[['SEMBOL', 'KAPANIS']]
+    else:
+        df_fiyat = pd.DataFrame(columns=['SEMBOL', 'KAPANIS'])
+        
+    # Birleştir (Alış-Satış inner, Kapanış left)
+    alis, satis = ortak_semboller(derinlik_matrisi(paket, 'ALIS', derinlik_siniri),
+                                  derinlik_matrisi(paket, 'SATIS', derinlik_siniri))
+    kapanis = (df_fiyat.drop_duplicates('SEMBOL').set_index('SEMBOL')['KAPANIS']
+               .reindex(alis.semboller).to_numpy(dtype='float64', na_value=np.nan))
+    
+    def duvar_tablosu(matris, yon):
+        # Dolu kademelerin ortalaması ve en büyük kademe (tüm hisseler için tek seferde)
+        max_lot, duvar_fiyati, ort_lot, kademe_sayisi = matris.en_buyuk_kademe()
+        
+        # Duvar mı? (Max Lot > Ortalama * Çarpan)
+        duvar = (kademe_sayisi > 0) & (max_lot > ort_lot * carpan)
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            duvar_gucu = max_lot / ort_lot
+            if yon == 'ALIS (DESTEK)':
+                uzaklik = (kapanis - duvar_fiyati) / kapanis * 100
+            else:
+                uzaklik = (duvar_fiyati - kapanis) / kapanis * 100
+        uzaklik = np.where(kapanis == 0, 0, uzaklik)
+        
+        return pd.DataFrame({
+            'SEMBOL': matris.semboller[duvar],
+            'YON': yon,
+            'DUVAR_FIYATI': duvar_fiyati[duvar],
+            'DUVAR_LOTU': max_lot[duvar].astype('int64'),
+            'DUVAR_GUCU_KAT': yuvarla(duvar_gucu[duvar], 1),
+            'FIYATA_UZAKLIK_%': yuvarla(uzaklik[duvar], 2),
+            'KAPANIS': kapanis[duvar]
+        }, index=np.flatnonzero(duvar))
+    
+    # --- ALIŞ TARAFI (DESTEK DUVARI) ve SATIŞ TARAFI (DİRENÇ DUVARI) ---
+    # Her hissenin önce alış, sonra satış duvarı gelecek şekilde sırala
+    df_duvar = pd.concat([duvar_tablosu(alis, 'ALIS (DESTEK)'), duvar_tablosu(satis, 'SATIS (DIRENC)')])
+    return df_duvar.sort_index(kind='stable').reset_index(drop=True)
\ No newline at end of file
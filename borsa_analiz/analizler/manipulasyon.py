@@ -0,0 +1,90 @@
+"""
+================================================================================
+MODÜL ADI   : Tahtacı Manipülasyon Tespiti
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Wash trading, sahte destek ve baskılama senaryolarına uyan hisseler
+ve tespit edilen manipülasyon türü.
+Script: 'Tahtacı Manipülasyon Tespit.py'
+================================================================================
+"""
+
+import logging
+
+from .. import veri_paketi_al
+from ..ozellikler import ozellik_al
+from ..semboller import sembol_metne
+from ..sonuc_onbellegi import onbellekli
+
+gunluk = logging.getLogger(__name__)
+
+
+@onbellekli
+def manipulasyon_analizi(veri):
+    """Pasif ve aktif lot akışı fiyatla çelişen şüpheli hisseleri döndürür."""
+    paket = veri_paketi_al(veri, 'manipulasyon_analizi')
+    
+    # Dosyaları Oku
+    df_fiyat = paket.oku('ACILISLAR-1.csv')
+    df_kademe = paket.oku('KADEME_ANALIZI.csv')
+    df_bekleyen = paket.oku('BEKLEYEN_EMIRLER.csv')
+    
+    # --- 1. HACİM VE FİYAT VERİLERİ ---
+    # Rölatif Hacim (Son 5 gün ortalamasına göre bugünkü durum)
+    rolatif_hacim = ozellik_al(paket, 'ROLATIF_HACIM')
+    if rolatif_hacim is not None:
+        df_fiyat['ROLATIF_HACIM'] = rolatif_hacim
+    else:
+         df_fiyat['ROLATIF_HACIM'] = 1.0 
+         
+    df_fiyat['DEGISIM_YUZDE'] = ozellik_al(paket, 'DEGISIM_YUZDE')
+    
+    # --- 2. AKTİF VE PASİF VERİLERİ ---
+    # Aktif Net: Anlık gerçekleşen işlemlerde kim baskın?
+    df_kademe = df_kademe[['SEMBOL', 'FARK']].rename(columns={'FARK': 'AKTIF_NET_LOT'})
+    
+    # Pasif Net: Bekleyen emirlerde kim baskın?
+    df_bekleyen = df_bekleyen[['SEMBOL', 'NET.EMIR.FARKI']].rename(columns={'NET.EMIR.FARKI': 'PASIF_NET_LOT'})
+    
+    # Birleştirme (SEMBOL kimlikleriyle)
+    sozluk = paket.sembol_sozlugu()
+    df_m = sozluk.birlestir(df_fiyat, df_kademe, 'inner', 'KADEME_ANALIZI.csv')
+    df_m = sozluk.birlestir(df_m, df_bekleyen, 'inner', 'BEKLEYEN_EMIRLER.csv')
+    for satir in sozluk.dusen_raporu():
+        gunluk.info(satir)
+    
+    # --- 3. MANİPÜLASYON SENARYOLARI ---
+    
+    # SENARYO A: "WASH TRADING" (Hacim Var, İcraat Yok)
+    # Hacim çok yüksek (>2 kat), ama fiyat değişimi çok küçük (<%0.5).
+    # Amaç: Hissede hareket varmış gibi gösterip ky çekmek.
+    df_m['SINYAL_WASH'] = (df_m['ROLATIF_HACIM'] > 2.0) & (df_m['DEGISIM_YUZDE'].abs() < 0.5)
+    
+    # SENARYO B: "SAHTE DESTEK / MAL ÇAKMA" (Boğa Tuzağı)
+    # Görüntü: Altta çok alıcı bekliyor (Pasif > 0), güvenli liman gibi.
+    # Gerçek: Aktif olarak satış yeniyor (Aktif < 0).
+    # Anlamı: Tahtacı alta kendi alışlarını yazıp "Düşmez bu" diyor, ama yukarıdan malı veriyor.
+    df_m['SINYAL_SAHTE_DESTEK'] = (df_m['PASIF_NET_LOT'] > 0) & (df_m['AKTIF_NET_LOT'] < 0) & (df_m['DEGISIM_YUZDE'] > -2.0)
+    
+    # SENARYO C: "BASKILAMA / MAL TOPLAMA" (Ayı Tuzağı)
+    # Görüntü: Üstte çok satıcı var (Pasif < 0), gitmez bu hisse gibi.
+    # Gerçek: Aktif olarak alım yapılıyor (Aktif > 0).
+    # Anlamı: Tahtacı üste duvar örüp fiyatı tutuyor, alttan dökülenleri topluyor.
+    df_m['SINYAL_BASKILAMA'] = (df_m['PASIF_NET_LOT'] < 0) & (df_m['AKTIF_NET_LOT'] > 0)
+    
+    # Filtreleme
+    supheli_hisseler = df_m[df_m['SINYAL_WASH'] | df_m['SINYAL_SAHTE_DESTEK'] | df_m['SINYAL_BASKILAMA']].copy()
+    
+    # Etiketleme Fonksiyonu
+    def etiketle(row):
+        tespitler = []
+        if row['SINYAL_WASH']: tespitler.append("HACIM VAR YON YOK (Fake Hacim)")
+        if row['SINYAL_SAHTE_DESTEK']: tespitler.append("SAHTE DESTEK (Mal Cakma)")
+        if row['SINYAL_BASKILAMA']: tespitler.append("BASKILAMA (Mal Toplama)")
+        return " + ".join(tespitler)
+        
+    supheli_hisseler['MANIPULASYON_TURU'] = supheli_hisseler.apply(etiketle, axis=1)
+    
+    return sembol_metne(supheli_hisseler[['SEMBOL', 'KAPANIS', 'DEGISIM_YUZDE', 'ROLATIF_HACIM', 'AKTIF_NET_LOT', 'PASIF_NET_LOT', 'MANIPULASYON_TURU']])
\ No newline at end of file
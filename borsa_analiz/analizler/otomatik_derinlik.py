@@ -0,0 +1,63 @@
+"""
+================================================================================
+MODÜL ADI   : Otomatik Derinlik (Derinlik Dengesizliği)
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Derinlik Oranı (toplam alış / toplam satış lotu), net lot farkı,
+Major Destek / Direnç fiyatları ve durum etiketi.
+Script: 'Otomatik Derinlik Analizi.py'
+================================================================================
+"""
+
+import numpy as np
+import pandas as pd
+
+from .. import veri_paketi_al
+from ..derinlik_motoru import derinlik_matrisi, net_dengesizlik, ortak_semboller
+from ..sonuc_onbellegi import onbellekli
+
+KADEME_DERINLIGI = 14
+
+
+@onbellekli
+def otomatik_derinlik_analizi(veri, derinlik_siniri=KADEME_DERINLIGI):
+    """İlk 'derinlik_siniri' kademede alış-satış lot dengesini hesaplar."""
+    paket = veri_paketi_al(veri, 'otomatik_derinlik_analizi')
+    
+    # Derinlik matrislerini al (Dosyalar pakette bir kez okunur ve matrise çevrilir)
+    alis = derinlik_matrisi(paket, 'ALIS', derinlik_siniri)
+    satis = derinlik_matrisi(paket, 'SATIS', derinlik_siniri)
+    
+    # Alış ve Satış tarafını 'SEMBOL' üzerinden eşleştir (inner join)
+    alis, satis = ortak_semboller(alis, satis)
+    
+    # --- ALIŞ (DESTEK) VE SATIŞ (DİRENÇ) TARAFI ANALİZİ ---
+    # Toplam lot ve en büyük yığılma (Major Destek / Major Direnç) tüm hisseler için tek seferde
+    toplam_alis_lot = alis.toplam_lot()
+    toplam_satis_lot = satis.toplam_lot()
+    en_guclu_destek_fiyat, _ = alis.duvar()
+    en_guclu_direnc_fiyat, _ = satis.duvar()
+    
+    # --- HESAPLAMA VE KARAR MEKANİZMASI ---
+    # Satıcı yoksa oran 100 (tavan olabilir), veri yoksa 0
+    derinlik_orani, net_fark = net_dengesizlik(toplam_alis_lot, toplam_satis_lot)
+    
+    # Durum Etiketi Ata
+    durum = np.select(
+        [derinlik_orani > 2.0, derinlik_orani > 1.2, derinlik_orani < 0.5, derinlik_orani < 0.8],
+        ["GÜÇLÜ BOĞA (ALICI ÇOK)", "ALICI AĞIRLIKLI", "GÜÇLÜ AYI (SATICI ÇOK)", "SATICI AĞIRLIKLI"],
+        default="DENGELİ"
+    )
+
+    return pd.DataFrame({
+        'SEMBOL': alis.semboller,
+        'DURUM': durum,
+        'DERINLIK_ORANI': derinlik_orani,
+        'TOPLAM_ALIS_LOT': toplam_alis_lot.astype('int64'),
+        'TOPLAM_SATIS_LOT': toplam_satis_lot.astype('int64'),
+        'NET_FARK_LOT': net_fark.astype('int64'),
+        'MAJOR_DESTEK': en_guclu_destek_fiyat,
+        'MAJOR_DIRENC': en_guclu_direnc_fiyat
+    })
\ No newline at end of file
@@ -0,0 +1,140 @@
+"""
+================================================================================
+MODÜL ADI   : Sıkışma Alanı (Squeeze) Tespiti
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Son 11 kapanışın standart sapmasının ortalamaya oranı (SIKISMA_PUANI)
+ve son gün hacim düşüşü. Geçmiş deposu verilirse kapanışlar
+ACILISLAR-2.csv yerine depodan, istenen gün sayısı kadar okunur.
+
+ÇOK UFUKLU SIKIŞMA (ufuklar=(5, 10, 20, 60, 120)):
+Her ufuk için aynı puan (SIKISMA_<h>G), Bollinger bant genişliği
+(BANT_GENISLIGI_<h>G = 4 x std / ortalama x 100, std ddof=0) ve bugünkü
+genişliğin hissenin kendi geçmişindeki yüzdelik sırası (BANT_YUZDELIK_<h>G;
+0'a yakın = geçmişinin en dar bandı). Pencereler kümülatif toplamlarla
+tek geçişte hesaplanır (bkz. kayan.py).
+Script: 'Sıkışma Alanı (Squeeze) Tespit.py'
+================================================================================
+"""
+
+import logging
+
+import numpy as np
+
+from .. import veri_paketi_al
+from ..arsiv import klasor_tarihi
+from ..kayan import KumulatifToplamlar, yuzdelik_sira
+from ..semboller import sembol_metne
+from ..sonuc_onbellegi import onbellekli
+from . import AnalizHatasi
+
+gunluk = logging.getLogger(__name__)
+
+UFUKLAR = (5, 10, 20, 60, 120)
+YUZDELIK_GECMISI = 500  # Bant genişliği yüzdeliği için geriye bakılan gün (~2 yıl)
+
+
+@onbellekli
+def sikisma_analizi(veri, depo=None, gun=11, ufuklar=None, yuzdelik_gecmisi=YUZDELIK_GECMISI, tarih=None):
+    """Son 'gun' kapanışın standart sapma / ortalama oranını (SIKISMA_PUANI) hesaplar.
+
+    depo (gecmis.GecmisDeposu) verilmezse kapanışlar günlük dosyalardaki
+    11 sütundan gelir; verilirse depodaki, snapshot'ın gününde ('tarih', 'YYYY-AA-GG';
+    verilmezse klasör adındaki tarih, bkz. arsiv.klasor_tarihi) biten son
+    'gun' günden. Sonraki günler kullanılmaz; o gün depoda yoksa veya 5'ten
+    az kapanış varsa AnalizHatasi yükseltir.
+    ufuklar verilirse çok ufuklu sütunlar eklenir; yüzdelikler aynı günde biten son
+    'yuzdelik_gecmisi' güne göre (depo yoksa dosyadaki 11 kapanışa göre).
+    """
+    # Depodan çalışırken ACILISLAR-2 okunmaz, önceden yüklenmez
+    paket = veri_paketi_al(veri, 'sikisma_analizi', onyukle=depo is None)
+    
+    if depo is None:
+        # 1. Dosyaları Oku
+        df1 = paket.oku('ACILISLAR-1.csv')
+        df2 = paket.oku('ACILISLAR-2.csv')
+        
+        # 2. Verileri Birleştir (SEMBOL kimlikleri üzerinden)
+        # ACILISLAR-1 ve ACILISLAR-2'yi yan yana getiriyoruz.
+        sozluk = paket.sembol_sozlugu()
+        df_full = sozluk.birlestir(df1, df2, 'inner', 'ACILISLAR-2.csv')
+        for satir in sozluk.dusen_raporu():
+            gunluk.info(satir)
+        
+        # 3. Kapanış Fiyatlarını Topla (Son 11 Gün)
+        # KAPANIS, KAPANIS-1 ... KAPANIS-10
+        kapanis_cols = ['KAPANIS'] + [f'KAPANIS-{i}' for i in range(1, 11)]
+    else:
+        # Geçmiş depodan: ACILISLAR-2 okunmaz, dosyadaki gecikme sütunları depodakilerle değişir
+        df1 = paket.oku('ACILISLAR-1.csv')
+        bitis = tarih or klasor_tarihi(paket.ana_dizin)
+        if bitis not in depo.tarihler(bitis):
+            raise AnalizHatasi(f"Geçmiş deposunda {bitis} günü yok; önce 'python -m borsa_analiz.gecmis ekle' ile eklenmeli.")
+        uzunluk = max([gun] + ([max(ufuklar), yuzdelik_gecmisi] if ufuklar else []))
+        kapanislar = depo.pencere('KAPANIS', uzunluk, bitis=bitis, semboller=df1['SEMBOL'].astype(str)).degerler
+        son_gunler = kapanislar[:, ::-1][:, :gun]
+        kapanis_cols = ['KAPANIS'] + [f'KAPANIS-{i}' for i in range(1, son_gunler.shape[1])]
+        df_full = df1.drop(columns=[c for c in df1.columns if c.startswith('KAPANIS')])
+        df_full[kapanis_cols] = son_gunler
+    
+    # Eğer sütunlar eksikse hata vermemesi için kontrol
+    mevcut_cols = [col for col in kapanis_cols if col in df_full.columns]
+    
+    if len(mevcut_cols) < 5:
+        raise AnalizHatasi("Yeterli geçmiş veri sütunu bulunamadı.")
+        
+    # 4. Sıkışma Hesabı (Volatility Ratio)
+    # Her satır için (hisse için) standart sapma ve ortalama hesapla
+    fiyatlar = df_full[mevcut_cols]
+    
+    # Standart Sapma (Volatilite)
+    df_full['STD_DEV'] = fiyatlar.std(axis=1)
+    
+    # Ortalama Fiyat
+    df_full['ORTALAMA_FIYAT'] = fiyatlar.mean(axis=1)
+    
+    # Sıkışma Puanı (Düşük olması iyidir)
+    # Puan = (Standart Sapma / Ortalama Fiyat) * 100
+    df_full['SIKISMA_PUANI'] = (df_full['STD_DEV'] / df_full['ORTALAMA_FIYAT']) * 100
+    
+    # Ekstra: Son gün hacmi ortalama hacmin altında mı? (Hacim düşüşü sıkışmayı teyit eder)
+    # Basitçe son gün hacmi ile önceki günlerin ortalamasını kıyaslayalım
+    if 'HACIM' in df_full.columns and 'HACIM-1' in df_full.columns:
+         df_full['HACIM_DUSUSU_VAR'] = df_full['HACIM'] < df_full['HACIM-1']
+    else:
+         df_full['HACIM_DUSUSU_VAR'] = False
+
+    # 5. Çok Ufuklu Sıkışma ve Bollinger Bant Genişliği
+    if ufuklar:
+        if depo is None:
+            # Dosyada sadece 11 kapanış var: sütunlar eskiden yeniye çevrilir
+            kapanislar = fiyatlar[mevcut_cols[::-1]].to_numpy(dtype='float64', na_value=np.nan)
+        for sutun, degerler in coklu_ufuk_sikismasi(kapanislar, ufuklar).items():
+            df_full[sutun] = degerler
+
+    return sembol_metne(df_full)
+
+
+def coklu_ufuk_sikismasi(kapanislar, ufuklar=UFUKLAR):
+    """(sembol x gün, eskiden yeniye) kapanış matrisinden ufuk başına sıkışma sütunları."""
+    toplamlar = KumulatifToplamlar(kapanislar)
+    sutunlar = {}
+    kisa = [h for h in ufuklar if h > toplamlar.gun_sayisi]
+    if kisa:
+        gunluk.info(f"{toplamlar.gun_sayisi} günlük geçmiş {', '.join(map(str, kisa))} günlük ufuklar için yetersiz.")
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for h in ufuklar:
+            if h in kisa:
+                for ad in ('SIKISMA', 'BANT_GENISLIGI', 'BANT_YUZDELIK'):
+                    sutunlar[f'{ad}_{h}G'] = np.full(len(kapanislar), np.nan)
+                continue
+            ortalama, std, _ = toplamlar.pencere(h, son=True)
+            sutunlar[f'SIKISMA_{h}G'] = (std[:, 0] / ortalama[:, 0]) * 100
+            # Bollinger: orta bant h günlük ortalama, bantlar ± 2 std
+            ortalama, std, _ = toplamlar.pencere(h, ddof=0)
+            genislik = 4 * std / ortalama * 100
+            sutunlar[f'BANT_GENISLIGI_{h}G'] = genislik[:, -1]
+            sutunlar[f'BANT_YUZDELIK_{h}G'] = yuzdelik_sira(genislik, genislik[:, -1])
+    return sutunlar
\ No newline at end of file
@@ -0,0 +1,58 @@
+"""
+================================================================================
+MODÜL ADI   : Spread (Makas) ve Volatilite
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+En iyi alış-satış makası (TL ve %) ile gün içi marj
+((Yüksek - Düşük) / Düşük).
+Script: 'Spread (Makas) ve Volatilite Analizi.py'
+================================================================================
+"""
+
+import logging
+
+import pandas as pd
+
+from .. import veri_paketi_al
+from ..semboller import sembol_metne
+from ..sonuc_onbellegi import onbellekli
+
+gunluk = logging.getLogger(__name__)
+
+
+@onbellekli
+def spread_analizi(veri):
+    """Alış-satış makası ve gün içi volatiliteyi hisse başına hesaplar."""
+    paket = veri_paketi_al(veri, 'spread_analizi')
+    
+    # 1. Verileri Oku (Sadece en iyi fiyatlar yeterli)
+    df_alis = paket.oku('DERINLIK_ALIS-1.csv')[['SEMBOL', '1 ALIS']]
+    df_satis = paket.oku('DERINLIK_SATIS-1.csv')[['SEMBOL', '1 SATIS']]
+    
+    # Fiyat verisi (Gün içi marj için)
+    if paket.var_mi('ACILISLAR-1.csv'):
+        df_fiyat = paket.oku('ACILISLAR-1.csv')[['SEMBOL', 'YUKSEK', 'DUSUK', 'KAPANIS']]
+    else:
+        df_fiyat = pd.DataFrame(columns=['SEMBOL', 'YUKSEK', 'DUSUK', 'KAPANIS'])
+    
+    # 2. Birleştir (SEMBOL kimlikleriyle)
+    sozluk = paket.sembol_sozlugu()
+    df = sozluk.birlestir(df_alis, df_satis, 'inner', 'DERINLIK_SATIS-1.csv')
+    df = sozluk.birlestir(df, df_fiyat, 'left')
+    for satir in sozluk.dusen_raporu():
+        gunluk.info(satir)
+    
+    # 3. Hesaplamalar
+    # Spread (Makas) Hesabı
+    df['SPREAD_TL'] = df['1 SATIS'] - df['1 ALIS']
+    df['SPREAD_YUZDE'] = (df['SPREAD_TL'] / df['1 ALIS']) * 100
+    
+    # Gün İçi Volatilite (Range) Hesabı
+    if 'YUKSEK' in df.columns:
+        df['GUN_ICI_MARJ_YUZDE'] = ((df['YUKSEK'] - df['DUSUK']) / df['DUSUK']) * 100
+    else:
+        df['GUN_ICI_MARJ_YUZDE'] = 0
+        
+    return sembol_metne(df)
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""
+================================================================================
+MODÜL ADI   : WAPD - Ağırlıklı Ortalama Derinlik
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Alış ve satış tarafının lot ağırlıklı ortalama fiyatı (WAPD) ve
+kapanış fiyatına uzaklığı (%).
+Script: 'WAPD - Ağırlıklı Ortalama Derinlik Analizi.py'
+================================================================================
+"""
+
+import logging
+
+import numpy as np
+import pandas as pd
+
+from .. import veri_paketi_al
+from ..derinlik_motoru import derinlik_matrisi, ortak_semboller
+from ..sonuc_onbellegi import onbellekli
+
+gunluk = logging.getLogger(__name__)
+
+KADEME_DERINLIGI = 14
+
+
+@onbellekli
+def wapd_analizi(veri, derinlik_siniri=KADEME_DERINLIGI):
+    """Alış ve satış tarafının lot ağırlıklı ortalama fiyatını ve kapanışa uzaklığını hesaplar.
+
+    Fiyat dosyası yoksa uzaklıklar 999 olur (uyarı günlüğe yazılır).
+    """
+    paket = veri_paketi_al(veri, 'wapd_analizi')
+    
+    # Fiyat dosyasını sadece referans (Kapanış) için alıyoruz
+    if paket.var_mi('ACILISLAR-1.csv'):
+        df_fiyat = paket.oku('ACILISLAR-1.csv')[['SEMBOL', 'KAPANIS']]
+    else:
+        gunluk.warning("Fiyat dosyası bulunamadı, uzaklık analizi yapılamayacak.")
+        df_fiyat = pd.DataFrame(columns=['SEMBOL', 'KAPANIS'])
+    
+    # Verileri Birleştir (Alış-Satış inner, Kapanış left)
+    alis, satis = ortak_semboller(derinlik_matrisi(paket, 'ALIS', derinlik_siniri),
+                                  derinlik_matrisi(paket, 'SATIS', derinlik_siniri))
+    kapanis = (df_fiyat.drop_duplicates('SEMBOL').set_index('SEMBOL')['KAPANIS']
+               .reindex(alis.semboller).to_numpy(dtype='float64', na_value=np.nan))
+    
+    # --- WAPD (ALIŞ / SATIŞ) HESABI ---
+    # Formül: Toplam (Fiyat * Lot) / Toplam Lot
+    wapd_alis, toplam_lot_alis = alis.wapd()
+    wapd_satis, toplam_lot_satis = satis.wapd()
+    
+    # --- ANALİZ ---
+    # WAPD'nin şu anki fiyata uzaklığı (%), hesaplanamıyorsa 999
+    with np.errstate(invalid='ignore', divide='ignore'):
+        destek_uzaklik = np.where(~np.isnan(kapanis) & (wapd_alis != 0), (kapanis - wapd_alis) / kapanis * 100, 999)
+        direnc_uzaklik = np.where(~np.isnan(kapanis) & (wapd_satis != 0), (wapd_satis - kapanis) / kapanis * 100, 999)
+    
+    return pd.DataFrame({
+        'SEMBOL': alis.semboller,
+        'KAPANIS': kapanis,
+        'WAPD_ALIS': wapd_alis,
+        'WAPD_SATIS': wapd_satis,
+        'DESTEK_UZAKLIK_YUZDE': destek_uzaklik,
+        'DIRENC_UZAKLIK_YUZDE': direnc_uzaklik,
+        'TOPLAM_ALIS_LOT': toplam_lot_alis.astype('int64'),
+        'TOPLAM_SATIS_LOT': toplam_lot_satis.astype('int64')
+    })
\ No newline at end of file
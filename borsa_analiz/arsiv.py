@@ -0,0 +1,98 @@
+"""
+================================================================================
+MODÜL ADI   : Snapshot Arşivi (Gün Klasörlerini Bulma)
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Günlük snapshot'lar tarih adlı klasörlerde birikir:
+    ARSIV/2025-01-02/ACILISLAR-1.csv, DERINLIK_ALIS-1.csv ...
+    ARSIV/2025-01-03/...
+gunleri_bul() klasör yolu, glob deseni ('ARSIV/2025-0*') veya arşiv
+klasörü karışık bir listeden ACILISLAR-1.csv içeren gün klasörlerini
+toplar, tarih aralığına göre süzer ve tarih sırasıyla Gun(tarih, klasor)
+listesi döndürür. Geriye dönük test (geriye_test.py) ve toplu çalıştırıcı
+(toplu.py) günleri buradan alır.
+
+NOT:
+Klasör adında tarih (2025-01-02 veya 20250102) yoksa ACILISLAR-1.csv'nin
+değişiklik tarihi kullanılır. Aynı tarihe iki klasör düşerse hangisinin
+geçerli olduğu bilinemeyeceği için ArsivHatasi yükseltilir.
+================================================================================
+"""
+
+import argparse
+import glob
+import os
+import re
+from collections import Counter, namedtuple
+from datetime import date, datetime
+
+GUN_DOSYASI = 'ACILISLAR-1.csv'
+
+_TARIH_DESENI = re.compile(r'(\d{4})-?(\d{2})-?(\d{2})')
+
+Gun = namedtuple('Gun', ['tarih', 'klasor'])
+
+
+class ArsivHatasi(Exception):
+    """Gün klasörleri bulunamadı veya aynı tarih birden fazla klasörde."""
+
+
+def gun_klasoru_mu(klasor):
+    return os.path.isfile(os.path.join(klasor, GUN_DOSYASI))
+
+
+def klasor_tarihi(klasor):
+    """Klasör adındaki tarih ('2025-01-02' / '20250102'), yoksa ACILISLAR-1.csv'nin tarihi."""
+    eslesme = _TARIH_DESENI.search(os.path.basename(os.path.normpath(klasor)))
+    if eslesme:
+        try:
+            return date(*map(int, eslesme.groups())).isoformat()
+        except ValueError:
+            pass
+    zaman = os.path.getmtime(os.path.join(klasor, GUN_DOSYASI))
+    return datetime.fromtimestamp(zaman).date().isoformat()
+
+
+def tarih_argumani(metin):
+    """argparse 'type': 'YYYY-AA-GG' denetlenip aynen döner."""
+    try:
+        return date.fromisoformat(metin).isoformat()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"geçersiz tarih: {metin} (YYYY-AA-GG)")
+
+
+def arsiv_gunleri(arsiv):
+    """Arşiv klasörünün ACILISLAR-1.csv içeren alt klasörleri (tarih sırasıyla)."""
+    return gunleri_bul([arsiv])
+
+
+def gunleri_bul(kaynaklar, baslangic=None, bitis=None):
+    """Gün klasörü / arşiv klasörü / glob desenlerinden tarih sıralı Gun listesi.
+
+    Kendisi gün klasörü olan yol doğrudan alınır; değilse alt klasörlerine
+    bakılır. baslangic / bitis ('YYYY-AA-GG') verilirse aralık dışı günler atlanır.
+    """
+    klasorler = []
+    for kaynak in kaynaklar:
+        eslesenler = sorted(glob.glob(kaynak)) if glob.has_magic(kaynak) else [kaynak]
+        for yol in eslesenler:
+            if gun_klasoru_mu(yol):
+                klasorler.append(yol)
+            elif os.path.isdir(yol):
+                klasorler += [os.path.join(yol, ad) for ad in sorted(os.listdir(yol))
+                              if gun_klasoru_mu(os.path.join(yol, ad))]
+
+    gunler = {}
+    for klasor in klasorler:
+        gun = Gun(klasor_tarihi(klasor), klasor)
+        gunler.setdefault(os.path.realpath(klasor), gun)   # Aynı klasör iki kaynaktan gelebilir
+    gunler = sorted(g for g in gunler.values()
+                    if (baslangic is None or g.tarih >= baslangic) and (bitis is None or g.tarih <= bitis))
+    if not gunler:
+        raise ArsivHatasi(f"ACILISLAR-1.csv içeren gün klasörü bulunamadı: {', '.join(kaynaklar)}")
+    tekrarlar = sorted(t for t, adet in Counter(g.tarih for g in gunler).items() if adet > 1)
+    if tekrarlar:
+        raise ArsivHatasi(f"Aynı tarihli birden fazla klasör: {', '.join(tekrarlar)}")
+    return gunler
\ No newline at end of file
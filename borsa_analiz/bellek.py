@@ -0,0 +1,158 @@
+"""
+================================================================================
+MODÜL ADI   : Bellek Profili (Aşama Başına Tepe Bellek ve Ayırma Noktaları)
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Çalışma profilinin (profil.py) isteğe bağlı bellek modu. Açıkken
+tracemalloc her aşama dilimini (ör. wapd_analizi / birlestirme) izler:
+- tepe_artis_mb : dilim sırasında, dilim başındaki bellek üstüne çıkılan
+                  en yüksek ek bellek (geçici kopyalar dahil)
+- net_mb        : dilim sonunda hâlâ tutulan ek bellek
+- siteler       : dilimde ayrılıp dilim sonunda tutulan belleğin en büyük
+                  ayırma noktaları; her ayırma, çağrı zincirindeki en içteki
+                  proje satırına (script veya borsa_analiz) yazılır, ör.
+                  'borsa_analiz/semboller.py:140' (pandas'ın içi değil)
+Ayrıca sürecin tepe RSS değeri (işletim sisteminin gördüğü, tracemalloc
+dışı bellek dahil) her analizin sonunda ve çalışmanın sonunda kaydedilir;
+artış gösteren analiz, sürecin bellek tavanını yükselten analizdir.
+Sonuç çalışma profilinin yanına BELLEK_PROFILI_<zaman>.json olarak yazılır.
+
+NOT:
+- Geçici ayırmalar (dilim bitmeden serbest kalanlar) tepe_artis_mb'de
+  görünür ama siteler listesinde görünmez; siteler dilim sonundaki
+  anlık görüntülerin farkıdır.
+- Anlık görüntü sadece SITE_ESIGI'nden fazla bellek kullanan dilimlerin
+  sonunda alınır (diğerleri küçük ve çok sayıdadır); küçük dilimlerin
+  kalıcı ayırmaları bir sonraki ölçülen dilimin sitelerine karışabilir.
+- tracemalloc ve anlık görüntüler işi birkaç kat yavaşlatır; bu modda
+  çalışma profilindeki süreler yanıltıcıdır. Üretimde kapalı tutulur.
+- Tepe RSS 'resource' modülüyle okunur; Windows'ta yoktur (None yazılır).
+
+KULLANIM:
+    python -m borsa_analiz.calistirici VERI_KLASORU -o RAPORLAR --bellek
+================================================================================
+"""
+
+import os
+import sys
+import tracemalloc
+from collections import Counter
+
+try:
+    import resource
+except ImportError:     # Windows
+    resource = None
+
+KARE_SAYISI = 16        # Ayırma başına saklanan çağrı zinciri derinliği
+ILK_N = 10              # Aşama başına raporlanan ayırma noktası
+SITE_ESIGI = 2 ** 20    # Bundan az bellek kullanan dilimde anlık görüntü alınmaz
+PROJE_KOKU = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MB = 2 ** 20
+
+
+def rss_tepe_mb():
+    """Sürecin şimdiye kadarki tepe RSS değeri (MB); ölçülemiyorsa None."""
+    if resource is None:
+        return None
+    tepe = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux kilobayt, macOS bayt döndürür
+    return round(tepe / (MB if sys.platform == 'darwin' else 1024), 1)
+
+
+class BellekIzleyici:
+    def __init__(self, kare_sayisi=KARE_SAYISI, ilk_n=ILK_N, site_esigi=SITE_ESIGI):
+        self.kare_sayisi = kare_sayisi
+        self.ilk_n = ilk_n
+        self.site_esigi = site_esigi
+        self.dilimler = {}          # (kayıt adı, aşama) -> ölçüm
+        self.rss = {}               # kayıt adı -> tepe RSS (MB)
+        self.izlenen_tepe = 0
+        self._onceki = None
+        self._baz = 0
+        self._baslatti = False
+
+    def baslat(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.kare_sayisi)
+            self._baslatti = True
+        self._sifirla()
+
+    def durdur(self):
+        self._onceki = None
+        if self._baslatti:
+            tracemalloc.stop()
+            self._baslatti = False
+
+    def _sifirla(self, ozet=None):
+        if ozet is not None or self._onceki is None:
+            self._onceki = ozet if ozet is not None else self._ozet()
+        tracemalloc.reset_peak()
+        self._baz = tracemalloc.get_traced_memory()[0]
+
+    def _ozet(self):
+        """Anlık görüntünün çağrı zinciri -> bayt özeti.
+
+        Görüntünün kendisi saklanmaz: izlenen nesneler olarak her görüntü bir
+        sonrakini büyütürdü. Özetin ve ölçümün kendi ayırmaları, site
+        belirlenirken ayıklanır.
+        """
+        return {istatistik.traceback: istatistik.size
+                for istatistik in tracemalloc.take_snapshot().statistics('traceback')}
+
+    def _site(self, iz):
+        """Çağrı zincirindeki en içteki proje satırı (yoksa en içteki satır).
+
+        Ölçümün kendi ayırmaları (tracemalloc, bu modül) için None.
+        """
+        if iz[-1].filename in (tracemalloc.__file__, __file__):
+            return None
+        for kare in reversed(iz):
+            if kare.filename.startswith(PROJE_KOKU):
+                return f"{os.path.relpath(kare.filename, PROJE_KOKU)}:{kare.lineno}"
+        kare = iz[-1]
+        return f"{kare.filename}:{kare.lineno}"
+
+    def dilim_bitti(self, kayit_adi, asama):
+        """Biten aşama diliminin tepe / net belleğini ve ayırma noktalarını ekler."""
+        if self._onceki is None:
+            return
+        simdi, tepe = tracemalloc.get_traced_memory()
+        self.izlenen_tepe = max(self.izlenen_tepe, tepe)
+        olcum = self.dilimler.setdefault((kayit_adi, asama), {'tepe_artis': 0, 'net': 0, 'siteler': Counter()})
+        olcum['tepe_artis'] = max(olcum['tepe_artis'], tepe - self._baz)
+        olcum['net'] += simdi - self._baz
+        if max(tepe, simdi) - self._baz < self.site_esigi:
+            # Anlık görüntü pahalıdır; küçük dilimin ayırmaları sonraki ölçülen dilime yazılır
+            self._sifirla()
+            return
+        ozet = self._ozet()
+        for iz, boyut in ozet.items():
+            fark = boyut - self._onceki.get(iz, 0)
+            if fark > 0:
+                site = self._site(iz)
+                if site is not None:
+                    olcum['siteler'][site] += fark
+        self._sifirla(ozet)
+
+    def rss_kaydet(self, kayit_adi):
+        self.rss[kayit_adi] = rss_tepe_mb()
+
+    def sozluk(self):
+        kayitlar = {}
+        for (kayit_adi, asama), olcum in self.dilimler.items():
+            kayit = kayitlar.setdefault(kayit_adi, {'rss_tepe_mb': self.rss.get(kayit_adi), 'asamalar': {}})
+            kayit['asamalar'][asama] = {
+                'tepe_artis_mb': round(olcum['tepe_artis'] / MB, 2),
+                'net_mb': round(olcum['net'] / MB, 2),
+                'siteler': [{'site': site, 'mb': round(boyut / MB, 3)}
+                            for site, boyut in olcum['siteler'].most_common(self.ilk_n)],
+            }
+        return {
+            'rss_tepe_mb': rss_tepe_mb(),
+            'izlenen_tepe_mb': round(self.izlenen_tepe / MB, 2),
+            'kare_sayisi': self.kare_sayisi,
+            'paket': kayitlar.pop('paket', None),
+            'analizler': kayitlar,
+        }
\ No newline at end of file
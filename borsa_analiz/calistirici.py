@@ -0,0 +1,238 @@
+"""
+================================================================================
+MODÜL ADI   : Toplu Çalıştırıcı (Analiz Zinciri)
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+15 analiz scriptini tek bir Python sürecinde, tek bir VeriPaketi üzerinde
+çalıştırır. Her analiz ANALIZLER kaydında girdi dosyalarını (sema.py) ve
+kullandığı ortak özellikleri (ozellikler.py) bildirir. Çalışma sırası:
+1. Seçilen analizlerin sütun ihtiyaçları pakete bildirilir; her dosya
+   birleşik ihtiyaçla bir kez (eşzamanlı) okunur.
+2. Ortak özellikler (PIVOT, ROLATIF_HACIM ...) bir kez hesaplanır.
+3. Analizler sırayla çalışır, raporlarını ortak çıktı klasörüne yazar.
+   Raporlar arka planda, CSV veya tek Parquet deposu olarak yazılır
+   (bkz. rapor_deposu.py).
+4. Aşama süreleri (okuma, birleştirme, hesap, süzme, yazma) ve satır
+   sayıları CALISMA_PROFILI_<zaman>.json olarak raporların yanına yazılır
+   (bkz. profil.py).
+Derinlik matrisleri ve satır metrikleri (toplam lot, duvar, WAPD) de
+paket üzerinden paylaşılır (bkz. derinlik_motoru.py).
+
+Raporsuz, sadece tablo isteyen kullanım için analizlerin saf fonksiyonları
+borsa_analiz.analizler paketindedir (AnalizKaydi.fonksiyon).
+
+KULLANIM:
+    python -m borsa_analiz VERI_KLASORU -o RAPOR_KLASORU
+    python -m borsa_analiz.calistirici VERI_KLASORU -o RAPOR_KLASORU
+    python -m borsa_analiz.calistirici VERI_KLASORU -a wapd_analizi destek_analizi
+    python -m borsa_analiz.calistirici VERI_KLASORU -o RAPOR_KLASORU --bicim parquet
+    python -m borsa_analiz.calistirici VERI_KLASORU -o RAPOR_KLASORU --sonuc-onbellegi
+    python -m borsa_analiz.calistirici --liste
+================================================================================
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+
+from . import analizler, sema
+from .konsol import konsol_gunlugu
+from .ozellikler import ozellik_al, ozellik_dosyasi
+from .profil import CalismaProfili
+from .rapor_deposu import BICIMLER, RaporHatasi, RaporYazici
+from .veri_paketi import VeriPaketi
+
+# Analiz scriptlerinin bulunduğu klasör (paketin bir üstü)
+BETIK_DIZINI = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class AnalizKaydi:
+    def __init__(self, ad, betik, ozellikler=()):
+        self.ad = ad                        # Analiz fonksiyonunun adı (sema.ANALIZ_SUTUNLARI anahtarı)
+        self.betik = betik                  # Scriptin dosya adı
+        self.ozellikler = tuple(ozellikler)  # Kullandığı ortak özellikler
+
+    def __repr__(self):
+        return f"AnalizKaydi({self.ad!r})"
+
+    @property
+    def girdiler(self):
+        return list(sema.analiz_sutunlari(self.ad))
+
+    @property
+    def fonksiyon(self):
+        """Analizin saf fonksiyonu (klasör veya VeriPaketi -> pd.DataFrame)."""
+        return analizler.ANALIZ_FONKSIYONLARI[self.ad]
+
+    def modul(self):
+        """Scripti modül olarak yükler (script sadece __main__ iken kendi başına çalışır)."""
+        yol = os.path.join(BETIK_DIZINI, self.betik)
+        spec = importlib.util.spec_from_file_location(f"borsa_analiz_betik_{self.ad}", yol)
+        modul = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(modul)
+        return modul
+
+
+ANALIZLER = [
+    AnalizKaydi('acilis_istahi_analizi', 'Açılış İştahı ve Gap Analizi.py'),
+    AnalizKaydi('buyuk_tarama_robotu', 'BÜYÜK TARAMA VE SKORLAMA.py',
+                ['PIVOT', 'TOPLAM_DERINLIK_ALIS', 'TOPLAM_DERINLIK_SATIS']),
+    AnalizKaydi('destek_analizi', 'Destek (Alış Duvarı) Tespit.py'),
+    AnalizKaydi('direnc_analizi', 'Direnç (Satış Duvarı) Tespit.py'),
+    AnalizKaydi('guclu_talep_analizi', 'Güçlü Talep & Hacim Patlaması Tarayıcısı.py',
+                ['ORT_HACIM_5G', 'ROLATIF_HACIM', 'DEGISIM_YUZDE']),
+    AnalizKaydi('kademe_denge_analizi', 'Kademeler Arası Denge Analiz.py'),
+    AnalizKaydi('kritik_destek_analizi', 'Kritik Destek Tespit.py', ['DIP_5G']),
+    AnalizKaydi('kritik_direnc_analizi', 'Kritik Direnç Tespit.py', ['ZIRVE_5G']),
+    AnalizKaydi('kurumsal_maliyet_analizi', 'Kurumsal Maliyet ve Dağılım Analizi.py'),
+    AnalizKaydi('likidite_duvari_analizi', 'Likidite Duvarı Analizi.py'),
+    AnalizKaydi('otomatik_derinlik_analizi', 'Otomatik Derinlik Analizi.py'),
+    AnalizKaydi('spread_analizi', 'Spread (Makas) ve Volatilite Analizi.py'),
+    AnalizKaydi('sikisma_analizi', 'Sıkışma Alanı (Squeeze) Tespit.py'),
+    AnalizKaydi('manipulasyon_analizi', 'Tahtacı Manipülasyon Tespit.py',
+                ['ROLATIF_HACIM', 'DEGISIM_YUZDE']),
+    AnalizKaydi('wapd_analizi', 'WAPD - Ağırlıklı Ortalama Derinlik Analizi.py'),
+]
+
+
+def analizleri_sec(adlar=None):
+    """Adı verilen analizlerin kayıtları (kayıt sırasıyla); verilmezse hepsi."""
+    if not adlar:
+        return list(ANALIZLER)
+    bilinen = {k.ad for k in ANALIZLER}
+    bilinmeyen = [ad for ad in adlar if ad not in bilinen]
+    if bilinmeyen:
+        raise KeyError(f"Tanımsız analiz: {', '.join(bilinmeyen)}")
+    return [k for k in ANALIZLER if k.ad in adlar]
+
+
+def plan(kayitlar):
+    """Dosya -> özellik -> analiz bağımlılıklarını okunabilir satırlar olarak döndürür."""
+    satirlar = []
+    dosyalar = sorted({d for k in kayitlar for d in k.girdiler})
+    ozellikler = sorted({o for k in kayitlar for o in k.ozellikler})
+    satirlar.append("DOSYALAR   : " + ', '.join(dosyalar))
+    for ad in ozellikler:
+        kullananlar = [k.ad for k in kayitlar if ad in k.ozellikler]
+        satirlar.append(f"ÖZELLİK    : {ad} <- {ozellik_dosyasi(ad)} -> {', '.join(kullananlar)}")
+    for k in kayitlar:
+        satirlar.append(f"ANALİZ     : {k.ad} <- {', '.join(k.girdiler + list(k.ozellikler))}")
+    return satirlar
+
+
+def calistir(ana_dizin, cikti_konumu, adlar=None, paket=None, profil_yaz=True, bellek=False,
+             bicim='csv', arka_plan=True, sonuc_onbellegi=False):
+    """Seçilen analizleri tek pakette çalıştırır; analiz adı -> sonuç tablosu döndürür.
+
+    Bir analizin hatası diğerlerini durdurmaz (sonucu None olur). Aşama
+    süreleri ve satır sayıları raporların yanına CALISMA_PROFILI_<zaman>.json
+    olarak yazılır (bkz. profil.py); profil_yaz=False ile yazılmaz.
+    bellek=True aşama başına tepe bellek ve ayırma noktalarını da ölçüp
+    BELLEK_PROFILI_<zaman>.json yazar (yavaştır, bkz. bellek.py).
+    Raporlar 'bicim' ile CSV, tek Parquet deposu (RAPOR_<zaman>/) veya
+    ikisi birden olarak, arka_plan=True ise ayrı bir thread'de yazılır
+    (bkz. rapor_deposu.py). sonuc_onbellegi=True, paket verilmemişse
+    analiz sonuçlarını veri klasöründe önbelleğe alır (bkz. sonuc_onbellegi.py).
+    """
+    kayitlar = analizleri_sec(adlar)
+    paket = paket if paket is not None else VeriPaketi(ana_dizin, sonuc_onbellegi=sonuc_onbellegi)
+    yazici = RaporYazici(cikti_konumu, bicim, arka_plan)
+
+    sonuclar = {}
+    with CalismaProfili(ana_dizin, cikti_konumu, bellek=bellek) as calisma, yazici:
+        # 1. Dosyalar: bütün ihtiyaçlar önce bildirilir ki her dosya bir kez okunsun
+        for kayit in kayitlar:
+            paket.ihtiyac_bildir(kayit.ad)
+        paket.onyukle()
+
+        # 2. Ortak özellikler (hata veren özellik, kullanan analizde tekrar denenip raporlanır)
+        for ad in sorted({o for k in kayitlar for o in k.ozellikler}):
+            try:
+                ozellik_al(paket, ad)
+            except Exception:
+                pass
+
+        # 3. Analizler
+        for kayit in kayitlar:
+            print(f"\n>>> {kayit.ad}")
+            with calisma.analiz(kayit.ad) as profil_kaydi, yazici.analiz(kayit.ad):
+                try:
+                    sonuclar[kayit.ad] = kayit.modul().calistir(paket, cikti_konumu)
+                except Exception as e:
+                    print(f"HATA: {kayit.ad}: {e}")
+                    sonuclar[kayit.ad] = None
+                    profil_kaydi['hata'] = str(e)
+                if sonuclar[kayit.ad] is not None:
+                    profil_kaydi['sonuc_satir'] = len(sonuclar[kayit.ad])
+                # Paylaşılan ara sonuçları kullanan analiz dosyayı kendisi okumamış olabilir
+                for dosya_adi in kayit.girdiler:
+                    if dosya_adi in calisma.dosyalar:
+                        profil_kaydi['girdi_satir'].setdefault(dosya_adi, calisma.dosyalar[dosya_adi]['satir'])
+
+    if yazici.arka_plan:
+        calisma.arka_plan_yazma_sn = yazici.sure_sn
+    for hata in yazici.hatalar:
+        print(f"HATA: rapor yazılamadı: {hata}")
+    if yazici.depo is not None:
+        print(f"\n✓ Rapor deposu: {yazici.depo}")
+    if profil_yaz:
+        try:
+            print(f"\n✓ Çalışma profili: {calisma.yaz(cikti_konumu)}")
+            if calisma.bellek_yolu:
+                print(f"✓ Bellek profili: {calisma.bellek_yolu}")
+        except OSError as e:
+            print(f"UYARI: çalışma profili yazılamadı: {e}")
+    return sonuclar
+
+
+def ana(argumanlar=None):
+    ayristirici = argparse.ArgumentParser(
+        prog='python -m borsa_analiz',
+        description="Analizleri tek süreçte, ortak veri paketi üzerinde çalıştırır.")
+    ayristirici.add_argument('klasor', nargs='?', help="CSV dosyalarının bulunduğu klasör")
+    ayristirici.add_argument('-o', '--cikti', help="Raporların yazılacağı klasör (varsayılan: KLASOR/RAPORLAR)")
+    ayristirici.add_argument('-a', '--analiz', nargs='+', metavar='AD', help="Sadece bu analizleri çalıştır")
+    ayristirici.add_argument('--liste', action='store_true', help="Analizleri ve bağımlılık planını göster")
+    ayristirici.add_argument('--profil-yok', action='store_true', help="Çalışma profilini (JSON) yazma")
+    ayristirici.add_argument('--bellek', action='store_true',
+                             help="Aşama başına tepe bellek ve ayırma noktalarını da ölç (yavaş)")
+    ayristirici.add_argument('--bicim', choices=BICIMLER, default='csv',
+                             help="Rapor biçimi: ayrı CSV'ler, tek Parquet deposu veya ikisi (varsayılan: csv)")
+    ayristirici.add_argument('--es-zamanli-yaz', action='store_true',
+                             help="Raporları arka plan thread'i yerine analiz sırasında yaz")
+    ayristirici.add_argument('--sonuc-onbellegi', action='store_true',
+                             help="Analiz sonuçlarını veri klasörünün .onbellek/sonuclar altında sakla / oradan oku")
+    secenekler = ayristirici.parse_args(argumanlar)
+
+    try:
+        kayitlar = analizleri_sec(secenekler.analiz)
+    except KeyError as e:
+        ayristirici.error(f"{e.args[0]} (bilinenler: {', '.join(k.ad for k in ANALIZLER)})")
+
+    if secenekler.liste:
+        print('\n'.join(plan(kayitlar)))
+        return 0
+    if not secenekler.klasor:
+        ayristirici.error("veri klasörü gerekli")
+
+    konsol_gunlugu()
+    cikti = secenekler.cikti or os.path.join(secenekler.klasor, 'RAPORLAR')
+    try:
+        sonuclar = calistir(secenekler.klasor, cikti, [k.ad for k in kayitlar], profil_yaz=not secenekler.profil_yok,
+                            bellek=secenekler.bellek, bicim=secenekler.bicim,
+                            arka_plan=not secenekler.es_zamanli_yaz, sonuc_onbellegi=secenekler.sonuc_onbellegi)
+    except RaporHatasi as e:
+        print(f"HATA: {e}")
+        return 1
+    basarisiz = [ad for ad, df in sonuclar.items() if df is None]
+    print(f"\n{len(sonuclar) - len(basarisiz)}/{len(sonuclar)} analiz tamamlandı.")
+    if basarisiz:
+        print("Sonuç üretmeyenler: " + ', '.join(basarisiz))
+    return 1 if basarisiz else 0
+
+
+if __name__ == '__main__':
+    sys.exit(ana())
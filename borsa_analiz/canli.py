@@ -0,0 +1,254 @@
+"""
+================================================================================
+MODÜL ADI   : Canlı Mod (Gün İçi Artımlı Yeniden Hesaplama)
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Seans içinde veri terminali DERINLIK_ALIS-1.csv, DERINLIK_SATIS-1.csv ve
+KADEME_ANALIZI.csv dosyalarını birkaç saniyede bir yeniden yazar. Bütün
+scriptleri her seferinde baştan çalıştırmak bu aralıktan uzun sürer.
+CanliMod klasörü izler ve her turda:
+1. Boyutu / değişiklik zamanı değişen dosyaları yeniden okur
+   (VeriPaketi.yenile; yarım yazılmış dosya bir sonraki tura kalır).
+2. Her satırın özetini (hash) bir önceki snapshot ile karşılaştırıp
+   satırı değişen, yeni gelen veya kaybolan sembolleri bulur.
+3. Derinlik, dengesizlik, duvar ve skor analizlerini sadece bu semboller
+   için (VeriPaketi.alt_paket) çalıştırır; diğer sembollerin önceki
+   sonuçları korunur.
+4. Güncellenen analizlerin sıralamalarını CANLI_<ANALİZ>.csv olarak yazar.
+
+NOT:
+Artımlı hesap, analiz sonuçlarının satır bazlı olmasına dayanır (bir
+sembolün sonucu sadece o sembolün satırlarından çıkar). CANLI_ANALIZLER
+listesindeki analizler bu koşulu sağlar; kesit istatistiği kullanan bir
+analiz eklenirse her turda tam hesaplanmalıdır.
+
+KULLANIM:
+    python -m borsa_analiz.canli VERI_KLASORU -o RAPOR_KLASORU --aralik 2
+================================================================================
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from . import analizler, sema
+from .konsol import konsol_gunlugu
+from .onbellek import parmak_izi
+from .siralama import aday_konumlari
+from .veri_paketi import VeriPaketi
+
+gunluk = logging.getLogger('borsa_analiz.canli')  # -m ile __main__ olarak da çalışır
+
+# Analiz adı -> (sıralama sütunu, artan mı?)
+CANLI_ANALIZLER = {
+    'otomatik_derinlik_analizi': ('DERINLIK_ORANI', False),
+    'destek_analizi': ('TOPLAM_ALIS_DESTEGI', False),
+    'direnc_analizi': ('TOPLAM_SATIS_BASKISI', False),
+    'likidite_duvari_analizi': ('DUVAR_GUCU_KAT', False),
+    'wapd_analizi': ('DESTEK_UZAKLIK_YUZDE', True),
+    'kademe_denge_analizi': ('GENEL_DENGE', False),
+    'buyuk_tarama_robotu': ('SKOR', False),
+}
+
+ILK_N = 20
+
+
+def satir_ozetleri(df):
+    """SEMBOL -> satırın 64 bitlik özeti (tekrarlanan sembolde ilk satır)."""
+    ozet = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    seri = pd.Series(ozet, index=pd.Index(df['SEMBOL'].astype(str).to_numpy(), name='SEMBOL'))
+    return seri[~seri.index.duplicated()]
+
+
+def degisen_semboller(eski, yeni):
+    """İki özet serisi arasında satırı değişen, eklenen ve silinen semboller."""
+    ortak = yeni.index.intersection(eski.index)
+    farkli = ortak[eski.reindex(ortak).to_numpy() != yeni.reindex(ortak).to_numpy()]
+    return farkli.append(yeni.index.difference(eski.index)).append(eski.index.difference(yeni.index))
+
+
+class CanliMod:
+    def __init__(self, ana_dizin, cikti_konumu=None, adlar=None, ilk_n=ILK_N):
+        adlar = list(adlar or CANLI_ANALIZLER)
+        bilinmeyen = [ad for ad in adlar if ad not in CANLI_ANALIZLER]
+        if bilinmeyen:
+            raise KeyError(f"Canlı modda desteklenmeyen analiz: {', '.join(bilinmeyen)}")
+        self.adlar = adlar
+        self.cikti_konumu = cikti_konumu
+        self.ilk_n = ilk_n
+        # Dosyalar saniyeler içinde değiştiği için önbelleğe yazılmaz
+        self.paket = VeriPaketi(ana_dizin, onbellek=False)
+        for ad in adlar:
+            self.paket.ihtiyac_bildir(ad)
+        self.dosyalar = sorted({d for ad in adlar for d in sema.analiz_sutunlari(ad)})
+        self.sonuclar = {}          # Analiz adı -> güncel sonuç tablosu
+        self._izler = {}            # Dosya -> okunan halinin (boyut, mtime_ns)
+        self._ozetler = {}          # Dosya -> satir_ozetleri
+        self.tur = 0
+
+    def __repr__(self):
+        return f"CanliMod({self.paket.ana_dizin!r}, analizler={len(self.adlar)}, tur={self.tur})"
+
+    # --- TUR ---
+    def adim(self):
+        """Bir tur: değişen dosyaları okur, etkilenen analizleri günceller.
+
+        Dönüş: güncellenen analiz adı -> sıralama tablosu (değişiklik yoksa boş).
+        """
+        degisen = self._degisen_dosyalar()
+        if not degisen:
+            return {}
+        self.tur += 1
+        semboller = self._degisen_semboller(degisen)
+        if not semboller:
+            return {}
+
+        # Bütün dosyalarda değişen semboller için tek bir alt paket kurulur;
+        # analizler derinlik matrisleri gibi ara sonuçları bu pakette paylaşır.
+        # Bir analiz için fazladan hesaplanan semboller önceki sonucunu aynen üretir.
+        kirli = None
+        if all(fark is not None for fark in semboller.values()):
+            kirli = pd.Index([]).append(list(semboller.values())).unique()
+        alt_paket = None
+
+        siralamalar = {}
+        for ad in self.adlar:
+            if not any(d in semboller for d in sema.analiz_sutunlari(ad)):
+                continue
+            try:
+                if kirli is None or ad not in self.sonuclar:
+                    self.sonuclar[ad] = analizler.ANALIZ_FONKSIYONLARI[ad](self.paket)
+                else:
+                    if alt_paket is None:
+                        alt_paket = self.paket.alt_paket(kirli)
+                    self.sonuclar[ad] = self._guncelle(ad, alt_paket, kirli)
+            except Exception as e:
+                gunluk.error(f"{ad}: {e}")
+                continue
+            siralamalar[ad] = self.siralama(ad)
+            self._yayinla(ad, siralamalar[ad])
+        return siralamalar
+
+    def izle(self, aralik=2.0, tur_sayisi=None):
+        """Klasörü 'aralik' saniyede bir kontrol eder (Ctrl+C ile durur)."""
+        try:
+            while tur_sayisi is None or self.tur < tur_sayisi:
+                baslangic = time.perf_counter()
+                siralamalar = self.adim()
+                if siralamalar:
+                    sure = time.perf_counter() - baslangic
+                    print(f"[{datetime.now():%H:%M:%S}] Tur {self.tur}: "
+                          f"{len(siralamalar)} analiz güncellendi ({sure:.2f} sn)")
+                time.sleep(max(0.0, aralik - (time.perf_counter() - baslangic)))
+        except KeyboardInterrupt:
+            print("\nCanlı izleme durduruldu.")
+        return self.sonuclar
+
+    def siralama(self, ad):
+        """Analizin güncel sonucunu sıralama sütununa göre ilk_n satır olarak döndürür."""
+        sutun, artan = CANLI_ANALIZLER[ad]
+        df = self.sonuclar[ad]
+        if len(df) > self.ilk_n:
+            # Bütün tabloyu sıralamak yerine ilk_n adayı (eşik değerine eşit olanlar dahil) seç
+            df = df.iloc[aday_konumlari(df[sutun], self.ilk_n, artan)]
+        # Eşit değerlerde sembol sırası; tam ve artımlı hesap aynı sıralamayı verir
+        return (df.assign(_SEMBOL=df['SEMBOL'].astype(str))
+                .sort_values([sutun, '_SEMBOL'], ascending=[artan, True], kind='stable')
+                .drop(columns='_SEMBOL').head(self.ilk_n).reset_index(drop=True))
+
+    # --- DEĞİŞİKLİK TESPİTİ ---
+    def _degisen_dosyalar(self):
+        """Okunanlardan farklı parmak izine sahip dosyaları yeniden okur."""
+        izler = {}
+        for dosya_adi in self.dosyalar:
+            try:
+                iz = parmak_izi(self.paket.yol(dosya_adi))
+            except OSError:
+                continue    # Dosya yok (veya yeniden yazılırken silinmiş)
+            if iz != self._izler.get(dosya_adi):
+                izler[dosya_adi] = iz
+        if not izler:
+            return []
+
+        hatalar = self.paket.yenile(list(izler))
+        for dosya_adi, hata in hatalar.items():
+            gunluk.warning(f"{dosya_adi} okunamadı, sonraki turda tekrar denenecek ({hata}).")
+        degisen = []
+        for dosya_adi, iz in izler.items():
+            if dosya_adi in hatalar:
+                continue
+            # Okuma sırasında tekrar yazıldıysa izi kaydetme: bir sonraki tur yeniden okusun
+            try:
+                if parmak_izi(self.paket.yol(dosya_adi)) == iz:
+                    self._izler[dosya_adi] = iz
+            except OSError:
+                pass
+            degisen.append(dosya_adi)
+        return degisen
+
+    def _degisen_semboller(self, dosyalar):
+        """Dosya -> satırı değişen semboller (ilk okumada None: hepsi)."""
+        semboller = {}
+        for dosya_adi in dosyalar:
+            yeni = satir_ozetleri(self.paket.oku(dosya_adi))
+            eski = self._ozetler.get(dosya_adi)
+            self._ozetler[dosya_adi] = yeni
+            if eski is None:
+                semboller[dosya_adi] = None
+                continue
+            fark = degisen_semboller(eski, yeni)
+            if len(fark):
+                semboller[dosya_adi] = fark
+        return semboller
+
+    # --- ARTIMLI HESAP ---
+    def _guncelle(self, ad, alt_paket, kirli):
+        """Analizi kirli sembollerin alt paketinde çalıştırıp önceki sonuçla birleştirir."""
+        yeni = analizler.ANALIZ_FONKSIYONLARI[ad](alt_paket)
+        eski = self.sonuclar[ad]
+        kalan = eski[~eski['SEMBOL'].astype(str).isin(kirli)]
+        parcalar = [df for df in (kalan, yeni) if len(df)]
+        if not parcalar:
+            return yeni
+        return pd.concat(parcalar, ignore_index=True) if len(parcalar) > 1 else parcalar[0].reset_index(drop=True)
+
+    def _yayinla(self, ad, siralama):
+        if self.cikti_konumu is None:
+            return
+        os.makedirs(self.cikti_konumu, exist_ok=True)
+        hedef = os.path.join(self.cikti_konumu, f"CANLI_{ad.upper()}.csv")
+        # Okuyan tarafın yarım dosya görmemesi için önce geçici dosyaya yazılır
+        siralama.to_csv(hedef + '.tmp', index=False, encoding='utf-8-sig')
+        os.replace(hedef + '.tmp', hedef)
+
+
+def ana(argumanlar=None):
+    ayristirici = argparse.ArgumentParser(
+        prog='python -m borsa_analiz.canli',
+        description="Klasörü izler, değişen sembollerin analizlerini gün içinde günceller.")
+    ayristirici.add_argument('klasor', help="Terminalin CSV yazdığı klasör")
+    ayristirici.add_argument('-o', '--cikti', help="Sıralamaların yazılacağı klasör (varsayılan: KLASOR/CANLI)")
+    ayristirici.add_argument('-a', '--analiz', nargs='+', metavar='AD', choices=list(CANLI_ANALIZLER),
+                             help="Sadece bu analizleri izle")
+    ayristirici.add_argument('--aralik', type=float, default=2.0, help="Kontrol aralığı (saniye)")
+    ayristirici.add_argument('--ilk', type=int, default=ILK_N, help="Sıralamada tutulacak satır sayısı")
+    ayristirici.add_argument('--tur', type=int, help="Bu kadar güncellemeden sonra dur")
+    secenekler = ayristirici.parse_args(argumanlar)
+
+    konsol_gunlugu()
+    mod = CanliMod(secenekler.klasor, secenekler.cikti or os.path.join(secenekler.klasor, 'CANLI'),
+                   secenekler.analiz, secenekler.ilk)
+    print(f"[{secenekler.klasor}] canlı izleniyor ({', '.join(mod.dosyalar)})...")
+    mod.izle(secenekler.aralik, secenekler.tur)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(ana())
\ No newline at end of file
@@ -0,0 +1,195 @@
+"""
+================================================================================
+MODÜL ADI   : Derinlik Motoru (Vektörel Kademe Hesapları)
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+DERINLIK_ALIS-1.csv ve DERINLIK_SATIS-1.csv dosyalarındaki geniş satırları
+("1 ALIS", "1 ALIS ADET", ... "14 ALIS ADET") bir kez
+(sembol x kademe) boyutunda NumPy fiyat ve lot matrislerine çevirir.
+Toplam lot, en büyük yığılma (duvar), WAPD ve net dengesizlik gibi
+metrikler satır satır döngü yerine tüm dizi üzerinde hesaplanır.
+
+Satır bazlı metrikler (toplam lot, duvar, WAPD) matris başına bir kez
+hesaplanır. satirlar() / ortak_semboller() ile türetilen matrisler bu
+metrikleri ana matristen satır seçerek alır; böylece aynı paketteki
+Destek, WAPD ve Otomatik Derinlik analizleri toplamları tekrar hesaplamaz.
+
+NOT:
+Toplamlar kademe sırasıyla (1, 2, ... N) yapılır. Böylece eski
+'iterrows' döngüleriyle ondalık basamağına kadar aynı sonuç çıkar.
+================================================================================
+"""
+
+import numpy as np
+import pandas as pd
+
+from .veri_paketi import veri_paketi_al
+
+TARAF_DOSYALARI = {
+    'ALIS': 'DERINLIK_ALIS-1.csv',
+    'SATIS': 'DERINLIK_SATIS-1.csv',
+}
+
+
+class DerinlikMatrisi:
+    def __init__(self, semboller, fiyat, adet, taraf, kaynak=None):
+        self.semboller = semboller  # (n,) sembol dizisi
+        self.fiyat = fiyat          # (n, kademe) fiyat matrisi, boş kademeler NaN
+        self.adet = adet            # (n, kademe) lot matrisi, boş kademeler NaN
+        self.taraf = taraf
+        self._kaynak = kaynak       # (ana matris, satır indeksi): satirlar() ile türetildiyse
+        self._metrikler = {}        # Ana matriste hesaplanmış satır bazlı metrikler
+
+    @classmethod
+    def tablodan(cls, df, taraf, derinlik_siniri):
+        """Geniş derinlik tablosunu matrise çevirir.
+
+        Dosyada sütunu (fiyat veya adet) olmayan kademeler, eski kodlardaki
+        'if col in row' kontrolünde olduğu gibi tamamen boş (NaN) sayılır.
+        """
+        n = len(df)
+        fiyat = np.full((n, derinlik_siniri), np.nan)
+        adet = np.full((n, derinlik_siniri), np.nan)
+        for i in range(1, derinlik_siniri + 1):
+            col_adet = f"{i} {taraf} ADET"
+            col_fiyat = f"{i} {taraf}"
+            if col_adet in df.columns and col_fiyat in df.columns:
+                adet[:, i - 1] = df[col_adet].to_numpy(dtype='float64', na_value=np.nan)
+                fiyat[:, i - 1] = df[col_fiyat].to_numpy(dtype='float64', na_value=np.nan)
+        return cls(df['SEMBOL'].to_numpy(), fiyat, adet, taraf)
+
+    def __len__(self):
+        return len(self.semboller)
+
+    def satirlar(self, indeks):
+        """Verilen satır sırasına göre yeni bir matris döndürür (birleştirme / hizalama için)."""
+        ana, ana_indeks = self._kaynak or (self, None)
+        kaynak = (ana, indeks if ana_indeks is None else ana_indeks[indeks])
+        return DerinlikMatrisi(self.semboller[indeks], self.fiyat[indeks], self.adet[indeks], self.taraf, kaynak)
+
+    def _metrik(self, anahtar, hesapla):
+        # Metrik ana matriste bir kez hesaplanır; türetilmiş matris kendi satırlarını seçer.
+        # Önbellekteki diziler salt okunurdur (paylaşılan sonucu yerinde değiştirmek hata verir).
+        if self._kaynak is not None:
+            ana, indeks = self._kaynak
+            sonuc = ana._metrik(anahtar, hesapla)
+            return tuple(d[indeks] for d in sonuc) if isinstance(sonuc, tuple) else sonuc[indeks]
+        if anahtar not in self._metrikler:
+            sonuc = hesapla(self)
+            for d in (sonuc if isinstance(sonuc, tuple) else (sonuc,)):
+                d.flags.writeable = False
+            self._metrikler[anahtar] = sonuc
+        return self._metrikler[anahtar]
+
+    # --- KADEME MASKELERİ ---
+    def gecerli(self, fiyat_gerekli=False):
+        """Hesaba katılacak kademeler: lot dolu (ve istenirse fiyat da dolu) olanlar."""
+        maske = ~np.isnan(self.adet)
+        if fiyat_gerekli:
+            maske &= ~np.isnan(self.fiyat)
+        return maske
+
+    # --- METRİKLER ---
+    def toplam_lot(self, fiyat_gerekli=False):
+        return self._metrik(('toplam_lot', fiyat_gerekli),
+                            lambda m: _sirali_toplam(np.where(m.gecerli(fiyat_gerekli), m.adet, 0.0)))
+
+    def duvar(self, fiyat_gerekli=False):
+        """En büyük yığılmanın (Major Destek/Direnç) fiyatı ve lotu.
+
+        Eski döngüdeki 'if adet > en_yuksek_lot' kuralı: ilk en büyük kademe
+        seçilir, hiç pozitif lot yoksa fiyat ve lot 0 kalır.
+        """
+        return self._metrik(('duvar', fiyat_gerekli), lambda m: m._duvar(fiyat_gerekli))
+
+    def _duvar(self, fiyat_gerekli):
+        lotlar = np.where(self.gecerli(fiyat_gerekli), self.adet, -np.inf)
+        kademe = np.argmax(lotlar, axis=1)
+        satir = np.arange(len(self))
+        duvar_lot = lotlar[satir, kademe]
+        var = duvar_lot > 0
+        return np.where(var, self.fiyat[satir, kademe], 0.0), np.where(var, duvar_lot, 0.0)
+
+    def en_buyuk_kademe(self):
+        """Dolu kademeler arasında en büyük lot, fiyatı, ortalama lot ve dolu kademe sayısı.
+
+        Likidite Duvarı analizindeki 'max(lotlar)' mantığı: eşik yoktur,
+        eşitlikte ilk kademe seçilir.
+        """
+        return self._metrik(('en_buyuk_kademe',), lambda m: m._en_buyuk_kademe())
+
+    def _en_buyuk_kademe(self):
+        maske = self.gecerli()
+        sayi = maske.sum(axis=1)
+        lotlar = np.where(maske, self.adet, -np.inf)
+        kademe = np.argmax(lotlar, axis=1)
+        satir = np.arange(len(self))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ortalama = self.toplam_lot() / sayi
+        return lotlar[satir, kademe], self.fiyat[satir, kademe], ortalama, sayi
+
+    def wapd(self):
+        """Ağırlıklı Ortalama Derinlik Fiyatı: Toplam (Fiyat * Lot) / Toplam Lot.
+
+        Sadece fiyatı ve lotu dolu kademeler kullanılır. Lot yoksa WAPD 0'dır.
+        Dönüş: (wapd, toplam_lot)
+        """
+        return self._metrik(('wapd',), lambda m: m._wapd())
+
+    def _wapd(self):
+        maske = self.gecerli(fiyat_gerekli=True)
+        hacim = _sirali_toplam(np.where(maske, self.adet * self.fiyat, 0.0))
+        lot = self.toplam_lot(fiyat_gerekli=True)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            wapd = np.where(lot > 0, hacim / lot, 0.0)
+        return wapd, lot
+
+
+def net_dengesizlik(toplam_alis, toplam_satis):
+    """Derinlik Oranı ve net lot farkı.
+
+    Oran = Alış / Satış. Satıcı yoksa 100 (tavan olabilir), veri yoksa 0.
+    """
+    with np.errstate(invalid='ignore', divide='ignore'):
+        oran = np.where(toplam_satis > 0, toplam_alis / toplam_satis,
+                        np.where(toplam_alis > 0, 100.0, 0.0))
+    return oran, toplam_alis - toplam_satis
+
+
+def derinlik_matrisi(ana_dizin, taraf, derinlik_siniri):
+    """Paketteki derinlik dosyasını matrise çevirir; aynı paket için tekrar hesaplanmaz."""
+    paket = veri_paketi_al(ana_dizin)
+    return paket.ara_sonuc(
+        ('derinlik_matrisi', taraf, derinlik_siniri),
+        lambda: DerinlikMatrisi.tablodan(paket.oku(TARAF_DOSYALARI[taraf]), taraf, derinlik_siniri),
+    )
+
+
+def ortak_semboller(sol, sag):
+    """İki matrisi SEMBOL üzerinden 'inner' birleştirir (soldaki sıra korunur)."""
+    sag_indeks = sembol_konumlari(sag.semboller, sol.semboller)
+    sol_indeks = np.flatnonzero(sag_indeks >= 0)
+    return sol.satirlar(sol_indeks), sag.satirlar(sag_indeks[sol_indeks])
+
+
+def sembol_konumlari(semboller, aranan):
+    """'aranan' içindeki her sembolün 'semboller' dizisindeki konumu (yoksa -1).
+
+    Tekrarlanan sembollerde ilk satır kullanılır.
+    """
+    indeks = pd.Index(semboller)
+    if indeks.is_unique:
+        return indeks.get_indexer(aranan)
+    ilk = np.flatnonzero(~indeks.duplicated())
+    konum = pd.Index(semboller[ilk]).get_indexer(aranan)
+    return np.where(konum >= 0, ilk[konum], -1)
+
+
+def _sirali_toplam(degerler):
+    # Kademeleri soldan sağa tek tek topla (eski döngüdeki toplama sırası)
+    toplam = np.zeros(degerler.shape[0])
+    for k in range(degerler.shape[1]):
+        toplam += degerler[:, k]
+    return toplam
@@ -0,0 +1,402 @@
+"""
+================================================================================
+MODÜL ADI   : Emir Defteri (Bellek İçi L2 Kademe Defteri)
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Derinlik analizleri (Otomatik Derinlik, Likidite Duvarı, Destek, WAPD)
+bugüne kadar sadece 14 kademelik geniş satırlı snapshot dosyalarını
+anlıyordu. Bu modül her hisse için bir emir defteri tutar ve kademe
+güncellemelerini (ekle / değiştir / sil) yerinde uygular:
+- Merdiven: bir tarafın fiyat sıralı kademeleri, sabit kapasiteli NumPy
+  dizilerinde (alışta en yüksek, satışta en düşük fiyat 1. kademedir).
+- Toplam lot ve WAPD pay / paydası her güncellemede artımlı tutulur;
+  toplam_lot, wapd ve en büyük kademe (duvar) sorguları O(1)'dir.
+  Duvar kademesi silinir veya küçülürse sadece bir sonraki sorguda
+  kademeler (en fazla kapasite kadar) yeniden taranır.
+- Defterler: sembol -> EmirDefteri. Günün snapshot dosyalarından
+  kurulabilir (tablodan) ve mevcut analizler için tekrar DerinlikMatrisi
+  üretebilir (matris).
+
+NOT:
+Defterde fiyatı olmayan kademe tutulamaz. Snapshot'taki fiyatı boş
+kademeler atlanır; defter metrikleri derinlik_motoru'nun fiyat_gerekli=True
+hesaplarıyla (Destek, WAPD) birebir aynıdır.
+
+GÜNCELLEME AKIŞI:
+Her satır 'SEMBOL,TARAF,ISLEM,FIYAT,LOT' biçimindedir (ISLEM: A=ekle,
+M=değiştir, D=sil; TARAF: ALIS / SATIS). Gerçek besleme yerine kayıtlı
+bir dosya (dosyadan_oku) veya yerel soket (soketten_oku) kullanılabilir.
+
+KULLANIM:
+    python -m borsa_analiz.emir_defteri KAYIT.csv --snapshot VERI_KLASORU
+================================================================================
+"""
+
+import argparse
+import socket
+import sys
+import time
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from .derinlik_motoru import TARAF_DOSYALARI, DerinlikMatrisi, derinlik_matrisi, net_dengesizlik
+from .siralama import ilk_n
+from .veri_paketi import VeriPaketi
+
+KADEME_DERINLIGI = 14
+
+EKLE, DEGISTIR, SIL = 'A', 'M', 'D'
+
+Guncelleme = namedtuple('Guncelleme', ['sembol', 'taraf', 'islem', 'fiyat', 'lot'])
+
+OZET_SUTUNLARI = ['SEMBOL', 'DERINLIK_ORANI', 'TOPLAM_ALIS_LOT', 'TOPLAM_SATIS_LOT', 'NET_FARK_LOT',
+                  'MAJOR_DESTEK', 'MAJOR_DIRENC', 'WAPD_ALIS', 'WAPD_SATIS']
+
+
+class DefterHatasi(Exception):
+    pass
+
+
+class Merdiven:
+    def __init__(self, taraf, kapasite=KADEME_DERINLIGI):
+        if taraf not in TARAF_DOSYALARI:
+            raise DefterHatasi(f"Tanımsız taraf: {taraf}")
+        self.taraf = taraf
+        self._yon = -1.0 if taraf == 'ALIS' else 1.0   # Sıralama anahtarı: yon * fiyat artan
+        self.fiyat = np.zeros(kapasite)
+        self.lot = np.zeros(kapasite, dtype='int64')
+        self._anahtar = np.zeros(kapasite)     # yon * fiyat (searchsorted için artan)
+        self.n = 0
+        self.toplam_lot = 0
+        self.hacim = 0.0            # Toplam (Fiyat * Lot): WAPD payı
+        self._duvar = -1            # En büyük lotlu kademe; None: yeniden taranacak
+
+    def __len__(self):
+        return self.n
+
+    def __repr__(self):
+        return f"Merdiven({self.taraf!r}, kademe={self.n}, toplam_lot={self.toplam_lot})"
+
+    @property
+    def kapasite(self):
+        return len(self.fiyat)
+
+    def kademeler(self):
+        """(fiyat, lot) dizileri; 1. kademe en iyi fiyattır (kopya değil, görünüm)."""
+        return self.fiyat[:self.n], self.lot[:self.n]
+
+    # --- GÜNCELLEMELER ---
+    def _bul(self, fiyat):
+        """Fiyatın sıralı konumu ve o konumda aynı fiyatın bulunup bulunmadığı."""
+        i = int(self._anahtar[:self.n].searchsorted(self._yon * fiyat))
+        return i, i < self.n and self.fiyat[i] == fiyat
+
+    def ekle(self, fiyat, lot):
+        """Kademe ekler; fiyat zaten varsa lotunu değiştirir.
+
+        Merdiven doluysa en kötü kademe düşer; en kötüden de kötü bir
+        fiyat eklenmez. Dönüş: defter değişti mi?
+        """
+        if lot <= 0:
+            return self.sil(fiyat)
+        i, var = self._bul(fiyat)
+        if var:
+            return self._lot_degistir(i, lot)
+        if i >= self.kapasite:
+            return False
+        if self.n == self.kapasite:
+            self._cikar(self.n - 1)
+        n = self.n
+        self.fiyat[i + 1:n + 1] = self.fiyat[i:n]
+        self.lot[i + 1:n + 1] = self.lot[i:n]
+        self._anahtar[i + 1:n + 1] = self._anahtar[i:n]
+        self.fiyat[i] = fiyat
+        self._anahtar[i] = self._yon * fiyat
+        self.lot[i] = lot
+        self.n = n + 1
+        self.toplam_lot += lot
+        self.hacim += fiyat * lot
+        if self._duvar is not None:
+            if self._duvar >= i:
+                self._duvar += 1
+            if self._duvar < 0 or lot > self.lot[self._duvar] or (lot == self.lot[self._duvar] and i < self._duvar):
+                self._duvar = i
+        return True
+
+    def degistir(self, fiyat, lot):
+        """Var olan kademenin lotunu değiştirir (lot 0 ise siler); kademe yoksa False."""
+        if lot <= 0:
+            return self.sil(fiyat)
+        i, var = self._bul(fiyat)
+        return self._lot_degistir(i, lot) if var else False
+
+    def sil(self, fiyat):
+        i, var = self._bul(fiyat)
+        if not var:
+            return False
+        self._cikar(i)
+        return True
+
+    def _lot_degistir(self, i, lot):
+        eski = int(self.lot[i])
+        if lot == eski:
+            return False
+        self.lot[i] = lot
+        self.toplam_lot += lot - eski
+        self.hacim += self.fiyat[i] * (lot - eski)
+        if self._duvar is not None:
+            if i == self._duvar:
+                if lot < eski:
+                    self._duvar = None
+            elif lot > self.lot[self._duvar] or (lot == self.lot[self._duvar] and i < self._duvar):
+                self._duvar = i
+        return True
+
+    def _cikar(self, i):
+        n = self.n
+        self.toplam_lot -= int(self.lot[i])
+        self.hacim -= self.fiyat[i] * self.lot[i]
+        self.fiyat[i:n - 1] = self.fiyat[i + 1:n]
+        self.lot[i:n - 1] = self.lot[i + 1:n]
+        self._anahtar[i:n - 1] = self._anahtar[i + 1:n]
+        self.n = n - 1
+        if self.n == 0:
+            self.hacim = 0.0    # Çıkarma artıklarını (yuvarlama) temizle
+        if self._duvar is not None:
+            if i == self._duvar:
+                self._duvar = None
+            elif self._duvar > i:
+                self._duvar -= 1
+
+    def yukle(self, fiyatlar, lotlar):
+        """Merdiveni bir snapshot satırından kurar (boş / sıfır kademeler atlanır)."""
+        self.n = 0
+        for fiyat, lot in zip(fiyatlar, lotlar):
+            if not (np.isnan(fiyat) or np.isnan(lot)) and lot > 0 and self.n < self.kapasite:
+                self.fiyat[self.n] = fiyat
+                self.lot[self.n] = int(lot)
+                self.n += 1
+        # Snapshot kademeleri zaten fiyat sıralıdır; değilse sırala
+        anahtar = self._yon * self.fiyat[:self.n]
+        if self.n > 1 and (np.diff(anahtar) < 0).any():
+            sira = np.argsort(anahtar, kind='stable')
+            self.fiyat[:self.n] = self.fiyat[:self.n][sira]
+            self.lot[:self.n] = self.lot[:self.n][sira]
+        self._anahtar[:self.n] = self._yon * self.fiyat[:self.n]
+        self.yeniden_hesapla()
+        return self
+
+    def yeniden_hesapla(self):
+        """Toplamları kademelerden baştan hesaplar (artımlı toplamdaki yuvarlamayı sıfırlar)."""
+        fiyat, lot = self.kademeler()
+        self.toplam_lot = int(lot.sum())
+        hacim = 0.0
+        for f, l in zip(fiyat.tolist(), lot.tolist()):
+            hacim += f * l      # Kademe sırasıyla, derinlik_motoru ile aynı toplama sırası
+        self.hacim = hacim
+        self._duvar = None
+
+    # --- METRİKLER (O(1)) ---
+    def wapd(self):
+        """Ağırlıklı Ortalama Derinlik Fiyatı (lot yoksa 0)."""
+        return self.hacim / self.toplam_lot if self.toplam_lot > 0 else 0.0
+
+    def duvar(self):
+        """En büyük lotlu kademenin (fiyat, lot); eşitlikte en iyi fiyat. Kademe yoksa (0, 0)."""
+        if self._duvar is None:
+            self._duvar = int(np.argmax(self.lot[:self.n])) if self.n else -1
+        if self._duvar < 0:
+            return 0.0, 0
+        return float(self.fiyat[self._duvar]), int(self.lot[self._duvar])
+
+
+class EmirDefteri:
+    def __init__(self, sembol, kapasite=KADEME_DERINLIGI):
+        self.sembol = sembol
+        self.taraflar = {taraf: Merdiven(taraf, kapasite) for taraf in TARAF_DOSYALARI}
+        self.guncelleme_sayisi = 0
+
+    def __repr__(self):
+        return f"EmirDefteri({self.sembol!r}, alis={len(self.alis)}, satis={len(self.satis)})"
+
+    @property
+    def alis(self):
+        return self.taraflar['ALIS']
+
+    @property
+    def satis(self):
+        return self.taraflar['SATIS']
+
+    def uygula(self, taraf, islem, fiyat, lot=0):
+        """Tek bir kademe güncellemesini uygular. Dönüş: defter değişti mi?"""
+        merdiven = self.taraflar.get(taraf)
+        if merdiven is None:
+            raise DefterHatasi(f"Tanımsız taraf: {taraf}")
+        if islem == EKLE:
+            degisti = merdiven.ekle(fiyat, lot)
+        elif islem == DEGISTIR:
+            degisti = merdiven.degistir(fiyat, lot)
+        elif islem == SIL:
+            degisti = merdiven.sil(fiyat)
+        else:
+            raise DefterHatasi(f"Tanımsız işlem: {islem}")
+        self.guncelleme_sayisi += 1
+        return degisti
+
+    def ozet(self):
+        """Otomatik Derinlik ve WAPD analizlerindeki metriklerin bu defterdeki değerleri."""
+        toplam_alis, toplam_satis = self.alis.toplam_lot, self.satis.toplam_lot
+        oran, net_fark = net_dengesizlik(np.float64(toplam_alis), np.float64(toplam_satis))
+        return {
+            'SEMBOL': self.sembol,
+            'DERINLIK_ORANI': float(oran),
+            'TOPLAM_ALIS_LOT': toplam_alis,
+            'TOPLAM_SATIS_LOT': toplam_satis,
+            'NET_FARK_LOT': int(net_fark),
+            'MAJOR_DESTEK': self.alis.duvar()[0],
+            'MAJOR_DIRENC': self.satis.duvar()[0],
+            'WAPD_ALIS': self.alis.wapd(),
+            'WAPD_SATIS': self.satis.wapd(),
+        }
+
+
+class Defterler:
+    def __init__(self, kapasite=KADEME_DERINLIGI):
+        self.kapasite = kapasite
+        self.defterler = {}     # Sembol -> EmirDefteri
+        self.degisenler = set() # Son ozet_tablosu() çağrısından beri değişen semboller
+
+    def __len__(self):
+        return len(self.defterler)
+
+    def __getitem__(self, sembol):
+        defter = self.defterler.get(sembol)
+        if defter is None:
+            defter = self.defterler[sembol] = EmirDefteri(sembol, self.kapasite)
+        return defter
+
+    def __contains__(self, sembol):
+        return sembol in self.defterler
+
+    def __repr__(self):
+        return f"Defterler({len(self)} sembol)"
+
+    def uygula(self, guncelleme):
+        """Guncelleme (veya aynı alanlı demet) uygular; değişen sembolü işaretler."""
+        sembol, taraf, islem, fiyat, lot = guncelleme
+        if self[sembol].uygula(taraf, islem, fiyat, lot):
+            self.degisenler.add(sembol)
+            return True
+        return False
+
+    def hepsini_uygula(self, guncellemeler):
+        """Akıştaki bütün güncellemeleri uygular, uygulanan satır sayısını döndürür."""
+        sayi = 0
+        for guncelleme in guncellemeler:
+            self.uygula(guncelleme)
+            sayi += 1
+        return sayi
+
+    # --- SNAPSHOT KÖPRÜSÜ ---
+    @classmethod
+    def tablodan(cls, ana_dizin, kapasite=KADEME_DERINLIGI):
+        """Günün DERINLIK_ALIS-1 / DERINLIK_SATIS-1 dosyalarından defterleri kurar."""
+        defterler = cls(kapasite)
+        paket = ana_dizin if isinstance(ana_dizin, VeriPaketi) else VeriPaketi(ana_dizin)
+        for taraf in TARAF_DOSYALARI:
+            matris = derinlik_matrisi(paket, taraf, kapasite)
+            for sembol, fiyatlar, lotlar in zip(matris.semboller, matris.fiyat, matris.adet):
+                if sembol in defterler and len(defterler[sembol].taraflar[taraf]):
+                    continue    # Tekrarlanan sembolde ilk satır (analizlerdeki gibi)
+                defterler[sembol].taraflar[taraf].yukle(fiyatlar, lotlar)
+        return defterler
+
+    def matris(self, taraf, semboller=None):
+        """Defterlerin güncel halini DerinlikMatrisi olarak döndürür (boş kademeler NaN).
+
+        Mevcut analizlerin vektörel hesapları canlı defter üzerinde
+        çalıştırılabilir.
+        """
+        semboller = list(self.defterler) if semboller is None else list(semboller)
+        fiyat = np.full((len(semboller), self.kapasite), np.nan)
+        adet = np.full((len(semboller), self.kapasite), np.nan)
+        for satir, sembol in enumerate(semboller):
+            merdiven = self[sembol].taraflar[taraf]
+            fiyatlar, lotlar = merdiven.kademeler()
+            fiyat[satir, :merdiven.n] = fiyatlar
+            adet[satir, :merdiven.n] = lotlar
+        return DerinlikMatrisi(np.array(semboller, dtype=object), fiyat, adet, taraf)
+
+    def ozet_tablosu(self, sadece_degisenler=False):
+        """Her defterin ozet() satırı; sadece_degisenler=True ise son çağrıdan beri değişenler."""
+        semboller = sorted(self.degisenler) if sadece_degisenler else list(self.defterler)
+        self.degisenler = set()
+        return pd.DataFrame([self.defterler[s].ozet() for s in semboller], columns=OZET_SUTUNLARI)
+
+
+# --- GÜNCELLEME KAYNAKLARI ---
+def satir_coz(satir):
+    """'SEMBOL,TARAF,ISLEM,FIYAT[,LOT]' satırını Guncelleme'ye çevirir (boş / # satırlar: None)."""
+    satir = satir.strip()
+    if not satir or satir.startswith('#'):
+        return None
+    parcalar = satir.split(',')
+    if len(parcalar) not in (4, 5):
+        raise DefterHatasi(f"Geçersiz güncelleme satırı: {satir!r}")
+    sembol, taraf, islem, fiyat = (p.strip() for p in parcalar[:4])
+    lot = int(float(parcalar[4])) if len(parcalar) == 5 and parcalar[4].strip() else 0
+    return Guncelleme(sembol, taraf.upper(), islem.upper(), float(fiyat), lot)
+
+
+def satirlardan(satirlar):
+    for satir in satirlar:
+        guncelleme = satir_coz(satir)
+        if guncelleme is not None:
+            yield guncelleme
+
+
+def dosyadan_oku(yol):
+    """Kayıtlı güncelleme dosyasını (başlık satırı '#' ile başlayabilir) sırayla okur."""
+    with open(yol, encoding='utf-8') as f:
+        yield from satirlardan(f)
+
+
+def soketten_oku(adres):
+    """Yerel sokete bağlanıp satır satır gelen güncellemeleri okur.
+
+    adres: UNIX soket yolu (str) veya (host, port).
+    """
+    aile = socket.AF_UNIX if isinstance(adres, str) else socket.AF_INET
+    with socket.socket(aile, socket.SOCK_STREAM) as baglanti:
+        baglanti.connect(adres)
+        with baglanti.makefile('r', encoding='utf-8') as akis:
+            yield from satirlardan(akis)
+
+
+def ana(argumanlar=None):
+    ayristirici = argparse.ArgumentParser(
+        prog='python -m borsa_analiz.emir_defteri',
+        description="Kayıtlı kademe güncellemelerini emir defterlerine uygular.")
+    ayristirici.add_argument('kayit', help="Güncelleme dosyası (SEMBOL,TARAF,ISLEM,FIYAT,LOT)")
+    ayristirici.add_argument('--snapshot', metavar='KLASOR', help="Başlangıç defterleri için günün derinlik dosyaları")
+    ayristirici.add_argument('--ilk', type=int, default=15, help="Gösterilecek hisse sayısı")
+    secenekler = ayristirici.parse_args(argumanlar)
+
+    defterler = Defterler.tablodan(secenekler.snapshot) if secenekler.snapshot else Defterler()
+    baslangic = time.perf_counter()
+    sayi = defterler.hepsini_uygula(dosyadan_oku(secenekler.kayit))
+    sure = time.perf_counter() - baslangic
+    print(f"{sayi} güncelleme {sure:.3f} sn'de uygulandı "
+          f"({sayi / sure if sure else 0:,.0f} güncelleme/sn, {len(defterler)} sembol).")
+
+    df = defterler.ozet_tablosu(sadece_degisenler=True)
+    print(ilk_n(df, 'DERINLIK_ORANI', secenekler.ilk).to_string(index=False))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(ana())
\ No newline at end of file
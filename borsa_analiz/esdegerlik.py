@@ -0,0 +1,296 @@
+"""
+================================================================================
+MODÜL ADI   : Eşdeğerlik Testi (Eski Satır Satır Kod - Yeni Motorlar)
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Scriptlerin eski, iterrows() ile satır satır çalışan halleri
+(Matematiksel/ klasörü) ile borsa_analiz.analizler fonksiyonlarını aynı
+snapshot'larda çalıştırır, sonuç tablolarını karşılaştırır:
+- Satırlar SEMBOL üzerinden eşlenir; sadece bir tarafta olan semboller
+  ve sadece bir tarafta olan sütunlar ayrıca sayılır.
+- Sayısal sütunlar bağıl / mutlak toleransla (np.isclose, NaN = NaN),
+  diğerleri birebir karşılaştırılır.
+- İki taraf da uçtan uca ölçülür (CSV okuma dahil, önbelleksiz); HIZ_KATI
+  eski süre / yeni süredir.
+Yeni bir hızlandırma, bu test farksız geçmeden üretime alınmamalıdır.
+
+ESKİ KODUN YÜKLENMESİ:
+Eski scriptler içe aktarılınca sabit klasör yolunda analiz çalıştırıp
+ekrana rapor basar. Bu yüzden dosya ast ile ayrıştırılır; sadece importlar,
+fonksiyon tanımları ve sabit atamaları (KADEME_DERINLIGI, KURUMSAL_LISTESI
+...) çalıştırılır. Scriptin kendi çağrısındaki (df = f(DOSYA_KONUMU, ...))
+parametreler aynen iki tarafa da verilir. Aynı düzendeki başka bir klasör
+(ör. scriptlerin eski bir sürümü) --eski ile gösterilebilir.
+
+NOT:
+Satır sırası (SIRA_AYNI) ve yeni tarafın fazladan sütunları (FAZLA_SUTUN)
+bilgi amaçlıdır. Eski tabloda olup yenide olmayan sütun (EKSIK_SUTUN)
+tabloyu eşitsiz yapar; yeni motorun bilerek taşımadığı sütunlar (ör.
+okumadığı ham girdi sütunları) BEKLENEN_EKSIK_SUTUNLAR'da analiz başına
+açıkça listelenir. Eski kodun ekrana bastıkları yutulur; eski tarafın hatası
+("HATA: ..." basıp None döndürmesi) de ESIT=False olarak raporlanır.
+
+KULLANIM:
+    python -m borsa_analiz.esdegerlik ARSIV/2025-01-02 VERI_KLASORU
+    python -m borsa_analiz.esdegerlik --sentetik 500 5000 --kademe 14 50
+    python -m borsa_analiz.esdegerlik ARSIV -a wapd_analizi --rtol 1e-6 -o ESDEGERLIK.csv
+================================================================================
+"""
+
+import argparse
+import ast
+import glob
+import io
+import logging
+import os
+import sys
+import time
+import warnings
+from collections import namedtuple
+from contextlib import redirect_stdout
+
+import numpy as np
+import pandas as pd
+
+from .analizler import ANALIZ_FONKSIYONLARI
+from .arsiv import gun_klasoru_mu, gunleri_bul
+from .kiyaslama import veri_klasoru
+from .veri_paketi import VeriPaketi
+
+ESKI_KLASOR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Matematiksel')
+RTOL = 1e-9
+ATOL = 1e-9
+ORNEK_FARK = 5      # Analiz başına gösterilen farklı hücre sayısı
+
+# Analiz -> eski tabloda olup yeni tabloda bilerek olmayan sütunlar
+BEKLENEN_EKSIK_SUTUNLAR = {
+    # Şemada sadece kapanışlar ve HACIM / HACIM-1 okunur; eski kod ACILISLAR'ın bütün sütunlarını taşıyordu
+    'sikisma_analizi': (['ACILIS', 'YUKSEK', 'DUSUK'] + [f'HACIM-{i}' for i in range(2, 6)]
+                        + [f'{alan}-{i}' for alan in ('DUSUK', 'YUKSEK') for i in range(1, 5)]),
+}
+
+EskiAnaliz = namedtuple('EskiAnaliz', ['ad', 'dosya', 'fonksiyon', 'parametreler'])
+
+
+class EsdegerlikHatasi(Exception):
+    """Eski script yüklenemedi (analiz çağrısı bulunamadı)."""
+
+
+def _analiz_cagrisi(dugum):
+    """'df = analiz(DOSYA_KONUMU, ...)' atamasıysa çağrı düğümü, değilse None."""
+    if isinstance(dugum, ast.Assign) and isinstance(dugum.value, ast.Call):
+        cagri = dugum.value
+        if isinstance(cagri.func, ast.Name) and cagri.func.id in ANALIZ_FONKSIYONLARI:
+            return cagri
+    return None
+
+
+def eski_analizi_yukle(dosya):
+    """Eski scriptten analiz fonksiyonunu ve scriptin verdiği parametreleri yükler."""
+    with open(dosya, encoding='utf-8') as f:
+        agac = ast.parse(f.read(), dosya)
+
+    govde, cagri = [], None
+    for dugum in agac.body:
+        if isinstance(dugum, (ast.Import, ast.ImportFrom, ast.FunctionDef)):
+            govde.append(dugum)
+        elif _analiz_cagrisi(dugum) is not None:
+            cagri = cagri or _analiz_cagrisi(dugum)
+        elif isinstance(dugum, ast.Assign):
+            try:
+                ast.literal_eval(dugum.value)
+            except ValueError:
+                continue    # Sabit olmayan (rapor) ataması
+            govde.append(dugum)
+    if cagri is None:
+        raise EsdegerlikHatasi(f"Analiz çağrısı bulunamadı: {dosya}")
+
+    ad_alani = {'__name__': f'eski.{cagri.func.id}', '__file__': dosya}
+    exec(compile(ast.Module(govde, type_ignores=[]), dosya, 'exec'), ad_alani)
+    # İlk argüman veri klasörüdür (DOSYA_KONUMU); kalanlar scriptin sabitleri
+    parametreler = tuple(eval(compile(ast.Expression(a), dosya, 'eval'), ad_alani) for a in cagri.args[1:])
+    return EskiAnaliz(cagri.func.id, dosya, ad_alani[cagri.func.id], parametreler)
+
+
+def eski_analizler(klasor=ESKI_KLASOR):
+    """Klasördeki eski scriptler: analiz adı -> EskiAnaliz."""
+    sonuc = {}
+    for dosya in sorted(glob.glob(os.path.join(klasor, '*.py'))):
+        eski = eski_analizi_yukle(dosya)
+        sonuc[eski.ad] = eski
+    if not sonuc:
+        raise EsdegerlikHatasi(f"Eski script bulunamadı: {klasor}")
+    return sonuc
+
+
+def _hizala(df):
+    """SEMBOL tekilse SEMBOL indeksli, değilse sıra indeksli tablo."""
+    if 'SEMBOL' in df.columns and df['SEMBOL'].is_unique:
+        return df.set_index('SEMBOL', drop=False)
+    return df.reset_index(drop=True)
+
+
+def _sayisal_mi(seri):
+    return pd.api.types.is_numeric_dtype(seri) or pd.api.types.is_bool_dtype(seri)
+
+
+def cerceve_farki(eski, yeni, rtol=RTOL, atol=ATOL, beklenen_eksik=()):
+    """İki sonuç tablosunun farkı.
+
+    Döner: sözlük (ESIT, ORTAK_SATIR, SADECE_ESKI, SADECE_YENI, EKSIK_SUTUN,
+    FAZLA_SUTUN, FARKLI_HUCRE, SIRA_AYNI) ve farklı hücrelerin tablosu
+    (ANAHTAR: SEMBOL veya satır sırası, SUTUN, ESKI, YENI). EKSIK_SUTUN,
+    beklenen_eksik dışında yeni tabloda olmayan eski sütunlardır.
+    """
+    a, b = _hizala(eski), _hizala(yeni)
+    ortak = a.index.intersection(b.index, sort=False)
+    sutunlar = [s for s in a.columns if s in b.columns]
+
+    farklar = []
+    for sutun in sutunlar:
+        x, y = a.loc[ortak, sutun], b.loc[ortak, sutun]
+        if _sayisal_mi(x) and _sayisal_mi(y):
+            xf, yf = x.to_numpy(dtype='float64'), y.to_numpy(dtype='float64')
+            esit = np.isclose(xf, yf, rtol=rtol, atol=atol, equal_nan=True)
+        else:
+            esit = ((x.astype(object) == y.astype(object)) | (x.isna() & y.isna())).to_numpy()
+        if not esit.all():
+            farklar.append(pd.DataFrame({
+                'ANAHTAR': ortak[~esit], 'SUTUN': sutun,
+                'ESKI': x[~esit].to_numpy(), 'YENI': y[~esit].to_numpy()}))
+
+    fark = pd.concat(farklar, ignore_index=True) if farklar else \
+        pd.DataFrame(columns=['ANAHTAR', 'SUTUN', 'ESKI', 'YENI'])
+    ozet = {
+        'ORTAK_SATIR': len(ortak),
+        'SADECE_ESKI': len(a.index.difference(b.index)),
+        'SADECE_YENI': len(b.index.difference(a.index)),
+        'EKSIK_SUTUN': ', '.join(s for s in a.columns if s not in b.columns and s not in beklenen_eksik),
+        'FAZLA_SUTUN': ', '.join(s for s in b.columns if s not in a.columns),
+        'FARKLI_HUCRE': len(fark),
+        'SIRA_AYNI': list(a.index) == list(b.index),
+    }
+    ozet['ESIT'] = not (ozet['SADECE_ESKI'] or ozet['SADECE_YENI'] or ozet['FARKLI_HUCRE']
+                        or ozet['EKSIK_SUTUN'])
+    return ozet, fark
+
+
+def _eskiyi_calistir(eski, klasor):
+    ekran = io.StringIO()
+    baslangic = time.perf_counter()
+    with redirect_stdout(ekran), warnings.catch_warnings():
+        warnings.simplefilter('ignore')     # Eski kodun pandas uyarıları (parçalı DataFrame vb.)
+        df = eski.fonksiyon(klasor, *eski.parametreler)
+    sure = time.perf_counter() - baslangic
+    if df is None:
+        hatalar = [s for s in ekran.getvalue().splitlines() if s.startswith('HATA')]
+        raise RuntimeError(hatalar[-1] if hatalar else "eski kod sonuç döndürmedi")
+    return df, sure
+
+
+def _yeniyi_calistir(eski, klasor):
+    baslangic = time.perf_counter()
+    df = ANALIZ_FONKSIYONLARI[eski.ad](VeriPaketi(klasor, onbellek=False), *eski.parametreler)
+    return df, time.perf_counter() - baslangic
+
+
+def esdegerlik(klasorler, adlar=None, eski_klasor=ESKI_KLASOR, rtol=RTOL, atol=ATOL, bildir=print):
+    """Her (klasör, analiz) için eski ve yeni sonucu karşılaştırır; özet tablosunu döndürür."""
+    eskiler = eski_analizler(eski_klasor)
+    adlar = [ad for ad in (adlar or ANALIZ_FONKSIYONLARI) if ad in eskiler]
+
+    # Eski ve yeni tarafın veri uyarıları karşılaştırma çıktısını kalabalıklaştırmasın
+    logging.getLogger('borsa_analiz.analizler').setLevel(logging.ERROR)
+
+    satirlar = []
+    for klasor in klasorler:
+        for ad in adlar:
+            satir = {'KLASOR': klasor, 'ANALIZ': ad}
+            try:
+                df_eski, satir['ESKI_SN'] = _eskiyi_calistir(eskiler[ad], klasor)
+                df_yeni, satir['YENI_SN'] = _yeniyi_calistir(eskiler[ad], klasor)
+            except Exception as e:
+                satir.update(ESIT=False, HATA=str(e))
+                satirlar.append(satir)
+                bildir(f"{ad:28s} HATA: {e}")
+                continue
+            ozet, fark = cerceve_farki(df_eski, df_yeni, rtol, atol, BEKLENEN_EKSIK_SUTUNLAR.get(ad, ()))
+            satir.update(ozet, HIZ_KATI=satir['ESKI_SN'] / satir['YENI_SN'] if satir['YENI_SN'] > 0 else np.nan)
+            satirlar.append(satir)
+
+            durum = 'EŞİT' if ozet['ESIT'] else 'FARKLI'
+            bildir(f"{ad:28s} {durum:6s} {ozet['ORTAK_SATIR']:>6d} satır  "
+                   f"eski {satir['ESKI_SN']:8.3f} sn  yeni {satir['YENI_SN']:7.3f} sn  x{satir['HIZ_KATI']:.1f}")
+            if not ozet['ESIT']:
+                for alan in ('SADECE_ESKI', 'SADECE_YENI', 'EKSIK_SUTUN'):
+                    if ozet[alan]:
+                        bildir(f"    {alan}: {ozet[alan]}")
+                if len(fark):
+                    bildir(fark.head(ORNEK_FARK).to_string(index=False))
+
+    sutunlar = ['KLASOR', 'ANALIZ', 'ESIT', 'ORTAK_SATIR', 'SADECE_ESKI', 'SADECE_YENI', 'EKSIK_SUTUN',
+                'FAZLA_SUTUN', 'FARKLI_HUCRE', 'SIRA_AYNI', 'ESKI_SN', 'YENI_SN', 'HIZ_KATI', 'HATA']
+    return pd.DataFrame(satirlar).reindex(columns=sutunlar)
+
+
+def _klasorler(kaynaklar):
+    """Gün klasörleri aynen, diğerleri arşiv olarak açılır."""
+    klasorler = []
+    for kaynak in kaynaklar:
+        if gun_klasoru_mu(kaynak):
+            klasorler.append(kaynak)
+        else:
+            klasorler += [g.klasor for g in gunleri_bul([kaynak])]
+    return klasorler
+
+
+def ana(argumanlar=None):
+    ayristirici = argparse.ArgumentParser(
+        prog='python -m borsa_analiz.esdegerlik',
+        description="Eski satır satır analizlerle yeni motorların sonuçlarını ve hızlarını karşılaştırır.")
+    ayristirici.add_argument('kaynaklar', nargs='*', metavar='KLASOR',
+                             help="Veri klasörü, arşiv klasörü veya glob deseni")
+    ayristirici.add_argument('--sentetik', nargs='+', type=int, metavar='SEMBOL',
+                             help="Bu sembol sayılarında sentetik snapshot'lar da kullan")
+    ayristirici.add_argument('--kademe', nargs='+', type=int, default=[14], help="Sentetik derinlik kademeleri")
+    ayristirici.add_argument('--veri', help="Sentetik snapshot klasörü (varsayılan: geçici klasör)")
+    ayristirici.add_argument('-a', '--analiz', nargs='+', metavar='AD', help="Sadece bu analizler")
+    ayristirici.add_argument('--eski', default=ESKI_KLASOR, help=f"Eski scriptlerin klasörü (varsayılan: {ESKI_KLASOR})")
+    ayristirici.add_argument('--rtol', type=float, default=RTOL, help=f"Bağıl tolerans (varsayılan: {RTOL})")
+    ayristirici.add_argument('--atol', type=float, default=ATOL, help=f"Mutlak tolerans (varsayılan: {ATOL})")
+    ayristirici.add_argument('-o', '--cikti', help="Özet tablonun yazılacağı CSV")
+    secenekler = ayristirici.parse_args(argumanlar)
+
+    bilinmeyen = [ad for ad in secenekler.analiz or [] if ad not in ANALIZ_FONKSIYONLARI]
+    if bilinmeyen:
+        ayristirici.error(f"Tanımsız analiz: {', '.join(bilinmeyen)} (bilinenler: {', '.join(ANALIZ_FONKSIYONLARI)})")
+    if not secenekler.kaynaklar and not secenekler.sentetik:
+        ayristirici.error("en az bir KLASOR veya --sentetik gerekli")
+
+    try:
+        klasorler = _klasorler(secenekler.kaynaklar)
+        for kademe in secenekler.kademe if secenekler.sentetik else []:
+            klasorler += [veri_klasoru(secenekler.veri, sembol, kademe) for sembol in sorted(secenekler.sentetik)]
+        ozet = esdegerlik(klasorler, secenekler.analiz, secenekler.eski, secenekler.rtol, secenekler.atol)
+    except Exception as e:
+        print(f"HATA: {e}")
+        return 1
+
+    if secenekler.cikti:
+        ozet.to_csv(secenekler.cikti, index=False, encoding='utf-8-sig')
+        print(f"\n✓ Özet: {secenekler.cikti}")
+
+    farkli = ozet[~ozet['ESIT'].astype(bool)]
+    print("\n" + "=" * 85)
+    print(f" {len(ozet) - len(farkli)}/{len(ozet)} karşılaştırma eşit"
+          f" | medyan hız katı x{ozet['HIZ_KATI'].median():.1f}")
+    print("=" * 85)
+    if len(farkli):
+        print(farkli[['KLASOR', 'ANALIZ', 'FARKLI_HUCRE', 'SADECE_ESKI', 'SADECE_YENI', 'HATA']].to_string(index=False))
+    return 1 if len(farkli) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(ana())
\ No newline at end of file
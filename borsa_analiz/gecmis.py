@@ -0,0 +1,294 @@
+"""
+================================================================================
+MODÜL ADI   : Geçmiş Deposu (Tarih Bölümlü Sütunsal OHLCV Deposu)
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Fiyat geçmişi günlük dosyalarda geniş gecikme sütunları olarak geliyor
+(KAPANIS-1..10, HACIM-1..5, DUSUK-1..4, YUKSEK-1..4; kapanışların yarısı
+ACILISLAR-2.csv'de). Bu yüzden geriye en fazla 11 kapanış görülebiliyor
+ve aynı geçmiş her gün tekrar taşınıp ayrıştırılıyor.
+
+GecmisDeposu her günün ACILISLAR-1 snapshot'ını bir kez alır ve sadece o
+günün ACILIS / KAPANIS / YUKSEK / DUSUK / HACIM değerlerini ekler:
+    DEPO/semboller.txt          sembol -> kalıcı tam sayı kimlik (satır no)
+    DEPO/katalog.json           alınan günler ve kaynak dosya özetleri
+    DEPO/2026-10-16/KIMLIK.npy  o gün satırı olan sembollerin kimlikleri
+    DEPO/2026-10-16/KAPANIS.npy ... (alan başına bir dizi)
+Depo sadece eklenir: alınmış bir gün farklı içerikle tekrar gelirse
+GecmisHatasi yükseltilir (yeniden=True ile bilerek değiştirilebilir).
+
+pencere(alan, gun) istenen uzunlukta (20, 60, 250 ...) geçmişi
+(sembol x gün) biçiminde bitişik bir float64 dizi olarak verir; sütunlar
+eskiden yeniye sıralıdır, satırı olmayan gün NaN kalır. genis_tablo()
+aynı pencereyi eski KAPANIS, KAPANIS-1 ... düzeninde DataFrame yapar.
+
+TOHUMLAMA:
+Boş bir depo, ilk snapshot'taki gecikme sütunlarından (tohumla=True)
+geriye doğru doldurulabilir. Dosyada tarih olmadığı için gecikmeli
+günlere iş günü takvimi (hafta sonu hariç, tatiller dahil) ile tarih
+verilir; bu günler katalogda 'tohum' işaretlidir ve o günün gerçek
+snapshot'ı alınınca yerine geçer.
+
+KULLANIM:
+    python -m borsa_analiz.gecmis ekle VERI_KLASORU --depo GECMIS --tarih 2026-10-16
+    python -m borsa_analiz.gecmis ekle ARSIV/2026-10-* --depo GECMIS
+    python -m borsa_analiz.gecmis goster --depo GECMIS --alan KAPANIS --gun 60 --sembol THYAO
+================================================================================
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+from collections import namedtuple
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from .arsiv import klasor_tarihi
+from .onbellek import icerik_ozeti
+from .veri_paketi import VeriPaketi, veri_paketi_al
+
+SURUM = 1
+ALANLAR = ['ACILIS', 'KAPANIS', 'YUKSEK', 'DUSUK', 'HACIM']
+
+# Alan -> günlük dosyalardaki gecikme sütunlarının en büyük gecikmesi
+GECIKMELER = {'KAPANIS': 10, 'HACIM': 5, 'YUKSEK': 4, 'DUSUK': 4}
+
+Pencere = namedtuple('Pencere', ['semboller', 'tarihler', 'degerler'])
+
+
+class GecmisHatasi(Exception):
+    pass
+
+
+class GecmisDeposu:
+    def __init__(self, kok):
+        self.kok = kok
+        os.makedirs(kok, exist_ok=True)
+        self.katalog = self._katalog_oku()
+        self.semboller = self._semboller_oku()
+        self._kimlik = {s: i for i, s in enumerate(self.semboller)}
+        self._bolumler = {}     # (tarih, alan) -> yüklenmiş dizi
+
+    def __len__(self):
+        return len(self.katalog['gunler'])
+
+    def __repr__(self):
+        gunler = self.tarihler()
+        aralik = f"{gunler[0]}..{gunler[-1]}" if gunler else "boş"
+        return f"GecmisDeposu({self.kok!r}, {len(gunler)} gün {aralik}, {len(self.semboller)} sembol)"
+
+    def tarihler(self, bitis=None):
+        """Depodaki günler (eskiden yeniye); bitis verilirse o güne kadar olanlar."""
+        gunler = sorted(self.katalog['gunler'])
+        if bitis is not None:
+            gunler = [g for g in gunler if g <= _tarih(bitis)]
+        return gunler
+
+    # --- ALMA ---
+    def ekle(self, veri, tarih=None, tohumla=False, yeniden=False):
+        """Günün ACILISLAR-1 snapshot'ını depoya ekler; eklenen gün listesini döndürür.
+
+        tarih verilmezse analizlerin günü aradığı tarih kullanılır
+        (arsiv.klasor_tarihi: klasör adındaki tarih, yoksa ACILISLAR-1.csv'nin
+        değişiklik tarihi). Aynı içerikli gün tekrar verilirse bir şey yapılmaz.
+        """
+        paket = veri_paketi_al(veri)
+        yol = paket.yol('ACILISLAR-1.csv')
+        tarih = _tarih(tarih or klasor_tarihi(paket.ana_dizin))
+        ozet = icerik_ozeti(yol)
+
+        kayit = self.katalog['gunler'].get(tarih)
+        if kayit is not None and not kayit.get('tohum'):
+            if kayit['ozet'] == ozet:
+                return []
+            if not yeniden:
+                raise GecmisHatasi(f"{tarih} farklı içerikle zaten depoda ({kayit['kaynak']}).")
+
+        df = paket.oku('ACILISLAR-1.csv').drop_duplicates('SEMBOL')
+        kimlikler = self._kimlikler(df['SEMBOL'].astype(str))
+        self._bolum_yaz(tarih, kimlikler, {alan: _sutun(df, alan) for alan in ALANLAR})
+        self.katalog['gunler'][tarih] = {'kaynak': os.path.abspath(yol), 'ozet': ozet, 'satir': len(df)}
+        eklenen = [tarih]
+        if tohumla:
+            eklenen += self._tohumla(paket, df, kimlikler, tarih)
+        self._katalog_yaz()
+        return eklenen
+
+    def _tohumla(self, paket, df, kimlikler, tarih):
+        # Gecikme sütunlarından geçmiş günler; gerçek günlerin üzerine yazılmaz
+        uzak = None
+        if any(f'KAPANIS-{i}' not in df.columns for i in range(1, GECIKMELER['KAPANIS'] + 1)) \
+                and paket.var_mi('ACILISLAR-2.csv'):
+            uzak = paket.sembol_indeksli('ACILISLAR-2.csv').reindex(df['SEMBOL'])
+        eklenen = []
+        for gecikme in range(1, max(GECIKMELER.values()) + 1):
+            gun = _tarih(pd.Timestamp(tarih) - pd.offsets.BDay(gecikme))
+            if gun in self.katalog['gunler']:
+                continue
+            degerler = {}
+            for alan in ALANLAR:
+                sutun = f'{alan}-{gecikme}'
+                if sutun in df.columns:
+                    degerler[alan] = _sutun(df, sutun)
+                elif uzak is not None and sutun in uzak.columns:
+                    degerler[alan] = uzak[sutun].to_numpy(dtype='float64', na_value=np.nan)
+                else:
+                    degerler[alan] = np.full(len(df), np.nan)
+            if all(np.isnan(d).all() for d in degerler.values()):
+                continue
+            self._bolum_yaz(gun, kimlikler, degerler)
+            self.katalog['gunler'][gun] = {'kaynak': os.path.abspath(paket.yol('ACILISLAR-1.csv')),
+                                           'ozet': None, 'satir': len(df), 'tohum': True}
+            eklenen.append(gun)
+        return eklenen
+
+    # --- OKUMA ---
+    def pencere(self, alan, gun, bitis=None, semboller=None):
+        """Son 'gun' günün 'alan' değerleri: Pencere(semboller, tarihler, degerler).
+
+        degerler (sembol x gün) bitişik float64 dizidir, sütunlar eskiden
+        yeniye sıralıdır. Depoda daha az gün varsa o kadar sütun döner.
+        semboller verilirse satırlar o sırayla (depoda olmayan sembol NaN).
+        """
+        if alan not in ALANLAR:
+            raise GecmisHatasi(f"Bilinmeyen alan: {alan} (geçerli: {', '.join(ALANLAR)})")
+        tarihler = self.tarihler(bitis)[-gun:] if gun > 0 else []
+        # Günler satır satır (bitişik) doldurulup tek seferde çevrilir. Son
+        # sütun hep NaN: depoda olmayan sembol (-1) oraya düşer.
+        gunluk_degerler = np.full((len(tarihler), len(self.semboller) + 1), np.nan)
+        for j, tarih in enumerate(tarihler):
+            gunluk_degerler[j, self._bolum(tarih, 'KIMLIK')] = self._bolum(tarih, alan)
+        if semboller is None:
+            etiketler = pd.Index(self.semboller, name='SEMBOL')
+            return Pencere(etiketler, tarihler, np.ascontiguousarray(gunluk_degerler[:, :-1].T))
+        etiketler = pd.Index(semboller, name='SEMBOL').astype(str)
+        satirlar = pd.Index(self.semboller).get_indexer(etiketler)
+        return Pencere(etiketler, tarihler, np.ascontiguousarray(gunluk_degerler[:, satirlar].T))
+
+    def genis_tablo(self, alan, gun, bitis=None, semboller=None):
+        """Pencereyi günlük dosyalardaki düzende verir: SEMBOL, ALAN, ALAN-1, ... (yeniden eskiye)."""
+        p = self.pencere(alan, gun, bitis, semboller)
+        sutunlar = [alan] + [f'{alan}-{i}' for i in range(1, len(p.tarihler))]
+        df = pd.DataFrame(p.degerler[:, ::-1], columns=sutunlar)
+        df.insert(0, 'SEMBOL', p.semboller.to_numpy())
+        return df
+
+    # --- DEPOLAMA ---
+    def _kimlikler(self, semboller):
+        yeni = [s for s in pd.unique(semboller) if s not in self._kimlik]
+        if yeni:
+            for s in yeni:
+                self._kimlik[s] = len(self.semboller)
+                self.semboller.append(s)
+            _atomik_yaz(os.path.join(self.kok, 'semboller.txt'), '\n'.join(self.semboller) + '\n')
+        return np.fromiter((self._kimlik[s] for s in semboller), dtype='int32', count=len(semboller))
+
+    def _bolum_yaz(self, tarih, kimlikler, degerler):
+        hedef = os.path.join(self.kok, tarih)
+        gecici = hedef + '.tmp'
+        shutil.rmtree(gecici, ignore_errors=True)
+        os.makedirs(gecici)
+        np.save(os.path.join(gecici, 'KIMLIK.npy'), kimlikler)
+        for alan, dizi in degerler.items():
+            np.save(os.path.join(gecici, f'{alan}.npy'), np.ascontiguousarray(dizi, dtype='float64'))
+        if os.path.exists(hedef):
+            shutil.rmtree(hedef)
+        os.replace(gecici, hedef)
+        for anahtar in [a for a in self._bolumler if a[0] == tarih]:
+            del self._bolumler[anahtar]
+
+    def _bolum(self, tarih, alan):
+        anahtar = (tarih, alan)
+        if anahtar not in self._bolumler:
+            self._bolumler[anahtar] = np.load(os.path.join(self.kok, tarih, f'{alan}.npy'))
+        return self._bolumler[anahtar]
+
+    def _katalog_oku(self):
+        yol = os.path.join(self.kok, 'katalog.json')
+        if not os.path.exists(yol):
+            return {'surum': SURUM, 'gunler': {}}
+        with open(yol, encoding='utf-8') as f:
+            katalog = json.load(f)
+        if katalog.get('surum') != SURUM:
+            raise GecmisHatasi(f"Depo sürümü desteklenmiyor: {katalog.get('surum')}")
+        return katalog
+
+    def _katalog_yaz(self):
+        _atomik_yaz(os.path.join(self.kok, 'katalog.json'),
+                    json.dumps(self.katalog, ensure_ascii=False, indent=1, sort_keys=True))
+
+    def _semboller_oku(self):
+        yol = os.path.join(self.kok, 'semboller.txt')
+        if not os.path.exists(yol):
+            return []
+        with open(yol, encoding='utf-8') as f:
+            return f.read().splitlines()
+
+
+def _tarih(deger):
+    """'2026-10-16', date, datetime veya Timestamp -> 'YYYY-MM-DD'."""
+    if isinstance(deger, str):
+        return date.fromisoformat(deger).isoformat()
+    return pd.Timestamp(deger).date().isoformat()
+
+
+def _sutun(df, sutun):
+    if sutun not in df.columns:
+        return np.full(len(df), np.nan)
+    return df[sutun].to_numpy(dtype='float64', na_value=np.nan)
+
+
+def _atomik_yaz(yol, metin):
+    with open(yol + '.tmp', 'w', encoding='utf-8') as f:
+        f.write(metin)
+    os.replace(yol + '.tmp', yol)
+
+
+def ana(argumanlar=None):
+    ayristirici = argparse.ArgumentParser(
+        prog='python -m borsa_analiz.gecmis',
+        description="Günlük ACILISLAR snapshot'larını tarih bölümlü geçmiş deposunda toplar.")
+    komutlar = ayristirici.add_subparsers(dest='komut', required=True)
+
+    ekle = komutlar.add_parser('ekle', help="Bir veya daha fazla günün klasörünü depoya ekle")
+    ekle.add_argument('klasorler', nargs='+', help="Günün CSV klasörü")
+    ekle.add_argument('--depo', required=True, help="Depo klasörü")
+    ekle.add_argument('--tarih', help="Günün tarihi (YYYY-AA-GG; tek klasörde, varsayılan: klasör adındaki tarih, yoksa dosya tarihi)")
+    ekle.add_argument('--tohumla', action='store_true', help="Gecikme sütunlarından geçmiş günleri doldur")
+    ekle.add_argument('--yeniden', action='store_true', help="Farklı içerikli günün üzerine yaz")
+
+    goster = komutlar.add_parser('goster', help="Depodaki geçmişi göster")
+    goster.add_argument('--depo', required=True, help="Depo klasörü")
+    goster.add_argument('--alan', default='KAPANIS', choices=ALANLAR)
+    goster.add_argument('--gun', type=int, default=20, help="Geriye bakılacak gün sayısı")
+    goster.add_argument('--sembol', nargs='+', help="Sadece bu semboller")
+    secenekler = ayristirici.parse_args(argumanlar)
+
+    depo = GecmisDeposu(secenekler.depo)
+    if secenekler.komut == 'ekle':
+        if secenekler.tarih and len(secenekler.klasorler) > 1:
+            ayristirici.error("--tarih sadece tek klasörle kullanılabilir.")
+        for klasor in secenekler.klasorler:
+            try:
+                eklenen = depo.ekle(VeriPaketi(klasor), secenekler.tarih, secenekler.tohumla, secenekler.yeniden)
+            except Exception as e:
+                print(f"HATA: {klasor}: {e}")
+                continue
+            print(f"[{klasor}] {', '.join(eklenen) if eklenen else 'zaten depoda'}")
+        print(depo)
+        return 0
+
+    p = depo.pencere(secenekler.alan, secenekler.gun, semboller=secenekler.sembol)
+    df = pd.DataFrame(p.degerler, index=p.semboller, columns=p.tarihler)
+    print(df.dropna(how='all').to_string())
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(ana())
\ No newline at end of file
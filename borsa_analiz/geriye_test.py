@@ -0,0 +1,380 @@
+"""
+================================================================================
+MODÜL ADI   : Geriye Dönük Test (Sinyallerin İleri Getirileri)
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Günlük snapshot klasörlerinden oluşan bir arşivi analizlerden geçirir ve
+her sinyali (Büyük Tarama '🚀 MEGA BOĞA', Tahtacı 'SAHTE DESTEK (Mal
+Cakma)', WAPD 'GÜVENLİ LİMAN' ...) sembolün 1 / 5 / 20 gün sonraki
+getirisiyle eşleştirir. Sonuç, sinyal başına isabet oranı (getirisi
+pozitif olanların yüzdesi), ortalama / medyan getiri ve aynı günün bütün
+hisselerinin ortalamasına göre fark tablosudur.
+
+    ARSIV/2025-01-02/ACILISLAR-1.csv, DERINLIK_ALIS-1.csv ...
+    ARSIV/2025-01-03/...
+
+Her gün bir süreç havuzunda ayrı bir VeriPaketi ile çalışır (analizler
+aynı paketi paylaşır, bkz. calistirici.py). Günlerden sadece sinyaller
+(SEMBOL, SINYAL) ve kapanışlar döner; getiriler bütün arşiv için tek bir
+(sembol x gün) kapanış matrisinden hesaplanır, sinyaller bu matrise
+dizi indeksleme ile bağlanır ve istatistikler tek bir groupby ile çıkar.
+
+SİNYALLER:
+SINYALLER kaydı her analizin sonuç tablosunu (SEMBOL, SINYAL) satırlarına
+çevirir. Eşikler scriptlerin raporladığı listelerle aynıdır (ör. WAPD
+güvenli liman: desteğe uzaklık -%5 ile %2 arası ve alış lotu satıştan
+fazla). Sadece sıralama raporu olan analizler (Destek, Direnç, Sıkışma)
+için scriptin gösterdiği ilk N hisse sinyal sayılır.
+
+NOT:
+- Gün sırası arşivin (veya verilirse GecmisDeposu'nun) gün sırasıdır;
+  'h gün sonra' h işlem günü sonrasıdır. Arşivde eksik gün varsa o aralık
+  takvimde daha uzun bir süreye denk gelir.
+- Giriş fiyatı sinyal gününün kapanışıdır. Sonraki kapanışı olmayan
+  (arşiv sonu, işlem görmeyen hisse) sinyaller o ufkun istatistiğine
+  girmez; OLCULEN_hG sütunu ölçülebilen sinyal sayısıdır.
+- Gün klasörleri ve tarihleri arsiv.py ile bulunur: arşiv klasörü yerine
+  glob deseni ve tarih aralığı da verilebilir.
+
+KULLANIM:
+    python -m borsa_analiz.geriye_test ARSIV
+    python -m borsa_analiz.geriye_test ARSIV -a buyuk_tarama_robotu wapd_analizi --ufuk 1 5 20
+    python -m borsa_analiz.geriye_test ARSIV --depo GECMIS -j 4 -o RAPORLAR
+    python -m borsa_analiz.geriye_test "ARSIV/2024-*" --baslangic 2024-03-01
+================================================================================
+"""
+
+import argparse
+import logging
+import os
+import sys
+import warnings
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from .analizler import ANALIZ_FONKSIYONLARI
+from .arsiv import gunleri_bul, tarih_argumani
+from .siralama import ilk_n
+from .veri_paketi import VeriPaketi
+
+UFUKLAR = (1, 5, 20)
+
+GunSonucu = namedtuple('GunSonucu', ['tarih', 'sinyaller', 'semboller', 'kapanislar', 'hatalar'])
+GeriyeTestSonucu = namedtuple('GeriyeTestSonucu', ['istatistik', 'olaylar', 'hatalar'])
+
+
+# --- SİNYAL TANIMLARI ---
+def _etiketle(df, maske, etiket):
+    return df.loc[maske, ['SEMBOL']].assign(SINYAL=etiket)
+
+
+def _sutun_etiketi(sutun):
+    def cikar(df):
+        return df[['SEMBOL']].assign(SINYAL=df[sutun].astype(str))
+    return cikar
+
+
+def _ilk(sutun, adet, etiket, artan=False):
+    # Sadece sıralama raporu olan analizler: scriptin gösterdiği ilk 'adet' hisse
+    def cikar(df):
+        return ilk_n(df, sutun, adet, artan)[['SEMBOL']].assign(SINYAL=etiket)
+    return cikar
+
+
+def _acilis(df):
+    return pd.concat([
+        _etiketle(df, (df['GAP_YUZDE'] > 0.5) & (df['ACILIS_PERFORMANSI_YUZDE'] > 0.5), 'GÜÇLÜ İŞTAH'),
+        _etiketle(df, (df['GAP_YUZDE'] > 1.0) & (df['ACILIS_PERFORMANSI_YUZDE'] < -0.5), 'AÇILIŞ TUZAĞI'),
+    ])
+
+
+def _guclu_talep(df):
+    maske = (df['ROLATIF_HACIM'] > 1.5) & (df['DEGISIM_YUZDE'] > 2.0) & (df['NET_PARA_GIRIS_LOT'] > 0)
+    return _etiketle(df, maske, 'GÜÇLÜ TALEP')
+
+
+def _kademe_denge(df):
+    return pd.concat([
+        _etiketle(df, (df['AKTIF_DENGE'] > 0) & (df['PASIF_DENGE'] > 0), 'GÜÇLÜ ALICILI'),
+        _etiketle(df, (df['AKTIF_DENGE'] < 0) & (df['PASIF_DENGE'] < 0), 'GÜÇLÜ SATICILI'),
+    ])
+
+
+def _kurumsal(df):
+    maske = ((df['ALICI_KURUMSAL_MI'] == True)  # noqa: E712
+             & (df['MALIYET_FARK_YUZDE'] < 5.0) & (df['MALIYET_FARK_YUZDE'] > -5.0))
+    return _etiketle(df, maske, 'KURUMSAL ALIM FIRSATI')
+
+
+def _spread(df):
+    return _etiketle(df, (df['SPREAD_YUZDE'] < 0.5) & (df['SPREAD_YUZDE'] > 0), 'DAR MAKAS')
+
+
+def _manipulasyon(df):
+    # 'SAHTE DESTEK (Mal Cakma) + BASKILAMA (Mal Toplama)' gibi birleşik etiketler ayrı sinyal sayılır
+    turler = df['MANIPULASYON_TURU'].astype(str).str.split(' + ', regex=False)
+    return df[['SEMBOL']].assign(SINYAL=turler).explode('SINYAL')
+
+
+def _wapd(df):
+    return pd.concat([
+        _etiketle(df, (df['DESTEK_UZAKLIK_YUZDE'] < 2.0) & (df['DESTEK_UZAKLIK_YUZDE'] > -5.0)
+                  & (df['TOPLAM_ALIS_LOT'] > df['TOPLAM_SATIS_LOT']), 'GÜVENLİ LİMAN'),
+        _etiketle(df, (df['DIRENC_UZAKLIK_YUZDE'] < 2.0)
+                  & (df['TOPLAM_SATIS_LOT'] > df['TOPLAM_ALIS_LOT']), 'SATIŞ BASKISI'),
+    ])
+
+
+# Analiz adı -> sonuç tablosundan (SEMBOL, SINYAL) satırları çıkaran fonksiyon
+SINYALLER = {
+    'acilis_istahi_analizi': _acilis,
+    'buyuk_tarama_robotu': _sutun_etiketi('SİNYAL'),
+    'destek_analizi': _ilk('TOPLAM_ALIS_DESTEGI', 10, 'EN SAĞLAM DESTEK'),
+    'direnc_analizi': _ilk('TOPLAM_SATIS_BASKISI', 10, 'EN GÜÇLÜ DİRENÇ'),
+    'guclu_talep_analizi': _guclu_talep,
+    'kademe_denge_analizi': _kademe_denge,
+    'kritik_destek_analizi': lambda df: _etiketle(df, df['CAKISMA_DURUMU'] == 'VAR', 'KRİTİK DESTEK'),
+    'kritik_direnc_analizi': lambda df: _etiketle(df, df['CAKISMA_DURUMU'] == 'VAR', 'KRİTİK DİRENÇ'),
+    'kurumsal_maliyet_analizi': _kurumsal,
+    'likidite_duvari_analizi': _sutun_etiketi('YON'),
+    'otomatik_derinlik_analizi': _sutun_etiketi('DURUM'),
+    'spread_analizi': _spread,
+    'sikisma_analizi': _ilk('SIKISMA_PUANI', 15, 'EN SIKIŞIK', artan=True),
+    'manipulasyon_analizi': _manipulasyon,
+    'wapd_analizi': _wapd,
+}
+
+
+# --- GÜN ÇALIŞTIRMA (süreç havuzunda) ---
+def gunu_oynat(gun, adlar):
+    """Bir günün klasöründe analizleri çalıştırır; sinyalleri ve kapanışları döndürür.
+
+    Bir analizin hatası (eksik dosya vb.) diğerlerini durdurmaz, 'hatalar'a yazılır.
+    """
+    paket = VeriPaketi(gun.klasor)
+    for ad in adlar:
+        paket.ihtiyac_bildir(ad)
+    paket.onyukle()
+
+    sinyaller, hatalar = [], []
+    for ad in adlar:
+        try:
+            df = SINYALLER[ad](ANALIZ_FONKSIYONLARI[ad](paket))
+        except Exception as e:
+            hatalar.append((gun.tarih, ad, f"{type(e).__name__}: {e}"))
+            continue
+        sinyaller.append(df.assign(ANALIZ=ad))
+
+    try:
+        fiyatlar = paket.oku('ACILISLAR-1.csv').drop_duplicates('SEMBOL')
+        semboller = fiyatlar['SEMBOL'].astype(str).to_numpy()
+        kapanislar = fiyatlar['KAPANIS'].to_numpy(dtype='float64', na_value=np.nan)
+    except Exception as e:
+        hatalar.append((gun.tarih, 'ACILISLAR-1.csv', f"{type(e).__name__}: {e}"))
+        semboller, kapanislar = np.array([], dtype=object), np.array([])
+
+    if sinyaller:
+        sinyaller = pd.concat(sinyaller, ignore_index=True)
+        sinyaller = sinyaller.assign(SEMBOL=sinyaller['SEMBOL'].astype(str), SINYAL=sinyaller['SINYAL'].astype(str))
+    else:
+        sinyaller = pd.DataFrame(columns=['SEMBOL', 'SINYAL', 'ANALIZ'])
+    return GunSonucu(gun.tarih, sinyaller, semboller, kapanislar, hatalar)
+
+
+def _isci_baslat():
+    # Her gün için analizlerin bilgi satırları konsolu doldurmasın
+    logging.getLogger('borsa_analiz.analizler').setLevel(logging.ERROR)
+
+
+def gunleri_oynat(gunler, adlar, is_sayisi=None):
+    """Günleri süreç havuzunda çalıştırır; gün sırasıyla GunSonucu listesi döndürür."""
+    is_sayisi = min(is_sayisi or os.cpu_count() or 1, len(gunler))
+    if is_sayisi <= 1:
+        return [gunu_oynat(g, adlar) for g in gunler]
+    # Süreç başına birkaç gün: iş dağıtma ve sonuç taşıma maliyeti bölünür
+    parca = max(1, len(gunler) // (is_sayisi * 4))
+    with ProcessPoolExecutor(max_workers=is_sayisi, initializer=_isci_baslat) as havuz:
+        return list(havuz.map(gunu_oynat, gunler, [adlar] * len(gunler), chunksize=parca))
+
+
+# --- GETİRİLER VE İSTATİSTİKLER ---
+def kapanis_matrisi(gun_sonuclari):
+    """Gün sonuçlarının kapanışları: (semboller, tarihler, (sembol x gün) matris)."""
+    semboller = pd.Index(pd.unique(np.concatenate([g.semboller for g in gun_sonuclari])))
+    matris = np.full((len(semboller), len(gun_sonuclari)), np.nan)
+    for j, g in enumerate(gun_sonuclari):
+        matris[semboller.get_indexer(g.semboller), j] = g.kapanislar
+    return semboller, [g.tarih for g in gun_sonuclari], matris
+
+
+def ileri_getiriler(kapanislar, h):
+    """(sembol x gün) kapanışlardan h gün sonraki yüzde getiri; son h gün NaN."""
+    getiri = np.full(kapanislar.shape, np.nan)
+    if h < kapanislar.shape[1]:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            getiri[:, :-h] = (kapanislar[:, h:] / kapanislar[:, :-h] - 1) * 100
+    getiri[~np.isfinite(getiri)] = np.nan
+    return getiri
+
+
+def getirileri_bagla(olaylar, semboller, tarihler, kapanislar, ufuklar=UFUKLAR):
+    """Olaylara (TARIH, SEMBOL ...) her ufuk için GETIRI_hG ve EVRENE_FARK_hG ekler.
+
+    EVRENE_FARK: sinyalin getirisi eksi aynı gün bütün hisselerin ortalama getirisi.
+    """
+    satir = semboller.get_indexer(olaylar['SEMBOL'])
+    sutun = pd.Index(tarihler).get_indexer(olaylar['TARIH'])
+    gecerli = (satir >= 0) & (sutun >= 0)
+    olaylar = olaylar.copy()
+    for h in ufuklar:
+        matris = ileri_getiriler(kapanislar, h)
+        with warnings.catch_warnings():
+            # Hiç fiyatı olmayan gün sütunu: 'Mean of empty slice'
+            warnings.simplefilter('ignore', RuntimeWarning)
+            evren = np.nanmean(matris, axis=0)
+        getiri = np.full(len(olaylar), np.nan)
+        getiri[gecerli] = matris[satir[gecerli], sutun[gecerli]]
+        olaylar[f'GETIRI_{h}G'] = getiri
+        fark = np.full(len(olaylar), np.nan)
+        fark[gecerli] = getiri[gecerli] - evren[sutun[gecerli]]
+        olaylar[f'EVRENE_FARK_{h}G'] = fark
+    return olaylar
+
+
+def sinyal_istatistikleri(olaylar, ufuklar=UFUKLAR):
+    """(ANALIZ, SINYAL) başına ADET, GUN ve her ufuk için ölçülen / isabet / getiri özetleri."""
+    tablo = olaylar[['ANALIZ', 'SINYAL', 'TARIH']].copy()
+    adlandirilmis = {'ADET': ('TARIH', 'size'), 'GUN': ('TARIH', 'nunique')}
+    for h in ufuklar:
+        getiri = olaylar[f'GETIRI_{h}G']
+        tablo[f'G{h}'] = getiri
+        tablo[f'I{h}'] = (getiri > 0).astype('float64').where(getiri.notna())
+        tablo[f'F{h}'] = olaylar[f'EVRENE_FARK_{h}G']
+        adlandirilmis.update({
+            f'OLCULEN_{h}G': (f'G{h}', 'count'),
+            f'ISABET_{h}G': (f'I{h}', 'mean'),
+            f'ORT_GETIRI_{h}G': (f'G{h}', 'mean'),
+            f'MEDYAN_GETIRI_{h}G': (f'G{h}', 'median'),
+            f'EVRENE_FARK_{h}G': (f'F{h}', 'mean'),
+        })
+    sonuc = tablo.groupby(['ANALIZ', 'SINYAL'], sort=True).agg(**adlandirilmis).reset_index()
+    for h in ufuklar:
+        sonuc[f'ISABET_{h}G'] *= 100
+    return sonuc
+
+
+def evren_istatistigi(kapanislar, gun_sutunlari, ufuklar=UFUKLAR):
+    """Sinyal gözetmeksizin her (sembol, gün) çiftinin aynı özetleri: karşılaştırma satırı."""
+    gunler = kapanislar[:, gun_sutunlari]
+    satir = {'ANALIZ': 'EVREN', 'SINYAL': 'TÜM HİSSELER',
+             'ADET': int(np.isfinite(gunler).sum()), 'GUN': len(gun_sutunlari)}
+    for h in ufuklar:
+        getiri = ileri_getiriler(kapanislar, h)[:, gun_sutunlari]
+        getiri = getiri[~np.isnan(getiri)]
+        satir[f'OLCULEN_{h}G'] = len(getiri)
+        bos = len(getiri) == 0
+        satir[f'ISABET_{h}G'] = np.nan if bos else (getiri > 0).mean() * 100
+        satir[f'ORT_GETIRI_{h}G'] = np.nan if bos else getiri.mean()
+        satir[f'MEDYAN_GETIRI_{h}G'] = np.nan if bos else np.median(getiri)
+        # Günlük ortalamaya göre farkların ortalaması evrenin kendisi için tanım gereği 0
+        satir[f'EVRENE_FARK_{h}G'] = np.nan if bos else 0.0
+    return pd.DataFrame([satir])
+
+
+def geriye_test(arsiv, adlar=None, ufuklar=UFUKLAR, is_sayisi=None, depo=None):
+    """Arşivi analizlerden geçirir; GeriyeTestSonucu(istatistik, olaylar, hatalar) döndürür.
+
+    arsiv: gün klasörlerinin bulunduğu klasör veya Gun listesi (bkz. arsiv.gunleri_bul).
+    depo : verilirse kapanışlar arşiv yerine GecmisDeposu'ndan alınır; arşivin
+           son gününden sonraki günler de depodaysa ileri getiriler onlarla ölçülür.
+    """
+    gunler = gunleri_bul([arsiv]) if isinstance(arsiv, str) else sorted(arsiv)
+    adlar = [ad for ad in SINYALLER if ad in adlar] if adlar else list(SINYALLER)
+    ufuklar = sorted(set(ufuklar))
+
+    gun_sonuclari = gunleri_oynat(gunler, adlar, is_sayisi)
+
+    if depo is not None:
+        tarihler = [t for t in depo.tarihler() if t >= gunler[0].tarih]
+        p = depo.pencere('KAPANIS', len(tarihler))
+        semboller, tarihler, kapanislar = p.semboller, p.tarihler, p.degerler
+    else:
+        semboller, tarihler, kapanislar = kapanis_matrisi(gun_sonuclari)
+
+    olaylar = pd.concat([g.sinyaller.assign(TARIH=g.tarih) for g in gun_sonuclari], ignore_index=True)
+    olaylar = olaylar[['TARIH', 'ANALIZ', 'SINYAL', 'SEMBOL']].drop_duplicates(ignore_index=True)
+    olaylar = getirileri_bagla(olaylar, semboller, tarihler, kapanislar, ufuklar)
+
+    gun_sutunlari = pd.Index(tarihler).get_indexer([g.tarih for g in gunler])
+    istatistik = pd.concat([
+        sinyal_istatistikleri(olaylar, ufuklar),
+        evren_istatistigi(kapanislar, gun_sutunlari[gun_sutunlari >= 0], ufuklar),
+    ], ignore_index=True)
+    hatalar = pd.DataFrame([h for g in gun_sonuclari for h in g.hatalar], columns=['TARIH', 'ANALIZ', 'HATA'])
+    return GeriyeTestSonucu(istatistik, olaylar, hatalar)
+
+
+def ana(argumanlar=None):
+    ayristirici = argparse.ArgumentParser(
+        prog='python -m borsa_analiz.geriye_test',
+        description="Günlük snapshot arşivini analizlerden geçirip sinyallerin ileri getirilerini ölçer.")
+    ayristirici.add_argument('kaynaklar', nargs='+', metavar='ARSIV',
+                             help="Arşiv klasörü (2025-01-02/ ... alt klasörleri), gün klasörü veya glob deseni")
+    ayristirici.add_argument('--baslangic', type=tarih_argumani, help="Bu tarihten (YYYY-AA-GG) itibaren")
+    ayristirici.add_argument('--bitis', type=tarih_argumani, help="Bu tarihe (YYYY-AA-GG) kadar")
+    ayristirici.add_argument('-a', '--analiz', nargs='+', metavar='AD', help="Sadece bu analizlerin sinyalleri")
+    ayristirici.add_argument('--ufuk', nargs='+', type=int, default=list(UFUKLAR), metavar='GUN',
+                             help="İleri getiri ufukları (işlem günü, varsayılan: 1 5 20)")
+    ayristirici.add_argument('-j', '--is-sayisi', type=int, help="Süreç sayısı (varsayılan: çekirdek sayısı)")
+    ayristirici.add_argument('--depo', help="Kapanışları bu GecmisDeposu'ndan al")
+    ayristirici.add_argument('-o', '--cikti', help="İstatistik ve olay tablolarının yazılacağı klasör")
+    secenekler = ayristirici.parse_args(argumanlar)
+
+    bilinmeyen = [ad for ad in secenekler.analiz or [] if ad not in SINYALLER]
+    if bilinmeyen:
+        ayristirici.error(f"Tanımsız analiz: {', '.join(bilinmeyen)} (bilinenler: {', '.join(SINYALLER)})")
+    if any(h < 1 for h in secenekler.ufuk):
+        ayristirici.error("ufuklar en az 1 gün olmalı")
+
+    depo = None
+    if secenekler.depo:
+        from .gecmis import GecmisDeposu
+        depo = GecmisDeposu(secenekler.depo)
+
+    try:
+        gunler = gunleri_bul(secenekler.kaynaklar, secenekler.baslangic, secenekler.bitis)
+        sonuc = geriye_test(gunler, secenekler.analiz, secenekler.ufuk, secenekler.is_sayisi, depo)
+    except Exception as e:
+        print(f"HATA: {e}")
+        return 1
+
+    ufuk = min(secenekler.ufuk)
+    print("\n" + "=" * 100)
+    print(f" SİNYAL PERFORMANSI ({ufuk} GÜN SONRA; EVRENE GÖRE FARKA GÖRE SIRALI)")
+    print("=" * 100)
+    cols = ['ANALIZ', 'SINYAL', 'ADET', f'ISABET_{ufuk}G', f'ORT_GETIRI_{ufuk}G', f'EVRENE_FARK_{ufuk}G']
+    print(sonuc.istatistik.sort_values(by=f'EVRENE_FARK_{ufuk}G', ascending=False)[cols]
+          .to_string(index=False, float_format=lambda x: f"{x:.2f}"))
+
+    if len(sonuc.hatalar):
+        print(f"\nÇalışmayan analiz-gün: {len(sonuc.hatalar)}")
+        print(sonuc.hatalar.groupby('ANALIZ')['HATA'].agg(['size', 'first']).to_string())
+
+    if secenekler.cikti:
+        os.makedirs(secenekler.cikti, exist_ok=True)
+        zaman_damgasi = datetime.now().strftime("%Y%m%d_%H%M%S")
+        for ad, df in (('ISTATISTIK', sonuc.istatistik), ('OLAYLAR', sonuc.olaylar)):
+            dosya = os.path.join(secenekler.cikti, f'GERIYE_TEST_{ad}_{zaman_damgasi}.csv')
+            df.to_csv(dosya, index=False, encoding='utf-8-sig')
+            print(f"✓ {dosya}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(ana())
\ No newline at end of file
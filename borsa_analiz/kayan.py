@@ -0,0 +1,85 @@
+"""
+================================================================================
+MODÜL ADI   : Kayan Pencere İstatistikleri (Kümülatif Toplamlarla O(1) Pencere)
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+(sembol x gün) fiyat matrisinde her gün için son 'h' günün ortalama ve
+standart sapmasını hesaplar. Her satırın fiyat, fiyat karesi ve geçerli
+gözlem sayısının kümülatif toplamları bir kez alınır; her pencere iki
+kümülatif değerin farkıdır. Pencere uzunluğu ne olursa olsun pencere
+başına maliyet sabittir ve aynı toplamlar bütün ufuklarda paylaşılır.
+
+NOT:
+Boş (NaN) günler pandas'ın skipna davranışındaki gibi atlanır (std,
+ddof'tan fazla gözlem yoksa NaN). Büyük fiyatların karesini toplarken
+hassasiyet kaybolmasın diye değerler önce her satırın kendi ortalamasına
+göre kaydırılır (varyans kaydırmadan etkilenmez). Sonuç pandas rolling
+ile yuvarlama farkı (gerçek fiyatlarda ~1e-9 göreli) kadar ayrışabilir.
+================================================================================
+"""
+
+import numpy as np
+
+
+class KumulatifToplamlar:
+    def __init__(self, degerler):
+        degerler = np.asarray(degerler, dtype='float64')
+        gecerli = ~np.isnan(degerler)
+        sayi = gecerli.sum(axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.kayma = np.where(sayi > 0, np.where(gecerli, degerler, 0.0).sum(axis=1) / sayi, 0.0)
+        kaydirilmis = np.where(gecerli, degerler - self.kayma[:, None], 0.0)
+        self.gun_sayisi = degerler.shape[1]
+        # Başa sıfır sütunu: pencere toplamı = T[:, bitis + 1] - T[:, baslangic]
+        self.sayi = _kumulatif(gecerli, 'int32')
+        self.toplam = _kumulatif(kaydirilmis)
+        self.kare_toplam = _kumulatif(kaydirilmis * kaydirilmis)
+
+    def __repr__(self):
+        return f"KumulatifToplamlar({self.sayi.shape[0]} satır, {self.gun_sayisi} gün)"
+
+    def pencere(self, h, ddof=1, son=False):
+        """h günlük pencerelerin (ortalama, std, gözlem sayısı) matrisleri.
+
+        Sütun j, (j + h - 1). günde biten penceredir: h günden kısa geçmişin
+        baş kısmı için pencere üretilmez. son=True ise sadece son gün
+        (tek sütun) hesaplanır.
+        """
+        if h > self.gun_sayisi:
+            bos = np.empty((self.sayi.shape[0], 0))
+            return bos, bos, bos
+        bas = slice(self.gun_sayisi - h, self.gun_sayisi - h + 1) if son else slice(0, self.gun_sayisi - h + 1)
+        bit = slice(self.gun_sayisi, self.gun_sayisi + 1) if son else slice(h, self.gun_sayisi + 1)
+        sayi = self.sayi[:, bit] - self.sayi[:, bas]
+        toplam = self.toplam[:, bit] - self.toplam[:, bas]
+        varyans = self.kare_toplam[:, bit] - self.kare_toplam[:, bas]
+        # Büyük matrislerde bellek geçişi pahalı: ara sonuçlar yerinde güncellenir
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ortalama = toplam / sayi
+            toplam *= ortalama                          # (Σx)² / n
+            varyans -= toplam
+            varyans /= sayi - ddof
+        varyans[sayi <= ddof] = np.nan
+        np.maximum(varyans, 0.0, out=varyans)           # Yuvarlama kaynaklı -0.0...1 değerler
+        std = np.sqrt(varyans, out=varyans)
+        ortalama += self.kayma[:, None]
+        return ortalama, std, sayi
+
+
+def yuzdelik_sira(gecmis, deger):
+    """Her satırda, geçmiş değerlerin (NaN hariç) kaçta kaçı 'deger'den küçük veya eşit (0-100)."""
+    gecerli = ~np.isnan(gecmis)
+    sayi = gecerli.sum(axis=1)
+    altinda = (gecerli & (gecmis <= deger[:, None])).sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        sira = altinda / sayi * 100
+    sira[(sayi == 0) | np.isnan(deger)] = np.nan
+    return sira
+
+
+def _kumulatif(dizi, tur='float64'):
+    sonuc = np.zeros((dizi.shape[0], dizi.shape[1] + 1), dtype=tur)
+    np.cumsum(dizi, axis=1, dtype=tur, out=sonuc[:, 1:])
+    return sonuc
\ No newline at end of file
@@ -0,0 +1,248 @@
+"""
+================================================================================
+MODÜL ADI   : Kıyaslama (Analiz Başına Hız ve Bellek Ölçümü)
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Her analiz fonksiyonunu büyüyen sentetik snapshot'larda (varsayılan 500,
+5.000 ve 50.000 sembol; 14 ve 50 derinlik kademesi) çalıştırır ve şunları
+kaydeder:
+- okuma_sn : analizin dosyalarının pakete yüklenmesi (CSV ayrıştırma)
+- hesap_sn : yüklü paket üzerinde analiz fonksiyonu (tekrarların en iyisi)
+- satir_sn : girdi sembol sayısı / hesap_sn
+- bellek_mb: analiz sırasında tracemalloc ile görülen tepe ek bellek
+Bir boyuttan sonrakine süre artışı üs olarak da verilir (olcek: 1.0
+doğrusal, 2.0 karesel); sembol sayısıyla karesel büyüyen analiz işaretlenir.
+
+Sonuçlar JSON olarak yazılır. Kayıtlı bir taban (önceki bir JSON) ile
+karşılaştırınca hesap süresi veya bellek eşikten fazla artan ölçümler
+GERİLEME olarak raporlanır ve komut 1 ile çıkar.
+
+NOT:
+- Sentetik günler (bkz. sentetik.py) veri klasöründe bir kez üretilir ve
+  sonraki çalıştırmalarda aynen kullanılır; aynı tohumla aynı veridir.
+- Önbellek kapalıdır (okuma_sn her seferinde CSV ayrıştırmadır); her
+  tekrar yeni bir VeriPaketi ile başlar, analizler ara sonuç paylaşmaz.
+- Bellek ölçümü tracemalloc'u yavaşlattığı için ayrı bir çalıştırmadır;
+  süreler ondan etkilenmez.
+- Farklı makinelerde alınmış sonuçları karşılaştırmak anlamsızdır; JSON
+  ortam bilgisini (Python / pandas / numpy sürümü, işlemci) de taşır.
+
+KULLANIM:
+    python -m borsa_analiz.kiyaslama -o taban.json
+    python -m borsa_analiz.kiyaslama --taban taban.json -o yeni.json
+    python -m borsa_analiz.kiyaslama -a wapd_analizi likidite_duvari_analizi --sembol 500 5000 --kademe 14
+================================================================================
+"""
+
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from .analizler import ANALIZ_FONKSIYONLARI
+from .sentetik import sentetik_arsiv
+from .veri_paketi import VeriPaketi
+
+SURUM = 1
+SEMBOL_SAYILARI = (500, 5000, 50000)
+KADEMELER = (14, 50)
+TEKRAR = 5
+GERILEME_ESIGI = 0.25       # %25'ten fazla yavaşlama / bellek artışı
+GURULTU_SN = 0.01           # Bu kadar kısa süreler arasındaki fark gürültü sayılır
+KARESEL_OLCEK = 1.5         # Boyut üssü bunu aşarsa KARESEL işareti
+VERI_KOKU = os.path.join(tempfile.gettempdir(), 'borsa_analiz_kiyaslama')
+
+
+def veri_klasoru(kok, sembol, kademe, tohum=0):
+    """Boyut için sentetik günün klasörü (kok None ise VERI_KOKU altında); yoksa üretilir."""
+    klasor = os.path.join(kok or VERI_KOKU, f'sembol{sembol}_kademe{kademe}_tohum{tohum}')
+    if not os.path.exists(os.path.join(klasor, 'SENTETIK.json')):
+        sentetik_arsiv(klasor, tohum=tohum, sembol=sembol, kademe=kademe)
+    return klasor
+
+
+def analizi_olc(ad, klasor, tekrar=TEKRAR, bellek=True):
+    """Bir analizin bir snapshot'taki ölçümü: okuma / hesap süresi, çıktı satırı, tepe bellek."""
+    fonksiyon = ANALIZ_FONKSIYONLARI[ad]
+    okuma, hesap = [], []
+    for _ in range(tekrar):
+        paket = VeriPaketi(klasor, onbellek=False).ihtiyac_bildir(ad)
+        gc.collect()
+        t0 = time.perf_counter()
+        paket.onyukle()
+        t1 = time.perf_counter()
+        sonuc = fonksiyon(paket)
+        t2 = time.perf_counter()
+        okuma.append(t1 - t0)
+        hesap.append(t2 - t1)
+        cikti_satir = len(sonuc)
+        del sonuc
+
+    bellek_mb = None
+    if bellek:
+        paket = VeriPaketi(klasor, onbellek=False).ihtiyac_bildir(ad).onyukle()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            baslangic = tracemalloc.get_traced_memory()[0]
+            fonksiyon(paket)
+            bellek_mb = round((tracemalloc.get_traced_memory()[1] - baslangic) / 2**20, 2)
+        finally:
+            tracemalloc.stop()
+
+    hesap_sn = min(hesap)
+    return {
+        'okuma_sn': round(min(okuma), 4),
+        'hesap_sn': round(hesap_sn, 4),
+        'cikti_satir': cikti_satir,
+        'bellek_mb': bellek_mb,
+        '_hesap_sn': hesap_sn,
+    }
+
+
+def kiyasla(adlar=None, sembol_sayilari=SEMBOL_SAYILARI, kademeler=KADEMELER, tekrar=TEKRAR,
+            kok=None, tohum=0, bellek=True, bildir=print):
+    """Bütün (boyut, kademe, analiz) ölçümlerini çalıştırır; JSON'a yazılacak sözlüğü döndürür."""
+    adlar = list(adlar or ANALIZ_FONKSIYONLARI)
+    olcumler = []
+    for kademe in kademeler:
+        for sembol in sorted(sembol_sayilari):
+            klasor = veri_klasoru(kok, sembol, kademe, tohum)
+            for ad in adlar:
+                try:
+                    olcum = analizi_olc(ad, klasor, tekrar, bellek)
+                except Exception as e:
+                    bildir(f"HATA: {ad} ({sembol} sembol, {kademe} kademe): {e}")
+                    continue
+                olcum = dict({'analiz': ad, 'sembol': sembol, 'kademe': kademe}, **olcum)
+                olcum['satir_sn'] = round(sembol / olcum.pop('_hesap_sn'), 1) if olcum['hesap_sn'] > 0 else None
+                olcumler.append(olcum)
+                bildir(f"{ad:28s} {sembol:>6d} sembol {kademe:>3d} kademe  "
+                       f"okuma {olcum['okuma_sn']:8.3f} sn  hesap {olcum['hesap_sn']:8.3f} sn  "
+                       f"bellek {olcum['bellek_mb'] if olcum['bellek_mb'] is not None else '-':>8} MB")
+    return {
+        'surum': SURUM,
+        'zaman': datetime.now().isoformat(timespec='seconds'),
+        'ortam': ortam_bilgisi(),
+        'ayarlar': {'tekrar': tekrar, 'tohum': tohum, 'bellek': bellek},
+        'olcumler': olceklendir(olcumler),
+    }
+
+
+def olceklendir(olcumler):
+    """Her ölçüme, aynı analiz ve kademede bir önceki boyuta göre süre üssünü ekler."""
+    onceki = {}
+    for olcum in sorted(olcumler, key=lambda o: (o['analiz'], o['kademe'], o['sembol'])):
+        anahtar = (olcum['analiz'], olcum['kademe'])
+        olcum['olcek'] = None
+        if anahtar in onceki:
+            o = onceki[anahtar]
+            if min(o['hesap_sn'], olcum['hesap_sn']) > GURULTU_SN:
+                olcum['olcek'] = round(math.log(olcum['hesap_sn'] / o['hesap_sn']) / math.log(olcum['sembol'] / o['sembol']), 2)
+        onceki[anahtar] = olcum
+    return olcumler
+
+
+def ortam_bilgisi():
+    return {
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'islemci': platform.processor() or platform.machine(),
+        'cekirdek': os.cpu_count(),
+    }
+
+
+def karsilastir(taban, yeni, esik=GERILEME_ESIGI):
+    """Taban ve yeni ölçümleri eşleştirir; oranlar ve DURUM sütunuyla bir tablo döndürür.
+
+    DURUM: GERİLEME (hesap süresi veya bellek eşikten fazla arttı), İYİLEŞME,
+    KARESEL (boyut üssü KARESEL_OLCEK'i aştı) veya boş.
+    """
+    anahtar = ['analiz', 'sembol', 'kademe']
+    sutunlar = anahtar + ['hesap_sn', 'bellek_mb', 'olcek']
+    df = pd.DataFrame(yeni['olcumler'], columns=sutunlar).merge(
+        pd.DataFrame(taban['olcumler'], columns=sutunlar), on=anahtar, how='left', suffixes=('', '_TABAN'))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        df['HIZ_ORANI'] = df['hesap_sn'] / df['hesap_sn_TABAN']
+        df['BELLEK_ORANI'] = df['bellek_mb'].astype('float64') / df['bellek_mb_TABAN'].astype('float64')
+    yavas = (df['HIZ_ORANI'] > 1 + esik) & (df['hesap_sn'] - df['hesap_sn_TABAN'] > GURULTU_SN)
+    hizli = (df['HIZ_ORANI'] < 1 / (1 + esik)) & (df['hesap_sn_TABAN'] - df['hesap_sn'] > GURULTU_SN)
+    sisman = (df['BELLEK_ORANI'] > 1 + esik) & (df['bellek_mb'] - df['bellek_mb_TABAN'] > 1)
+    karesel = df['olcek'].astype('float64') > KARESEL_OLCEK
+    df['DURUM'] = np.select([yavas | sisman, karesel, hizli], ['GERİLEME', 'KARESEL', 'İYİLEŞME'], '')
+    return df
+
+
+def ana(argumanlar=None):
+    ayristirici = argparse.ArgumentParser(
+        prog='python -m borsa_analiz.kiyaslama',
+        description="Analizleri büyüyen sentetik snapshot'larda ölçer, tabanla karşılaştırır.")
+    ayristirici.add_argument('-a', '--analiz', nargs='+', metavar='AD', help="Sadece bu analizler")
+    ayristirici.add_argument('--sembol', nargs='+', type=int, default=list(SEMBOL_SAYILARI), help="Sembol sayıları")
+    ayristirici.add_argument('--kademe', nargs='+', type=int, default=list(KADEMELER), help="Derinlik kademeleri")
+    ayristirici.add_argument('--tekrar', type=int, default=TEKRAR, help="Süre ölçümü tekrar sayısı (en iyisi alınır)")
+    ayristirici.add_argument('--tohum', type=int, default=0, help="Sentetik veri tohumu")
+    ayristirici.add_argument('--veri', help="Sentetik günlerin klasörü (varsayılan: geçici klasör)")
+    ayristirici.add_argument('--bellek-yok', action='store_true', help="tracemalloc bellek ölçümünü atla")
+    ayristirici.add_argument('--taban', help="Karşılaştırılacak önceki sonuç (JSON)")
+    ayristirici.add_argument('--esik', type=float, default=GERILEME_ESIGI,
+                             help=f"Gerileme eşiği (oran, varsayılan: {GERILEME_ESIGI})")
+    ayristirici.add_argument('-o', '--cikti', help="Sonuçların yazılacağı JSON dosyası")
+    secenekler = ayristirici.parse_args(argumanlar)
+
+    bilinmeyen = [ad for ad in secenekler.analiz or [] if ad not in ANALIZ_FONKSIYONLARI]
+    if bilinmeyen:
+        ayristirici.error(f"Tanımsız analiz: {', '.join(bilinmeyen)} (bilinenler: {', '.join(ANALIZ_FONKSIYONLARI)})")
+
+    taban = None
+    if secenekler.taban:
+        try:
+            with open(secenekler.taban, encoding='utf-8') as f:
+                taban = json.load(f)
+        except Exception as e:
+            print(f"HATA: taban okunamadı: {e}")
+            return 1
+
+    sonuc = kiyasla(secenekler.analiz, secenekler.sembol, secenekler.kademe, secenekler.tekrar,
+                    secenekler.veri, secenekler.tohum, not secenekler.bellek_yok)
+
+    if secenekler.cikti:
+        with open(secenekler.cikti, 'w', encoding='utf-8') as f:
+            json.dump(sonuc, f, ensure_ascii=False, indent=1)
+        print(f"\n✓ Sonuçlar: {secenekler.cikti}")
+
+    karesel = [o for o in sonuc['olcumler'] if o['olcek'] is not None and o['olcek'] > KARESEL_OLCEK]
+    if karesel:
+        print("\nBoyutla karesel büyüyenler:")
+        for o in karesel:
+            print(f"  {o['analiz']} ({o['kademe']} kademe, {o['sembol']} sembol): üs {o['olcek']}")
+
+    if taban is None:
+        return 0
+    df = karsilastir(taban, sonuc, secenekler.esik)
+    print("\n" + "=" * 100)
+    print(f" TABANLA KARŞILAŞTIRMA ({taban.get('zaman', '?')})")
+    print("=" * 100)
+    cols = ['analiz', 'sembol', 'kademe', 'hesap_sn_TABAN', 'hesap_sn', 'HIZ_ORANI', 'BELLEK_ORANI', 'DURUM']
+    print(df[cols].to_string(index=False, float_format=lambda x: f"{x:.3f}"))
+    gerileme = int((df['DURUM'] == 'GERİLEME').sum())
+    print(f"\n{gerileme} gerileme." if gerileme else "\nGerileme yok.")
+    return 1 if gerileme else 0
+
+
+if __name__ == '__main__':
+    sys.exit(ana())
\ No newline at end of file
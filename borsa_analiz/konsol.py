@@ -0,0 +1,44 @@
+"""
+================================================================================
+MODÜL ADI   : Konsol Günlüğü
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Analiz kütüphanesi (borsa_analiz.analizler) ekrana yazmaz; notlarını
+'borsa_analiz' günlüğüne bırakır. Scriptler ve çalıştırıcı bu notları
+eskisi gibi "BİLGİ: ...", "UYARI: ..." satırları olarak görmek için
+konsol_gunlugu() çağırır. Kütüphaneyi kendi uygulamasında kullanan
+günlüğü istediği gibi yapılandırabilir.
+================================================================================
+"""
+
+import logging
+
+ETIKETLER = {
+    logging.DEBUG: 'AYRINTI',
+    logging.INFO: 'BİLGİ',
+    logging.WARNING: 'UYARI',
+    logging.ERROR: 'HATA',
+    logging.CRITICAL: 'HATA',
+}
+
+
+class KonsolIsleyici(logging.Handler):
+    """Kaydı 'ETİKET: mesaj' olarak print ile yazar (sys.stdout o anda çözülür)."""
+
+    def emit(self, kayit):
+        try:
+            print(f"{ETIKETLER.get(kayit.levelno, kayit.levelname)}: {self.format(kayit)}")
+        except Exception:
+            self.handleError(kayit)
+
+
+def konsol_gunlugu(seviye=logging.INFO):
+    """'borsa_analiz' günlüğünü konsola bağlar (tekrar çağrılırsa ikinci işleyici eklenmez)."""
+    gunluk = logging.getLogger('borsa_analiz')
+    if not any(isinstance(h, KonsolIsleyici) for h in gunluk.handlers):
+        gunluk.addHandler(KonsolIsleyici())
+    gunluk.setLevel(seviye)
+    gunluk.propagate = False
+    return gunluk
\ No newline at end of file
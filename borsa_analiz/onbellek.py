@@ -0,0 +1,278 @@
+"""
+================================================================================
+MODÜL ADI   : Önbellek (Ayrıştırılmış Snapshot Önbelleği)
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Aynı DOSYA_KONUMU üzerinde scriptler tekrar çalıştırıldığında (örneğin bir
+eşik değiştirildikten sonra) CSV'lerin metinden yeniden ayrıştırılmasını
+önler. Her girdi dosyasının tipli (sema.py) tablosu bütün günlerin ortak
+önbellek klasörüne (varsayılan: ~/.borsa_analiz/onbellek, Onbellek(dizin=...)
+ile değiştirilebilir) ikili sütunsal biçimde yazılır:
+- pyarrow kuruluysa Feather (Arrow IPC),
+- değilse NumPy '.npz' (sütun başına bir dizi, sadece istenen sütunlar yüklenir).
+
+ANAHTAR:
+Kayıt; kaynak yolu, dosya boyutu, değişiklik zamanı (mtime) ve içerik
+özeti (blake2b) ile eşleşirse kullanılır. Boyut ve zaman aynıysa dosya
+okunmaz; sadece zaman değiştiyse içerik özeti karşılaştırılır. Kaydın
+parmak izi CSV ayrıştırılmadan önce alınır (kaynak_izi); dosya ayrıştırma
+sırasında değiştiyse tablo önbelleğe yazılmaz.
+
+TAHLİYE:
+Ortak klasördeki bütün günlerin kayıtlarının toplam boyutu sınırı
+(sinir_bayt) aşarsa en uzun süredir kullanılmayan kayıtlar (eski günler)
+silinir. Kayıt adları kaynak yolun özetini içerdiğinden farklı günlerin
+aynı adlı dosyaları çakışmaz.
+================================================================================
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401  (Feather ve pyarrow CSV ayrıştırıcısı için)
+    PYARROW_VAR = True
+except ImportError:
+    PYARROW_VAR = False
+
+SURUM = 1
+KLASOR_ADI = '.onbellek'
+VARSAYILAN_SINIR = 512 * 1024 * 1024  # bayt
+VARSAYILAN_DIZIN = os.path.join(os.path.expanduser('~'), '.borsa_analiz', 'onbellek')
+
+
+class OnbellekHatasi(Exception):
+    pass
+
+
+class Onbellek:
+    def __init__(self, dizin=None, sinir_bayt=VARSAYILAN_SINIR, bicim=None):
+        self.dizin = dizin or VARSAYILAN_DIZIN    # Bütün günlerin ortak klasörü
+        self.sinir_bayt = sinir_bayt
+        self.bicim = bicim or ('feather' if PYARROW_VAR else 'npz')
+
+    def __repr__(self):
+        return f"Onbellek(dizin={self.dizin!r}, bicim={self.bicim!r})"
+
+    # --- ANA İŞLEMLER ---
+    def oku(self, yol, sutunlar, etiket=''):
+        """Kayıt geçerliyse ve istenen sütunları içeriyorsa tabloyu döndürür, yoksa None."""
+        kayit = self.izli_oku(yol, sutunlar, etiket)
+        return None if kayit is None else kayit[0]
+
+    def izli_oku(self, yol, sutunlar, etiket=''):
+        """oku() gibi; tabloyla birlikte kaydın kaynak parmak izini (boyut, mtime_ns, özet) döndürür."""
+        meta = self._gecerli_meta(yol, etiket)
+        if meta is None or not all(s in meta['sutunlar'] for s in sutunlar):
+            return None
+        veri_yolu = self._veri_yolu(yol, etiket, meta['bicim'])
+        if meta['bicim'] == 'feather':
+            df = pd.read_feather(veri_yolu, columns=list(sutunlar))
+        else:
+            df = npz_oku(veri_yolu, meta, sutunlar)
+        # LRU tahliyesi için son kullanım zamanı
+        os.utime(self._meta_yolu(yol, etiket))
+        return df, (meta['boyut'], meta['mtime_ns'], meta['ozet'])
+
+    def kayitli_sutunlar(self, yol, etiket=''):
+        """Kaynak için geçerli kayıttaki sütunlar (kayıt yoksa boş liste)."""
+        meta = self._gecerli_meta(yol, etiket)
+        return [] if meta is None else meta['sutunlar']
+
+    def yaz(self, yol, df, iz, etiket=''):
+        """Tabloyu kaynağın parmak izi ile kaydeder, sonra boyut sınırını uygular.
+
+        iz, tablo ayrıştırılmadan önce alınmış kaynak_izi(yol) olmalıdır.
+        Dosyanın boyutu veya zamanı o andan beri değiştiyse tablo eski
+        içeriğe ait olabilir; kayıt yazılmaz ve False döner.
+        """
+        boyut, mtime_ns, ozet = iz
+        if parmak_izi(yol) != (boyut, mtime_ns):
+            return False
+        os.makedirs(self.dizin, exist_ok=True)
+        meta = {
+            'surum': SURUM,
+            'kaynak': os.path.abspath(yol),
+            'etiket': etiket,
+            'boyut': boyut,
+            'mtime_ns': mtime_ns,
+            'ozet': ozet,
+            'bicim': self.bicim,
+            'sutunlar': [str(s) for s in df.columns],
+        }
+        veri_yolu = self._veri_yolu(yol, etiket, self.bicim)
+        gecici = veri_yolu + '.tmp'
+        if self.bicim == 'feather':
+            df.reset_index(drop=True).to_feather(gecici)
+        else:
+            meta['turler'] = npz_yaz(df, gecici)
+        os.replace(gecici, veri_yolu)
+        self._meta_yaz(yol, etiket, meta)
+        self.tahliye(self.dizin, koru=self._meta_yolu(yol, etiket))
+        return True
+
+    def tahliye(self, klasor, koru=None):
+        """Klasördeki kayıtlar sınırı aşıyorsa en eski kullanılanları siler.
+
+        Klasör birden fazla süreçle (toplu, geriye_test) paylaşılır; bu
+        arada silinen kayıtlar atlanır.
+        """
+        kayitlar = []
+        for ad in os.listdir(klasor):
+            if not ad.endswith('.json'):
+                continue
+            meta_yolu = os.path.join(klasor, ad)
+            # Veri dosyaları önce silinir: yarım kalan silmede meta kalır, sonraki tahliye onu da alır
+            dosyalar = [os.path.join(klasor, ad[:-5] + uz) for uz in ('.npz', '.feather')] + [meta_yolu]
+            try:
+                zaman = os.path.getmtime(meta_yolu)
+                boyut = sum(os.path.getsize(d) for d in dosyalar if os.path.exists(d))
+            except FileNotFoundError:
+                continue
+            kayitlar.append((zaman, meta_yolu, dosyalar, boyut))
+        toplam = sum(k[3] for k in kayitlar)
+        for _, meta_yolu, dosyalar, boyut in sorted(kayitlar):
+            if toplam <= self.sinir_bayt:
+                break
+            if meta_yolu == koru:
+                continue
+            for d in dosyalar:
+                try:
+                    os.remove(d)
+                except FileNotFoundError:
+                    pass
+            toplam -= boyut
+
+    # --- YARDIMCILAR ---
+    def _kayit_adi(self, yol, etiket):
+        # Ortak klasörde farklı günlerin aynı adlı dosyaları çakışmasın
+        anahtar = hashlib.blake2b(f"{os.path.abspath(yol)}|{etiket}".encode('utf-8'), digest_size=6).hexdigest()
+        return f"{os.path.splitext(os.path.basename(yol))[0]}-{anahtar}"
+
+    def _meta_yolu(self, yol, etiket):
+        return os.path.join(self.dizin, self._kayit_adi(yol, etiket) + '.json')
+
+    def _veri_yolu(self, yol, etiket, bicim):
+        return os.path.join(self.dizin, f"{self._kayit_adi(yol, etiket)}.{bicim}")
+
+    def _meta_yaz(self, yol, etiket, meta):
+        meta_yolu = self._meta_yolu(yol, etiket)
+        with open(meta_yolu + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(meta_yolu + '.tmp', meta_yolu)
+
+    def _gecerli_meta(self, yol, etiket):
+        meta_yolu = self._meta_yolu(yol, etiket)
+        if not os.path.exists(meta_yolu):
+            return None
+        with open(meta_yolu, encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('surum') != SURUM or meta.get('etiket') != etiket:
+            return None
+        if meta['bicim'] == 'feather' and not PYARROW_VAR:
+            return None
+        boyut, mtime_ns = parmak_izi(yol)
+        if meta['boyut'] != boyut:
+            return None
+        if meta['mtime_ns'] != mtime_ns:
+            # Dosyaya dokunulmuş (kopyalama vb.) ama içerik aynı olabilir
+            if icerik_ozeti(yol) != meta['ozet']:
+                return None
+            meta['mtime_ns'] = mtime_ns
+            self._meta_yaz(yol, etiket, meta)
+        return meta
+
+
+def parmak_izi(yol):
+    bilgi = os.stat(yol)
+    return bilgi.st_size, bilgi.st_mtime_ns
+
+
+def icerik_ozeti(yol):
+    ozet = hashlib.blake2b(digest_size=16)
+    with open(yol, 'rb') as f:
+        for parca in iter(lambda: f.read(1 << 20), b''):
+            ozet.update(parca)
+    return ozet.hexdigest()
+
+
+def kaynak_izi(yol):
+    """(boyut, mtime_ns, içerik özeti); dosya ayrıştırılmadan önce alınır."""
+    boyut, mtime_ns = parmak_izi(yol)
+    return boyut, mtime_ns, icerik_ozeti(yol)
+
+
+# --- NPZ SÜTUN KODLAMASI ---
+# Her sütun pickle kullanmadan düz NumPy dizileriyle saklanır:
+#   category -> kodlar + kategoriler, Int32 vb. -> değerler + maske,
+#   metin -> unicode dizi + maske, diğer NumPy tipleri olduğu gibi.
+
+def npz_yaz(df, hedef):
+    diziler = {}
+    turler = {}
+    for i, sutun in enumerate(df.columns):
+        seri = df[sutun]
+        anahtar = f"s{i}"
+        if isinstance(seri.dtype, pd.CategoricalDtype):
+            turler[sutun] = ['category', anahtar]
+            diziler[anahtar + '_kod'] = seri.cat.codes.to_numpy()
+            diziler[anahtar + '_kat'] = _duz_dizi(seri.cat.categories)
+        elif isinstance(seri.dtype, np.dtype) and seri.dtype.kind != 'O':
+            turler[sutun] = ['numpy', anahtar]
+            diziler[anahtar] = seri.to_numpy()
+        elif pd.api.types.is_string_dtype(seri.dtype):
+            turler[sutun] = ['metin', anahtar, str(seri.dtype)]
+            bos = seri.isna().to_numpy()
+            degerler = seri.to_numpy(dtype=object)
+            if not all(isinstance(d, str) for d in degerler[~bos]):
+                raise OnbellekHatasi(f"'{sutun}' sütunu karışık tipli, önbelleğe yazılamaz.")
+            degerler[bos] = ''
+            diziler[anahtar] = degerler.astype(str)
+            diziler[anahtar + '_bos'] = bos
+        elif pd.api.types.is_extension_array_dtype(seri.dtype) and seri.dtype.kind in 'iufb':
+            turler[sutun] = ['maskeli', anahtar, str(seri.dtype)]
+            diziler[anahtar] = seri.to_numpy(dtype=seri.dtype.numpy_dtype, na_value=0)
+            diziler[anahtar + '_bos'] = seri.isna().to_numpy()
+        else:
+            raise OnbellekHatasi(f"'{sutun}' sütununun tipi ({seri.dtype}) önbelleğe yazılamaz.")
+    with open(hedef, 'wb') as f:
+        np.savez(f, **diziler)
+    return turler
+
+
+def npz_oku(veri_yolu, meta, sutunlar):
+    sutunlar_veri = {}
+    with np.load(veri_yolu, allow_pickle=False) as arsiv:
+        for sutun in sutunlar:
+            tur, anahtar, *ek = meta['turler'][sutun]
+            if tur == 'category':
+                kategoriler = pd.Index(arsiv[anahtar + '_kat'])
+                if kategoriler.dtype.kind == 'U':
+                    kategoriler = pd.Index(kategoriler.astype(object), dtype='str')
+                sutunlar_veri[sutun] = pd.Categorical.from_codes(arsiv[anahtar + '_kod'], kategoriler)
+            elif tur == 'numpy':
+                sutunlar_veri[sutun] = arsiv[anahtar]
+            elif tur == 'metin':
+                degerler = arsiv[anahtar].astype(object)
+                degerler[arsiv[anahtar + '_bos']] = np.nan
+                sutunlar_veri[sutun] = pd.array(degerler, dtype=ek[0])
+            else:
+                dizi_tipi = pd.api.types.pandas_dtype(ek[0]).construct_array_type()
+                sutunlar_veri[sutun] = dizi_tipi(arsiv[anahtar], arsiv[anahtar + '_bos'])
+    return pd.DataFrame(sutunlar_veri, columns=list(sutunlar))
+
+
+def _duz_dizi(indeks):
+    # Kategori etiketleri: metinse unicode dizi, sayıysa olduğu gibi
+    if indeks.dtype.kind in 'iufb':
+        return indeks.to_numpy()
+    degerler = indeks.to_numpy(dtype=object)
+    if not all(isinstance(d, str) for d in degerler):
+        raise OnbellekHatasi("Kategori etiketleri karışık tipli, önbelleğe yazılamaz.")
+    return degerler.astype(str)
\ No newline at end of file
@@ -0,0 +1,121 @@
+"""
+================================================================================
+MODÜL ADI   : Ortak Özellikler (Türetilmiş Ara Sonuç Kaydı)
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Birden fazla analizin ayrı ayrı hesapladığı türetilmiş sütunlar burada
+tek bir kayıtta (OZELLIKLER) toplanır:
+- ORT_HACIM_5G, ROLATIF_HACIM, DEGISIM_YUZDE (Güçlü Talep, Tahtacı)
+- PIVOT (Büyük Tarama)
+- DIP_5G / ZIRVE_5G: son 5 günün en düşüğü / en yükseği (Kritik Destek / Direnç)
+- TOPLAM_DERINLIK_ALIS / SATIS: dosyadaki bütün ADET sütunlarının toplamı
+
+ozellik_al(paket, ad) özelliği paket ömrü boyunca bir kez hesaplar
+(bkz. VeriPaketi.ara_sonuc). Aynı paketle çalışan analizler (bkz.
+calistirici.py) aynı sonucu paylaşır.
+
+NOT:
+Özellikler kaynak tablonun satır sırasıyla hizalı pd.Series döndürür
+(DIP_5G / ZIRVE_5G: SEMBOL indeksli). Gerekli sütunlar dosyada yoksa
+None döner; analiz eski davranışına (hata mesajı veya varsayılan değer)
+kendisi karar verir.
+================================================================================
+"""
+
+# Özellik adı -> (kaynak dosya, hesaplama fonksiyonu)
+OZELLIKLER = {}
+
+HACIM_GECMISI = [f'HACIM-{i}' for i in range(1, 6)]
+DUSUK_5G = ['DUSUK'] + [f'DUSUK-{i}' for i in range(1, 5)]
+YUKSEK_5G = ['YUKSEK'] + [f'YUKSEK-{i}' for i in range(1, 5)]
+
+
+def ozellik(ad, dosya_adi):
+    """Fonksiyonu OZELLIKLER kaydına ekleyen dekoratör."""
+    def kaydet(hesapla):
+        OZELLIKLER[ad] = (dosya_adi, hesapla)
+        return hesapla
+    return kaydet
+
+
+def ozellik_al(paket, ad):
+    """Özelliği pakette bir kez hesaplar ve sonraki çağrılarda aynısını döndürür."""
+    if ad not in OZELLIKLER:
+        raise KeyError(f"Tanımsız özellik: {ad}")
+    _, hesapla = OZELLIKLER[ad]
+    return paket.ara_sonuc(('ozellik', ad), lambda: hesapla(paket))
+
+
+def ozellik_dosyasi(ad):
+    return OZELLIKLER[ad][0]
+
+
+# --- HACİM VE FİYAT DEĞİŞİMİ ---
+@ozellik('ORT_HACIM_5G', 'ACILISLAR-1.csv')
+def _ort_hacim_5g(paket):
+    df = paket.oku('ACILISLAR-1.csv')
+    if not all(c in df.columns for c in HACIM_GECMISI):
+        return None
+    return df[HACIM_GECMISI].mean(axis=1)
+
+
+@ozellik('ROLATIF_HACIM', 'ACILISLAR-1.csv')
+def _rolatif_hacim(paket):
+    # Bugünkü hacim / son 5 gün ortalaması (1.0 = ortalama kadar)
+    ort_hacim = ozellik_al(paket, 'ORT_HACIM_5G')
+    if ort_hacim is None:
+        return None
+    return paket.oku('ACILISLAR-1.csv')['HACIM'] / ort_hacim
+
+
+@ozellik('DEGISIM_YUZDE', 'ACILISLAR-1.csv')
+def _degisim_yuzde(paket):
+    # ((Kapanış - Önceki Kapanış) / Önceki Kapanış) * 100
+    df = paket.oku('ACILISLAR-1.csv')
+    return ((df['KAPANIS'] - df['KAPANIS-1']) / df['KAPANIS-1']) * 100
+
+
+# --- TEKNİK SEVİYELER ---
+@ozellik('PIVOT', 'ACILISLAR-1.csv')
+def _pivot(paket):
+    # Pivot: (Yüksek + Düşük + Kapanış) / 3
+    df = paket.oku('ACILISLAR-1.csv')
+    return (df['YUKSEK'] + df['DUSUK'] + df['KAPANIS']) / 3
+
+
+def _bes_gun(paket, sutunlar, fonksiyon):
+    df = paket.sembol_indeksli('ACILISLAR-1.csv')
+    mevcut = [c for c in sutunlar if c in df.columns]
+    if not mevcut:
+        return None
+    return getattr(df[mevcut], fonksiyon)(axis=1)
+
+
+@ozellik('DIP_5G', 'ACILISLAR-1.csv')
+def _dip_5g(paket):
+    return _bes_gun(paket, DUSUK_5G, 'min')
+
+
+@ozellik('ZIRVE_5G', 'ACILISLAR-1.csv')
+def _zirve_5g(paket):
+    return _bes_gun(paket, YUKSEK_5G, 'max')
+
+
+# --- DERİNLİK TOPLAMLARI ---
+def _toplam_derinlik(paket, dosya_adi):
+    # Lotlar Int32 okunuyor; toplam int32'yi aşabileceği için float64
+    df = paket.oku(dosya_adi)
+    adet_cols = [c for c in df.columns if 'ADET' in c]
+    return df[adet_cols].astype('float64').sum(axis=1)
+
+
+@ozellik('TOPLAM_DERINLIK_ALIS', 'DERINLIK_ALIS-1.csv')
+def _toplam_derinlik_alis(paket):
+    return _toplam_derinlik(paket, 'DERINLIK_ALIS-1.csv')
+
+
+@ozellik('TOPLAM_DERINLIK_SATIS', 'DERINLIK_SATIS-1.csv')
+def _toplam_derinlik_satis(paket):
+    return _toplam_derinlik(paket, 'DERINLIK_SATIS-1.csv')
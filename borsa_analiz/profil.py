@@ -0,0 +1,304 @@
+"""
+================================================================================
+MODÜL ADI   : Çalışma Profili (Aşama Süreleri ve Satır Sayıları)
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Analiz zincirinin (calistirici.py) her analizinde sürenin nereye gittiğini
+aşama aşama tutar:
+    okuma        CSV / önbellek ayrıştırma (VeriPaketi)
+    birlestirme  SEMBOL üzerinden birleştirmeler (SembolSozlugu.birlestir)
+    hesap        analiz fonksiyonunun geri kalanı
+    suzme        scriptte alt kümeler, sıralama ve ekran çıktısı
+    yazma        CSV raporları (rapor_yaz); raporlar arka planda yazılıyorsa
+                 kuyruğa ekleme, diskte geçen süre arka_plan_yazma_sn
+Bunlara ek olarak analizin okuduğu dosyaların, sonuç tablosunun ve
+yazılan her raporun satır sayısı tutulur. Analizlerden önceki ortak iş
+(dosyaların bir kez okunması, ortak özellikler) 'paket' altında durur.
+Zincir bitince profil raporların yanına CALISMA_PROFILI_<zaman>.json
+olarak yazılır.
+
+Aşamalar iç içe açılabilir (hesap sırasında okuma); süre en içteki
+aşamaya yazılır, dıştaki aşamanın saati o arada durur. Böylece bir
+analizin aşama süreleri toplamı kendi süresine eşittir.
+
+MALİYET:
+Aşama başına iki perf_counter çağrısı ve bir sözlük güncellemesi. Profil
+açık değilken (ör. script tek başına çalışırken) aşama çağrıları hiçbir
+şey yapmaz. Üretimde açık bırakılmak üzere tasarlandı.
+
+BELLEK MODU:
+CalismaProfili(..., bellek=True) aynı aşama dilimlerinde tracemalloc ile
+tepe bellek ve ayırma noktalarını da tutar (bkz. bellek.py); pahalıdır,
+isteğe bağlıdır.
+
+NOT:
+Profil, onu açan thread'e bağlıdır; başka thread'lerden gelen aşama
+çağrıları yok sayılır. Sadece dosya okuma kayıtları (onyukle()'nin
+thread havuzundan) kilitle eklenir.
+
+KULLANIM:
+    with CalismaProfili(veri, cikti) as profil_:
+        with profil_.analiz('wapd_analizi') as kayit:
+            ...
+    profil_.yaz(cikti)
+
+    # Analiz / script tarafı (profil yoksa etkisiz)
+    with profil.asama('okuma'): ...
+    @profil.asamali('birlestirme')      # fonksiyonun her çağrısı
+    profil.gecis('suzme')
+    profil.rapor_yaz(df, dosya)
+================================================================================
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from .bellek import BellekIzleyici
+
+ASAMALAR = ('okuma', 'birlestirme', 'hesap', 'suzme', 'yazma')
+PROFIL_ONEKI = 'CALISMA_PROFILI'
+BELLEK_ONEKI = 'BELLEK_PROFILI'
+
+_etkin = None   # Açık profil (süreç başına bir zincir)
+_yazici = None  # Açık rapor yazıcısı (bkz. rapor_deposu.py)
+
+
+def _yeni_kayit():
+    return {'sure_sn': 0.0, 'asamalar': {}, 'girdi_satir': {}, 'sonuc_satir': None, 'raporlar': {}, 'hata': None}
+
+
+class CalismaProfili:
+    def __init__(self, veri=None, cikti=None, bellek=False):
+        self.veri = veri
+        self.cikti = cikti
+        self.baslangic = datetime.now()
+        self.sure_sn = None
+        self.dosyalar = {}                  # Dosya adı -> okuma kaydı
+        self.paket = _yeni_kayit()          # Analizlerden önceki ortak iş
+        self.analizler = {}                 # Analiz adı -> kayıt
+        self.bellek = BellekIzleyici() if bellek else None
+        self._kayit = self.paket
+        self._kayit_adi = 'paket'
+        self._yigin = []                    # [aşama, başlangıç]
+        self._t0 = None
+        self._thread = None
+        self._onceki = None
+        self._kilit = threading.Lock()
+        self.bellek_yolu = None
+        self.arka_plan_yazma_sn = None      # Rapor yazıcısının thread'inde geçen süre
+
+    # --- AÇMA / KAPAMA ---
+    def __enter__(self):
+        global _etkin
+        self._onceki, _etkin = _etkin, self
+        self._thread = threading.get_ident()
+        if self.bellek is not None:
+            self.bellek.baslat()
+        self._t0 = time.perf_counter()
+        self._gir('hesap')
+        return self
+
+    def __exit__(self, *hata):
+        global _etkin
+        while self._yigin:
+            self._cik()
+        self.sure_sn = time.perf_counter() - self._t0
+        self.paket['sure_sn'] = sum(self.paket['asamalar'].values())
+        if self.bellek is not None:
+            self.bellek.durdur()
+        _etkin = self._onceki
+        return False
+
+    @contextmanager
+    def analiz(self, ad):
+        """Bloğun süresini 'ad' analizinin kaydına yazar (varsayılan aşama: hesap)."""
+        kayit = self.analizler[ad] = _yeni_kayit()
+        onceki, onceki_adi, derinlik = self._kayit, self._kayit_adi, len(self._yigin)
+        self._duraklat()
+        self._kayit, self._kayit_adi = kayit, ad
+        baslangic = time.perf_counter()
+        self._gir('hesap')
+        try:
+            yield kayit
+        except Exception as e:
+            kayit['hata'] = str(e)
+            raise
+        finally:
+            while len(self._yigin) > derinlik:
+                self._cik()
+            kayit['sure_sn'] = time.perf_counter() - baslangic
+            if self.bellek is not None:
+                self.bellek.rss_kaydet(ad)
+            self._kayit, self._kayit_adi = onceki, onceki_adi
+            self._devam()
+
+    # --- AŞAMA YIĞINI ---
+    def _ekle(self, asama, sure):
+        asamalar = self._kayit['asamalar']
+        asamalar[asama] = asamalar.get(asama, 0.0) + sure
+        if self.bellek is not None:
+            self.bellek.dilim_bitti(self._kayit_adi, asama)
+
+    def _duraklat(self):
+        if self._yigin:
+            ust = self._yigin[-1]
+            self._ekle(ust[0], time.perf_counter() - ust[1])
+            ust[1] = time.perf_counter()
+
+    def _devam(self):
+        if self._yigin:
+            self._yigin[-1][1] = time.perf_counter()
+
+    def _gir(self, asama):
+        self._duraklat()
+        self._yigin.append([asama, time.perf_counter()])
+
+    def _cik(self):
+        asama, baslangic = self._yigin.pop()
+        self._ekle(asama, time.perf_counter() - baslangic)
+        self._devam()
+
+    def _gecis(self, asama):
+        self._duraklat()
+        if self._yigin:
+            self._yigin[-1][0] = asama
+
+    # --- KAYITLAR ---
+    def dosya_okundu(self, dosya_adi, satir, sutun, sure, onbellekten):
+        with self._kilit:
+            self.dosyalar[dosya_adi] = {
+                'satir': satir, 'sutun': sutun, 'sure_sn': round(sure, 4),
+                'kaynak': 'onbellek' if onbellekten else 'csv'}
+
+    def sozluk(self):
+        """JSON'a yazılacak hali (süreler saniye, 4 basamak)."""
+        def yuvarla(kayit):
+            kayit = dict(kayit, sure_sn=round(kayit['sure_sn'], 4))
+            kayit['asamalar'] = {a: round(s, 4) for a, s in sorted(
+                kayit['asamalar'].items(), key=lambda x: ASAMALAR.index(x[0]) if x[0] in ASAMALAR else len(ASAMALAR))}
+            return kayit
+
+        toplam = {}
+        for kayit in [self.paket] + list(self.analizler.values()):
+            for asama, sure in kayit['asamalar'].items():
+                toplam[asama] = toplam.get(asama, 0.0) + sure
+        return {
+            'baslangic': self.baslangic.isoformat(timespec='seconds'),
+            'sure_sn': round(self.sure_sn if self.sure_sn is not None else time.perf_counter() - self._t0, 4),
+            'veri': os.path.abspath(self.veri) if self.veri else None,
+            'cikti': os.path.abspath(self.cikti) if self.cikti else None,
+            'asama_toplamlari': {a: round(s, 4) for a, s in sorted(toplam.items(), key=lambda x: -x[1])},
+            'arka_plan_yazma_sn': (round(self.arka_plan_yazma_sn, 4)
+                                   if self.arka_plan_yazma_sn is not None else None),
+            'dosyalar': self.dosyalar,
+            'paket': {a: d for a, d in yuvarla(self.paket).items() if a in ('sure_sn', 'asamalar', 'girdi_satir')},
+            'analizler': {ad: yuvarla(k) for ad, k in self.analizler.items()},
+        }
+
+    def yaz(self, klasor=None):
+        """Profili klasöre CALISMA_PROFILI_<zaman>.json olarak yazar, yolunu döndürür.
+
+        Bellek modu açıksa bellek profili de BELLEK_PROFILI_<zaman>.json
+        olarak yanına yazılır (yolu: self.bellek_yolu).
+        """
+        yol = self._json_yaz(klasor, PROFIL_ONEKI, self.sozluk())
+        if self.bellek is not None:
+            self.bellek_yolu = self._json_yaz(klasor, BELLEK_ONEKI, self.bellek.sozluk())
+        return yol
+
+    def _json_yaz(self, klasor, onek, icerik):
+        klasor = klasor or self.cikti
+        os.makedirs(klasor, exist_ok=True)
+        yol = os.path.join(klasor, f"{onek}_{self.baslangic.strftime('%Y%m%d_%H%M%S')}.json")
+        with open(yol, 'w', encoding='utf-8') as f:
+            json.dump(icerik, f, ensure_ascii=False, indent=1)
+        return yol
+
+
+def etkin_profil():
+    """Bu thread'de açık profil; yoksa None."""
+    profil = _etkin
+    if profil is None or profil._thread != threading.get_ident():
+        return None
+    return profil
+
+
+@contextmanager
+def asama(ad):
+    """Bloğun süresini açık profilde 'ad' aşamasına yazar; profil yoksa etkisiz."""
+    profil = etkin_profil()
+    if profil is None:
+        yield
+        return
+    profil._gir(ad)
+    try:
+        yield
+    finally:
+        profil._cik()
+
+
+def asamali(ad):
+    """Fonksiyonun her çağrısını 'ad' aşaması sayan dekoratör."""
+    def dekorator(fonksiyon):
+        @functools.wraps(fonksiyon)
+        def sarmal(*args, **kwargs):
+            with asama(ad):
+                return fonksiyon(*args, **kwargs)
+        return sarmal
+    return dekorator
+
+
+def gecis(ad):
+    """Analizin o anki aşamasını kapatıp 'ad' aşamasına geçer (ör. hesap -> suzme)."""
+    profil = etkin_profil()
+    if profil is not None:
+        profil._gecis(ad)
+
+
+def girdi_satiri(dosya_adi, satir):
+    """Çalışan analizin okuduğu dosyanın satır sayısını kaydeder."""
+    profil = etkin_profil()
+    if profil is not None:
+        profil._kayit['girdi_satir'][dosya_adi] = satir
+
+
+def dosya_okundu(dosya_adi, satir, sutun, sure, onbellekten):
+    """Bir dosyanın ayrıştırılmasını kaydeder (thread havuzundan çağrılabilir)."""
+    profil = _etkin
+    if profil is not None:
+        profil.dosya_okundu(dosya_adi, satir, sutun, sure, onbellekten)
+
+
+def yazici_ata(yazici):
+    """rapor_yaz'ın raporları vereceği yazıcıyı değiştirir (None: CSV); öncekini döndürür."""
+    global _yazici
+    onceki, _yazici = _yazici, yazici
+    return onceki
+
+
+def csv_yaz(df, yol):
+    """Raporların ortak CSV biçimi (indekssiz, utf-8-sig)."""
+    df.to_csv(yol, index=False, encoding='utf-8-sig')
+
+
+def rapor_yaz(df, yol):
+    """Raporu CSV olarak yazar; süresi 'yazma' aşamasına gider.
+
+    Açık bir rapor yazıcısı varsa (bkz. rapor_deposu.py) rapor ona verilir;
+    arka planda yazılıyorsa 'yazma' sadece kuyruğa ekleme süresidir.
+    """
+    with asama('yazma'):
+        if _yazici is not None:
+            _yazici.ekle(df, yol)
+        else:
+            csv_yaz(df, yol)
+    profil = etkin_profil()
+    if profil is not None:
+        profil._kayit['raporlar'][os.path.basename(yol)] = len(df)
\ No newline at end of file
@@ -0,0 +1,307 @@
+"""
+================================================================================
+MODÜL ADI   : Rapor Deposu (Çalışma Başına Tek Parquet Veri Seti)
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Analiz zinciri her analiz için 2-3 ayrı CSV yazıyordu (*_TUM_, *_EN_IYI_,
+*_SHORT_ADAY_ ...) ve alt listeler TUM dosyasındaki satırların
+kopyalarıydı. Rapor deposu bir çalışmanın raporlarını tek bir klasörde,
+analize göre bölümlenmiş Parquet veri seti olarak tutar:
+    RAPOR_<zaman>/ANALIZ=wapd_analizi/part-0.parquet
+    RAPOR_<zaman>/ANALIZ=destek_analizi/part-0.parquet
+    RAPOR_<zaman>/RAPORLAR.json     rapor -> parça, sütunlar, tipler
+Bir analizin raporları aynı satırlardan geldiği için (sonuç tablosunun
+süzülmüş / sıralanmış halleri) satırlar bir kez saklanır; her rapor bir
+SIRA__<RAPOR> sütunudur: satır o rapordaysa rapordaki sırası, değilse boş.
+rapor_oku() raporu (sütunları, sırası ve tipleriyle) geri kurar; csv_aktar()
+eski CSV dosyalarını aynı adlarla ve aynı içerikle yazar.
+
+Satırlar analiz sonucunun indeks etiketiyle eşleştirilir. Ortak satırlarda
+değerleri tutmayan rapor (ör. indeksi sıfırlanmış bir tablo) birleştirilmez,
+aynı bölümde ayrı bir parça olarak yazılır.
+
+ARKA PLAN YAZMA:
+Açıkken raporlar bir kuyruğa eklenir ve tek bir thread diske yazar (CSV
+biçiminde de); analizler diski beklemez. Kuyruk KUYRUK_SINIRI raporla
+sınırlıdır, disk yetişemezse üretici bekler. Yazma hataları kapanışta
+'hatalar' listesinde toplanır; analizleri durdurmaz.
+
+NOT:
+- Parquet için pyarrow gerekir; kurulu değilse 'csv' dışındaki biçimler
+  RaporHatasi verir (CSV her zaman kullanılabilir).
+- Yazıcı açık değilken (ör. script tek başına çalışırken) profil.rapor_yaz
+  eskisi gibi doğrudan CSV yazar.
+
+KULLANIM:
+    with RaporYazici(cikti, bicim='parquet') as yazici:
+        with yazici.analiz('wapd_analizi'):
+            profil.rapor_yaz(df, yol)          # kuyruğa eklenir
+
+    python -m borsa_analiz.calistirici VERI -o RAPORLAR --bicim parquet
+    python -m borsa_analiz.rapor_deposu RAPORLAR/RAPOR_20250102_180000 --liste
+    python -m borsa_analiz.rapor_deposu RAPORLAR/RAPOR_20250102_180000 --csv CSV_KLASORU
+================================================================================
+"""
+
+import argparse
+import json
+import os
+import queue
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import pandas as pd
+
+from .profil import csv_yaz, yazici_ata
+
+try:
+    import pyarrow  # noqa: F401  (pandas Parquet motoru)
+    PYARROW_VAR = True
+except ImportError:
+    PYARROW_VAR = False
+
+SURUM = 1
+BICIMLER = ('csv', 'parquet', 'ikisi')
+DEPO_ONEKI = 'RAPOR'
+BILGI_DOSYASI = 'RAPORLAR.json'
+SIRA_ONEKI = 'SIRA__'
+SIKISTIRMA = 'zstd'
+KUYRUK_SINIRI = 32
+ZAMAN_EKI = re.compile(r'_\d{8}_\d{6}$')
+
+
+class RaporHatasi(Exception):
+    pass
+
+
+def rapor_adi(yol):
+    """Dosya yolundan rapor adı: 'WAPD_ANALIZI_TUM_20250102_180000.csv' -> 'WAPD_ANALIZI_TUM'."""
+    return ZAMAN_EKI.sub('', os.path.splitext(os.path.basename(yol))[0])
+
+
+class RaporYazici:
+    def __init__(self, klasor, bicim='csv', arka_plan=True):
+        if bicim not in BICIMLER:
+            raise RaporHatasi(f"Bilinmeyen rapor biçimi: {bicim} (seçenekler: {', '.join(BICIMLER)})")
+        if bicim != 'csv' and not PYARROW_VAR:
+            raise RaporHatasi("Parquet rapor deposu için pyarrow gerekli (pip install pyarrow).")
+        self.klasor = klasor
+        self.bicim = bicim
+        self.arka_plan = arka_plan
+        self.depo = (os.path.join(klasor, f"{DEPO_ONEKI}_{datetime.now():%Y%m%d_%H%M%S}")
+                     if bicim != 'csv' else None)
+        self.hatalar = []               # "rapor: hata" metinleri
+        self.sure_sn = 0.0              # Diskte (veya birleştirmede) geçen süre
+        self._grup = 'genel'
+        self._parcalar = {}             # grup -> [(rapor adı, tablo, yol)]
+        self._bilgi = {}                # rapor adı -> RAPORLAR.json kaydı
+        self._kuyruk = None
+        self._thread = None
+        self._onceki = None
+
+    def __repr__(self):
+        return f"RaporYazici({self.klasor!r}, bicim={self.bicim!r})"
+
+    # --- AÇMA / KAPAMA ---
+    def __enter__(self):
+        self._onceki = yazici_ata(self)
+        if self.arka_plan:
+            self._kuyruk = queue.Queue(maxsize=KUYRUK_SINIRI)
+            self._thread = threading.Thread(target=self._calis, name='rapor-yazici', daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *hata):
+        yazici_ata(self._onceki)
+        self.kapat()
+        return False
+
+    def kapat(self):
+        """Kuyruktaki raporları ve bekleyen grupları yazar; RAPORLAR.json'u en son yazar."""
+        for grup in list(self._parcalar):
+            self._gonder(('bitir', grup))
+        if self._thread is not None:
+            self._kuyruk.put(None)
+            self._thread.join()
+            self._thread = None
+        if self.depo is not None and self._bilgi:
+            self._is(self._bilgi_yaz, BILGI_DOSYASI)
+
+    @contextmanager
+    def analiz(self, ad):
+        """Bloktaki raporları 'ad' analizinin bölümüne yazar."""
+        onceki, self._grup = self._grup, ad
+        try:
+            yield self
+        finally:
+            self._grup = onceki
+            if ad in self._parcalar:
+                self._gonder(('bitir', ad))
+
+    # --- EKLEME ---
+    def ekle(self, df, yol):
+        """Raporu yazılmak üzere alır (arka planda yazılacaksa kopyasını)."""
+        if self.arka_plan:
+            df = df.copy()
+        if self.depo is not None:
+            self._parcalar.setdefault(self._grup, [])
+        self._gonder(('ekle', self._grup, df, yol))
+
+    def _gonder(self, is_):
+        if self._thread is not None:
+            self._kuyruk.put(is_)
+        else:
+            self._yap(is_)
+
+    def _calis(self):
+        while True:
+            is_ = self._kuyruk.get()
+            if is_ is None:
+                return
+            self._yap(is_)
+
+    def _yap(self, is_):
+        if is_[0] == 'ekle':
+            _, grup, df, yol = is_
+            if self.bicim != 'parquet':
+                self._is(csv_yaz, rapor_adi(yol), df, yol)
+            if self.depo is not None:
+                self._parcalar.setdefault(grup, []).append((rapor_adi(yol), df, yol))
+        else:
+            parcalar = self._parcalar.pop(is_[1], [])
+            if parcalar:
+                self._is(self._grup_yaz, is_[1], is_[1], parcalar)
+
+    def _is(self, fonksiyon, etiket, *args):
+        baslangic = time.perf_counter()
+        try:
+            fonksiyon(*args)
+        except Exception as e:
+            self.hatalar.append(f"{etiket}: {e}")
+        finally:
+            self.sure_sn += time.perf_counter() - baslangic
+
+    # --- DEPO ---
+    def _grup_yaz(self, grup, parcalar):
+        """Grubun raporlarını ortak satırlarda birleştirip Parquet parçalarına yazar."""
+        tablolar = []       # [(tablo, [rapor adları])]
+        for ad, df, yol in parcalar:
+            self._bilgi[ad] = {
+                'analiz': grup, 'dosya': os.path.basename(yol), 'satir': len(df),
+                'sutunlar': [str(s) for s in df.columns],
+                'tipler': {str(s): str(t) for s, t in df.dtypes.items()},
+            }
+            if not df.index.is_unique:
+                df = df.reset_index(drop=True)
+            sira = pd.Series(pd.array(range(len(df)), dtype='Int32'), index=df.index, name=SIRA_ONEKI + ad)
+            for i, (tablo, adlar) in enumerate(tablolar):
+                birlesik = _birlestir(tablo, df, sira)
+                if birlesik is not None:
+                    tablolar[i] = (birlesik, adlar + [ad])
+                    break
+            else:
+                tablolar.append((pd.concat([df, sira], axis=1), [ad]))
+
+        bolum = os.path.join(self.depo, f"ANALIZ={grup}")
+        os.makedirs(bolum, exist_ok=True)
+        for i, (tablo, adlar) in enumerate(tablolar):
+            parca = f"part-{i}.parquet"
+            tablo.to_parquet(os.path.join(bolum, parca), index=False, compression=SIKISTIRMA)
+            for ad in adlar:
+                self._bilgi[ad]['parca'] = f"ANALIZ={grup}/{parca}"
+
+    def _bilgi_yaz(self):
+        gecici = os.path.join(self.depo, BILGI_DOSYASI + '.tmp')
+        with open(gecici, 'w', encoding='utf-8') as f:
+            json.dump({'surum': SURUM, 'raporlar': self._bilgi}, f, ensure_ascii=False, indent=1)
+        os.replace(gecici, os.path.join(self.depo, BILGI_DOSYASI))
+
+
+def _birlestir(tablo, df, sira):
+    """df'yi (ve sıra sütununu) tabloya ekler; ortak satırlar tutmuyorsa None."""
+    if sira.name in tablo.columns:
+        return None
+    ortak = df.index.intersection(tablo.index)
+    sutunlar = [s for s in df.columns if s in tablo.columns]
+    if len(ortak) and not (tablo.loc[ortak, sutunlar].astype(object)
+                           .equals(df.loc[ortak, sutunlar].astype(object))):
+        return None
+    yeni_satir = df.index.difference(tablo.index, sort=False)
+    if len(yeni_satir):
+        tablo = pd.concat([tablo, df.loc[yeni_satir, sutunlar]])
+    yeni_sutun = [s for s in df.columns if s not in tablo.columns]
+    return tablo.join(df[yeni_sutun]).join(sira) if yeni_sutun else tablo.join(sira)
+
+
+# --- OKUMA ---
+def depo_bilgisi(depo):
+    """RAPORLAR.json içeriği (rapor adı -> kayıt)."""
+    try:
+        with open(os.path.join(depo, BILGI_DOSYASI), encoding='utf-8') as f:
+            return json.load(f)['raporlar']
+    except (OSError, ValueError, KeyError) as e:
+        raise RaporHatasi(f"{depo} bir rapor deposu değil ({e})") from e
+
+
+def rapor_oku(depo, ad, bilgi=None):
+    """Raporu CSV'ye yazıldığı haliyle (sütunlar, sıra, tipler) döndürür."""
+    bilgi = bilgi or depo_bilgisi(depo)
+    if ad not in bilgi:
+        raise RaporHatasi(f"Depoda '{ad}' raporu yok (raporlar: {', '.join(bilgi)})")
+    kayit = bilgi[ad]
+    sira = SIRA_ONEKI + ad
+    tablo = pd.read_parquet(os.path.join(depo, kayit['parca']), columns=kayit['sutunlar'] + [sira])
+    tablo = tablo[tablo[sira].notna()].sort_values(sira, kind='stable')
+    return tablo[kayit['sutunlar']].astype(kayit['tipler']).reset_index(drop=True)
+
+
+def csv_aktar(depo, hedef, adlar=None):
+    """Raporları hedef klasöre özgün CSV adlarıyla yazar; yazılan yolları döndürür."""
+    bilgi = depo_bilgisi(depo)
+    os.makedirs(hedef, exist_ok=True)
+    yollar = []
+    for ad in adlar or bilgi:
+        df = rapor_oku(depo, ad, bilgi)
+        yol = os.path.join(hedef, bilgi[ad]['dosya'])
+        csv_yaz(df, yol)
+        yollar.append(yol)
+    return yollar
+
+
+def ana(argumanlar=None):
+    ayristirici = argparse.ArgumentParser(
+        prog='python -m borsa_analiz.rapor_deposu',
+        description="Parquet rapor deposunu listeler, raporları gösterir veya CSV olarak dışa aktarır.")
+    ayristirici.add_argument('depo', help="RAPOR_<zaman> klasörü")
+    ayristirici.add_argument('-r', '--rapor', nargs='+', metavar='AD', help="Sadece bu raporlar")
+    ayristirici.add_argument('--liste', action='store_true', help="Raporları ve satır sayılarını göster")
+    ayristirici.add_argument('--csv', metavar='KLASOR', help="Raporları bu klasöre CSV olarak yaz")
+    ayristirici.add_argument('--ilk', type=int, default=10, help="Gösterilecek satır sayısı")
+    secenekler = ayristirici.parse_args(argumanlar)
+
+    try:
+        bilgi = depo_bilgisi(secenekler.depo)
+        if secenekler.liste:
+            for ad, kayit in bilgi.items():
+                print(f"{ad:<40} {kayit['analiz']:<28} {kayit['satir']:>7} satır")
+        elif secenekler.csv:
+            for yol in csv_aktar(secenekler.depo, secenekler.csv, secenekler.rapor):
+                print(f"✓ {yol}")
+        else:
+            for ad in secenekler.rapor or bilgi:
+                print(f"\n{ad}")
+                print(rapor_oku(secenekler.depo, ad, bilgi).head(secenekler.ilk).to_string(index=False))
+    except (RaporHatasi, ImportError) as e:
+        print(f"HATA: {e}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(ana())
\ No newline at end of file
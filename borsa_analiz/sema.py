@@ -0,0 +1,259 @@
+"""
+================================================================================
+MODÜL ADI   : Şema (Girdi Dosyalarının Sütun ve Tip Kaydı)
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Girdi CSV dosyalarındaki sütunların hangi tipte tutulacağını ve her
+analizin hangi dosyadan hangi sütunlara ihtiyaç duyduğunu tek yerde
+tanımlar. VeriPaketi bu kayda bakarak:
+- Sadece analizlerin istediği sütunları okur (read_csv 'usecols'),
+- SEMBOL ve aracı kurum adlarını ('ENIYI ALICI.1' ...) 'category' tutar,
+- Kademe lotlarını ('1 ALIS ADET' ...) 'Int32' tutar (boş kademe <NA>),
+- Kompakt modda fiyatları float32'ye indirir.
+
+NOT:
+Fiyatlar varsayılan modda pandas'ın kendi çıkarımıyla (float64) okunur.
+float32 yuvarlaması rapor sütunlarını son basamakta değiştirebildiği için
+sadece 'kompakt=True' ile açılır. Lotlar ise ancak tamamı tam sayı ve
+int32 sınırları içindeyse küçültülür; aksi halde float64 kalır.
+================================================================================
+"""
+
+import csv
+import re
+
+import numpy as np
+import pandas as pd
+
+# --- SÜTUN TÜRLERİ ---
+SEMBOL = 'sembol'
+KURUM = 'kurum'   # Aracı kurum adı (ENIYI ALICI.1, ENIYI ALICI.2 ...)
+FIYAT = 'fiyat'
+LOT = 'lot'       # Tek bir kademedeki lot (int32'ye sığar)
+SAYI = 'sayi'     # Hacim, günlük toplam lot vb.: pandas çıkarımına bırakılır
+
+# Sütun adı -> tür (ilk eşleşen kural geçerli, tam eşleşme aranır)
+TUR_KURALLARI = [
+    (re.compile(r'SEMBOL'), SEMBOL),
+    (re.compile(r'ENIYI ALICI\.\d+'), KURUM),  # Analizler kurum adını '.1', '.2' ... sütunlarından okuyor
+    (re.compile(r'\d+ (ALIS|SATIS) ADET'), LOT),
+    (re.compile(r'\d+ (ALIS|SATIS)'), FIYAT),
+    (re.compile(r'(ACILIS|KAPANIS|YUKSEK|DUSUK)(-\d+)?'), FIYAT),
+    (re.compile(r'AORT|MALIYET(\.\d+)?'), FIYAT),
+]
+
+INT32_ARALIGI = (np.iinfo('int32').min, np.iinfo('int32').max)
+
+# --- ANALİZLERİN İHTİYAÇ DUYDUĞU SÜTUNLAR ---
+# Dosya -> sütun listesi. Liste elemanı tam sütun adı veya derlenmiş desendir.
+# TUM: dosyanın bütün sütunları (analiz tabloyu olduğu gibi rapora yazıyor).
+TUM = None
+
+_ALIS_KADEMELERI = re.compile(r'\d+ ALIS( ADET)?')
+_SATIS_KADEMELERI = re.compile(r'\d+ SATIS( ADET)?')
+_ALIS_LOTLARI = re.compile(r'\d+ ALIS ADET')
+_SATIS_LOTLARI = re.compile(r'\d+ SATIS ADET')
+_HACIM_GECMISI = re.compile(r'HACIM(-\d+)?')
+
+_DERINLIK = {
+    'DERINLIK_ALIS-1.csv': ['SEMBOL', _ALIS_KADEMELERI],
+    'DERINLIK_SATIS-1.csv': ['SEMBOL', _SATIS_KADEMELERI],
+}
+
+ANALIZ_SUTUNLARI = {
+    'acilis_istahi_analizi': {
+        'ACILISLAR-1.csv': TUM,
+    },
+    'buyuk_tarama_robotu': {
+        'MALIYET_ALICI-1.csv': ['SEMBOL', 'ENIYI ALICI.1', 'NET ADET', 'MALIYET'],
+        'KADEME_ANALIZI.csv': ['SEMBOL', 'TOPLAM', 'AORT', 'ALIS', 'SATIS'],
+        'ACILISLAR-1.csv': ['SEMBOL', 'KAPANIS', 'YUKSEK', 'DUSUK'],
+        'BEKLEYEN_EMIRLER.csv': ['SEMBOL', 'NET.EMIR.FARKI'],
+        'DERINLIK_ALIS-1.csv': ['SEMBOL', _ALIS_LOTLARI],
+        'DERINLIK_SATIS-1.csv': ['SEMBOL', _SATIS_LOTLARI],
+    },
+    'destek_analizi': {
+        'DERINLIK_ALIS-1.csv': _DERINLIK['DERINLIK_ALIS-1.csv'],
+    },
+    'direnc_analizi': {
+        'DERINLIK_SATIS-1.csv': _DERINLIK['DERINLIK_SATIS-1.csv'],
+    },
+    'guclu_talep_analizi': {
+        'ACILISLAR-1.csv': TUM,
+        'KADEME_ANALIZI.csv': ['SEMBOL', 'FARK'],
+    },
+    'kademe_denge_analizi': {
+        'KADEME_ANALIZI.csv': ['SEMBOL', 'FARK'],
+        'BEKLEYEN_EMIRLER.csv': ['SEMBOL', 'NET.EMIR.FARKI'],
+    },
+    'kritik_destek_analizi': {
+        'ACILISLAR-1.csv': ['SEMBOL', 'KAPANIS', re.compile(r'DUSUK(-\d+)?')],
+        'DERINLIK_ALIS-1.csv': _DERINLIK['DERINLIK_ALIS-1.csv'],
+    },
+    'kritik_direnc_analizi': {
+        'ACILISLAR-1.csv': ['SEMBOL', 'KAPANIS', re.compile(r'YUKSEK(-\d+)?')],
+        'DERINLIK_SATIS-1.csv': _DERINLIK['DERINLIK_SATIS-1.csv'],
+    },
+    'kurumsal_maliyet_analizi': {
+        'MALIYET_ALICI-1.csv': ['SEMBOL', 'ENIYI ALICI.1', re.compile(r'NET ADET(\.\d+)?'),
+                                re.compile(r'MALIYET(\.\d+)?')],
+        'ACILISLAR-1.csv': ['SEMBOL', 'KAPANIS'],
+    },
+    'likidite_duvari_analizi': dict(_DERINLIK, **{
+        'ACILISLAR-1.csv': ['SEMBOL', 'KAPANIS'],
+    }),
+    'otomatik_derinlik_analizi': dict(_DERINLIK),
+    'spread_analizi': {
+        'DERINLIK_ALIS-1.csv': ['SEMBOL', '1 ALIS'],
+        'DERINLIK_SATIS-1.csv': ['SEMBOL', '1 SATIS'],
+        'ACILISLAR-1.csv': ['SEMBOL', 'YUKSEK', 'DUSUK', 'KAPANIS'],
+    },
+    'sikisma_analizi': {
+        'ACILISLAR-1.csv': ['SEMBOL', re.compile(r'KAPANIS(-\d+)?'), 'HACIM', 'HACIM-1'],
+        'ACILISLAR-2.csv': ['SEMBOL', re.compile(r'KAPANIS(-\d+)?')],
+    },
+    'manipulasyon_analizi': {
+        'ACILISLAR-1.csv': ['SEMBOL', 'KAPANIS', 'KAPANIS-1', _HACIM_GECMISI],
+        'KADEME_ANALIZI.csv': ['SEMBOL', 'FARK'],
+        'BEKLEYEN_EMIRLER.csv': ['SEMBOL', 'NET.EMIR.FARKI'],
+    },
+    'wapd_analizi': dict(_DERINLIK, **{
+        'ACILISLAR-1.csv': ['SEMBOL', 'KAPANIS'],
+    }),
+}
+
+
+def sutun_turu(sutun):
+    for desen, tur in TUR_KURALLARI:
+        if desen.fullmatch(sutun):
+            return tur
+    return SAYI
+
+
+def analiz_sutunlari(analiz):
+    """Analizin dosya -> sütun ihtiyacını döndürür. Kayıtlı değilse KeyError."""
+    if analiz not in ANALIZ_SUTUNLARI:
+        raise KeyError(f"Şemada tanımsız analiz: {analiz}")
+    return ANALIZ_SUTUNLARI[analiz]
+
+
+def ihtiyac_birlestir(eski, yeni):
+    """İki sütun ihtiyacını birleştirir. Biri TUM ise sonuç TUM'dur."""
+    if eski is TUM or yeni is TUM:
+        return TUM
+    return list(eski) + [s for s in yeni if s not in eski]
+
+
+def ihtiyac_kapsiyor_mu(eski, yeni):
+    """'eski' ihtiyaçla okunmuş tablo 'yeni' ihtiyacı karşılıyor mu?"""
+    if eski is TUM:
+        return True
+    if yeni is TUM:
+        return False
+    return all(s in eski for s in yeni)
+
+
+def secilen_sutunlar(basliklar, ihtiyac):
+    """Dosya başlığından ihtiyaca uyan sütunları (dosyadaki sırasıyla) seçer.
+
+    Dosyada olmayan sütunlar sessizce atlanır; analizler zaten
+    'if col in df.columns' kontrolü yapıyor.
+    """
+    if ihtiyac is TUM:
+        return list(basliklar)
+    adlar = {s for s in ihtiyac if isinstance(s, str)}
+    desenler = [s for s in ihtiyac if not isinstance(s, str)]
+    return [c for c in basliklar if c in adlar or any(d.fullmatch(c) for d in desenler)]
+
+
+def okuma_tipleri(sutunlar, kompakt=False):
+    """read_csv 'dtype' sözlüğü: sadece kompakt modda fiyatlar için float32.
+
+    Kategoriler ve lotlar okumadan sonra 'kucult' ile çevrilir (bkz. kategorik;
+    read_csv'nin 'Int32' okuması int32 sınırını aşan sayıları sessizce taşırıyor).
+    """
+    if not kompakt:
+        return {}
+    return {s: 'float32' for s in sutunlar if sutun_turu(s) == FIYAT}
+
+
+def kucult(df, sozlukler=None):
+    """Okunmuş tabloyu şemadaki kompakt tiplere çevirir (df yerinde değişir).
+
+    - SEMBOL / kurum adları: 'category'. 'sozlukler' (tür -> pd.Index) verilirse
+      bütün dosyalar aynı sözlüğü büyüterek kullanır; her metin bellekte bir
+      kez tutulur, tablolarda sadece kodlar kalır.
+    - Kademe lotları: bütün lot sütunları tek matriste kontrol edilir, tamamı
+      tam sayı ve int32 sınırları içindeyse 'Int32' olur.
+    Dönüş: Int32'ye sığmadığı için float64 bırakılan lot sütunları.
+    """
+    if sozlukler is None:
+        sozlukler = {}
+    for sutun in df.columns:
+        tur = sutun_turu(sutun)
+        if tur in (SEMBOL, KURUM):
+            df[sutun], sozlukler[tur] = kategorik(df[sutun], sozlukler.get(tur))
+
+    # (Önbellekten gelen Int32 sütunlar tekrar kontrol edilmez)
+    sutunlar = [c for c in df.columns
+                if sutun_turu(c) == LOT and isinstance(df[c].dtype, np.dtype) and df[c].dtype.kind in 'fi']
+    if not sutunlar:
+        return []
+    degerler = df[sutunlar].to_numpy(dtype='float64', na_value=np.nan)
+    bos = np.isnan(degerler)
+    dolu = np.where(bos, 0.0, degerler)
+    uygun = ((dolu == np.trunc(dolu))
+             & (dolu >= INT32_ARALIGI[0]) & (dolu <= INT32_ARALIGI[1])).all(axis=0)
+    kucuk = {c: pd.arrays.IntegerArray(dolu[:, j].astype('int32'), bos[:, j])
+             for j, c in enumerate(sutunlar) if uygun[j]}
+    if kucuk:
+        df[list(kucuk)] = pd.DataFrame(kucuk, index=df.index)
+    return [c for j, c in enumerate(sutunlar) if not uygun[j]]
+
+
+def kategorik(seri, sozluk=None):
+    """Metin sütununu 'category'ye çevirir; kategoriler ilk görülme sırasıyla.
+
+    (read_csv'nin 'category' okuması kategorileri sıraladığı için tekil
+    sembollerde okumayı iki katına çıkarıyor; factorize sıralamaz.)
+    Sütun zaten kategorikse (önbellekten gelen) sadece kodları sözlüğe taşınır.
+    Dönüş: (Categorical, güncel sözlük)
+    """
+    if isinstance(seri.dtype, pd.CategoricalDtype):
+        kodlar, yerel = seri.cat.codes.to_numpy(), seri.cat.categories
+        if sozluk is not None and yerel.equals(sozluk):
+            return seri.array, sozluk
+    else:
+        kodlar, yerel = pd.factorize(seri)
+    if sozluk is None:
+        return pd.Categorical.from_codes(kodlar, yerel), yerel
+    konum = sozluk.get_indexer(yerel)
+    yeni = konum < 0
+    if yeni.any():
+        konum[yeni] = len(sozluk) + np.arange(int(yeni.sum()))
+        sozluk = sozluk.append(yerel[yeni])
+    kodlar = np.where(kodlar >= 0, konum[kodlar], -1)
+    return pd.Categorical.from_codes(kodlar, sozluk), sozluk
+
+
+def basliklar(yol):
+    """CSV başlık satırını pandas'ın verdiği adlarla döndürür.
+
+    Tekrarlanan başlıklar read_csv gibi '.1', '.2' ekiyle ayrılır
+    (MALIYET_ALICI: 'ENIYI ALICI', 'ENIYI ALICI.1' ...). Tabloyu okumadan
+    'usecols' ve 'dtype' hazırlamak için kullanılır.
+    """
+    with open(yol, encoding='utf-8-sig', newline='') as f:
+        ilk_satir = next(csv.reader(f), [])
+    sayac = {}
+    adlar = []
+    for ad in ilk_satir:
+        if ad in sayac:
+            sayac[ad] += 1
+            adlar.append(f"{ad}.{sayac[ad]}")
+        else:
+            sayac[ad] = 0
+            adlar.append(ad)
+    return adlar
\ No newline at end of file
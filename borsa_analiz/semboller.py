@@ -0,0 +1,161 @@
+"""
+================================================================================
+MODÜL ADI   : Sembol Sözlüğü (Tam Sayı Sembol Kimlikleri)
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+VeriPaketi bütün dosyaların SEMBOL sütununu tek bir ortak kategori
+sözlüğüyle kodlar (bkz. sema.kucult). Bu sözlükte her hissenin sırası
+onun yoğun (0, 1, 2 ...) tam sayı kimliğidir. SembolSozlugu:
+- Tabloları bu kimliklere göre hizalar; 'SEMBOL' üzerinden pd.merge
+  yerine dizi indeksleme ile birleştirir (birlestir),
+- Hangi sembolün hangi dosyada olmadığını açıkça raporlar (eksikler);
+  eskiden how='inner' bu sembolleri sessizce düşürüyordu.
+
+NOT:
+Sağdaki tabloda tekrarlanan sembollerde ilk satır kullanılır (paket
+tekrarları zaten uyarı olarak bildiriyor). Soldaki tablonun satırları
+ve sırası korunur; pd.merge(how='inner'/'left') ile aynı sonuç çıkar.
+================================================================================
+"""
+
+import numpy as np
+import pandas as pd
+
+from .profil import asamali
+
+
+class SembolSozlugu:
+    def __init__(self, semboller, tablolar=None):
+        self.semboller = semboller      # pd.Index: kimlik -> sembol
+        self._var = {}                  # Dosya -> (n,) o dosyada bulunan kimlikler maskesi
+        self.dusenler = {}              # Dosya -> birleştirmede düşen semboller
+        self._kategori_konumlari = []   # (kategoriler, sözlükteki konumları) önbelleği
+        for dosya_adi, df in (tablolar or {}).items():
+            self.kaydet(dosya_adi, df)
+
+    def __len__(self):
+        return len(self.semboller)
+
+    def __repr__(self):
+        return f"SembolSozlugu({len(self)} sembol, dosyalar={sorted(self._var)})"
+
+    # --- KİMLİKLER ---
+    def kimlikler(self, df):
+        """Tablonun her satırı için sembol kimliği (sözlükte yoksa -1).
+
+        SEMBOL sütunu kategorikse sadece kategoriler aranır, satırlar
+        kodlardan çevrilir (metin karşılaştırması yapılmaz).
+        """
+        seri = df['SEMBOL']
+        if isinstance(seri.dtype, pd.CategoricalDtype):
+            konum = self._kategori_konumu(seri.cat.categories)
+            kodlar = seri.cat.codes.to_numpy()
+            return np.where(kodlar >= 0, konum[kodlar], -1)
+        return self.semboller.get_indexer(seri)
+
+    def _kategori_konumu(self, kategoriler):
+        # Paket tabloları sözlüğün o anki halini (bir önekini) kategori olarak taşır;
+        # aynı kategori nesnesi için arama bir kez yapılır.
+        for bilinen, konum in self._kategori_konumlari:
+            if bilinen is kategoriler:
+                return konum
+        if kategoriler is self.semboller:
+            konum = np.arange(len(self))
+        else:
+            konum = self.semboller.get_indexer(kategoriler)
+        self._kategori_konumlari.append((kategoriler, konum))
+        return konum
+
+    def ilk_satirlar(self, df):
+        """Kimlik -> tablodaki ilk satırın konumu (yoksa -1), uzunluk len(self)."""
+        kimlik = self.kimlikler(df)
+        satirlar = np.full(len(self), -1, dtype='int64')
+        gecerli = np.flatnonzero(kimlik >= 0)
+        satirlar[kimlik[gecerli]] = gecerli
+        if (satirlar[kimlik[gecerli]] != gecerli).any():
+            # Tekrarlanan semboller var: ilk satır geçerli olsun
+            tekil, ilk = np.unique(kimlik[gecerli], return_index=True)
+            satirlar[tekil] = gecerli[ilk]
+        return satirlar
+
+    # --- DOSYA KAPSAMI ---
+    def kaydet(self, dosya_adi, df):
+        """Dosyadaki sembolleri kapsam raporu için kaydeder."""
+        var = np.zeros(len(self), dtype=bool)
+        kimlik = self.kimlikler(df)
+        var[kimlik[kimlik >= 0]] = True
+        self._var[dosya_adi] = var
+        return self
+
+    def eksikler(self):
+        """Dosya -> o dosyada olmayan semboller (kayıtlı dosyaların birleşimine göre)."""
+        if not self._var:
+            return {}
+        evren = np.logical_or.reduce(list(self._var.values()))
+        return {dosya_adi: self.semboller[evren & ~var] for dosya_adi, var in self._var.items()}
+
+    def eksik_tablosu(self):
+        """Her dosya için sembol sayısı, eksik sembol sayısı ve ilk birkaç eksik sembol."""
+        eksikler = self.eksikler()
+        return pd.DataFrame({
+            'DOSYA': list(eksikler),
+            'SEMBOL_SAYISI': [int(self._var[d].sum()) for d in eksikler],
+            'EKSIK_SAYISI': [len(e) for e in eksikler.values()],
+            'EKSIK_ORNEK': [', '.join(map(str, e[:5])) for e in eksikler.values()],
+        })
+
+    # --- BİRLEŞTİRME ---
+    @asamali('birlestirme')
+    def birlestir(self, sol, sag, how='inner', dosya_adi=None):
+        """pd.merge(sol, sag, on='SEMBOL', how=how) karşılığı, kimlik indeksleme ile.
+
+        how='inner': sağda olmayan satırlar düşer (dosya_adi verilirse
+        düşen semboller 'dusenler' altında saklanır). how='left': sağdan
+        gelen sütunlar o satırlarda NaN olur.
+        """
+        if how not in ('inner', 'left'):
+            raise ValueError(f"Desteklenmeyen birleştirme: {how}")
+        # Aynı adlı sütunlar pd.merge'deki gibi '_x' / '_y' ekiyle ayrılır
+        ortak = [c for c in sag.columns if c != 'SEMBOL' and c in sol.columns]
+        if ortak:
+            sol = sol.rename(columns={c: f"{c}_x" for c in ortak})
+            sag = sag.rename(columns={c: f"{c}_y" for c in ortak})
+
+        kimlik = self.kimlikler(sol)
+        ilk = self.ilk_satirlar(sag)
+        satir = np.where(kimlik >= 0, ilk[np.maximum(kimlik, 0)], -1)
+        sag = sag.drop(columns='SEMBOL').reset_index(drop=True)
+
+        if how == 'inner':
+            tut = satir >= 0
+            if dosya_adi is not None and not tut.all():
+                self.dusenler[dosya_adi] = pd.Index(sol['SEMBOL'].to_numpy()[~tut]).unique()
+            sol = sol[tut]
+            ek = sag.take(satir[tut])
+        else:
+            # -1 RangeIndex'te olmadığı için o satırlar NaN gelir
+            ek = sag.reindex(satir)
+
+        sol = sol.reset_index(drop=True)
+        ek.index = sol.index
+        return pd.concat([sol, ek], axis=1)
+
+    def dusen_raporu(self):
+        """'inner' birleştirmelerde düşen semboller için okunabilir satırlar."""
+        return [f"{dosya_adi} dosyasında olmayan {len(semboller)} sembol analiz dışı kaldı "
+                f"({', '.join(map(str, semboller[:5]))}{' ...' if len(semboller) > 5 else ''})"
+                for dosya_adi, semboller in self.dusenler.items()]
+
+
+def sembol_metne(df):
+    """Analiz sonucunun SEMBOL sütununu metne (str) çevirip tabloyu döndürür.
+
+    Paket tablolarının kategorileri ortak sözlüğün okuma anındaki halidir;
+    yüklenen dosyalara ve önbelleğe göre değişir. Sonuç tablosu bu sözlüğü
+    taşırsa aynı analizin tipi çalışmadan çalışmaya farklı olur ve günler
+    birleştirilince SEMBOL object'e döner.
+    """
+    df['SEMBOL'] = df['SEMBOL'].astype('str')
+    return df
\ No newline at end of file
@@ -0,0 +1,301 @@
+"""
+================================================================================
+MODÜL ADI   : Sentetik Piyasa Günü Üretici (Yedi Girdi Dosyası)
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Proje örnek veriyle gelmiyor; test ve ölçüm için scriptlerin beklediği
+sütun adlarıyla birbiriyle tutarlı yedi dosya üretir:
+    ACILISLAR-1.csv      ACILIS, KAPANIS, YUKSEK, DUSUK, HACIM ve gecikmeleri
+    ACILISLAR-2.csv      KAPANIS-6 ... KAPANIS-<gecmis>
+    DERINLIK_ALIS-1.csv  "{i} ALIS", "{i} ALIS ADET" (i = 1..kademe)
+    DERINLIK_SATIS-1.csv "{i} SATIS", "{i} SATIS ADET"
+    KADEME_ANALIZI.csv   TOPLAM, AORT, ALIS, SATIS, FARK
+    BEKLEYEN_EMIRLER.csv NET.EMIR.FARKI
+    MALIYET_ALICI-1.csv  ENIYI ALICI + 4 x (ENIYI ALICI, NET ADET, MALIYET)
+                         (pandas: ENIYI ALICI.1, NET ADET.3, MALIYET.2 ...)
+
+Fiyatlar her sembol için gece + gün içi getirilerden oluşan bir rastgele
+yürüyüştür; gecikme sütunları önceki günlerin gerçek değerleridir (çok
+günlük arşivde bugünün KAPANIS-1'i dünün KAPANIS'ıdır). Derinlik
+kademeleri BIST fiyat adımlarıyla kapanışın etrafına dizilir; bekleyen
+emir farkı derinlikteki lotlardan, kademe analizi hacimden türetilir.
+
+DESENLER:
+- duvar  : alış / satış derinliğinde bir kademeye 8-15 kat lot (Destek,
+           Direnç, Likidite Duvarı)
+- sikisma: son 12 günde oynaklığı onda birine inen, hacmi düşen hisse
+- gap    : %1-5 yukarı açılış; yarısı gün içinde yükselmeye devam eder,
+           yarısı açılıştan aşağı kapanır (tuzak)
+Hangi sembole hangi desenin eklendiği gün klasöründeki SENTETIK.json'a
+yazılır. Aynı tohum ve ayarlar aynı dosyaları üretir.
+
+NOT:
+Dosyalar gerçek dışa aktarımlar gibi karışık sıralıdır ve her dosyadan
+'eksik' oranında sembol düşer (sembol eşleştirmesini sınamak için).
+50.000 sembollük bir gün (~45 MB) tek çekirdekte ~10 saniyede yazılır
+(sürenin çoğu CSV metni). Çok günlük arşivde fiyat yolu (sembol x gün)
+bellekte tutulur.
+
+KULLANIM:
+    python -m borsa_analiz.sentetik VERI --sembol 600
+    python -m borsa_analiz.sentetik STRES --sembol 50000 --kademe 25 --tohum 7
+    python -m borsa_analiz.sentetik ARSIV --gun 250 --baslangic 2025-01-02 --sikisma 0.05
+================================================================================
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from .analizler.kurumsal_maliyet import KURUMSAL_LISTESI
+from .arsiv import tarih_argumani
+
+# BIST fiyat adımları: fiyat < sınır ise adım (son adım sınırsız)
+ADIM_SINIRLARI = np.array([20.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0])
+ADIMLAR = np.array([0.01, 0.02, 0.05, 0.10, 0.25, 0.50, 1.00, 2.50])
+
+BIREYSEL_ARACILAR = ['GEDIK', 'INFO', 'TERA', 'A1 CAPITAL', 'ALNUS', 'BAHAR', 'MARBAS', 'PHILLIP']
+ALICI_SAYISI = 4
+SIKISMA_PENCERESI = 12
+BASLANGIC = '2025-01-02'    # Varsayılan ilk gün (sabit: çıktı üretildiği güne bağlı olmasın)
+
+VARSAYILANLAR = {
+    'sembol': 600,      # Sembol sayısı
+    'kademe': 14,       # Derinlik kademesi
+    'gecmis': 10,       # Kapanış gecikmesi (KAPANIS-1 .. KAPANIS-gecmis)
+    'duvar': 0.05,      # Taraf başına duvar olan sembol oranı
+    'sikisma': 0.03,    # Gün başına sıkışması biten sembol oranı
+    'gap': 0.05,        # Gün başına gap açan sembol oranı
+    'kurumsal': 0.4,    # En iyi alıcısı kurumsal olan sembol oranı
+    'eksik': 0.02,      # Her dosyadan düşen sembol oranı
+}
+
+
+def fiyat_adimi(fiyat):
+    return ADIMLAR[np.searchsorted(ADIM_SINIRLARI, fiyat, side='right')]
+
+
+def sembol_adlari(n):
+    genislik = max(4, len(str(n - 1)))
+    return np.array([f'S{i:0{genislik}d}' for i in range(n)], dtype=object)
+
+
+# --- FİYAT YOLU ---
+def fiyat_yolu(rng, n, uzunluk, gun_sayisi, sikisma=0.03, gap=0.05):
+    """(sembol x gün) ACILIS / KAPANIS / YUKSEK / DUSUK / HACIM matrisleri ve desen maskeleri.
+
+    Desenler sadece son 'gun_sayisi' günde (yazılacak günler) başlatılır;
+    öncesi gecikme sütunları için geçmiştir.
+    """
+    yazilan = np.zeros((n, uzunluk), dtype=bool)
+    yazilan[:, uzunluk - gun_sayisi:] = True
+    sikisma_biten = (rng.random((n, uzunluk)) < sikisma) & yazilan
+    gap_var = (rng.random((n, uzunluk)) < gap) & yazilan
+    tuzak = gap_var & (rng.random((n, uzunluk)) < 0.5)
+
+    # Sıkışma penceresi: j. gün, sonraki SIKISMA_PENCERESI gün içinde biten bir sıkışmanın parçası
+    kum = np.zeros((n, uzunluk + 1), dtype='int32')
+    np.cumsum(sikisma_biten, axis=1, out=kum[:, 1:])
+    son = np.minimum(np.arange(uzunluk) + SIKISMA_PENCERESI, uzunluk)
+    sikisik = (kum[:, son] - kum[:, :-1]) > 0
+
+    oynaklik = rng.uniform(0.01, 0.035, n)[:, None] * np.where(sikisik, 0.1, 1.0)
+    gece = rng.standard_normal((n, uzunluk)) * oynaklik * 0.3
+    gun_ici = rng.standard_normal((n, uzunluk)) * oynaklik
+    gece[gap_var] = np.log1p(rng.uniform(0.01, 0.05, gap_var.sum()))
+    yon = np.where(tuzak, -1.0, 1.0)[gap_var]
+    gun_ici[gap_var] = yon * rng.uniform(0.005, 0.03, gap_var.sum())
+
+    ilk = np.exp(rng.uniform(np.log(1.0), np.log(500.0), n))
+    log_kapanis = np.log(ilk)[:, None] + np.cumsum(gece + gun_ici, axis=1)
+    kapanis = np.exp(log_kapanis)
+    acilis = np.exp(log_kapanis - gun_ici)
+    fitil = np.abs(rng.standard_normal((2, n, uzunluk))) * oynaklik * 0.5
+    yuksek = np.maximum(acilis, kapanis) * (1 + fitil[0])
+    dusuk = np.minimum(acilis, kapanis) * (1 - fitil[1])
+
+    adim = fiyat_adimi(kapanis)
+    acilis, kapanis = _adima_yuvarla(acilis, adim), _adima_yuvarla(kapanis, adim)
+    yuksek = np.maximum(_adima_yuvarla(yuksek, adim, np.ceil), np.maximum(acilis, kapanis))
+    dusuk = np.minimum(_adima_yuvarla(dusuk, adim, np.floor), np.minimum(acilis, kapanis))
+
+    taban_hacim = np.exp(rng.normal(np.log(5e6), 1.2, n))[:, None]
+    carpan = np.exp(rng.normal(0, 0.35, (n, uzunluk)))
+    carpan[gap_var] *= 3.0
+    carpan[sikisik] *= 0.5
+    carpan[sikisma_biten] *= 0.5          # Sıkışmanın son günü: hacim bir önceki günden düşük
+    hacim = np.round(taban_hacim * carpan)
+
+    return {
+        'ACILIS': acilis, 'KAPANIS': kapanis, 'YUKSEK': yuksek, 'DUSUK': dusuk, 'HACIM': hacim,
+        'SIKISMA': sikisma_biten, 'GAP_DEVAM': gap_var & ~tuzak, 'GAP_TUZAK': tuzak,
+    }
+
+
+def _adima_yuvarla(fiyat, adim, yuvarla=np.round):
+    return np.round(np.maximum(yuvarla(fiyat / adim), 1) * adim, 2)
+
+
+# --- GÜN TABLOLARI ---
+def gun_tablolari(rng, semboller, yol, t, kademe=14, gecmis=10, duvar=0.05, kurumsal=0.4):
+    """Fiyat yolunun t. günü için yedi dosyanın tabloları ve o günün desenleri."""
+    n = len(semboller)
+    kapanis = yol['KAPANIS'][:, t]
+    tablolar = {}
+
+    # ACILISLAR-1 / -2: gün değerleri ve gecikmeler (HACIM 5, DUSUK / YUKSEK 4 gün geriye)
+    acilis1 = {'SEMBOL': semboller}
+    for alan in ('ACILIS', 'KAPANIS', 'YUKSEK', 'DUSUK', 'HACIM'):
+        acilis1[alan] = yol[alan][:, t]
+    for alan, son in (('KAPANIS', min(gecmis, 5)), ('HACIM', min(gecmis, 5)),
+                      ('DUSUK', min(gecmis, 4)), ('YUKSEK', min(gecmis, 4))):
+        for i in range(1, son + 1):
+            acilis1[f'{alan}-{i}'] = yol[alan][:, t - i]
+    tablolar['ACILISLAR-1.csv'] = pd.DataFrame(acilis1)
+    acilis2 = {'SEMBOL': semboller}
+    for i in range(6, gecmis + 1):
+        acilis2[f'KAPANIS-{i}'] = yol['KAPANIS'][:, t - i]
+    tablolar['ACILISLAR-2.csv'] = pd.DataFrame(acilis2)
+
+    # DERINLIK: kapanışın etrafında fiyat adımlarıyla dizilmiş, hisse başına 3..kademe dolu kademe
+    adim = fiyat_adimi(kapanis)
+    dolu = np.where(rng.random(n) < 0.7, kademe, rng.integers(min(3, kademe), kademe + 1, n))
+    seviye = np.arange(kademe)
+    bos = seviye[None, :] >= dolu[:, None]
+    ort_lot = np.maximum(yol['HACIM'][:, t] / kapanis * 0.01, 10)
+    desenler = {}
+    lotlar = {}
+    for taraf, yon in (('ALIS', -1), ('SATIS', 1)):
+        ilk_fiyat = kapanis if yon < 0 else kapanis + adim
+        fiyatlar = np.round(ilk_fiyat[:, None] + yon * seviye[None, :] * adim[:, None], 2)
+        lot = np.round(ort_lot[:, None] * np.exp(rng.normal(0, 0.6, (n, kademe)))).clip(1)
+        duvarli = np.flatnonzero(rng.random(n) < duvar)
+        duvar_kademesi = (rng.random(len(duvarli)) * dolu[duvarli]).astype(int)
+        lot[duvarli, duvar_kademesi] *= rng.uniform(8, 15, len(duvarli)).round()
+        fiyatlar[bos | (fiyatlar <= 0)] = np.nan
+        lot[np.isnan(fiyatlar)] = np.nan
+        sutunlar = {'SEMBOL': semboller}
+        for i in range(kademe):
+            sutunlar[f'{i + 1} {taraf}'] = fiyatlar[:, i]
+            sutunlar[f'{i + 1} {taraf} ADET'] = lot[:, i]
+        tablolar[f'DERINLIK_{taraf}-1.csv'] = pd.DataFrame(sutunlar)
+        desenler[f'DUVAR_{taraf}'] = semboller[duvarli].tolist()
+        lotlar[taraf] = np.nansum(lot, axis=1)
+
+    # KADEME_ANALIZI: hacmin lot karşılığı; aktif alış payı günün yönüyle ilişkili
+    toplam = np.round(yol['HACIM'][:, t] / kapanis).astype('int64')
+    yukselis = np.sign(kapanis - yol['ACILIS'][:, t])
+    alis = (toplam * np.clip(rng.normal(0.5 + 0.1 * yukselis, 0.1), 0.05, 0.95)).astype('int64')
+    aort = np.round((yol['ACILIS'][:, t] + kapanis + yol['YUKSEK'][:, t] + yol['DUSUK'][:, t]) / 4, 2)
+    tablolar['KADEME_ANALIZI.csv'] = pd.DataFrame({
+        'SEMBOL': semboller, 'TOPLAM': toplam, 'AORT': aort,
+        'ALIS': alis, 'SATIS': toplam - alis, 'FARK': 2 * alis - toplam,
+    })
+
+    # BEKLEYEN_EMIRLER: derinlikteki alış lotları - satış lotları
+    tablolar['BEKLEYEN_EMIRLER.csv'] = pd.DataFrame({
+        'SEMBOL': semboller, 'NET.EMIR.FARKI': (lotlar['ALIS'] - lotlar['SATIS']).astype('int64'),
+    })
+
+    tablolar['MALIYET_ALICI-1.csv'] = _maliyet_tablosu(rng, semboller, toplam, aort, kurumsal)
+    return tablolar, desenler
+
+
+def _maliyet_tablosu(rng, semboller, toplam, aort, kurumsal):
+    # Başlık gerçek dışa aktarımdaki gibi tekrarlı: pandas ENIYI ALICI.1, NET ADET.1 ... diye okur
+    n = len(semboller)
+    kurumlar = np.array(KURUMSAL_LISTESI, dtype=object)
+    bireyseller = np.array(BIREYSEL_ARACILAR, dtype=object)
+    hepsi = np.concatenate([kurumlar, bireyseller])
+    sutunlar = ['SEMBOL', 'ENIYI ALICI']
+    degerler = [semboller, np.full(n, '1', dtype=object)]
+    net = toplam * rng.uniform(0.05, 0.3, n)
+    for j in range(ALICI_SAYISI):
+        if j == 0:
+            adlar = np.where(rng.random(n) < kurumsal, kurumlar[rng.integers(len(kurumlar), size=n)],
+                             bireyseller[rng.integers(len(bireyseller), size=n)])
+        else:
+            adlar = hepsi[rng.integers(len(hepsi), size=n)]
+            net = net * rng.uniform(0.3, 0.9, n)
+        sutunlar += ['ENIYI ALICI', 'NET ADET', 'MALIYET']
+        degerler += [' ' + adlar + ' ', np.maximum(net, 1).astype('int64'),
+                     np.round(aort * np.exp(rng.normal(0, 0.02, n)), 2)]
+    tablo = pd.DataFrame(dict(enumerate(degerler)))
+    tablo.columns = sutunlar
+    return tablo
+
+
+# --- YAZMA ---
+def sentetik_arsiv(hedef, gun=1, baslangic=BASLANGIC, tohum=0, **ayarlar):
+    """'gun' günlük sentetik veri üretir; yazılan klasörlerin listesini döndürür.
+
+    gun=1 ise dosyalar doğrudan 'hedef'e, değilse hedef/YYYY-AA-GG/ altına
+    (baslangic'tan itibaren iş günleri; varsayılan BASLANGIC) yazılır. Ayarlar: VARSAYILANLAR.
+    """
+    bilinmeyen = sorted(set(ayarlar) - set(VARSAYILANLAR))
+    if bilinmeyen:
+        raise TypeError(f"Tanımsız ayar: {', '.join(bilinmeyen)}")
+    ayar = dict(VARSAYILANLAR, **ayarlar)
+    rng = np.random.default_rng(tohum)
+    semboller = sembol_adlari(ayar['sembol'])
+    uzunluk = ayar['gecmis'] + gun
+    yol = fiyat_yolu(rng, ayar['sembol'], uzunluk, gun, ayar['sikisma'], ayar['gap'])
+    tarihler = pd.bdate_range(baslangic or BASLANGIC, periods=gun)
+
+    klasorler = []
+    for k, tarih in enumerate(tarihler):
+        t = ayar['gecmis'] + k
+        klasor = hedef if gun == 1 else os.path.join(hedef, tarih.strftime('%Y-%m-%d'))
+        os.makedirs(klasor, exist_ok=True)
+        tablolar, desenler = gun_tablolari(rng, semboller, yol, t, ayar['kademe'], ayar['gecmis'],
+                                           ayar['duvar'], ayar['kurumsal'])
+        for ad in ('SIKISMA', 'GAP_DEVAM', 'GAP_TUZAK'):
+            desenler[ad] = semboller[yol[ad][:, t]].tolist()
+        for dosya_adi, tablo in tablolar.items():
+            # Gerçek dışa aktarımlar gibi: karışık sıra, bazı semboller eksik
+            tut = rng.permutation(len(tablo))[:int(round(len(tablo) * (1 - ayar['eksik'])))]
+            tablo.iloc[np.sort(tut)].sample(frac=1, random_state=rng).to_csv(
+                os.path.join(klasor, dosya_adi), index=False)
+        with open(os.path.join(klasor, 'SENTETIK.json'), 'w', encoding='utf-8') as f:
+            json.dump({'tarih': tarih.strftime('%Y-%m-%d'), 'tohum': tohum, 'gun_no': k,
+                       'ayarlar': ayar, 'desenler': desenler}, f, ensure_ascii=False)
+        klasorler.append(klasor)
+    return klasorler
+
+
+def ana(argumanlar=None):
+    ayristirici = argparse.ArgumentParser(
+        prog='python -m borsa_analiz.sentetik',
+        description="Scriptlerin beklediği yedi dosyayı tohumlu, sentetik olarak üretir.")
+    ayristirici.add_argument('hedef', help="Çıktı klasörü (--gun > 1 ise altında tarih klasörleri)")
+    ayristirici.add_argument('--gun', type=int, default=1, help="Üretilecek gün sayısı")
+    ayristirici.add_argument('--baslangic', type=tarih_argumani, default=BASLANGIC, help=f"İlk gün (varsayılan: {BASLANGIC})")
+    ayristirici.add_argument('--tohum', type=int, default=0, help="Rastgele sayı tohumu")
+    for ad, deger in VARSAYILANLAR.items():
+        ayristirici.add_argument(f'--{ad}', type=type(deger), default=deger, help=f"(varsayılan: {deger})")
+    secenekler = ayristirici.parse_args(argumanlar)
+
+    ayarlar = {ad: getattr(secenekler, ad) for ad in VARSAYILANLAR}
+    if ayarlar['sembol'] < 1 or ayarlar['kademe'] < 1 or secenekler.gun < 1:
+        ayristirici.error("sembol, kademe ve gün en az 1 olmalı")
+    if ayarlar['gecmis'] < 1:
+        ayristirici.error("gecmis en az 1 olmalı")
+
+    try:
+        klasorler = sentetik_arsiv(secenekler.hedef, secenekler.gun, secenekler.baslangic,
+                                   secenekler.tohum, **ayarlar)
+    except Exception as e:
+        print(f"HATA: {e}")
+        return 1
+    print(f"✓ {len(klasorler)} gün, {ayarlar['sembol']} sembol: {secenekler.hedef}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(ana())
\ No newline at end of file
@@ -0,0 +1,66 @@
+"""
+================================================================================
+MODÜL ADI   : Sıralama (İlk N Seçimi ve Tek Sıralama)
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Raporların "en iyi 10 / en kötü 15" listeleri bütün tabloyu sıralayıp
+head() almak yerine kısmi seçimle (np.partition) bulunur: n satır için
+tablo boyunda doğrusal iş, sonra sadece adaylar sıralanır. TUM dosyası
+zaten sıralı yazılıyorsa liste ayrıca seçilmez; o tek sıralamanın başı
+kullanılır (sirali(...).head(n)).
+
+SIRALAMA KURALI (her fonksiyonda aynı):
+- Eşit değerler tablodaki sırasını korur (kararlı sıralama); bu yüzden
+  ilk_n(df, s, n) == sirali(df, s).head(n), artan ya da azalan.
+- Boş (NaN) değerler yön ne olursa olsun en sona gider.
+
+KULLANIM:
+    from borsa_analiz.siralama import ilk_n, sirali
+    tum = sirali(df, 'SKOR')                  # TUM raporu için tek sıralama
+    en_iyi = tum.head(20)
+    en_dar = ilk_n(df, 'SPREAD_YUZDE', 15, artan=True)
+================================================================================
+"""
+
+import numpy as np
+
+
+def _anahtar(seri, artan):
+    """Sıralama anahtarı: küçük olan önce gelir, NaN korunur."""
+    anahtar = seri.to_numpy(dtype='float64', na_value=np.nan)
+    return anahtar if artan else -anahtar
+
+
+def aday_konumlari(seri, n, artan=False):
+    """İlk n satırın adaylarının konumları (tablo sırasıyla).
+
+    n'inci değere eşit olanların hepsi aday sayılır; böylece adaylar
+    hangi eşitlik kuralıyla sıralanırsa sıralansın ilk n doğru çıkar.
+    Geçerli değer n'den azsa NaN satırlar da aday olur.
+    """
+    anahtar = _anahtar(seri, artan)
+    bos = np.isnan(anahtar)
+    gecerli = int(len(anahtar) - bos.sum())
+    if n <= 0:
+        return np.empty(0, dtype='intp')
+    if n >= gecerli:
+        return np.arange(len(anahtar)) if n > gecerli else np.flatnonzero(~bos)
+    esik = np.partition(anahtar[~bos], n - 1)[n - 1]
+    return np.flatnonzero(anahtar <= esik)
+
+
+def ilk_n(df, sutun, n, artan=False):
+    """df.sort_values(sutun, ascending=artan, kind='stable').head(n) ile aynı sonuç.
+
+    Sıralama sadece adaylara uygulanır; n küçükken iş tablo boyunda
+    doğrusaldır.
+    """
+    adaylar = df.iloc[aday_konumlari(df[sutun], n, artan)]
+    return sirali(adaylar, sutun, artan).head(n)
+
+
+def sirali(df, sutun, artan=False):
+    """Tablonun tamamı, ilk_n ile aynı kuralla sıralı (TUM raporları için)."""
+    return df.sort_values(by=sutun, ascending=artan, kind='stable')
\ No newline at end of file
@@ -0,0 +1,108 @@
+"""
+================================================================================
+MODÜL ADI   : Skor Motoru (Büyük Tarama Puanlaması)
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+BÜYÜK TARAMA VE SKORLAMA robotunun puanlama kurallarını satır satır
+döngü yerine sütun maskeleriyle hesaplar. Her kural bir boolean maske,
+SKOR bu maskelerin ağırlıklı toplamıdır. Etiketler (SİNYAL,
+BALINA_DURUMU, TREND, TEORİK) vektörel seçimlerle atanır.
+
+KURALLAR (Toplam 100 Puan):
+A. BALINA GÜCÜ (40) : Balina lotu > İşlem hacminin %20'si (+20),
+                      Balina maliyeti fiyata %2 yakın (+20)
+B. TREND (30)       : Kapanış > AORT (+15), Aktif Alış > Aktif Satış (+15)
+C. NİYET (20)       : Bekleyen net emir > 0 (+10), Kapanış > Pivot (+10)
+D. DERİNLİK (10)    : Toplam alış derinliği > Toplam satış derinliği (+10)
+================================================================================
+"""
+
+import numpy as np
+import pandas as pd
+
+from .yardimci import yuvarla
+
+# Kural adı -> Puan
+KURAL_PUANLARI = {
+    'BALINA_GUCU': 20,
+    'MALIYET_UYGUN': 20,
+    'TREND_POZITIF': 15,
+    'PARA_GIRISI': 15,
+    'NIYET_ALICILI': 10,
+    'PIVOT_USTU': 10,
+    'DERINLIK_SAGLAM': 10,
+}
+
+# (Alt sınır, Sinyal) - yukarıdan aşağı ilk sağlanan eşik geçerli
+SINYAL_ESIKLERI = [
+    (80, "🚀 MEGA BOĞA"),
+    (60, "🟢 GÜÇLÜ AL"),
+    (40, "🟡 İZLE"),
+]
+NEGATIF_SINYAL = "🔴 SAT / NEGATİF"
+
+
+def kural_maskeleri(df):
+    """Birleştirilmiş tarama tablosundan her kural için boolean maske üretir.
+
+    Eksik (NaN) değerler kuralı sağlamaz; eski 'if' karşılaştırmalarıyla aynı.
+    """
+    with np.errstate(invalid='ignore', divide='ignore'):
+        fark_yuzde = ((df['KAPANIS'] - df['BALINA_MALIYET']) / df['BALINA_MALIYET']) * 100
+
+    maskeler = pd.DataFrame({
+        # --- A. BALINA GÜCÜ (40 PUAN) ---
+        'BALINA_GUCU': df['BALINA_LOT'] > (df['TOPLAM_ISLEM_LOT'] * 0.20),
+        'MALIYET_UYGUN': (fark_yuzde >= -2) & (fark_yuzde <= 2),
+        # --- B. TREND VE KADEME (30 PUAN) ---
+        'TREND_POZITIF': df['KAPANIS'] > df['AORT'],
+        'PARA_GIRISI': df['AKTIF_ALIS'] > df['AKTIF_SATIS'],
+        # --- C. TEORİK NİYET / PIVOT (20 PUAN) ---
+        'NIYET_ALICILI': df['NET.EMIR.FARKI'] > 0,
+        'PIVOT_USTU': df['KAPANIS'] > df['PIVOT'],
+        # --- D. DERİNLİK DESTEĞİ (10 PUAN) ---
+        'DERINLIK_SAGLAM': df['TOPLAM_DERINLIK_ALIS'] > df['TOPLAM_DERINLIK_SATIS'],
+    }, index=df.index)
+    return maskeler.fillna(False).astype(bool)
+
+
+def skor_hesapla(maskeler):
+    """SKOR = Sağlanan kuralların puanlarının toplamı (0-100)."""
+    puanlar = np.array([KURAL_PUANLARI[k] for k in maskeler.columns])
+    return maskeler.to_numpy(dtype='int64') @ puanlar
+
+
+def sinyal_ata(skor):
+    return np.select([skor >= esik for esik, _ in SINYAL_ESIKLERI],
+                     [sinyal for _, sinyal in SINYAL_ESIKLERI],
+                     default=NEGATIF_SINYAL)
+
+
+def skorla(df):
+    """Büyük tarama tablosunu puanlar ve rapor tablosunu döndürür."""
+    maskeler = kural_maskeleri(df)
+    skor = skor_hesapla(maskeler)
+
+    balina = maskeler['BALINA_GUCU'].to_numpy()
+    trend = maskeler['TREND_POZITIF'].to_numpy()
+    para = maskeler['PARA_GIRISI'].to_numpy()
+
+    # Tablo İçin Durum Metinleri
+    # (Kurum adları 'category' okunuyor; boş ad eskisi gibi 'nan' yazılsın diye object)
+    balina_adi = df['BALINA_ADI'].astype(object).map(lambda ad: str(ad).strip())
+    balina_durumu = np.where(balina, "TOPLUYOR (" + balina_adi + ")", "ZAYIF")
+    trend_durumu = np.select([trend & para, trend | para], ["POZİTİF", "KARIŞIK"], default="NEGATİF")
+    teorik_durumu = np.where(maskeler['NIYET_ALICILI'].to_numpy(), "ALICILI", "SATICILI")
+
+    return pd.DataFrame({
+        'SEMBOL': df['SEMBOL'].to_numpy(),
+        'SKOR': skor,
+        'SİNYAL': sinyal_ata(skor),
+        'BALINA_DURUMU': balina_durumu,
+        'TREND': trend_durumu,
+        'TEORİK': teorik_durumu,
+        'FİYAT': df['KAPANIS'].to_numpy(),
+        'BALINA_MLYT': yuvarla(df['BALINA_MALIYET'].to_numpy(), 2),
+    })
@@ -0,0 +1,309 @@
+"""
+================================================================================
+MODÜL ADI   : Sonuç Önbelleği (Analiz Sonuçlarının Kalıcı Hafızası)
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Veri klasöründe hiçbir şey değişmediyse ve parametreler (KADEME_DERINLIGI,
+DUVAR_CARPANI ...) aynıysa bir analizi tekrar çalıştırmak hesap
+gerektirmez. Önbellek isteğe bağlıdır: VeriPaketi(..., sonuc_onbellegi=True)
+ile açılan pakette, @onbellekli ile işaretlenen analiz fonksiyonunun
+sonuç tablosu klasördeki '.onbellek/sonuclar' altına yazılır ve aynı
+istekte diskten okunur. Klasör yolu verilen çağrılar ve varsayılan
+paketler veri klasörüne bir şey yazmaz.
+
+ANAHTAR:
+- Analizin adı, parametreleri (varsayılanlar dahil) ve paketin kompakt modu,
+- Kod sürümü: borsa_analiz paketindeki bütün .py dosyalarının özeti ile
+  pandas / NumPy sürümleri (kod değişince bütün kayıtlar geçersizleşir),
+- Analizin girdi dosyaları (sema.ANALIZ_SUTUNLARI): her dosyanın boyutu,
+  değişiklik zamanı ve içerik özeti (blake2b). Kaydedilen iz, paketin
+  tabloyu ayrıştırmadan önce aldığı izdir (VeriPaketi.girdi_izleri); dosya
+  hesaptan sonra değişse de sonuç eski içeriğin anahtarıyla yazılır.
+  Kontrolde paketin yüklediği dosyalar için bu iz, yüklemediği dosyalar
+  için diskteki hal kullanılır: boyut ve zaman aynıysa dosya okunmaz,
+  sadece zaman değiştiyse içerik özeti karşılaştırılır (onbellek.py ile
+  aynı kural). Olmayan dosya da anahtarın parçasıdır.
+Parametresi JSON'a çevrilemeyen çağrılar (ör. sikisma_analizi'ne verilen
+GecmisDeposu) önbelleğe alınmaz, her seferinde hesaplanır.
+
+TAHLİYE:
+Klasördeki kayıtların toplam boyutu sınırı aşarsa en uzun süredir
+kullanılmayan kayıtlar silinir (LRU; okunan kaydın zamanı güncellenir).
+
+NOT:
+- Paketin tabloları diskteki dosyalar olmalıdır. Bellekte kurulan veya
+  süzülen paketlerde (tablo_koy, alt_paket) sonuç önbelleği kapalıdır;
+  ayrıştırılırken dosyası değişen tablonun izi bilinmez, o tabloyu okuyan
+  analiz önbelleğe alınmaz.
+- Önbellekten dönen sonuçta analizin günlük notları (düşen semboller vb.)
+  tekrar yazılmaz; notlar sonucu hesaplayan çalışmada görünür.
+- Önbelleğe yazılamayan sonuç (ör. tipi desteklenmeyen sütun) uyarı ile
+  atlanır; analizin kendisi etkilenmez.
+
+KULLANIM:
+    @onbellekli
+    def wapd_analizi(veri, derinlik_siniri=KADEME_DERINLIGI): ...
+
+    VeriPaketi(klasor, sonuc_onbellegi=True)      # açık ('<klasor>/.onbellek/sonuclar')
+    VeriPaketi(klasor, sonuc_onbellegi=SonucOnbellegi(dizin='ORTAK'))
+    python -m borsa_analiz.calistirici VERI_KLASORU -o RAPORLAR --sonuc-onbellegi
+================================================================================
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import pathlib
+
+import numpy as np
+import pandas as pd
+
+from . import sema
+from .onbellek import KLASOR_ADI, PYARROW_VAR, Onbellek, OnbellekHatasi, icerik_ozeti, npz_oku, npz_yaz, parmak_izi
+
+gunluk = logging.getLogger(__name__)
+
+SURUM = 1
+ALT_KLASOR = 'sonuclar'
+VARSAYILAN_SINIR = 256 * 1024 * 1024  # bayt
+INDEKS_SUTUNU = '__indeks__'
+
+_kod_surumu = None
+
+
+def kod_surumu():
+    """borsa_analiz kaynaklarının ve pandas / NumPy sürümlerinin özeti (süreç başına bir kez)."""
+    global _kod_surumu
+    if _kod_surumu is None:
+        ozet = hashlib.blake2b(f"{pd.__version__}|{np.__version__}".encode(), digest_size=16)
+        kok = pathlib.Path(__file__).parent
+        for yol in sorted(kok.rglob('*.py')):
+            ozet.update(yol.relative_to(kok).as_posix().encode('utf-8'))
+            ozet.update(yol.read_bytes())
+        _kod_surumu = ozet.hexdigest()
+    return _kod_surumu
+
+
+class SonucOnbellegi:
+    def __init__(self, dizin=None, sinir_bayt=VARSAYILAN_SINIR, bicim=None):
+        self.dizin = dizin          # None: her veri klasörünün '.onbellek/sonuclar' alt klasörü
+        self.sinir_bayt = sinir_bayt
+        self.bicim = bicim or ('feather' if PYARROW_VAR else 'npz')
+        self._ozetler = {}          # (yol, boyut, mtime_ns) -> içerik özeti (süreç içinde)
+
+    def __repr__(self):
+        return f"SonucOnbellegi(dizin={self.dizin!r}, bicim={self.bicim!r})"
+
+    # --- ANA İŞLEMLER ---
+    def oku(self, ana_dizin, analiz, anahtar, girdiler, yuklu=None):
+        """Anahtar ve girdi dosyaları kayıtla eşleşirse sonuç tablosunu döndürür, yoksa None.
+
+        yuklu: paketin yüklediği dosyaların izleri (VeriPaketi.girdi_izleri);
+        bu dosyalarda diskteki hal değil, tablonun ayrıştırıldığı içerik
+        karşılaştırılır.
+        """
+        meta_yolu = self._yol(ana_dizin, analiz, anahtar, 'json')
+        try:
+            with open(meta_yolu, encoding='utf-8') as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            return None
+        if meta.get('surum') != SURUM or meta.get('anahtar') != anahtar:
+            return None
+        if meta['bicim'] == 'feather' and not PYARROW_VAR:
+            return None
+        izler = self.izler(girdiler, meta['girdiler'], yuklu)
+        if izler.keys() != meta['girdiler'].keys() or any(
+                _ozet(iz) != _ozet(meta['girdiler'][ad]) for ad, iz in izler.items()):
+            return None
+
+        veri_yolu = self._yol(ana_dizin, analiz, anahtar, meta['bicim'])
+        if meta['bicim'] == 'feather':
+            df = pd.read_feather(veri_yolu)
+        else:
+            df = npz_oku(veri_yolu, meta, meta['sutunlar'])
+        df = _indeks_geri_kur(df, meta['indeks'])
+        farkli = {s: t for s, t in meta['tipler'].items() if str(df[s].dtype) != t}
+        if farkli:
+            df = df.astype(farkli)
+
+        if izler != meta['girdiler']:
+            # Dosyalara dokunulmuş ama içerik aynı: sonraki kontrol yine stat ile bitsin
+            meta['girdiler'] = izler
+            self._meta_yaz(meta_yolu, meta)
+        else:
+            os.utime(meta_yolu)     # LRU tahliyesi için son kullanım zamanı
+        return df
+
+    def yaz(self, ana_dizin, analiz, anahtar, izler, df):
+        """Sonucu, hesaplandığı girdilerin parmak izleriyle (bkz. _sonuc_izleri) kaydeder.
+
+        Sonra klasörün boyut sınırını uygular.
+        """
+        if not all(isinstance(s, str) for s in df.columns) or not df.columns.is_unique:
+            raise OnbellekHatasi("Sütun adları metin ve tekil olmalı.")
+        indeks = _indeks_bilgisi(df.index)
+        tablo = df if indeks['tur'] == 'aralik' else df.assign(**{INDEKS_SUTUNU: df.index.to_numpy()})
+        klasor = self._klasor(ana_dizin)
+        os.makedirs(klasor, exist_ok=True)
+        meta = {
+            'surum': SURUM,
+            'analiz': analiz,
+            'anahtar': anahtar,
+            'girdiler': izler,
+            'bicim': self.bicim,
+            'sutunlar': list(tablo.columns),
+            'tipler': {s: str(t) for s, t in df.dtypes.items()},
+            'indeks': indeks,
+        }
+        veri_yolu = self._yol(ana_dizin, analiz, anahtar, self.bicim)
+        gecici = veri_yolu + '.tmp'
+        if self.bicim == 'feather':
+            tablo.reset_index(drop=True).to_feather(gecici)
+        else:
+            meta['turler'] = npz_yaz(tablo, gecici)
+        os.replace(gecici, veri_yolu)
+        meta_yolu = self._yol(ana_dizin, analiz, anahtar, 'json')
+        self._meta_yaz(meta_yolu, meta)
+        # Kayıt düzeni (ad.json + ad.npz/.feather) ayrıştırma önbelleğiyle aynı
+        Onbellek(sinir_bayt=self.sinir_bayt).tahliye(klasor, koru=meta_yolu)
+
+    # --- YARDIMCILAR ---
+    def izler(self, girdiler, kayitli=None, yuklu=None):
+        """Dosya adı -> [boyut, mtime_ns, içerik özeti] (dosya yoksa None).
+
+        yuklu'daki dosyaların izi olduğu gibi alınır. Boyutu ve zamanı
+        kayıttakiyle aynı olan dosya okunmaz; bir dosyanın özeti süreç
+        içinde de bir kez hesaplanır (analizler dosyaları paylaşır).
+        """
+        kayitli = kayitli or {}
+        yuklu = yuklu or {}
+        izler = {}
+        for yol in girdiler:
+            ad = os.path.basename(yol)
+            if ad in yuklu:
+                izler[ad] = list(yuklu[ad])
+                continue
+            try:
+                boyut, mtime_ns = parmak_izi(yol)
+            except FileNotFoundError:
+                izler[ad] = None
+                continue
+            onceki = kayitli.get(ad)
+            if onceki is not None and onceki[:2] == [boyut, mtime_ns]:
+                izler[ad] = onceki
+                continue
+            anahtar = (os.path.abspath(yol), boyut, mtime_ns)
+            if anahtar not in self._ozetler:
+                self._ozetler[anahtar] = icerik_ozeti(yol)
+            izler[ad] = [boyut, mtime_ns, self._ozetler[anahtar]]
+        return izler
+
+    def _klasor(self, ana_dizin):
+        return self.dizin or os.path.join(os.path.abspath(ana_dizin), KLASOR_ADI, ALT_KLASOR)
+
+    def _yol(self, ana_dizin, analiz, anahtar, uzanti):
+        # Ortak bir klasörde farklı günlerin kayıtları çakışmasın
+        ozet = hashlib.blake2b(f"{os.path.abspath(ana_dizin)}|{anahtar}".encode('utf-8'), digest_size=8).hexdigest()
+        return os.path.join(self._klasor(ana_dizin), f"{analiz}-{ozet}.{uzanti}")
+
+    def _meta_yaz(self, meta_yolu, meta):
+        with open(meta_yolu + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(meta_yolu + '.tmp', meta_yolu)
+
+
+def _ozet(iz):
+    return iz[2] if iz else None
+
+
+def _indeks_bilgisi(indeks):
+    if isinstance(indeks, pd.RangeIndex):
+        return {'tur': 'aralik', 'baslangic': indeks.start, 'bitis': indeks.stop, 'adim': indeks.step}
+    if indeks.nlevels == 1 and indeks.dtype.kind in 'iu':
+        return {'tur': 'sutun', 'tip': str(indeks.dtype)}
+    raise OnbellekHatasi(f"İndeks tipi ({type(indeks).__name__}, {indeks.dtype}) önbelleğe yazılamaz.")
+
+
+def _indeks_geri_kur(df, indeks):
+    if indeks['tur'] == 'aralik':
+        return df.set_axis(pd.RangeIndex(indeks['baslangic'], indeks['bitis'], indeks['adim']))
+    degerler = df.pop(INDEKS_SUTUNU).to_numpy(dtype=indeks['tip'])
+    return df.set_axis(pd.Index(degerler))
+
+
+def _sonuc_izleri(onbellek, paket, dosyalar, vardi):
+    """Hesabı biten sonucun girdi izleri (dosya adı -> iz); bilinemiyorsa None.
+
+    Paketin yüklediği dosyalar için tablonun ayrıştırıldığı içeriğin izi
+    alınır. Analizin okumadığı dosyaların sadece var olup olmadığı sonucu
+    etkileyebilir; hesaptan önce olmayıp sonra ortaya çıkan dosyada sonuç
+    hangi duruma ait bilinemez. vardi: hesaptan önce dosya adı -> var mı.
+    """
+    yuklu = paket.girdi_izleri(dosyalar)
+    izler = {}
+    for dosya_adi in dosyalar:
+        yol = paket.yol(dosya_adi)
+        if dosya_adi in yuklu:
+            if yuklu[dosya_adi] is None:
+                return None
+            izler[dosya_adi] = list(yuklu[dosya_adi])
+        elif vardi[dosya_adi]:
+            izler.update(onbellek.izler([yol]))
+        elif os.path.exists(yol):
+            return None
+        else:
+            izler[dosya_adi] = None
+    return izler
+
+
+def onbellekli(fonksiyon):
+    """Analiz fonksiyonunun sonucunu girdi dosyaları, parametreler ve kod sürümüyle hatırlar."""
+    imza = inspect.signature(fonksiyon)
+    veri_parametresi = next(iter(imza.parameters))
+    analiz = fonksiyon.__name__
+
+    @functools.wraps(fonksiyon)
+    def sarmal(veri, *args, **kwargs):
+        # Sadece sonuç önbelleği açık paketlerde (klasör yolu verilen çağrılar diske yazmaz)
+        onbellek = getattr(veri, 'sonuc_onbellegi', None)
+        if onbellek is None:
+            return fonksiyon(veri, *args, **kwargs)
+        baglam = imza.bind(veri, *args, **kwargs)
+        baglam.apply_defaults()
+        parametreler = {a: d for a, d in baglam.arguments.items() if a != veri_parametresi}
+        try:
+            anahtar = json.dumps({'analiz': analiz, 'parametreler': parametreler, 'kompakt': veri.kompakt,
+                                  'kod': kod_surumu()}, sort_keys=True, ensure_ascii=False)
+        except TypeError:
+            return fonksiyon(veri, *args, **kwargs)
+        dosyalar = list(sema.analiz_sutunlari(analiz))
+        yuklu = veri.girdi_izleri(dosyalar)
+        if None in yuklu.values():
+            # Yüklü tablolardan biri bilinen bir dosya içeriğine bağlanamıyor
+            return fonksiyon(veri, *args, **kwargs)
+
+        try:
+            df = onbellek.oku(veri.ana_dizin, analiz, anahtar, [veri.yol(d) for d in dosyalar], yuklu)
+        except (OSError, ValueError, KeyError, OnbellekHatasi) as e:
+            gunluk.warning(f"{analiz}: sonuç önbelleği okunamadı ({e}), yeniden hesaplanıyor.")
+            df = None
+        if df is not None:
+            return df
+
+        vardi = {d: os.path.exists(veri.yol(d)) for d in dosyalar}
+        df = fonksiyon(veri, *args, **kwargs)
+        try:
+            izler = _sonuc_izleri(onbellek, veri, dosyalar, vardi)
+            if izler is not None:
+                onbellek.yaz(veri.ana_dizin, analiz, anahtar, izler, df)
+        except (OSError, ValueError, OnbellekHatasi) as e:
+            gunluk.warning(f"{analiz}: sonuç önbelleğe yazılamadı ({e}).")
+        return df
+
+    return sarmal
\ No newline at end of file
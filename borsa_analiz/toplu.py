@@ -0,0 +1,224 @@
+"""
+================================================================================
+MODÜL ADI   : Toplu Çalıştırıcı (Çok Günlü Arşiv, Süreç Havuzu)
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Geriye dönük doldurmalarda yüzlerce gün klasörü için her script ayrı ayrı
+(her seferinde yeni yorumlayıcı ve pandas importu ile) çalıştırılıyordu.
+Toplu mod gün klasörlerini (glob deseni, arşiv klasörü ve/veya tarih
+aralığı, bkz. arsiv.py) bir süreç havuzuna dağıtır; her gün calistirici.py
+ile tek pakette çalışır ve raporları tarih bölümlü klasörlere yazılır:
+    CIKTI/2025-01-02/WAPD_ANALIZI_TUM_....csv ...
+    CIKTI/2025-01-02/CALISMA.log      o günün ekran çıktısı
+    CIKTI/2025-01-02/CALISMA_PROFILI_....json  aşama süreleri (bkz. profil.py)
+    CIKTI/2025-01-02/RAPOR_.../       --bicim parquet ile CSV'ler yerine
+                                      tek rapor deposu (bkz. rapor_deposu.py)
+    CIKTI/2025-01-02/TAMAM.json       kontrol noktası (en son yazılır)
+
+KALDIĞI YERDEN DEVAM:
+TAMAM.json bir gün bütün analizleri bitince atomik olarak yazılır. Yeniden
+başlatılan (ör. çökmüş) bir doldurma, TAMAM.json'u olan ve istenen
+analizleri kapsayan günleri atlar; yarım kalmış (TAMAM.json'u olmayan)
+günün klasörü silinip gün baştan çalışır. TAMAM.json'u olup istenen
+analizlerin bir kısmını kapsamayan günde (ör. önce -a wapd_analizi, sonra
+-a spread_analizi) sadece eksik analizler çalışır ve TAMAM.json'a eklenir;
+eski raporlar silinmez. --yeniden ile bütün günler baştan çalıştırılır.
+
+NOT:
+Bir analizin hatası günü durdurmaz (calistirici.calistir gibi); gün yine
+tamamlanmış sayılır ve sonuç üretmeyen analizler TAMAM.json'da 'basarisiz'
+listesinde durur. Sadece günün kendisi hata verirse (okunamayan klasör,
+çöken süreç) kontrol noktası yazılmaz ve gün sonraki çalıştırmada tekrar denenir.
+
+KULLANIM:
+    python -m borsa_analiz.toplu ARSIV -o RAPORLAR
+    python -m borsa_analiz.toplu "ARSIV/2024-*" -o RAPORLAR -j 4
+    python -m borsa_analiz.toplu ARSIV -o RAPORLAR --baslangic 2024-01-01 --bitis 2024-06-30 -a wapd_analizi
+    python -m borsa_analiz.toplu ARSIV -o RAPORLAR --bicim parquet
+================================================================================
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from datetime import datetime
+
+from .arsiv import gunleri_bul, tarih_argumani
+from .calistirici import ANALIZLER, analizleri_sec, calistir
+from .konsol import konsol_gunlugu
+from .rapor_deposu import BICIMLER, PYARROW_VAR
+
+KONTROL_NOKTASI = 'TAMAM.json'
+GUNLUK_DOSYASI = 'CALISMA.log'
+
+GunRaporu = namedtuple('GunRaporu', ['tarih', 'basarisiz', 'sure_sn'])
+
+
+def gun_klasoru(cikti, tarih):
+    return os.path.join(cikti, tarih)
+
+
+def kontrol_noktasi(cikti, tarih):
+    """Günün TAMAM.json içeriği; gün tamamlanmamışsa None."""
+    try:
+        with open(os.path.join(gun_klasoru(cikti, tarih), KONTROL_NOKTASI), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def tamamlandi_mi(cikti, tarih, adlar):
+    kayit = kontrol_noktasi(cikti, tarih)
+    return kayit is not None and set(adlar) <= set(kayit.get('analizler', []))
+
+
+def gunu_calistir(gun, cikti, adlar, bicim='csv', yeniden=False):
+    """Bir günün analizlerini CIKTI/<tarih> altına çalıştırır, sonunda kontrol noktasını yazar.
+
+    Gün daha önce başka analizlerle tamamlanmışsa sadece kontrol noktasında
+    olmayan analizler çalışır ve kontrol noktasına eklenir.
+    """
+    hedef = gun_klasoru(cikti, gun.tarih)
+    onceki = None if yeniden else kontrol_noktasi(cikti, gun.tarih)
+    if onceki is None:
+        # Kontrol noktası olmayan klasör yarım kalmış bir denemedir: eski raporlar karışmasın
+        if os.path.exists(hedef):
+            shutil.rmtree(hedef)
+        os.makedirs(hedef)
+        onceki = {'analizler': [], 'basarisiz': [], 'sure_sn': 0.0}
+    eksikler = [ad for ad in adlar if ad not in onceki['analizler']]
+    if not eksikler:
+        return GunRaporu(gun.tarih, [ad for ad in onceki['basarisiz'] if ad in adlar], 0.0)
+
+    mevcut = set(os.listdir(hedef))
+    baslangic = time.perf_counter()
+    try:
+        with open(os.path.join(hedef, GUNLUK_DOSYASI), 'a', encoding='utf-8') as gunluk, redirect_stdout(gunluk):
+            print(f"[{gun.tarih}] {gun.klasor}")
+            sonuclar = calistir(gun.klasor, hedef, eksikler, bicim=bicim)
+    except BaseException:
+        # Tamamlanmış analizlerin raporları kalır; bu denemenin yarım raporları silinir
+        for ad in set(os.listdir(hedef)) - mevcut:
+            yol = os.path.join(hedef, ad)
+            if os.path.isdir(yol):
+                shutil.rmtree(yol)
+            else:
+                os.remove(yol)
+        raise
+    sure = time.perf_counter() - baslangic
+
+    basarisiz = onceki['basarisiz'] + [ad for ad, df in sonuclar.items() if df is None]
+    kayit = {
+        'tarih': gun.tarih,
+        'kaynak': os.path.abspath(gun.klasor),
+        'analizler': onceki['analizler'] + list(sonuclar),
+        'basarisiz': basarisiz,
+        'sure_sn': round(onceki['sure_sn'] + sure, 3),
+        'bitis': datetime.now().isoformat(timespec='seconds'),
+    }
+    yol = os.path.join(hedef, KONTROL_NOKTASI)
+    with open(yol + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(kayit, f, ensure_ascii=False, indent=1)
+    os.replace(yol + '.tmp', yol)
+    return GunRaporu(gun.tarih, [ad for ad in basarisiz if ad in adlar], sure)
+
+
+def toplu_calistir(gunler, cikti, adlar=None, is_sayisi=None, yeniden=False, bildir=print, bicim='csv'):
+    """Günleri süreç havuzunda çalıştırır; tarih -> GunRaporu (hata verenler: istisna) döndürür.
+
+    İstenen analizleri kapsayan tamamlanmış günler (yeniden=False iken)
+    atlanır ve sonuçta yer almaz; kısmen kapsayanlarda eksik analizler çalışır.
+    """
+    adlar = [k.ad for k in analizleri_sec(adlar)]
+    os.makedirs(cikti, exist_ok=True)
+    bekleyenler = [g for g in gunler if yeniden or not tamamlandi_mi(cikti, g.tarih, adlar)]
+    if len(bekleyenler) < len(gunler):
+        bildir(f"{len(gunler) - len(bekleyenler)} gün daha önce tamamlanmış, atlanıyor.")
+
+    sonuclar = {}
+
+    def kaydet(tarih, sonuc):
+        sonuclar[tarih] = sonuc
+        if isinstance(sonuc, Exception):
+            bildir(f"[{len(sonuclar)}/{len(bekleyenler)}] {tarih} HATA: {sonuc}")
+        else:
+            durum = f"{len(adlar) - len(sonuc.basarisiz)}/{len(adlar)} analiz"
+            bildir(f"[{len(sonuclar)}/{len(bekleyenler)}] {tarih} {durum} ({sonuc.sure_sn:.1f} sn)")
+
+    is_sayisi = min(is_sayisi or os.cpu_count() or 1, len(bekleyenler))
+    if is_sayisi <= 1:
+        konsol_gunlugu()
+        for gun in bekleyenler:
+            try:
+                kaydet(gun.tarih, gunu_calistir(gun, cikti, adlar, bicim, yeniden))
+            except Exception as e:
+                kaydet(gun.tarih, e)
+        return sonuclar
+
+    # Günler tarih sırasıyla verilir: çökme olursa tamamlananlar arşivin başından gelir
+    with ProcessPoolExecutor(max_workers=is_sayisi, initializer=konsol_gunlugu) as havuz:
+        isler = {havuz.submit(gunu_calistir, gun, cikti, adlar, bicim, yeniden): gun for gun in bekleyenler}
+        for is_ in as_completed(isler):
+            try:
+                kaydet(isler[is_].tarih, is_.result())
+            except Exception as e:
+                kaydet(isler[is_].tarih, e)
+    return sonuclar
+
+
+def ana(argumanlar=None):
+    ayristirici = argparse.ArgumentParser(
+        prog='python -m borsa_analiz.toplu',
+        description="Arşivdeki gün klasörlerini süreç havuzunda analiz eder, raporları tarihe göre yazar.")
+    ayristirici.add_argument('kaynaklar', nargs='+', metavar='ARSIV',
+                             help="Arşiv klasörü (2025-01-02/ ... alt klasörleri), gün klasörü veya glob deseni")
+    ayristirici.add_argument('-o', '--cikti', required=True, help="Tarih bölümlü raporların yazılacağı klasör")
+    ayristirici.add_argument('--baslangic', type=tarih_argumani, help="Bu tarihten (YYYY-AA-GG) itibaren")
+    ayristirici.add_argument('--bitis', type=tarih_argumani, help="Bu tarihe (YYYY-AA-GG) kadar")
+    ayristirici.add_argument('-a', '--analiz', nargs='+', metavar='AD', help="Sadece bu analizleri çalıştır")
+    ayristirici.add_argument('-j', '--is-sayisi', type=int, help="Süreç sayısı (varsayılan: çekirdek sayısı)")
+    ayristirici.add_argument('--yeniden', action='store_true',
+                             help="Tamamlanmış günlerin klasörünü silip baştan çalıştır")
+    ayristirici.add_argument('--bicim', choices=BICIMLER, default='csv',
+                             help="Rapor biçimi: ayrı CSV'ler, günlük tek Parquet deposu veya ikisi (varsayılan: csv)")
+    secenekler = ayristirici.parse_args(argumanlar)
+    if secenekler.bicim != 'csv' and not PYARROW_VAR:
+        ayristirici.error("--bicim parquet/ikisi için pyarrow gerekli")
+
+    try:
+        adlar = [k.ad for k in analizleri_sec(secenekler.analiz)]
+    except KeyError as e:
+        ayristirici.error(f"{e.args[0]} (bilinenler: {', '.join(k.ad for k in ANALIZLER)})")
+
+    try:
+        gunler = gunleri_bul(secenekler.kaynaklar, secenekler.baslangic, secenekler.bitis)
+    except Exception as e:
+        print(f"HATA: {e}")
+        return 1
+    print(f"{len(gunler)} gün: {gunler[0].tarih} .. {gunler[-1].tarih} -> {secenekler.cikti}")
+
+    baslangic = time.perf_counter()
+    sonuclar = toplu_calistir(gunler, secenekler.cikti, adlar, secenekler.is_sayisi, secenekler.yeniden,
+                              bicim=secenekler.bicim)
+    hatalar = sorted(t for t, s in sonuclar.items() if isinstance(s, Exception))
+    eksikler = sorted(t for t, s in sonuclar.items() if not isinstance(s, Exception) and s.basarisiz)
+
+    print(f"\n{len(sonuclar) - len(hatalar)}/{len(sonuclar)} gün tamamlandı "
+          f"({time.perf_counter() - baslangic:.1f} sn).")
+    if eksikler:
+        print(f"Bazı analizleri sonuç üretmeyen gün: {len(eksikler)} (ayrıntı: CIKTI/<tarih>/{KONTROL_NOKTASI})")
+    if hatalar:
+        print("Hata veren günler (tekrar çalıştırınca yeniden denenir): " + ', '.join(hatalar))
+    return 1 if hatalar else 0
+
+
+if __name__ == '__main__':
+    sys.exit(ana())
\ No newline at end of file
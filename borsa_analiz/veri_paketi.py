@@ -0,0 +1,399 @@
+"""
+================================================================================
+MODÜL ADI   : Veri Paketi (Ortak Snapshot Yükleyici)
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.1 (Şemalı Okuma)
+
+AÇIKLAMA:
+Bir 'DOSYA_KONUMU' klasöründeki CSV dosyalarını (ACILISLAR, DERINLIK,
+KADEME_ANALIZI, BEKLEYEN_EMIRLER, MALIYET_ALICI) tek bir nesnede toplar.
+Her dosya ilk istendiğinde bir kez okunur ve doğrulanır; aynı süreçte
+çalışan bütün analizler aynı tabloyu kullanır.
+
+KULLANIM:
+    paket = VeriPaketi(DOSYA_KONUMU)
+    df_alis = paket.oku('DERINLIK_ALIS-1.csv')
+
+Analiz fonksiyonları hem klasör yolunu hem de VeriPaketi nesnesini kabul
+eder (bkz. veri_paketi_al). Böylece eski kullanım bozulmaz.
+
+ŞEMALI OKUMA:
+Analiz, paketi alırken adını verirse (veri_paketi_al(ana_dizin, 'wapd_analizi'))
+dosyalardan sadece şemada o analiz için tanımlı sütunlar okunur ve
+sütunlar kompakt tiplerle tutulur (bkz. sema.py). Aynı paketi kullanan
+analizlerin ihtiyaçları birleştirilir; ihtiyaç bildirilmeyen dosyalar
+eskisi gibi bütün sütunlarıyla okunur.
+
+ÖNBELLEK:
+Ayrıştırılan tablolar varsayılan olarak bütün günlerin ortak, boyutu
+sınırlı önbellek klasörüne ikili biçimde yazılır; CSV değişmedikçe sonraki
+çalıştırmalar metni tekrar ayrıştırmaz (bkz. onbellek.py).
+VeriPaketi(..., onbellek=False) ile kapatılabilir.
+VeriPaketi(..., sonuc_onbellegi=True) ile aynı girdiler ve parametrelerle
+tekrar çalışan analizin sonucu da veri klasöründeki '.onbellek/sonuclar'
+altından gelir (bkz. sonuc_onbellegi.py; varsayılan kapalı). Her tablonun ayrıştırıldığı içeriğin parmak izi saklanır
+(girdi_izleri); sonuç önbelleği kayıtları bununla anahtarlanır.
+
+EŞZAMANLI OKUMA:
+paket.onyukle() analizin ihtiyaç duyduğu dosyaları bir thread havuzunda
+aynı anda ayrıştırır; veri_paketi_al(ana_dizin, analiz) bunu analiz
+başlamadan yapar. pyarrow kuruluysa çok çekirdekli 'pyarrow'
+ayrıştırıcısı kullanılır, değilse (veya hata verirse) pandas'ın C
+ayrıştırıcısına dönülür.
+
+CANLI MOD:
+paket.yenile(dosyalar) gün içinde yeniden yazılan dosyaları okuyup
+tabloların yerine koyar; paket.alt_paket(semboller) yüklü tablolardan
+sadece değişen sembolleri içeren bir paket çıkarır (bkz. canli.py).
+paket.tablo_koy(dosya_adi, df) akıştan kurulan tabloyu dosyanın yerine
+koyar (bkz. akis.py).
+================================================================================
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from . import profil, sema
+from .onbellek import Onbellek, PYARROW_VAR, kaynak_izi, parmak_izi
+from .sonuc_onbellegi import SonucOnbellegi
+from .semboller import SembolSozlugu
+
+# Projenin tanıdığı girdi dosyaları
+DOSYALAR = [
+    'ACILISLAR-1.csv',
+    'ACILISLAR-2.csv',
+    'DERINLIK_ALIS-1.csv',
+    'DERINLIK_SATIS-1.csv',
+    'KADEME_ANALIZI.csv',
+    'BEKLEYEN_EMIRLER.csv',
+    'MALIYET_ALICI-1.csv',
+]
+
+
+class VeriPaketi:
+    def __init__(self, ana_dizin, kompakt=False, onbellek=True, motor=None, sonuc_onbellegi=False):
+        self.ana_dizin = ana_dizin
+        self.motor = motor or ('pyarrow' if PYARROW_VAR else 'c')  # read_csv 'engine'
+        self.kompakt = kompakt      # True: fiyatlar float32 (bkz. sema.py)
+        # True: ortak önbellek klasörü (onbellek.VARSAYILAN_DIZIN), False/None: kapalı, ya da hazır bir Onbellek
+        self.onbellek = Onbellek() if onbellek is True else (onbellek or None)
+        # Analiz sonuçlarının önbelleği (bkz. sonuc_onbellegi.py); True: veri klasöründe, None/False: kapalı
+        self.sonuc_onbellegi = SonucOnbellegi() if sonuc_onbellegi is True else (sonuc_onbellegi or None)
+        self._tablolar = {}
+        self._izler = {}            # Dosya -> tablonun ayrıştırıldığı içeriğin (boyut, mtime_ns, özet)
+        self._ihtiyaclar = {}       # Dosya -> analizlerin bildirdiği sütunlar
+        self._okunan = {}           # Dosya -> tablonun okunduğu sütun ihtiyacı
+        self._sozlukler = {}        # Sütun türü -> dosyaların ortak kategori sözlüğü
+        self._ara_sonuclar = {}
+        self.uyarilar = []
+
+    def __str__(self):
+        # Analizlerdeki print(f"[{ana_dizin}] ...") satırları klasör yolunu göstermeye devam etsin
+        return str(self.ana_dizin)
+
+    def __repr__(self):
+        return f"VeriPaketi({self.ana_dizin!r}, yuklu={sorted(self._tablolar)})"
+
+    def yol(self, dosya_adi):
+        return os.path.join(self.ana_dizin, dosya_adi)
+
+    def var_mi(self, dosya_adi):
+        return dosya_adi in self._tablolar or os.path.exists(self.yol(dosya_adi))
+
+    def ihtiyac_bildir(self, analiz):
+        """Analizin şemadaki sütun ihtiyacını pakete ekler (bkz. sema.ANALIZ_SUTUNLARI)."""
+        for dosya_adi, ihtiyac in sema.analiz_sutunlari(analiz).items():
+            if dosya_adi in self._ihtiyaclar:
+                ihtiyac = sema.ihtiyac_birlestir(self._ihtiyaclar[dosya_adi], ihtiyac)
+            self._ihtiyaclar[dosya_adi] = ihtiyac
+        return self
+
+    def oku(self, dosya_adi):
+        """Dosyayı (ilk çağrıda) okur, doğrular ve tablonun bir kopyasını döndürür.
+
+        Dönen kopya sığdır (shallow): analizlerin yeni sütun eklemesi veya
+        yeniden adlandırması paylaşılan tabloyu bozmaz, ama veri tekrar
+        kopyalanmaz. Dosya yoksa FileNotFoundError fırlatılır.
+
+        Sonradan eklenen bir analiz daha önce okunmamış sütunlar isterse
+        dosya birleşik ihtiyaçla yeniden okunur.
+        """
+        ihtiyac = self._ihtiyac(dosya_adi)
+        if dosya_adi not in self._tablolar:
+            with profil.asama('okuma'):
+                self._yukle(dosya_adi)
+        elif not sema.ihtiyac_kapsiyor_mu(self._okunan[dosya_adi], ihtiyac):
+            with profil.asama('okuma'):
+                self._tablolar[dosya_adi] = self._dosya_oku(dosya_adi, ihtiyac)
+            # Eski tablodan türetilmiş ara sonuçlar eksik sütunlu olabilir
+            self._ara_sonuclar.clear()
+        df = self._tablolar[dosya_adi]
+        profil.girdi_satiri(dosya_adi, len(df))
+        return df.copy(deep=False)
+
+    def sembol_indeksli(self, dosya_adi):
+        """Dosyayı SEMBOL indeksli tablo olarak döndürür (paket başına bir kez kurulur).
+
+        Hisse başına 'df[df['SEMBOL'] == sembol]' taraması yerine .reindex /
+        .loc ile O(1) erişim sağlar. Tekrarlanan sembollerde ilk satır kalır.
+        """
+        tablo = self.ara_sonuc(
+            ('sembol_indeksli', dosya_adi),
+            lambda: self.oku(dosya_adi).drop_duplicates('SEMBOL').set_index('SEMBOL'),
+        )
+        return tablo.copy(deep=False)
+
+    def sembol_sozlugu(self, dosyalar=None):
+        """Paketin ortak sembol -> kimlik sözlüğü (bkz. semboller.py).
+
+        Verilen dosyaların (verilmezse o ana kadar okunanların) sembol
+        kapsamı sözlüğe kaydedilir; eksik sembol raporu bunlara göre çıkar.
+        """
+        tablolar = {d: self.oku(d) for d in (dosyalar or list(self._tablolar))}
+        return SembolSozlugu(self._sozlukler.get(sema.SEMBOL, pd.Index([], dtype='str')), tablolar)
+
+    def ara_sonuc(self, anahtar, hesapla):
+        """Türetilmiş bir ara sonucu (derinlik matrisi vb.) paket ömrü boyunca bir kez hesaplar."""
+        if anahtar not in self._ara_sonuclar:
+            self._ara_sonuclar[anahtar] = hesapla()
+        return self._ara_sonuclar[anahtar]
+
+    @profil.asamali('okuma')
+    def onyukle(self, dosyalar=None, is_sayisi=None):
+        """Dosyaları thread havuzunda eşzamanlı ayrıştırıp pakete yükler.
+
+        Varsayılan: analizlerin ihtiyaç bildirdiği dosyalar (bildirim yoksa
+        bilinen bütün dosyalar). Bulunamayan veya okunamayan dosyalar
+        atlanır; hata, dosya oku() ile istendiğinde eskisi gibi ortaya çıkar.
+        """
+        dosyalar = [d for d in (dosyalar or list(self._ihtiyaclar) or DOSYALAR)
+                    if d not in self._tablolar and os.path.exists(self.yol(d))]
+        if len(dosyalar) < 2:
+            is_sayisi = 1
+        isler = {}
+        with ThreadPoolExecutor(max_workers=is_sayisi or min(len(dosyalar), os.cpu_count() or 1)) as havuz:
+            for dosya_adi in dosyalar:
+                isler[dosya_adi] = havuz.submit(self._ayristir, dosya_adi, self._ihtiyac(dosya_adi))
+        # Paket durumu (ortak sembol sözlüğü, önbellek) dosya sırasıyla tek thread'de güncellenir
+        for dosya_adi, is_ in isler.items():
+            try:
+                self._yukle(dosya_adi, is_.result())
+            except Exception:
+                continue
+        return self
+
+    @profil.asamali('okuma')
+    def yenile(self, dosyalar, is_sayisi=None):
+        """Değişen dosyaları yeniden okuyup paketteki tabloların yerine koyar.
+
+        Canlı modda (bkz. canli.py) klasördeki dosyalar gün içinde yeniden
+        yazılır. Okunamayan dosyanın (eksik, yarım yazılmış) eski tablosu
+        kalır; dosya adı -> hata sözlüğü döndürülür. Tablo değiştiyse
+        türetilmiş ara sonuçlar silinir.
+        """
+        hatalar = {}
+        if not dosyalar:
+            return hatalar
+        if len(dosyalar) < 2:
+            is_sayisi = 1
+        isler = {}
+        with ThreadPoolExecutor(max_workers=is_sayisi or min(len(dosyalar), os.cpu_count() or 1)) as havuz:
+            for dosya_adi in dosyalar:
+                isler[dosya_adi] = havuz.submit(self._ayristir, dosya_adi, self._ihtiyac(dosya_adi))
+        for dosya_adi, is_ in isler.items():
+            try:
+                self._yukle(dosya_adi, is_.result())
+            except Exception as e:
+                hatalar[dosya_adi] = e
+        if len(hatalar) < len(dosyalar):
+            self._ara_sonuclar.clear()
+        return hatalar
+
+    def alt_paket(self, semboller):
+        """Sadece verilen sembollerin satırlarını içeren, belleğe yüklü bir paket.
+
+        Tablolar diskten tekrar okunmaz; paketin yüklü tabloları süzülür ve
+        ortak sembol sözlüğü paylaşılır. Satır bazlı analizler alt pakette
+        çalıştırılınca o sembollerin tam paketteki sonuçları çıkar.
+        """
+        alt = VeriPaketi(self.ana_dizin, kompakt=self.kompakt, onbellek=False, motor=self.motor)
+        alt._ihtiyaclar = dict(self._ihtiyaclar)
+        alt._okunan = dict(self._okunan)
+        alt._sozlukler = self._sozlukler
+        semboller = pd.Index(semboller)
+        for dosya_adi, df in self._tablolar.items():
+            alt._tablolar[dosya_adi] = df[df['SEMBOL'].isin(semboller)].reset_index(drop=True)
+        return alt
+
+    def tablo_koy(self, dosya_adi, df):
+        """Bellekte kurulmuş bir tabloyu (bkz. akis.py) dosyanın yerine koyar.
+
+        Tablo diskten okunmuş gibi küçültülür ve doğrulanır; bütün sütunları
+        okunmuş sayılır, oku() dosyayı tekrar okumaz. Türetilmiş ara
+        sonuçlar silinir.
+        """
+        kalanlar = sema.kucult(df, self._sozlukler)
+        if kalanlar:
+            self.uyarilar.append(f"{dosya_adi}: {len(kalanlar)} lot sütunu int32'ye sığmadı, float64 bırakıldı.")
+        self._tablo_dogrula(dosya_adi, df)
+        self._tablolar[dosya_adi] = df
+        self._okunan[dosya_adi] = sema.TUM
+        self._izler[dosya_adi] = None
+        self._ara_sonuclar.clear()
+        self.sonuc_onbellegi = None     # Tablolar artık diskteki dosyalar değil
+        return self
+
+    def girdi_izleri(self, dosyalar):
+        """Yüklü dosyaların tablolarının ayrıştırıldığı içeriğin parmak izi (dosya -> (boyut, mtime_ns, özet)).
+
+        Yüklenmemiş dosyalar sözlükte yoktur. Parmak izi bilinmeyen tablonun
+        (bellekte kurulmuş, ayrıştırılırken dosyası değişmiş, önbellekler
+        kapalıyken okunmuş) değeri None'dır.
+        """
+        return {d: self._izler.get(d) for d in dosyalar if d in self._tablolar}
+
+    def hepsini_oku(self, dosyalar=None):
+        """Klasördeki bilinen dosyaların hepsini (veya verilenleri) önceden yükler."""
+        dosyalar = dosyalar or DOSYALAR
+        self.onyukle(dosyalar)
+        for dosya_adi in dosyalar:
+            if self.var_mi(dosya_adi):
+                self.oku(dosya_adi)
+        return self
+
+    def dogrula(self):
+        """Klasörün genel durumunu kontrol eder, bulunan sorunları liste olarak döndürür."""
+        sorunlar = []
+        if not os.path.isdir(self.ana_dizin):
+            return [f"Klasör bulunamadı: {self.ana_dizin}"]
+        for dosya_adi in DOSYALAR:
+            if not self.var_mi(dosya_adi):
+                sorunlar.append(f"Dosya eksik: {dosya_adi}")
+                continue
+            try:
+                self.oku(dosya_adi)
+            except Exception as e:
+                sorunlar.append(f"{dosya_adi}: {e}")
+        return sorunlar + self.uyarilar
+
+    def _ihtiyac(self, dosya_adi):
+        return self._ihtiyaclar.get(dosya_adi, sema.TUM)
+
+    def _yukle(self, dosya_adi, ham=None):
+        df = self._dosya_oku(dosya_adi, self._ihtiyac(dosya_adi), ham)
+        self._tablo_dogrula(dosya_adi, df)
+        self._tablolar[dosya_adi] = df
+
+    def _ayristir(self, dosya_adi, ihtiyac):
+        """Dosyayı önbellekten veya CSV'den ham tablo olarak okur.
+
+        Paketin ortak durumuna dokunmaz; onyukle() bunu thread'lerde çalıştırır.
+        Dönüş: (tablo, istenen sütunlar, önbellekten mi, kaynak parmak izi)
+        """
+        baslangic = time.perf_counter()
+        yol = self.yol(dosya_adi)
+        basliklar = sema.basliklar(yol)
+        sutunlar = sema.secilen_sutunlar(basliklar, ihtiyac)
+        kayit = self._onbellekten_oku(dosya_adi, sutunlar)
+        if kayit is not None:
+            df, iz = kayit
+            profil.dosya_okundu(dosya_adi, len(df), len(sutunlar), time.perf_counter() - baslangic, True)
+            return df, sutunlar, True, iz
+        # Önbellek kaydı küçülmesin: kayıttaki eski sütunlar da tekrar okunur
+        okunacak = sutunlar
+        if self.onbellek is not None and ihtiyac is not sema.TUM:
+            okunacak = sema.secilen_sutunlar(basliklar, sutunlar + self._onbellek_sutunlari(dosya_adi))
+        # Parmak izi ayrıştırmadan önce: dosya bu arada değişirse tablo yeni izle kaydedilmesin
+        iz = None
+        if self.onbellek is not None or self.sonuc_onbellegi is not None:
+            iz = kaynak_izi(yol)
+        df = self._csv_oku(yol, None if ihtiyac is sema.TUM else okunacak,
+                           sema.okuma_tipleri(okunacak, self.kompakt), okunacak)
+        if iz is not None and parmak_izi(yol) != iz[:2]:
+            iz = None       # Dosya ayrıştırılırken değişti: tablonun hangi içeriğe ait olduğu bilinmiyor
+        profil.dosya_okundu(dosya_adi, len(df), len(sutunlar), time.perf_counter() - baslangic, False)
+        return df, sutunlar, False, iz
+
+    def _csv_oku(self, yol, usecols, dtype, beklenen):
+        if self.motor == 'pyarrow':
+            try:
+                df = pd.read_csv(yol, usecols=usecols, dtype=dtype, engine='pyarrow')
+                # Tekrarlanan başlıkları C ayrıştırıcısı gibi adlandırmazsa kullanma
+                if list(df.columns) == list(beklenen):
+                    return df
+                raise ValueError("sütun adları C ayrıştırıcısından farklı")
+            except Exception as e:
+                self.motor = 'c'
+                self.uyarilar.append(f"pyarrow ayrıştırıcısı kullanılamadı ({e}), C ayrıştırıcısına dönüldü.")
+        return pd.read_csv(yol, usecols=usecols, dtype=dtype)
+
+    def _dosya_oku(self, dosya_adi, ihtiyac, ham=None):
+        df, sutunlar, onbellekten, iz = ham or self._ayristir(dosya_adi, ihtiyac)
+        kalanlar = sema.kucult(df, self._sozlukler)
+        if not onbellekten:
+            self._onbellege_yaz(dosya_adi, df, iz)
+            if len(df.columns) != len(sutunlar):
+                df = df[sutunlar]
+        if kalanlar:
+            self.uyarilar.append(f"{dosya_adi}: {len(kalanlar)} lot sütunu int32'ye sığmadı, float64 bırakıldı.")
+        self._okunan[dosya_adi] = ihtiyac
+        self._izler[dosya_adi] = iz
+        return df
+
+    # --- ÖNBELLEK ---
+    # Önbellek hataları analizi durdurmaz; uyarı yazılır ve CSV'den okunur.
+    def _onbellek_etiketi(self):
+        return 'kompakt' if self.kompakt else 'tam'
+
+    def _onbellekten_oku(self, dosya_adi, sutunlar):
+        if self.onbellek is None:
+            return None
+        try:
+            return self.onbellek.izli_oku(self.yol(dosya_adi), sutunlar, self._onbellek_etiketi())
+        except Exception as e:
+            self.uyarilar.append(f"{dosya_adi}: önbellek okunamadı ({e}).")
+            return None
+
+    def _onbellek_sutunlari(self, dosya_adi):
+        try:
+            return self.onbellek.kayitli_sutunlar(self.yol(dosya_adi), self._onbellek_etiketi())
+        except Exception:
+            return []
+
+    def _onbellege_yaz(self, dosya_adi, df, iz):
+        if self.onbellek is None or iz is None:
+            return
+        try:
+            self.onbellek.yaz(self.yol(dosya_adi), df, iz, self._onbellek_etiketi())
+        except Exception as e:
+            self.uyarilar.append(f"{dosya_adi}: önbelleğe yazılamadı ({e}).")
+
+    def _tablo_dogrula(self, dosya_adi, df):
+        # Bütün analizler SEMBOL sütunu üzerinden birleştirme yapıyor
+        if 'SEMBOL' not in df.columns:
+            raise ValueError(f"{dosya_adi} dosyasında 'SEMBOL' sütunu yok.")
+        if df.empty:
+            self.uyarilar.append(f"{dosya_adi} dosyası boş.")
+        tekrar = df['SEMBOL'].duplicated()
+        if tekrar.any():
+            ornek = ', '.join(map(str, df.loc[tekrar, 'SEMBOL'].head(5)))
+            self.uyarilar.append(f"{dosya_adi}: {int(tekrar.sum())} tekrarlanan sembol var ({ornek}).")
+
+
+def veri_paketi_al(ana_dizin, analiz=None, onyukle=True):
+    """Analiz fonksiyonlarına verilen klasör yolunu veya hazır paketi VeriPaketi'ne çevirir.
+
+    'analiz' verilirse o analizin şemadaki sütun ihtiyacı pakete bildirilir
+    ve dosyaları thread havuzunda birlikte ayrıştırılır (onyukle=False ise
+    dosyalar eskisi gibi oku() ile istendikçe okunur).
+    """
+    paket = ana_dizin if isinstance(ana_dizin, VeriPaketi) else VeriPaketi(ana_dizin)
+    if analiz is not None:
+        paket.ihtiyac_bildir(analiz)
+        dosyalar = list(sema.analiz_sutunlari(analiz))
+        if onyukle and dosyalar:
+            paket.onyukle(dosyalar)
+    return paket
@@ -0,0 +1,28 @@
+"""
+================================================================================
+MODÜL ADI   : Ortak Yardımcılar
+YAZAR       : Borsa (AI Assistant)
+VERSIYON    : 1.0
+
+AÇIKLAMA:
+Vektörel hesaplama motorlarının eski satır bazlı scriptlerle birebir aynı
+sonucu üretmesi için gereken küçük yardımcı fonksiyonlar.
+================================================================================
+"""
+
+import numpy as np
+
+
+def yuvarla(dizi, basamak):
+    """Python'un round() fonksiyonunu dizinin her elemanına uygular.
+
+    Eski scriptler iterrows ile gelen Python float'larını round() ile
+    yuvarlıyordu. np.round bazı sınır değerlerde (örn. x.xx5) farklı sonuç
+    verdiği için CSV çıktılarının birebir aynı kalması adına burada
+    Python'un kendi round'u kullanılır.
+    """
+    dizi = np.asarray(dizi)
+    if np.issubdtype(dizi.dtype, np.integer):
+        return dizi  # round(int, n) tamsayıyı olduğu gibi bırakır
+    dizi = dizi.astype('float64')
+    return np.fromiter((round(x, basamak) for x in dizi.tolist()), dtype='float64', count=dizi.size)
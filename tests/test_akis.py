@@ -0,0 +1,43 @@
+"""Akış tüketicisinin snapshot tablolarını koruduğunu doğrular (bkz. borsa_analiz/akis.py)."""
+
+from borsa_analiz.akis import AnalizTuketicisi, SonDurum, TabloSatiri
+from borsa_analiz.veri_paketi import VeriPaketi
+
+
+def _snapshot(klasor):
+    (klasor / 'KADEME_ANALIZI.csv').write_text(
+        'SEMBOL,TOPLAM,AORT,ALIS,SATIS,FARK\n'
+        'AAA,1000,10.5,600,400,200\n'
+        'BBB,2000,20.0,500,1500,-1000\n'
+        'CCC,3000,30.0,1800,1200,600\n', encoding='utf-8')
+    (klasor / 'BEKLEYEN_EMIRLER.csv').write_text(
+        'SEMBOL,NET.EMIR.FARKI\n'
+        'AAA,50\n'
+        'BBB,-70\n'
+        'CCC,90\n', encoding='utf-8')
+    return VeriPaketi(str(klasor), onbellek=False)
+
+
+def test_tek_sembol_guncellemesi_satirlari_korur(tmp_path):
+    paket = _snapshot(tmp_path)
+    tuketici = AnalizTuketicisi(paket, 'kademe_denge_analizi')
+
+    tuketici([TabloSatiri('KADEME_ANALIZI.csv', 'BBB', ('2100', '20.0', '1600', '500', '1100'))])
+
+    kademe = paket.oku('KADEME_ANALIZI.csv')
+    assert len(kademe) == 3
+    assert sorted(kademe['SEMBOL'].astype(str)) == ['AAA', 'BBB', 'CCC']
+    assert len(tuketici.sonuc) == 3
+    denge = tuketici.sonuc.set_index(tuketici.sonuc['SEMBOL'].astype(str))['AKTIF_DENGE']
+    assert denge.to_dict() == {'AAA': 200, 'BBB': 1100, 'CCC': 600}
+
+
+def test_tohumlama_akistan_gelen_satiri_ezmez(tmp_path):
+    paket = _snapshot(tmp_path)
+    durum = SonDurum()
+    durum([TabloSatiri('BEKLEYEN_EMIRLER.csv', 'AAA', ('-5',))])
+    durum.tohumla(paket)
+
+    bekleyen = durum.tablo('BEKLEYEN_EMIRLER.csv')
+    assert len(bekleyen) == 3
+    assert bekleyen.set_index('SEMBOL')['NET.EMIR.FARKI'].to_dict() == {'AAA': -5, 'BBB': -70, 'CCC': 90}
\ No newline at end of file
@@ -0,0 +1,26 @@
+"""Geçmiş deposuna arşiv alımı ile sikisma_analizi'nin gün araması aynı tarihi kullanır (bkz. borsa_analiz/gecmis.py)."""
+
+import pandas as pd
+
+from borsa_analiz import gecmis, onbellek
+from borsa_analiz.analizler.sikisma import sikisma_analizi
+from borsa_analiz.sentetik import sentetik_arsiv
+from borsa_analiz.veri_paketi import VeriPaketi
+
+
+def test_arsiv_gunleri_klasor_tarihiyle_alinir(tmp_path, monkeypatch):
+    monkeypatch.setattr(onbellek, 'VARSAYILAN_DIZIN', str(tmp_path / 'ONBELLEK'))
+    klasorler = sentetik_arsiv(str(tmp_path / 'ARSIV'), gun=3, baslangic='2025-01-06', sembol=40, eksik=0)
+    depo_yolu = str(tmp_path / 'DEPO')
+    assert gecmis.ana(['ekle', *klasorler, '--depo', depo_yolu, '--tohumla']) == 0
+
+    depo = gecmis.GecmisDeposu(depo_yolu)
+    gercek = [g for g, kayit in depo.katalog['gunler'].items() if not kayit.get('tohum')]
+    assert sorted(gercek) == ['2025-01-06', '2025-01-07', '2025-01-08']
+
+    # En yeni olmayan gün: kapanışlar o günün snapshot'ıyla aynı, sonraki gün kullanılmaz
+    sonuc = sikisma_analizi(klasorler[1], depo=depo).set_index('SEMBOL')
+    dosya = VeriPaketi(klasorler[1], onbellek=False).oku('ACILISLAR-1.csv').astype({'SEMBOL': 'str'}).set_index('SEMBOL')
+    sutunlar = [c for c in dosya.columns if c.startswith('KAPANIS')]
+    assert len(sutunlar) >= 5
+    pd.testing.assert_frame_equal(sonuc[sutunlar], dosya.loc[sonuc.index, sutunlar], check_dtype=False)
\ No newline at end of file
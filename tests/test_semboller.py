@@ -0,0 +1,21 @@
+"""Analiz sonuçlarındaki SEMBOL tipi paketin yükleme sırasına ve önbelleğe bağlı değildir (bkz. borsa_analiz/semboller.py)."""
+
+import pandas as pd
+
+from borsa_analiz.analizler import kademe_denge_analizi, wapd_analizi
+from borsa_analiz.onbellek import Onbellek
+from borsa_analiz.sentetik import sentetik_arsiv
+from borsa_analiz.veri_paketi import VeriPaketi
+
+
+def test_sonuc_tipi_onbellek_durumuna_bagli_degil(tmp_path):
+    klasor = sentetik_arsiv(str(tmp_path / 'GUN'), sembol=40)[0]
+    onbellek = Onbellek(dizin=str(tmp_path / 'ONBELLEK'))
+    # Önbelleği başka bir analizin dosya sırasıyla ısıt
+    wapd_analizi(VeriPaketi(klasor, onbellek=onbellek))
+
+    onbelleksiz = kademe_denge_analizi(VeriPaketi(klasor, onbellek=False))
+    onbellekli = kademe_denge_analizi(VeriPaketi(klasor, onbellek=onbellek))
+
+    assert onbelleksiz['SEMBOL'].dtype == 'str'
+    pd.testing.assert_frame_equal(onbelleksiz, onbellekli)
\ No newline at end of file